@@ -1,6 +1,6 @@
 """GraphQL API for Nautobot."""
 
-from nautobot.core.graphql import BigInteger, execute_query, execute_saved_query
+from nautobot.core.graphql import BigInteger, execute_query, execute_saved_query, execute_saved_query_many
 from nautobot.core.graphql.types import ContentTypeType, OptimizedNautobotObjectType
 from nautobot.core.graphql.utils import construct_resolver, get_filtering_args_from_filterset, str_to_var_name
 
@@ -10,6 +10,7 @@ __all__ = (
     "ContentTypeType",
     "execute_query",
     "execute_saved_query",
+    "execute_saved_query_many",
     "get_filtering_args_from_filterset",
     "OptimizedNautobotObjectType",
     "str_to_var_name",
@@ -19,8 +19,13 @@ from nautobot.core.models.generics import OrganizationalModel, PrimaryModel
 from nautobot.core.models.managers import BaseManager, TagsManager
 from nautobot.core.models.name_color_content_types import ContentTypeRelatedQuerySet, NameColorContentTypesModel
 from nautobot.core.models.ordering import naturalize, naturalize_interface
-from nautobot.core.models.query_functions import CollateAsChar, EmptyGroupByJSONBAgg, JSONBAgg
-from nautobot.core.models.querysets import CompositeKeyQuerySetMixin, count_related, RestrictedQuerySet
+from nautobot.core.models.query_functions import CollateAsChar, EmptyGroupByJSONBAgg, JSONBAgg, JSONRemove, JSONSet
+from nautobot.core.models.querysets import (
+    CompositeKeyQuerySetMixin,
+    count_related,
+    iter_queryset_chunks,
+    RestrictedQuerySet,
+)
 from nautobot.core.models.tree_queries import TreeManager, TreeModel, TreeQuerySet
 from nautobot.core.models.utils import (
     array_to_string,
@@ -81,8 +86,11 @@ __all__ = (
     "get_default_namespace",
     "get_default_namespace_pk",
     "is_taggable",
+    "iter_queryset_chunks",
     "JSONArrayField",
     "JSONBAgg",
+    "JSONRemove",
+    "JSONSet",
     "mac_unix_expanded_uppercase",
     "MACAddressCharField",
     "NameColorContentTypesModel",
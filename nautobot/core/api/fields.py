@@ -183,13 +183,13 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
         )
         return None
 
-    def to_internal_value(self, data):
-        """Convert potentially nested representation to a model instance."""
+    def get_queryset_filter_params(self, data, queryset):
+        """Extend the base method to also accept a nested representation or a composite-key."""
         if isinstance(data, dict):
             if "url" in data:
-                return super().to_internal_value(data["url"])
+                return super().get_queryset_filter_params(data["url"], queryset)
             elif "id" in data:
-                return super().to_internal_value(data["id"])
+                return super().get_queryset_filter_params(data["id"], queryset)
         if isinstance(data, str) and not is_uuid(data) and not is_url(data):
             # Maybe it's a composite-key?
             related_model = self._related_model
@@ -202,7 +202,7 @@ class NautobotHyperlinkedRelatedField(WritableSerializerMixin, serializers.Hyper
             elif related_model is not None and related_model.label_lower == "auth.group":
                 # auth.Group is a base Django model and so doesn't implement our natural_key_args_to_kwargs() method
                 data = {"name": deconstruct_composite_key(data)}
-        return super().to_internal_value(data)
+        return super().get_queryset_filter_params(data, queryset)
 
     def to_representation(self, value):
         """Convert URL representation to a brief nested representation."""
@@ -9,6 +9,7 @@ from django.core.exceptions import (
 from django.db.models import AutoField
 from rest_framework.exceptions import ValidationError
 
+from nautobot.core.api.resolvers import resolve_related_object
 from nautobot.core.api.utils import dict_to_filter_params
 from nautobot.core.utils.data import is_url
 
@@ -86,7 +87,7 @@ class WritableSerializerMixin:
         """
         filter_params = self.get_queryset_filter_params(data=data, queryset=queryset)
         try:
-            return queryset.get(**filter_params)
+            return resolve_related_object(self.context, queryset, filter_params)
         except ObjectDoesNotExist as e:
             raise ValidationError(f"Related object not found using the provided attributes: {filter_params}") from e
         except MultipleObjectsReturned as e:
@@ -1,4 +1,16 @@
+import base64
+import binascii
+from collections import OrderedDict
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from tree_queries.models import TreeNode
 
 from nautobot.core.utils.config import get_settings_or_config
 
@@ -63,3 +75,142 @@ class OptionalLimitOffsetPagination(LimitOffsetPagination):
             return None
 
         return super().get_previous_link()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": KeysetPagination.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": KeysetPagination.cursor_query_description,
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
+
+
+class KeysetPagination(OptionalLimitOffsetPagination):
+    """
+    Cursor-based paginator, used instead of `OptionalLimitOffsetPagination` when a `cursor` parameter is given.
+
+    Rather than counting all matching objects and skipping `offset` of them, each page is retrieved by filtering on the
+    sort key and primary key of the last object of the previous page, so retrieving a page is equally fast however far
+    into the results it is. Results are ordered by primary key, or by the single non-null field given by the `sort`
+    parameter (then by primary key); the response has no `count` or `previous` link, only an opaque `next` link.
+    Clients opt in by requesting the first page with an empty `cursor` parameter (`?cursor=`).
+    """
+
+    cursor_query_param = "cursor"
+    cursor_query_description = (
+        "Use cursor-based pagination, starting from the given position; give an empty value to get the first page."
+    )
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # No pagination when rendering to CSV
+        if "text/csv" in request.accepted_media_type:
+            return None
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.sort_field, self.descending = self.get_sort_field(request, queryset.model)
+
+        ordering = ["pk"] if self.sort_field is None else [self.sort_field.name, "pk"]
+        if self.descending:
+            ordering = [f"-{name}" for name in ordering]
+        if issubclass(queryset.model, TreeNode):
+            # As in NautobotOrderingFilter, tree querysets can't otherwise be ordered by their own fields
+            queryset = queryset.extra(order_by=ordering)
+        else:
+            queryset = queryset.order_by(*ordering)
+
+        position = self.decode_cursor(request, queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(*position))
+
+        if not self.limit:
+            self.has_next = False
+            return list(queryset)
+        results = list(queryset[: self.limit + 1])
+        self.has_next = len(results) > self.limit
+        self.page = results[: self.limit]
+        return self.page
+
+    def get_sort_field(self, request, model):
+        """
+        Get the field to sort by (before primary key) from the `sort` parameter, and whether to sort in descending order.
+
+        Returns:
+            (tuple[Field, bool]): The sort field (None to sort by primary key alone) and whether to sort descending.
+        """
+        sort = request.query_params.get(api_settings.ORDERING_PARAM, "").strip()
+        descending = sort.startswith("-")
+        name = sort.lstrip("-")
+        if not name or name == "pk":
+            return None, descending
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.is_relation or field.null:
+            raise ValidationError(
+                {api_settings.ORDERING_PARAM: "Cursor pagination only supports sorting by a single non-null field."}
+            )
+        if field.primary_key:
+            return None, descending
+        return field, descending
+
+    def get_position_filter(self, sort_value, pk):
+        """Get the filter of all objects after the given sort value and primary key, in the current ordering."""
+        lookup = "lt" if self.descending else "gt"
+        if self.sort_field is None:
+            return Q(**{f"pk__{lookup}": pk})
+        name = self.sort_field.name
+        return Q(**{f"{name}__{lookup}": sort_value}) | Q(**{name: sort_value, f"pk__{lookup}": pk})
+
+    def encode_cursor(self, obj):
+        """Encode the position of the given object in the results as an opaque cursor string."""
+        position = [None if self.sort_field is None else self.sort_field.value_to_string(obj), str(obj.pk)]
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request, model):
+        """
+        Decode the position given by the cursor parameter of the request.
+
+        Returns:
+            (tuple): The sort value and primary key of the last object of the previous page, or None for the first page.
+        """
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            sort_value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            pk = model._meta.pk.to_python(pk)
+            if self.sort_field is not None:
+                sort_value = self.sort_field.to_python(sort_value)
+        except (binascii.Error, DjangoValidationError, TypeError, UnicodeDecodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        return sort_value, pk
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([("next", self.get_next_link()), ("results", data)]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.page[-1]))
+
+    def get_previous_link(self):
+        return None
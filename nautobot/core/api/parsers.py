@@ -1,5 +1,5 @@
+import codecs
 import csv
-from io import StringIO
 import json
 import logging
 
@@ -19,6 +19,31 @@ class NautobotCSVParser(BaseParser):
     media_type = "text/csv"
 
     def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        data = list(self.iter_rows(stream, media_type=media_type, parser_context=parser_context))
+
+        if "pk" in parser_context.get("kwargs", {}):
+            # Single-object update, not bulk update - strip it so that we get the expected input and return format
+            data = data[0]
+        # Note that we can't distinguish between single-create and bulk-create with a list of one object,
+        # as both would have the same CSV representation. Therefore create via CSV **always** acts as bulk-create,
+        # and the response will always be a list of created objects, never a single object
+
+        if settings.DEBUG:
+            logger.debug("CSV loaded into data:\n%s", json.dumps(data, indent=2))
+        return data
+
+    def iter_rows(self, stream, media_type=None, parser_context=None):
+        """
+        Parse the rows of CSV data from the given stream one at a time, without reading all of it into memory.
+
+        Yields:
+            (dict): The data of each row, as `parse()` would return it in a list.
+
+        Raises:
+            ParseError: When the serializer class can't be determined or a row can't be parsed, in which case the rows
+                before it have already been yielded.
+        """
         parser_context = parser_context or {}
         encoding = parser_context.get("encoding", "UTF-8")
         try:
@@ -36,23 +61,9 @@ class NautobotCSVParser(BaseParser):
         serializer = serializer_class(context={"request": parser_context.get("request", None), "depth": 0})
 
         try:
-            text = stream.read().decode(encoding)
-            reader = csv.DictReader(StringIO(text))
-
-            data = []
+            reader = csv.DictReader(codecs.iterdecode(stream, encoding))
             for counter, row in enumerate(reader, start=1):
-                data.append(self.row_elements_to_data(counter, row, serializer=serializer))
-
-            if "pk" in parser_context.get("kwargs", {}):
-                # Single-object update, not bulk update - strip it so that we get the expected input and return format
-                data = data[0]
-            # Note that we can't distinguish between single-create and bulk-create with a list of one object,
-            # as both would have the same CSV representation. Therefore create via CSV **always** acts as bulk-create,
-            # and the response will always be a list of created objects, never a single object
-
-            if settings.DEBUG:
-                logger.debug("CSV loaded into data:\n%s", json.dumps(data, indent=2))
-            return data
+                yield self.row_elements_to_data(counter, row, serializer=serializer)
         except ParseError:
             raise
         except Exception as exc:
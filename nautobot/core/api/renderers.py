@@ -12,6 +12,13 @@ from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
 logger = logging.getLogger(__name__)
 
 
+class _Echo:
+    """File-like object that returns, rather than stores, the value written to it; for use with `csv.writer`."""
+
+    def write(self, value):
+        return value
+
+
 class FormlessBrowsableAPIRenderer(BrowsableAPIRenderer):
     """
     Override the built-in BrowsableAPIRenderer to disable HTML forms.
@@ -72,6 +79,21 @@ class NautobotCSVRenderer(BaseRenderer):
 
         return buffer.getvalue()
 
+    def render_stream(self, data):
+        """
+        Render the provided iterable of records to CSV format incrementally, yielding one line of CSV at a time.
+
+        Unlike `render()`, the headers are determined from the first record alone, so all records must have been
+        produced by the same serializer class (which always includes every custom field defined for its model).
+        """
+        writer = csv.writer(_Echo())
+        headers = None
+        for record in data:
+            if headers is None:
+                headers = self.get_headers([record])
+                yield writer.writerow(headers)
+            yield writer.writerow(self.object_to_row_elements(record, headers=headers))
+
     @classmethod
     def get_headers(cls, data):
         """Identify the appropriate CSV headers corresponding to the given data."""
@@ -0,0 +1,154 @@
+"""Resolution of the related objects referenced by data written through the REST API and CSV imports."""
+
+from collections import defaultdict
+import logging
+
+from django.core.exceptions import EmptyResultSet, FieldError, ValidationError as DjangoValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import F, Manager, Q
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Key of the RelatedObjectResolver, if any, in the context of a serializer
+RELATED_OBJECT_RESOLVER_CONTEXT_KEY = "related_object_resolver"
+
+
+def resolve_related_object(context, queryset, filter_params):
+    """
+    Get the single object of `queryset` matching `filter_params`, through the RelatedObjectResolver of the given
+    serializer context if it has one.
+
+    Raises:
+        ObjectDoesNotExist: If no object matches.
+        MultipleObjectsReturned: If more than one object matches.
+    """
+    resolver = context.get(RELATED_OBJECT_RESOLVER_CONTEXT_KEY)
+    if resolver is None:
+        return queryset.get(**filter_params)
+    return resolver.get(queryset, filter_params)
+
+
+class RelatedObjectResolver:
+    """
+    Memoize, and batch, the lookups of the related objects referenced by many rows of data written at once.
+
+    Writable related fields (see `WritableSerializerMixin`) look up each related object by PK, URL, composite-key or
+    dictionary of attributes (such as its natural key fields) with a query per row and per field. When an instance of
+    this class is included in the serializer context, as `RELATED_OBJECT_RESOLVER_CONTEXT_KEY`, each object found is
+    remembered and reused for any later reference to it, and `prefetch()` can be used beforehand to look up the objects
+    referenced by a whole batch of rows with one query per related field and kind of reference.
+
+    Only objects that were found are remembered, as an object that was not found may yet be created by a later row of
+    the same import. Resolved objects are shared by all of the rows referencing them, and therefore should not be
+    modified by their serializers.
+    """
+
+    # Maximum number of distinct references to look up in a single query
+    batch_size = 1000
+
+    def __init__(self):
+        self._objects = {}
+
+    @staticmethod
+    def _get_key(queryset, filter_params):
+        """Get the key of the object of `queryset` matching `filter_params`, or None if it can't be remembered."""
+        if isinstance(queryset, Manager):
+            queryset = queryset.all()
+        try:
+            return (queryset.model, str(queryset.query), frozenset(filter_params.items()))
+        except (EmptyResultSet, TypeError):
+            # The queryset can't match anything, or the filter values are unhashable
+            return None
+
+    def get(self, queryset, filter_params):
+        """
+        Get the single object of `queryset` matching `filter_params`, querying the database only if it isn't known yet.
+
+        Raises:
+            ObjectDoesNotExist: If no object matches.
+            MultipleObjectsReturned: If more than one object matches.
+        """
+        key = self._get_key(queryset, filter_params)
+        if key is None:
+            return queryset.get(**filter_params)
+        if key not in self._objects:
+            self._objects[key] = queryset.get(**filter_params)
+        return self._objects[key]
+
+    def prefetch(self, serializer, data):
+        """
+        Look up all of the related objects referenced by the given rows of data at once.
+
+        References that can't be resolved in bulk, such as ones that don't match exactly one object, are left for `get()`
+        to look up (and report errors on) one at a time as usual.
+
+        Args:
+            serializer (Serializer): A serializer of the model that the data is written to.
+            data (list[dict]): The rows of data, as they will be passed to the serializer.
+        """
+        for field_name, field in serializer.fields.items():
+            if field.read_only:
+                continue
+            many = isinstance(field, serializers.ManyRelatedField)
+            if many:
+                field = field.child_relation
+            # Only related fields using WritableSerializerMixin.get_object() to look up their objects
+            if not isinstance(field, serializers.RelatedField) or not hasattr(field, "get_queryset_filter_params"):
+                continue
+            queryset = field.queryset
+            if queryset is None:
+                continue
+
+            references = defaultdict(dict)
+            for row in data:
+                if not isinstance(row, dict) or row.get(field_name) in (None, "", []):
+                    continue
+                for value in row[field_name] if many and isinstance(row[field_name], list) else [row[field_name]]:
+                    try:
+                        filter_params = field.get_queryset_filter_params(data=value, queryset=queryset)
+                    except ValidationError:
+                        continue
+                    key = self._get_key(queryset, filter_params)
+                    if key is not None and key not in self._objects:
+                        # Group the references by the fields they filter on, so that each group can be queried at once
+                        references[tuple(sorted(filter_params))][key] = filter_params
+
+            for lookups, references_by_key in references.items():
+                references_by_key = list(references_by_key.items())
+                for start in range(0, len(references_by_key), self.batch_size):
+                    self._prefetch_batch(queryset, lookups, dict(references_by_key[start : start + self.batch_size]))
+
+    def _prefetch_batch(self, queryset, lookups, references_by_key):
+        """Look up the objects of `queryset` matching each of the given references, all filtering on `lookups`."""
+        aliases = {f"_resolver_lookup_{index}": F(lookup) for index, lookup in enumerate(lookups)}
+        lookup_values = [filter_params[lookups[0]] for filter_params in references_by_key.values()]
+        if len(lookups) == 1 and None not in lookup_values:
+            query = Q(**{f"{lookups[0]}__in": lookup_values})
+        else:
+            query = Q()
+            for filter_params in references_by_key.values():
+                query |= Q(**filter_params)
+        try:
+            # In a savepoint, so that a database error doesn't break any transaction that the import is running in
+            with transaction.atomic():
+                matches = list(queryset.filter(query).annotate(**aliases))
+        except (DatabaseError, DjangoValidationError, FieldError, TypeError, ValueError) as exc:
+            # Invalid references or lookups that aren't plain fields; leave it to get() to report any errors
+            logger.debug("Unable to prefetch %s objects by %s: %s", queryset.model.__name__, lookups, exc)
+            return
+
+        def normalize(value):
+            return None if value is None else str(value)
+
+        # The database may coerce the values of a reference (such as "10" for an integer field) or compare them more
+        # loosely (such as case-insensitively) than here, so any reference not matching exactly one object is skipped
+        objects_by_values = defaultdict(dict)
+        for obj in matches:
+            values = tuple(normalize(getattr(obj, alias)) for alias in aliases)
+            objects_by_values[values][obj.pk] = obj
+        for key, filter_params in references_by_key.items():
+            objects = objects_by_values.get(tuple(normalize(filter_params[lookup]) for lookup in lookups), {})
+            if len(objects) == 1:
+                self._objects[key] = next(iter(objects.values()))
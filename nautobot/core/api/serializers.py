@@ -27,6 +27,7 @@ from rest_framework.utils.model_meta import _get_to_field, RelationInfo
 
 from nautobot.core import constants
 from nautobot.core.api.fields import NautobotHyperlinkedRelatedField, ObjectTypeField
+from nautobot.core.api.resolvers import resolve_related_object
 from nautobot.core.api.utils import (
     dict_to_filter_params,
     nested_serializer_factory,
@@ -155,6 +156,9 @@ class BaseModelSerializer(OptInFieldsMixin, serializers.HyperlinkedModelSerializ
             case_query = self._build_query_case_for_natural_key_field_lookup(all_related_fields_natural_key_lookups)
             if isinstance(self.instance, models.QuerySet):
                 queryset = self.instance
+            elif isinstance(self.instance, (list, tuple)):
+                # A chunk of objects from a larger queryset, such as when streaming a CSV export
+                queryset = self.Meta.model.objects.filter(pk__in=[obj.pk for obj in self.instance])
             else:
                 # We would only need to run one additional query, making this a more efficient method of
                 # obtaining all the natural key values for this instance;
@@ -806,7 +810,7 @@ class WritableNestedSerializer(BaseModelSerializer):
 
             queryset = self.get_queryset()
             try:
-                return queryset.get(**params)
+                return resolve_related_object(self.context, queryset, params)
             except ObjectDoesNotExist:
                 raise ValidationError(f"Related object not found using the provided attributes: {params}")
             except MultipleObjectsReturned:
@@ -841,7 +845,7 @@ class WritableNestedSerializer(BaseModelSerializer):
                 )
 
         try:
-            return queryset.get(pk=pk)
+            return resolve_related_object(self.context, queryset, {"pk": pk})
         except ObjectDoesNotExist:
             raise ValidationError(f"Related object not found using the provided ID: {pk}")
 
@@ -914,6 +918,14 @@ class CustomFieldModelSerializerMixin(ValidatedModelSerializer):
 
     @extend_schema_field(OpenApiTypes.OBJECT)
     def get_computed_fields(self, obj):
+        # When serializing a page of objects, render the computed fields of all objects on the page at once
+        if isinstance(self.parent, serializers.ListSerializer) and isinstance(self.parent.instance, (list, tuple)):
+            computed_fields = getattr(self, "_computed_fields_by_pk", None)
+            if computed_fields is None or obj.pk not in computed_fields:
+                computed_fields = type(obj).get_computed_fields_for_objects(self.parent.instance)
+                self._computed_fields_by_pk = computed_fields
+            if obj.pk in computed_fields:
+                return computed_fields[obj.pk]
         return obj.get_computed_fields()
 
     def get_field_names(self, declared_fields, info):
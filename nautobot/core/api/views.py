@@ -11,7 +11,7 @@ from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import transaction
 from django.db.models import ProtectedError
-from django.http.response import HttpResponseBadRequest
+from django.http.response import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import NoReverseMatch, reverse as django_reverse
 from drf_spectacular.plumbing import get_relative_url, set_query_parameters
@@ -20,7 +20,6 @@ from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 from graphene_django.settings import graphene_settings
 from graphene_django.views import GraphQLView, HttpError, instantiate_middleware
-from graphql import get_default_backend
 from graphql.execution import ExecutionResult
 from graphql.execution.middleware import MiddlewareManager
 from graphql.type.schema import GraphQLSchema
@@ -35,14 +34,20 @@ import yaml
 
 from nautobot.core.api import BulkOperationSerializer
 from nautobot.core.api.exceptions import SerializerNotFound
+from nautobot.core.api.pagination import KeysetPagination
+from nautobot.core.api.resolvers import RELATED_OBJECT_RESOLVER_CONTEXT_KEY, RelatedObjectResolver
 from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.celery import app as celery_app
+from nautobot.core.constants import CSV_EXPORT_CHUNK_SIZE
 from nautobot.core.exceptions import FilterSetFieldNotFound
+from nautobot.core.graphql.backends import get_backend
+from nautobot.core.models.querysets import iter_queryset_chunks
 from nautobot.core.utils.data import is_uuid
 from nautobot.core.utils.filtering import get_all_lookup_expr_for_field, get_filterset_parameter_form_field
 from nautobot.core.utils.lookup import get_form_for_model, get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
 from nautobot.core.utils.requests import ensure_content_type_and_field_name_in_query_params
+from nautobot.core.views.counts import get_object_counts
 from nautobot.core.views.utils import get_csv_form_fields_from_serializer_class
 from nautobot.extras.registry import registry
 
@@ -114,6 +119,10 @@ class BulkUpdateModelMixin:
         return Response(data, status=status.HTTP_200_OK)
 
     def perform_bulk_update(self, objects, update_data, partial):
+        serializer = self.get_serializer()
+        resolver = serializer.context.get(RELATED_OBJECT_RESOLVER_CONTEXT_KEY)
+        if resolver is not None:
+            resolver.prefetch(serializer, list(update_data.values()))
         with transaction.atomic():
             data_list = []
             for obj in objects:
@@ -203,12 +212,29 @@ class ModelViewSetMixin:
 
         return obj
 
+    @property
+    def paginator(self):
+        """Use keyset pagination instead of the default paginator for requests that include a `cursor` parameter."""
+        if (
+            not hasattr(self, "_paginator")
+            and self.pagination_class is not None
+            and getattr(self, "request", None) is not None
+            and KeysetPagination.cursor_query_param in self.request.query_params
+        ):
+            self._paginator = KeysetPagination()
+        return super().paginator
+
     def get_serializer(self, *args, **kwargs):
         # If a list of objects has been provided, initialize the serializer with many=True
         if isinstance(kwargs.get("data", {}), list):
             kwargs["many"] = True
 
-        return super().get_serializer(*args, **kwargs)
+        serializer = super().get_serializer(*args, **kwargs)
+        resolver = serializer.context.get(RELATED_OBJECT_RESOLVER_CONTEXT_KEY)
+        if resolver is not None and kwargs.get("many") and isinstance(kwargs.get("data"), list):
+            # Bulk create, look up the related objects referenced by all of the objects at once
+            resolver.prefetch(serializer.child, kwargs["data"])
+        return serializer
 
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -228,6 +254,16 @@ class ModelViewSetMixin:
             # Use depth=0 in all write type requests.
             context["depth"] = 0
 
+        if (
+            self.request.method in ("POST", "PUT", "PATCH")
+            and not getattr(self, "swagger_fake_view", False)
+            and isinstance(self.request.data, list)
+        ):
+            # Bulk write, share one resolver between all serializers of the request to look up related objects only once
+            if not hasattr(self, "_related_object_resolver"):
+                self._related_object_resolver = RelatedObjectResolver()
+            context[RELATED_OBJECT_RESOLVER_CONTEXT_KEY] = self._related_object_resolver
+
         return context
 
     def restrict_queryset(self, request, *args, **kwargs):
@@ -260,6 +296,22 @@ class ModelViewSetMixin:
 
         self.restrict_queryset(request, *args, **kwargs)
 
+    def list(self, request, *args, **kwargs):
+        """Extend the list view to stream CSV responses, rather than rendering all objects at once."""
+        if "text/csv" not in request.accepted_media_type or not hasattr(request.accepted_renderer, "render_stream"):
+            return super().list(request, *args, **kwargs)
+
+        # CSV responses are never paginated (see OptionalLimitOffsetPagination), so serialize the queryset in chunks
+        queryset = self.filter_queryset(self.get_queryset())
+        data = itertools.chain.from_iterable(
+            self.get_serializer(chunk, many=True).data
+            for chunk in iter_queryset_chunks(queryset, CSV_EXPORT_CHUNK_SIZE)
+        )
+        renderer = request.accepted_renderer
+        return StreamingHttpResponse(
+            renderer.render_stream(data), content_type=f"{renderer.media_type}; charset={renderer.charset}"
+        )
+
     def dispatch(self, request, *args, **kwargs):
         try:
             return super().dispatch(request, *args, **kwargs)
@@ -605,7 +657,7 @@ class GraphQLDRFAPIView(NautobotAPIVersionMixin, APIView):
             self.schema = graphene_settings.SCHEMA
 
         if self.backend is None:
-            self.backend = get_default_backend()
+            self.backend = get_backend()
 
         self.graphql_schema = self.graphql_schema or self.schema
 
@@ -858,11 +910,14 @@ class GetObjectCountsView(NautobotAPIVersionMixin, APIView):
             ],
         }
 
-        for entry in itertools.chain(*object_counts.values()):
-            app_label, model_name = entry["model"].split(".")
-            model = apps.get_model(app_label, model_name)
-            permission = get_permission_for_model(model, "view")
-            if not request.user.has_perm(permission):
+        models = [apps.get_model(entry["model"]) for entry in itertools.chain(*object_counts.values())]
+        counts = get_object_counts(
+            request.user,
+            [model for model in models if request.user.has_perm(get_permission_for_model(model, "view"))],
+        )
+
+        for entry, model in zip(itertools.chain(*object_counts.values()), models):
+            if model not in counts:
                 continue
             data = {"name": model._meta.verbose_name_plural}
             try:
@@ -871,12 +926,7 @@ class GetObjectCountsView(NautobotAPIVersionMixin, APIView):
                 logger = logging.getLogger(__name__)
                 route = get_route_for_model(model, "list")
                 logger.warning(f"Handled expected exception when generating filter field: {route}")
-            manager = model.objects
-            if request.user.has_perm(permission):
-                if hasattr(manager, "restrict"):
-                    data["count"] = model.objects.restrict(request.user).count()
-                else:
-                    data["count"] = model.objects.count()
+            data["count"] = counts[model]
             entry.update(data)
 
         return Response(object_counts)
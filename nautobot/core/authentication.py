@@ -1,5 +1,6 @@
 from collections import defaultdict
 import logging
+import uuid
 
 from django.conf import settings
 from django.contrib.auth.backends import (
@@ -7,11 +8,14 @@ from django.contrib.auth.backends import (
     RemoteUserBackend as _RemoteUserBackend,
 )
 from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Q
+import redis.exceptions
 
 from nautobot.core.utils.permissions import (
     permission_is_exempt,
-    qs_filter_from_constraints,
+    qs_filter_from_user_permission,
     resolve_permission,
     resolve_permission_ct,
 )
@@ -20,14 +24,60 @@ from nautobot.users.models import ObjectPermission
 logger = logging.getLogger(__name__)
 
 
+OBJECT_PERMISSIONS_CACHE_VERSION_KEY = "nautobot.core.authentication.object_permissions.version"
+
+
+def get_object_permissions_cache_version():
+    """
+    Get the current version of the cached object permissions, which is part of the cache key of each user's permissions.
+    """
+    version = cache.get(OBJECT_PERMISSIONS_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(OBJECT_PERMISSIONS_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(OBJECT_PERMISSIONS_CACHE_VERSION_KEY)
+    return version
+
+
+def invalidate_object_permissions_cache():
+    """
+    Invalidate the cached object permissions of all users, by changing the cache version to a new, random, value.
+
+    A random value (rather than an incrementing counter) is used so that, should the version key ever be evicted from
+    the cache, permissions cached under a previous version can never be mistaken for current ones.
+    """
+    try:
+        cache.set(OBJECT_PERMISSIONS_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    except redis.exceptions.ConnectionError:
+        logger.warning("Unable to invalidate the cached object permissions, as the cache is unavailable")
+
+
 class ObjectPermissionBackend(ModelBackend):
     def get_all_permissions(self, user_obj, obj=None):
         if not user_obj.is_active or user_obj.is_anonymous:
             return {}
         if not hasattr(user_obj, "_object_perm_cache"):
-            user_obj._object_perm_cache = self.get_object_permissions(user_obj)
+            user_obj._object_perm_cache = self.get_cached_object_permissions(user_obj)
         return user_obj._object_perm_cache
 
+    def get_cached_object_permissions(self, user_obj):
+        """
+        Return all permissions granted to the user by an ObjectPermission, using the cache where possible.
+
+        The permissions are cached per user, under the current object permissions cache version, which is changed
+        (see `invalidate_object_permissions_cache()`) whenever an ObjectPermission or group membership is modified.
+        Permissions loaded within a transaction are not cached, as they may reflect changes that are later rolled back.
+        """
+        try:
+            cache_key = f"nautobot.core.authentication.object_permissions.{get_object_permissions_cache_version()}.{user_obj.pk}"
+            perms = cache.get(cache_key)
+            if perms is None:
+                perms = self.get_object_permissions(user_obj)
+                if not connection.in_atomic_block:
+                    cache.set(cache_key, perms)
+        except redis.exceptions.ConnectionError:
+            perms = self.get_object_permissions(user_obj)
+        return perms
+
     def get_object_permissions(self, user_obj):
         """
         Return all permissions granted to the user by an ObjectPermission.
@@ -83,10 +133,7 @@ class ObjectPermissionBackend(ModelBackend):
             raise ValueError(f"Invalid permission {perm} for model {model}")
 
         # Compile a QuerySet filter that matches all instances of the specified model
-        tokens = {
-            "$user": user_obj,
-        }
-        constraints = qs_filter_from_constraints(self.get_all_permissions(user_obj)[perm], tokens)
+        constraints = qs_filter_from_user_permission(user_obj, perm)
 
         # Permission to perform the requested action on the object depends on whether the specified object matches
         # the specified constraints. Note that this check is made against the *database* record representing the object,
@@ -142,6 +142,12 @@ def setup_nautobot_job_logging(sender, instance, conf, **kwargs):
         add_nautobot_log_handler(redirect_logger)
 
 
+@signals.task_postrun.connect
+def flush_nautobot_job_logs(sender=None, task_id=None, **kwargs):
+    """Write any JobLogEntry records still buffered by NautobotDatabaseHandler for the task that just finished."""
+    NautobotDatabaseHandler.flush_task(task_id)
+
+
 @signals.worker_ready.connect
 def setup_prometheus(**kwargs):
     """This sets up an HTTP server to serve prometheus metrics from the celery workers."""
@@ -1,38 +1,134 @@
 import logging
+import sys
+import threading
+import time
+import traceback
 
 from celery import current_task
 from django.core.exceptions import ValidationError
 
 
 class NautobotDatabaseHandler(logging.Handler):
-    """Custom logging handler to log messages to JobLogEntry database entries."""
+    """
+    Custom logging handler to log messages to JobLogEntry database entries.
+
+    To avoid a pair of database queries for every message logged by a Job, the JobResult for each task is cached, and
+    JobLogEntry records are buffered in memory and written with `bulk_create()`. The buffer is flushed when it reaches
+    `flush_size` entries, when a message of level `flush_level` or higher is logged, when a message is logged more than
+    `flush_interval` seconds after the last flush, and when the task finishes (see `flush_task()`). At most
+    `max_buffer_size` entries are ever held; should writing to the database fail repeatedly, further messages are
+    dropped, and a warning noting the number of dropped messages is logged once writing succeeds again.
+
+    The buffer and cache are shared by all instances of this handler, so that a task's log entries are written in order
+    regardless of which logger they were emitted through.
+    """
+
+    flush_size = 100
+    flush_interval = 1.0
+    flush_level = logging.WARNING
+    max_buffer_size = 10000
+
+    _lock = threading.RLock()
+    # Mapping of task_id to JobResult (or None, if the task has no associated JobResult)
+    _job_results = {}
+    # Pending JobLogEntry instances, in the order they were logged
+    _buffer = []
+    # Mapping of task_id to the number of messages that had to be dropped because the buffer was full
+    _dropped = {}
+    _last_flush = 0.0
 
     def emit(self, record):
         if current_task is None:
             return
 
-        from nautobot.extras.models.jobs import JobResult
-
         try:
             self.format(record)
 
-            try:
-                job_result = JobResult.objects.get(id=record.task_id)
-            except (ValidationError, JobResult.DoesNotExist):
-                # Both of these cases are very rare
-                # ValidationError - because the task_id might not a valid UUID
-                # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+            job_result = self.get_job_result(record.task_id)
+            if job_result is None:
                 return
 
             # Skip recording the log entry if it has been marked as such
             if getattr(record, "skip_db_logging", False):
                 return
 
-            job_result.log(
+            log_entry = job_result.build_log_entry(
                 message=record.message,
                 level_choice=record.levelname.lower(),
                 obj=getattr(record, "object", None),
                 grouping=getattr(record, "grouping", record.funcName),
             )
+
+            cls = type(self)
+            with cls._lock:
+                if len(cls._buffer) >= self.max_buffer_size:
+                    cls._dropped[record.task_id] = cls._dropped.get(record.task_id, 0) + 1
+                else:
+                    cls._buffer.append(log_entry)
+                if (
+                    len(cls._buffer) >= self.flush_size
+                    or record.levelno >= self.flush_level
+                    or time.monotonic() - cls._last_flush >= self.flush_interval
+                ):
+                    self.flush()
         except Exception:
             self.handleError(record)
+
+    @classmethod
+    def get_job_result(cls, task_id):
+        """Get the JobResult for the given task_id, or None if there isn't one, caching the result."""
+        from nautobot.extras.models.jobs import JobResult
+
+        with cls._lock:
+            if task_id not in cls._job_results:
+                try:
+                    cls._job_results[task_id] = JobResult.objects.get(id=task_id)
+                except (ValidationError, JobResult.DoesNotExist):
+                    # Both of these cases are very rare
+                    # ValidationError - because the task_id might not a valid UUID
+                    # JobResult.DoesNotExist - because we might not have a JobResult with that ID
+                    cls._job_results[task_id] = None
+            return cls._job_results[task_id]
+
+    def flush(self):
+        """Write all buffered log entries to the database."""
+        from nautobot.extras.choices import LogLevelChoices
+        from nautobot.extras.models.jobs import JobLogEntry
+
+        cls = type(self)
+        with cls._lock:
+            cls._last_flush = time.monotonic()
+            # If the bulk_create() below fails, the buffer is left as-is, to be retried on the next flush
+            log_entries = list(cls._buffer)
+            for task_id, count in cls._dropped.items():
+                job_result = cls._job_results.get(task_id)
+                if job_result is not None:
+                    log_entries.append(
+                        job_result.build_log_entry(
+                            message=f"{count} log message(s) were discarded as they could not be saved in time",
+                            level_choice=LogLevelChoices.LOG_WARNING,
+                            grouping="logging",
+                        )
+                    )
+            if not log_entries:
+                return
+
+            entries_by_database = {}
+            for log_entry in log_entries:
+                entries_by_database.setdefault(log_entry.job_result.log_database, []).append(log_entry)
+            for database, database_log_entries in entries_by_database.items():
+                JobLogEntry.objects.using(database).bulk_create(database_log_entries)
+            cls._buffer = []
+            cls._dropped = {}
+
+    @classmethod
+    def flush_task(cls, task_id):
+        """Write any buffered log entries to the database and forget the cached JobResult of the given finished task."""
+        with cls._lock:
+            try:
+                cls().flush()
+            except Exception:
+                if logging.raiseExceptions:
+                    traceback.print_exc(file=sys.stderr)
+            finally:
+                cls._job_results.pop(task_id, None)
@@ -4,6 +4,18 @@ import nh3
 
 SEARCH_MAX_RESULTS = 15
 
+# Number of seconds to cache the exact object counts shown on the home page
+OBJECT_COUNTS_CACHE_TIMEOUT = 60
+
+# Minimum estimated number of rows of a table for its estimate to be shown on the home page instead of an exact count
+OBJECT_COUNTS_APPROXIMATE_THRESHOLD = 100000
+
+# Maximum number of compiled Jinja2 templates kept in memory by `render_jinja2()`
+JINJA2_TEMPLATE_CACHE_SIZE = 1000
+
+# Maximum number of parsed and validated GraphQL documents kept in memory by `NautobotGraphQLBackend`
+GRAPHQL_DOCUMENT_CACHE_SIZE = 500
+
 #
 # Filter lookup expressions
 #
@@ -87,6 +99,13 @@ CSV_NULL_TYPE = "NULL"
 CSV_NO_OBJECT = "NoObject"
 # VarbinaryIPField Represents b'NoObject' as `::4e6f:4f62:6a65:6374`
 VARBINARY_IP_FIELD_REPR_OF_CSV_NO_OBJECT = "::4e6f:4f62:6a65:6374"
+# Number of objects to retrieve from the database and serialize at a time when streaming a CSV export
+CSV_EXPORT_CHUNK_SIZE = 1000
+# Number of rows of data whose related objects are looked up at a time when importing CSV data, which is also the
+# number of rows imported by each Celery task (and in each transaction) of a parallel import
+CSV_IMPORT_CHUNK_SIZE = 1000
+# Maximum number of chunks of rows of data queued or being imported at once by the Celery tasks of a parallel import
+CSV_IMPORT_MAX_PARALLEL_CHUNKS = 8
 
 
 # For our purposes, COMPOSITE_KEY_SEPARATOR needs to be:
@@ -133,6 +152,7 @@ GLOBAL_SEARCH_EXCLUDE_LIST = [
     "devicebay",
     "devicebaytemplate",
     "devicetypetosoftwareimagefile",
+    "dynamicgroupcachedmember",
     "dynamicgroupmembership",
     "exporttemplate",
     "fileattachment",
@@ -183,6 +203,7 @@ GLOBAL_SEARCH_EXCLUDE_LIST = [
     "tag",
     "taggeditem",
     "tenantgroup",
+    "treemodelancestor",
     "vlangroup",
     "vlanlocationassignment",
     "vminterface",
@@ -1,10 +1,12 @@
 from collections import OrderedDict
+import copy
 from copy import deepcopy
 import logging
 import uuid
 
 from django import forms as django_forms
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.forms.utils import ErrorDict, ErrorList
 import django_filters
@@ -12,6 +14,7 @@ from django_filters.constants import EMPTY_VALUES
 from django_filters.utils import get_model_field, resolve_field
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
+import redis.exceptions
 
 from nautobot.core import constants, forms
 from nautobot.core.forms import widgets
@@ -20,6 +23,9 @@ from nautobot.core.utils import data as data_utils
 
 logger = logging.getLogger(__name__)
 
+# Cache key of the current version of the filters that FilterSet classes generate from database records
+DYNAMIC_FILTERS_CACHE_VERSION_KEY = "nautobot.core.filters.dynamic_filters.version"
+
 
 def multivalue_field_factory(field_class, widget=django_forms.SelectMultiple):
     """
@@ -500,6 +506,21 @@ class TreeNodeMultipleChoiceFilter(NaturalKeyOrPKMultipleChoiceFilter):
         """
         Given a filter value, return a `Q` object that accounts for nested tree node descendants.
         """
+        if settings.TREE_ANCESTOR_INDEX_ENABLED:
+            from nautobot.extras.models import TreeModelAncestor
+
+            # Match all descendants of the given nodes with a single subquery on the tree ancestor index,
+            # rather than with one predicate per descendant.
+            query = models.Q()
+            node_pks = [node.pk for node in value if not isinstance(node, str)]
+            if node_pks:
+                descendants = TreeModelAncestor.objects.filter(ancestor_id__in=node_pks).values("descendant_id")
+                query |= models.Q(**{f"{self.field_name}__in": descendants})
+            for node in value:
+                if isinstance(node, str):
+                    query |= models.Q(**self.get_filter_predicate(None if node == self.null_value else node))
+            return query
+
         if value:
             # django-tree-queries
             value = [node.descendants(include_self=True) if not isinstance(node, str) else node for node in value]
@@ -537,6 +558,108 @@ class TreeNodeMultipleChoiceFilter(NaturalKeyOrPKMultipleChoiceFilter):
         return result
 
 
+#
+# Filter caching
+#
+
+
+def copy_filter(filter_):
+    """
+    Copy a filter for use by a single FilterSet instance, much more cheaply than `copy.deepcopy()` would.
+
+    Only the state that a filter may change or cache while in use is copied: its `extra` arguments (for its form field)
+    and any querysets (whose results may be cached when evaluated); everything else, such as labels, lookup expressions
+    and choices, is shared with the original filter.
+    """
+    clones = {}
+
+    def clone(value):
+        # A queryset referenced more than once (typically as both `queryset` and `extra["queryset"]`) is cloned once
+        if not isinstance(value, models.QuerySet):
+            return value
+        if id(value) not in clones:
+            clones[id(value)] = value.all()
+        return clones[id(value)]
+
+    new_filter = copy.copy(filter_)
+    for name, value in vars(filter_).items():
+        if isinstance(value, models.QuerySet):
+            setattr(new_filter, name, clone(value))
+    new_filter.extra = {key: clone(value) for key, value in filter_.extra.items()}
+    if filter_.method is not None:
+        # Bind a new FilterMethod to the copy, so that it calls the method of the copy's parent FilterSet
+        new_filter.method = filter_.method
+    # Discard any form field already built by the original filter, so that the copy builds its own
+    vars(new_filter).pop("_field", None)
+    return new_filter
+
+
+class FilterDict(OrderedDict):
+    """
+    Dictionary of filters that is "deep" copied by copying each filter with `copy_filter()`.
+
+    `django_filters.FilterSet.__init__()` deep-copies the `base_filters` of the FilterSet class for every instance, which
+    takes several milliseconds for models with hundreds of filters; `BaseFilterSet` uses this class for its
+    `base_filters` to avoid that.
+    """
+
+    def __deepcopy__(self, memo):
+        return OrderedDict((name, copy_filter(filter_)) for name, filter_ in self.items())
+
+
+def get_dynamic_filters_cache_version():
+    """
+    Get the current version of the filters generated from database records, such as custom fields and relationships.
+    """
+    version = cache.get(DYNAMIC_FILTERS_CACHE_VERSION_KEY)
+    if version is None:
+        cache.add(DYNAMIC_FILTERS_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(DYNAMIC_FILTERS_CACHE_VERSION_KEY)
+    return version
+
+
+def invalidate_dynamic_filters_cache():
+    """
+    Invalidate the filters generated from database records cached by all FilterSet classes, in all processes.
+
+    As with the cached object permissions, a random version is used, so that filters cached under a previous version can
+    never be mistaken for current ones should the version key be evicted from the cache.
+    """
+    try:
+        cache.set(DYNAMIC_FILTERS_CACHE_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+    except redis.exceptions.ConnectionError:
+        logger.warning("Unable to invalidate the cached dynamic filters, as the cache is unavailable")
+
+
+def get_dynamic_filters(filterset_class, name, generate_filters):
+    """
+    Get filters generated from database records for a FilterSet class, generating them only when they have changed.
+
+    The generated filters are cached on the FilterSet class (separately from any of its subclasses or parents) until
+    `invalidate_dynamic_filters_cache()` is called, which happens whenever a custom field, custom field choice or
+    relationship is changed.
+
+    Args:
+        filterset_class (type[FilterSet]): The FilterSet class to get the filters of.
+        name (str): Name of the set of filters, to tell apart different kinds of dynamic filters of the same class.
+        generate_filters (callable): Function to generate the filters, returning a tuple of a dictionary of filters and
+            any other data (such as the records that the filters were generated from) to cache along with them.
+
+    Returns:
+        (tuple): A dictionary of copies of the filters, for use by a single FilterSet instance, and the other data.
+    """
+    version = get_dynamic_filters_cache_version()
+    cached = vars(filterset_class).get("_dynamic_filters_cache")
+    if cached is None or cached["version"] != version:
+        cached = {"version": version}
+        setattr(filterset_class, "_dynamic_filters_cache", cached)
+    if name not in cached:
+        filters, data = generate_filters()
+        cached[name] = (FilterDict(filters), data)
+    filters, data = cached[name]
+    return copy.deepcopy(filters), data
+
+
 #
 # FilterSets
 #
@@ -740,7 +863,7 @@ class BaseFilterSet(django_filters.FilterSet):
 
             filters.update(new_filters)
 
-        return filters
+        return FilterDict(filters)
 
     @classmethod
     def filter_for_lookup(cls, field, lookup_type):
@@ -1,9 +1,10 @@
 from django.test.client import RequestFactory
 from graphene.types import Scalar
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend
 from graphql.language import ast
 
+from nautobot.core.graphql.backends import get_backend
+from nautobot.core.graphql.loaders import clear_loaders
 from nautobot.extras.models import GraphQLQuery
 
 
@@ -24,9 +25,10 @@ def execute_query(query, variables=None, request=None, user=None):
     if not request:
         request = RequestFactory().post("/graphql/")
         request.user = user
-    backend = get_default_backend()
     schema = graphene_settings.SCHEMA
-    document = backend.document_from_string(schema, query)
+    document = get_backend().document_from_string(schema, query)
+    # Don't reuse any results loaded by a previous query executed with the same request
+    clear_loaders(request)
     if variables:
         return document.execute(context_value=request, variable_values=variables)
     else:
@@ -51,6 +53,27 @@ def execute_saved_query(saved_query_name, **kwargs):
     return execute_query(query=query.query, **kwargs)
 
 
+def execute_saved_query_many(saved_query_name, variables_list, request=None, user=None):
+    """Execute a saved query from the ORM once for each of the given sets of variables.
+
+    The saved query is retrieved, parsed and validated only once, however many times it is executed.
+
+    Args:
+        saved_query_name (str): Name of a saved GraphQL query.
+        variables_list (list[dict]): The variables to execute the query with, one dictionary per execution.
+        request (django.test.client.RequestFactory, optional): Used to authenticate.
+        user (django.contrib.auth.models.User, optional): Used to authenticate.
+
+    Returns:
+        (list[ExecutionResult]): Result for each set of variables, in the same order as `variables_list`
+    """
+    query = GraphQLQuery.objects.get(name=saved_query_name)
+    return [
+        execute_query(query=query.query, variables=variables, request=request, user=user)
+        for variables in variables_list
+    ]
+
+
 # See also:
 # https://github.com/graphql-python/graphene-django/issues/241
 # https://github.com/graphql-python/graphene/pull/1261 (graphene 3.0)
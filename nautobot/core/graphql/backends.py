@@ -0,0 +1,74 @@
+"""GraphQL backend that caches parsed and validated query documents."""
+
+from collections import OrderedDict
+from functools import partial
+import hashlib
+import threading
+
+from graphql.backend.base import GraphQLDocument
+from graphql.backend.core import GraphQLCoreBackend
+from graphql.execution import execute, ExecutionResult
+from graphql.language.base import parse
+from graphql.validation import validate
+
+from nautobot.core import constants
+
+
+def execute_validated(schema, document_ast, validation_errors, *args, **kwargs):
+    """As `graphql.backend.core.execute_and_validate()`, but with the document already validated."""
+    kwargs.pop("validate", None)
+    if validation_errors:
+        return ExecutionResult(errors=validation_errors, invalid=True)
+    return execute(schema, document_ast, *args, **kwargs)
+
+
+class NautobotGraphQLBackend(GraphQLCoreBackend):
+    """
+    GraphQL backend that parses and validates each distinct query document only once.
+
+    Up to `GRAPHQL_DOCUMENT_CACHE_SIZE` documents are kept in memory, keyed by a digest of the query text and by the
+    schema they were validated against, so that the same query (for example a saved query, executed once per device)
+    can be executed repeatedly without being parsed and validated again each time. Queries that fail to parse are not
+    cached; the error is raised on every call.
+    """
+
+    def __init__(self, executor=None):
+        super().__init__(executor=executor)
+        # Documents by (digest of their query text, schema), least recently used first
+        self.documents = OrderedDict()
+        self.lock = threading.Lock()
+
+    def document_from_string(self, schema, document_string):
+        if not isinstance(document_string, str):
+            return super().document_from_string(schema, document_string)
+
+        key = (hashlib.sha256(document_string.encode()).digest(), schema)
+        with self.lock:
+            document = self.documents.get(key)
+            if document is not None:
+                self.documents.move_to_end(key)
+                return document
+
+        document_ast = parse(document_string)
+        validation_errors = validate(schema, document_ast)
+        document = GraphQLDocument(
+            schema=schema,
+            document_string=document_string,
+            document_ast=document_ast,
+            execute=partial(execute_validated, schema, document_ast, validation_errors, **self.execute_params),
+        )
+        # Also keep the validation errors, for use outside of execution (e.g. validating a saved query)
+        document.validation_errors = validation_errors
+        with self.lock:
+            self.documents[key] = document
+            while len(self.documents) > constants.GRAPHQL_DOCUMENT_CACHE_SIZE:
+                self.documents.popitem(last=False)
+        return document
+
+
+_backend = NautobotGraphQLBackend()
+
+
+def get_backend():
+    """Get the shared `NautobotGraphQLBackend` instance, whose document cache is used by all of Nautobot's queries."""
+    return _backend
@@ -0,0 +1,152 @@
+"""DataLoaders used to batch the database queries of GraphQL resolvers across all objects in a query's results."""
+
+from collections import defaultdict
+import logging
+
+from django.db.models import Q
+import graphene_django_optimizer as gql_optimizer
+from promise import Promise
+from promise.dataloader import DataLoader
+
+logger = logging.getLogger(__name__)
+
+
+def get_loader(context, loader_class, *args):
+    """
+    Get the instance of `loader_class` (initialized with `args`) for the given GraphQL query context.
+
+    Loaders are stored on the context (typically the request) so that each is shared by all resolvers of a single query,
+    and therefore batches their loads, but does not cache any results beyond the lifetime of that query.
+
+    Args:
+        context (HttpRequest): The `info.context` of the query being resolved, or None.
+        loader_class (type[DataLoader]): The class of loader to get.
+        *args: Arguments to initialize the loader with, also used to tell apart different loaders of the same class.
+
+    Returns:
+        (DataLoader): The loader instance.
+    """
+    if context is None:
+        return loader_class(*args)
+    loaders = getattr(context, "_nautobot_graphql_loaders", None)
+    if loaders is None:
+        loaders = {}
+        setattr(context, "_nautobot_graphql_loaders", loaders)
+    key = (loader_class, *args)
+    if key not in loaders:
+        loaders[key] = loader_class(*args)
+    return loaders[key]
+
+
+def clear_loaders(context):
+    """Discard the loaders (and so all results loaded by them) stored on the given GraphQL query context."""
+    if hasattr(context, "_nautobot_graphql_loaders"):
+        delattr(context, "_nautobot_graphql_loaders")
+
+
+class ConfigContextLoader(DataLoader):
+    """Load the rendered config context of many Devices or VirtualMachines (all of the same model) at once."""
+
+    def __init__(self, model, **kwargs):
+        self.model = model
+        super().__init__(**kwargs)
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        from nautobot.extras.models import ConfigContext
+
+        objects = ConfigContext.objects.populate_config_context_data(keys)
+        return Promise.resolve([obj.get_config_context() for obj in objects])
+
+
+class ComputedFieldLoader(DataLoader):
+    """Load the rendered value of a computed field of many objects (all of the same model) at once."""
+
+    def __init__(self, model, key, **kwargs):
+        self.model = model
+        self.key = key
+        super().__init__(**kwargs)
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        from nautobot.extras.models import ComputedField
+
+        computed_field = ComputedField.objects.get_for_model(self.model).filter(key=self.key).first()
+        if computed_field is None:
+            logger.warning(
+                "Computed Field with key %s does not exist for model %s", self.key, self.model._meta.verbose_name
+            )
+            return Promise.resolve([None] * len(keys))
+        return Promise.resolve(computed_field.render_many(keys))
+
+
+class RelationshipPeersLoader(DataLoader):
+    """
+    Load the peers of many objects (all of the same model) on one side of a custom relationship at once.
+
+    Each object is resolved to the list of its peers if the relationship has many peers on the opposite side, and
+    otherwise to its only peer (or None).
+    """
+
+    def __init__(self, relationship, side, peer_model, **kwargs):
+        self.relationship = relationship
+        self.side = side
+        self.peer_model = peer_model
+        # The `info` of the first resolver to use this loader, used to optimize the query of the peers' fields
+        self.info = None
+        super().__init__(**kwargs)
+
+    def get_peer_ids(self, object_ids):
+        """Get the list of peer IDs of each of the given object IDs, in a single query."""
+        from nautobot.extras.choices import RelationshipSideChoices
+        from nautobot.extras.models import RelationshipAssociation
+
+        peer_ids = defaultdict(list)
+        associations = RelationshipAssociation.objects.filter(relationship=self.relationship)
+        if not self.relationship.symmetric:
+            peer_side = RelationshipSideChoices.OPPOSITE[self.side]
+            for object_id, peer_id in associations.filter(**{f"{self.side}_id__in": object_ids}).values_list(
+                f"{self.side}_id", f"{peer_side}_id"
+            ):
+                peer_ids[object_id].append(peer_id)
+        else:
+            # Peers of a symmetric relationship may be on either side of each association
+            object_ids = set(object_ids)
+            for source_id, destination_id in associations.filter(
+                Q(source_id__in=object_ids) | Q(destination_id__in=object_ids)
+            ).values_list("source_id", "destination_id"):
+                if source_id in object_ids:
+                    peer_ids[source_id].append(destination_id)
+                if destination_id in object_ids:
+                    peer_ids[destination_id].append(source_id)
+        return peer_ids
+
+    def batch_load_fn(self, keys):  # pylint: disable=method-hidden
+        from nautobot.extras.choices import RelationshipSideChoices
+
+        peer_ids = self.get_peer_ids([obj.pk for obj in keys])
+        queryset = self.peer_model.objects.filter(id__in={pk for pks in peer_ids.values() for pk in pks})
+        if self.info is not None:
+            try:
+                queryset = gql_optimizer.query(queryset, self.info)
+            except (AttributeError, TypeError):
+                # https://github.com/nautobot/nautobot/issues/1228
+                # If querying for **only** the ID of the related object, for example:
+                # { device(id:"...") { ... rel_my_relationship { id } } }
+                # graphene_django_optimizer may raise exceptions such as:
+                # TypeError: Cannot call select_related() after .values() or .values_list()
+                # AttributeError: object has no attribute "only"
+                # This appears to be a bug in graphene_django_optimizer but no known issue has been found on GitHub.
+                # For now we just work around it by falling back to the queryset without optimization.
+                logger.debug("Caught error in graphene_django_optimizer, falling back to un-optimized query")
+        # Keep the peers in the (default) ordering of their model, as when each object's peers are queried separately
+        peers = list(queryset)
+        position = {peer.pk: index for index, peer in enumerate(peers)}
+
+        results = []
+        has_many = self.relationship.has_many(RelationshipSideChoices.OPPOSITE[self.side])
+        for obj in keys:
+            obj_peers = [peers[index] for index in sorted({position[pk] for pk in peer_ids[obj.pk] if pk in position})]
+            if has_many:
+                results.append(obj_peers)
+            else:
+                results.append(obj_peers[0] if obj_peers else None)
+        return Promise.resolve(results)
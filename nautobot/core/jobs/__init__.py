@@ -1,27 +1,57 @@
+from collections import deque
 import contextlib
 from io import BytesIO
+import itertools
+import logging
+import tempfile
+import time
 
 from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
 from django.http import QueryDict
+from kombu.exceptions import OperationalError as KombuOperationalError
+import redis.exceptions
 from rest_framework import exceptions as drf_exceptions
 
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.resolvers import RELATED_OBJECT_RESOLVER_CONTEXT_KEY, RelatedObjectResolver
 from nautobot.core.api.utils import get_serializer_for_model
-from nautobot.core.celery import app, register_jobs
+from nautobot.core.celery import app, nautobot_task, register_jobs
+from nautobot.core.constants import (
+    CSV_EXPORT_CHUNK_SIZE,
+    CSV_IMPORT_CHUNK_SIZE,
+    CSV_IMPORT_MAX_PARALLEL_CHUNKS,
+)
 from nautobot.core.exceptions import AbortTransaction
+from nautobot.core.models.querysets import iter_queryset_chunks
+from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.lookup import get_filterset_for_model
 from nautobot.core.utils.requests import get_filterable_params_from_filter_params
+from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeEventContextChoices
+from nautobot.extras.context_managers import web_request_context
 from nautobot.extras.datasources import ensure_git_repository, git_repository_dry_run, refresh_datasource_content
 from nautobot.extras.jobs import BooleanVar, ChoiceVar, FileVar, Job, ObjectVar, RunJobTaskFailed, StringVar, TextVar
-from nautobot.extras.models import ExportTemplate, GitRepository
+from nautobot.extras.models import DynamicGroup, ExportTemplate, GitRepository, JobResult
+
+logger = logging.getLogger(__name__)
 
 name = "System Jobs"
 
+# ExportObjectList logs its progress each time this percentage of the objects to export has been written
+CSV_EXPORT_PROGRESS_STEP = 10
+
+# How often, in seconds, a parallel ImportObjects Job checks whether a chunk of rows being imported by a Celery task is done
+CSV_IMPORT_POLL_INTERVAL = 0.5
+
+# How long, in seconds, a parallel ImportObjects Job waits for a Celery task to import a chunk of rows before giving up
+CSV_IMPORT_CHUNK_TIMEOUT = 600
+
 
 class GitRepositorySync(Job):
     """
@@ -184,11 +214,155 @@ class ExportObjectList(Job):
             self.logger.debug("Found serializer class: `%s`", serializer_class.__name__)
             renderer = NautobotCSVRenderer()
             self.logger.info("Exporting %d objects to CSV. This may take some time.", object_count)
-            # The force_csv=True attribute is a hack, but much easier than trying to construct a valid HttpRequest
-            # object from scratch that passes all implicit and explicit assumptions in Django and DRF.
-            serializer = serializer_class(queryset, many=True, context={"request": None}, force_csv=True)
-            csv_data = renderer.render(serializer.data)
-            self.create_file(filename + ".csv", csv_data)
+            max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
+            # Serialize and write the objects one chunk at a time, so that neither the queryset, the serialized data,
+            # nor the rendered CSV need to be held in memory all at once.
+            with tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE) as csv_file:
+                exported_count = 0
+                next_progress = CSV_EXPORT_PROGRESS_STEP
+                for chunk in iter_queryset_chunks(queryset, CSV_EXPORT_CHUNK_SIZE):
+                    # The force_csv=True attribute is a hack, but much easier than trying to construct a valid
+                    # HttpRequest object from scratch that passes all implicit and explicit assumptions in Django/DRF.
+                    serializer = serializer_class(chunk, many=True, context={"request": None}, force_csv=True)
+                    if exported_count == 0:
+                        lines = renderer.render_stream(serializer.data)
+                    else:
+                        # Skip the header line
+                        lines = itertools.islice(renderer.render_stream(serializer.data), 1, None)
+                    csv_file.write("".join(lines).encode("utf-8"))
+                    if csv_file.tell() > max_size:
+                        raise ValueError(
+                            f"Exported CSV data exceeds JOB_CREATE_FILE_MAX_SIZE of {max_size} bytes "
+                            f"after {exported_count + len(chunk)} of {object_count} objects"
+                        )
+                    exported_count += len(chunk)
+                    progress = exported_count * 100 // object_count if object_count else 100
+                    if progress >= next_progress:
+                        self.logger.info("Exported %d of %d objects", exported_count, object_count)
+                        next_progress = progress - progress % CSV_EXPORT_PROGRESS_STEP + CSV_EXPORT_PROGRESS_STEP
+                self.create_file(filename + ".csv", csv_file)
+
+
+def _iter_chunks(rows, chunk_size=None):
+    """Yield lists of up to `chunk_size` of the given rows of data at a time, consuming the rows only as needed."""
+    chunk_size = chunk_size or CSV_IMPORT_CHUNK_SIZE
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        yield chunk
+
+
+def _import_rows(rows, first_row, serializer_class, queryset, user, resolver):
+    """
+    Validate and save each of the given rows of data in turn.
+
+    Args:
+        rows (list[dict]): The rows of data, as parsed by `NautobotCSVParser`.
+        first_row (int): The number of the first of the rows in the CSV data.
+        serializer_class (type[Serializer]): The serializer to validate and save each row with.
+        queryset (QuerySet): The objects that the user is permitted to create.
+        user (User): The user importing the data.
+        resolver (RelatedObjectResolver): The resolver to look up the related objects referenced by the rows with.
+
+    Yields:
+        (tuple[int, Model, list[str]]): The number of each row, the object created from it (or None), and the errors
+            preventing its creation.
+    """
+    context = {"request": None, RELATED_OBJECT_RESOLVER_CONTEXT_KEY: resolver}
+    resolver.prefetch(serializer_class(context=context), rows)
+    for row, entry in enumerate(rows, start=first_row):
+        serializer = serializer_class(data=entry, context=context)
+        if not serializer.is_valid():
+            yield row, None, [f"`{field}`: `{err[0]}`" for field, err in serializer.errors.items()]
+            continue
+        try:
+            with transaction.atomic():
+                new_obj = serializer.save()
+                if not queryset.filter(pk=new_obj.pk).exists():
+                    raise AbortTransaction()
+        except AbortTransaction:
+            yield row, None, [f'User "{user}" does not have permission to create an object with these attributes']
+        else:
+            yield row, new_obj, []
+
+
+def _import_chunk(rows, first_row, model, user, can_commit=None):
+    """
+    Import the given chunk of rows of data in a single transaction, as part of a parallel `ImportObjects` Job.
+
+    Args:
+        can_commit (callable): Called once all of the rows have been processed; if it returns False, the entire chunk is
+            rolled back instead of being committed.
+
+    Returns:
+        (dict): The outcome of the import, either `{"rows": [[row, pk, errors], ...]}` listing the PK (or None) of the
+            object created from each row and its errors, or `{"error": message}` if the entire chunk was rolled back.
+    """
+    serializer_class = get_serializer_for_model(model)
+    queryset = model.objects.restrict(user, "add")
+    deferred_hierarchy = getattr(model.objects, "deferred_hierarchy", contextlib.nullcontext)
+    outcome = []
+    try:
+        with transaction.atomic(), deferred_hierarchy():
+            for row, new_obj, errors in _import_rows(
+                rows, first_row, serializer_class, queryset, user, RelatedObjectResolver()
+            ):
+                outcome.append([row, str(new_obj.pk) if new_obj is not None else None, errors])
+            if can_commit is not None and not can_commit():
+                raise AbortTransaction("The import of these rows was abandoned")
+    except Exception as exc:
+        logger.exception(
+            "Unable to import rows %d to %d of %s data", first_row, first_row + len(rows) - 1, model._meta.label
+        )
+        return {"error": str(exc)}
+    return {"rows": outcome}
+
+
+def _get_chunk_cache_key(job_result_id, index, suffix):
+    return f"nautobot.core.jobs.ImportObjects.{job_result_id}.{index}.{suffix}"
+
+
+@nautobot_task(ignore_result=True)
+def import_objects_chunk(job_result_id, index, content_type_id, user_id, rows, first_row, timeout):
+    """
+    Import a chunk of rows of data for a parallel `ImportObjects` Job, unless the Job has claimed the chunk itself.
+
+    The outcome of the import (see `_import_chunk()`) is stored in the cache for the Job to collect.
+    """
+    # The Job imports any chunk that no task has claimed by the time it gets to it, and has dealt with all of them once
+    # it has finished, so a task that is late to the claim has nothing to do.
+    if JobResult.objects.filter(pk=job_result_id, status__in=JobResultStatusChoices.READY_STATES).exists():
+        return
+    try:
+        if not cache.add(_get_chunk_cache_key(job_result_id, index, "claim"), "task", timeout):
+            return
+    except redis.exceptions.ConnectionError:
+        logger.warning(
+            "Unable to claim rows %d to %d, as the cache is unavailable", first_row, first_row + len(rows) - 1
+        )
+        return
+
+    def can_commit():
+        # The Job gives up on a chunk that is not imported in time, in which case the import must not be committed
+        return cache.add(_get_chunk_cache_key(job_result_id, index, "done"), "task", timeout)
+
+    try:
+        user = get_user_model().objects.get(pk=user_id)
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        # Record the changes as made by the Job, but with their own change ID, so that their webhooks and job hooks
+        # are enqueued once this chunk has been imported.
+        with web_request_context(
+            user=user, context_detail=ImportObjects.class_path, context=ObjectChangeEventContextChoices.CONTEXT_JOB
+        ):
+            outcome = _import_chunk(rows, first_row, model, user, can_commit=can_commit)
+    except Exception as exc:
+        logger.exception("Unable to import rows %d to %d", first_row, first_row + len(rows) - 1)
+        outcome = {"error": str(exc)}
+    try:
+        cache.set(_get_chunk_cache_key(job_result_id, index, "result"), outcome, timeout)
+    except redis.exceptions.ConnectionError:
+        logger.exception(
+            "Unable to record the outcome of the import of rows %d to %d", first_row, first_row + len(rows) - 1
+        )
 
 
 class ImportObjects(Job):
@@ -207,6 +381,16 @@ class ImportObjects(Job):
         default=True,
         description="If an error is encountered when processing any row of data, rollback the entire import such that no data is imported.",
     )
+    parallel = BooleanVar(
+        label="Import in Parallel",
+        required=False,
+        default=False,
+        description=(
+            f"Import the data in chunks of {CSV_IMPORT_CHUNK_SIZE} rows, each in its own transaction, across all "
+            "available Celery workers. Rows must not refer to objects created by other rows of the same import. "
+            "Not applicable when rolling back changes on failure."
+        ),
+    )
 
     template_name = "system_jobs/import_objects.html"
 
@@ -217,45 +401,176 @@ class ImportObjects(Job):
         soft_time_limit = 1800
         time_limit = 2000
 
-    def _perform_atomic_operation(self, data, serializer_class, queryset):
+    def _log_row(self, row, new_obj, errors):
+        if new_obj is not None:
+            self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
+        for error in errors:
+            self.logger.error("Row %d: %s", row, error)
+
+    def _perform_atomic_operation(self, rows, serializer_class, queryset):
         new_objs = []
+        row_count = 0
         with contextlib.suppress(AbortTransaction):
             with transaction.atomic():
-                new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
+                new_objs, row_count, validation_failed = self._perform_operation(rows, serializer_class, queryset)
                 if validation_failed:
                     raise AbortTransaction
-                return new_objs, validation_failed
+                return new_objs, row_count, validation_failed
         # If validation failed return an empty list, since all objs created where rolled back
         self.logger.warning("Rolling back all %s records.", len(new_objs))
-        return [], validation_failed
+        return [], row_count, validation_failed
 
-    def _perform_operation(self, data, serializer_class, queryset):
+    def _perform_operation(self, rows, serializer_class, queryset):
         new_objs = []
+        row_count = 0
         validation_failed = False
-        for row, entry in enumerate(data, start=1):
-            serializer = serializer_class(data=entry, context={"request": None})
-            if serializer.is_valid():
-                try:
-                    with transaction.atomic():
-                        new_obj = serializer.save()
-                        if not queryset.filter(pk=new_obj.pk).exists():
-                            raise AbortTransaction()
-                    self.logger.info('Row %d: Created record "%s"', row, new_obj, extra={"object": new_obj})
-                    new_objs.append(new_obj)
-                except AbortTransaction:
+        # Look up each related object referenced by the rows only once, and in bulk for each chunk of rows
+        resolver = RelatedObjectResolver()
+        try:
+            for chunk in _iter_chunks(rows):
+                for row, new_obj, errors in _import_rows(
+                    chunk, row_count + 1, serializer_class, queryset, self.user, resolver
+                ):
+                    self._log_row(row, new_obj, errors)
+                    if new_obj is not None:
+                        new_objs.append(new_obj)
+                    else:
+                        validation_failed = True
+                row_count += len(chunk)
+        except drf_exceptions.ParseError as exc:
+            validation_failed = True
+            self.logger.error("`%s`", exc)
+        return new_objs, row_count, validation_failed
+
+    def _perform_parallel_operation(self, rows, model):
+        """
+        Import the rows of data in chunks of `CSV_IMPORT_CHUNK_SIZE` rows, each in its own transaction, with the
+        `import_objects_chunk` Celery task, keeping up to `CSV_IMPORT_MAX_PARALLEL_CHUNKS` chunks in progress at once.
+
+        The chunks are collected in order, and any chunk that no worker has started on by then is imported by this Job
+        itself, so that the import never waits on a busy (or missing) worker. A chunk that a worker has started on but
+        not imported within `CSV_IMPORT_CHUNK_TIMEOUT` seconds (for example because the worker was restarted) is given
+        up on, and none of its rows are imported.
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        timeout = self.job_model.time_limit or settings.CELERY_TASK_TIME_LIMIT
+        new_objs = []
+        row_count = 0
+        validation_failed = False
+        pending = deque()
+
+        def wait_for_outcome(index):
+            """Wait for the outcome of a chunk claimed by a task, or give up on the chunk if it takes too long."""
+            result_key = _get_chunk_cache_key(self.job_result.pk, index, "result")
+            deadline = time.monotonic() + CSV_IMPORT_CHUNK_TIMEOUT
+            committing = False
+            while True:
+                # The cache being briefly unavailable is no different from the task not being done yet
+                with contextlib.suppress(redis.exceptions.ConnectionError):
+                    outcome = cache.get(result_key)
+                    if outcome is not None:
+                        cache.delete(result_key)
+                        return outcome
+                if time.monotonic() >= deadline:
+                    if committing:
+                        return {"unknown": f"no outcome was recorded within {CSV_IMPORT_CHUNK_TIMEOUT} seconds"}
+                    # Whichever of the Job and the task records that it is done with the chunk first decides whether
+                    # the task may commit its import of the chunk
+                    try:
+                        abandoned = cache.add(_get_chunk_cache_key(self.job_result.pk, index, "done"), "job", timeout)
+                    except redis.exceptions.ConnectionError as exc:
+                        return {"unknown": str(exc)}
+                    if abandoned:
+                        return {"timeout": f"not imported by a worker within {CSV_IMPORT_CHUNK_TIMEOUT} seconds"}
+                    # The task is committing its import, so give it the same time again to record its outcome
+                    committing = True
+                    deadline = time.monotonic() + CSV_IMPORT_CHUNK_TIMEOUT
+                time.sleep(CSV_IMPORT_POLL_INTERVAL)
+
+        def collect():
+            index, first_row, chunk = pending.popleft()
+            last_row = first_row + len(chunk) - 1
+            try:
+                claimed = cache.add(_get_chunk_cache_key(self.job_result.pk, index, "claim"), "job", timeout)
+            except redis.exceptions.ConnectionError as exc:
+                # A task may or may not have claimed the chunk, so it can't safely be imported here either
+                outcome = {"unknown": str(exc)}
+            else:
+                outcome = _import_chunk(chunk, first_row, model, self.user) if claimed else wait_for_outcome(index)
+
+            if "timeout" in outcome:
+                for row in range(first_row, last_row + 1):
                     self.logger.error(
-                        'Row %d: User "%s" does not have permission to create an object with these attributes',
-                        row,
-                        self.user,
+                        "Row %d: Not imported, as rows %d to %d were %s", row, first_row, last_row, outcome["timeout"]
                     )
-                    validation_failed = True
-            else:
-                validation_failed = True
-                for field, err in serializer.errors.items():
-                    self.logger.error("Row %d: `%s`: `%s`", row, field, err[0])
-        return new_objs, validation_failed
+                return [], True
+            if "unknown" in outcome:
+                self.logger.error(
+                    "Rows %d to %d: Unable to determine whether these rows were imported: `%s`",
+                    first_row,
+                    last_row,
+                    outcome["unknown"],
+                )
+                return [], True
+            if "error" in outcome:
+                self.logger.error(
+                    "Rows %d to %d: `%s`, none of these rows were imported",
+                    first_row,
+                    last_row,
+                    outcome["error"],
+                )
+                return [], True
+            created = {
+                str(pk): obj
+                for pk, obj in model.objects.in_bulk([pk for _, pk, _ in outcome["rows"] if pk is not None]).items()
+            }
+            chunk_objs = []
+            for row, pk, errors in outcome["rows"]:
+                new_obj = created.get(pk)
+                self._log_row(row, new_obj, errors)
+                if new_obj is not None:
+                    chunk_objs.append(new_obj)
+            return chunk_objs, any(errors for _, _, errors in outcome["rows"])
 
-    def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False):
+        try:
+            for index, chunk in enumerate(_iter_chunks(rows)):
+                try:
+                    import_objects_chunk.apply_async(
+                        args=[
+                            str(self.job_result.pk),
+                            index,
+                            content_type.pk,
+                            str(self.user.pk),
+                            chunk,
+                            row_count + 1,
+                            timeout,
+                        ],
+                        queue=self.celery_kwargs.get("queue"),
+                    )
+                except KombuOperationalError as exc:
+                    # The chunk will be imported by this Job once it gets to it
+                    self.logger.warning("Unable to enqueue the import of rows %d onwards: %s", row_count + 1, exc)
+                pending.append((index, row_count + 1, chunk))
+                row_count += len(chunk)
+                if len(pending) >= CSV_IMPORT_MAX_PARALLEL_CHUNKS:
+                    chunk_objs, chunk_failed = collect()
+                    new_objs += chunk_objs
+                    validation_failed |= chunk_failed
+        except drf_exceptions.ParseError as exc:
+            validation_failed = True
+            self.logger.error("`%s`", exc)
+        while pending:
+            chunk_objs, chunk_failed = collect()
+            new_objs += chunk_objs
+            validation_failed |= chunk_failed
+
+        # Chunks imported concurrently can't see each other's objects (such as the parent of a Prefix), so any
+        # hierarchy is recalculated for all of the objects once every chunk has been imported.
+        if new_objs and hasattr(model.objects, "update_hierarchy"):
+            model.objects.update_hierarchy(new_objs)
+        return new_objs, row_count, validation_failed
+
+    def run(self, *, content_type, csv_data=None, csv_file=None, roll_back_if_error=False, parallel=False):
         if not self.user.has_perm(f"{content_type.app_label}.add_{content_type.model}"):
             self.logger.error('User "%s" does not have permission to create %s objects', self.user, content_type.model)
             raise PermissionDenied("User does not have create permissions on the requested content-type")
@@ -286,24 +601,33 @@ class ImportObjects(Job):
         else:
             csv_bytes = BytesIO(csv_data.encode("utf-8"))
 
-        new_objs = []
-        try:
-            data = NautobotCSVParser().parse(
-                stream=csv_bytes,
-                parser_context={"request": None, "serializer_class": serializer_class},
-            )
-            self.logger.info("Processing %d rows of data", len(data))
-            if roll_back_if_error:
-                new_objs, validation_failed = self._perform_atomic_operation(data, serializer_class, queryset)
-            else:
-                new_objs, validation_failed = self._perform_operation(data, serializer_class, queryset)
-        except drf_exceptions.ParseError as exc:
-            validation_failed = True
-            self.logger.error("`%s`", exc)
+        if parallel and roll_back_if_error:
+            self.logger.warning("Rolling back changes on failure requires a single transaction, importing sequentially")
+            parallel = False
+
+        # The rows of data are parsed only as they are imported, rather than reading the entire CSV data into memory
+        rows = NautobotCSVParser().iter_rows(
+            stream=csv_bytes,
+            parser_context={"request": None, "serializer_class": serializer_class},
+        )
+        if parallel:
+            self.logger.info("Processing rows of data in parallel, in chunks of %d rows", CSV_IMPORT_CHUNK_SIZE)
+            new_objs, row_count, validation_failed = self._perform_parallel_operation(rows, model)
+        else:
+            self.logger.info("Processing rows of data")
+            # Some models (such as Prefix) can defer maintaining their hierarchy until all rows have been imported
+            deferred_hierarchy = getattr(model.objects, "deferred_hierarchy", contextlib.nullcontext)
+            with deferred_hierarchy():
+                if roll_back_if_error:
+                    new_objs, row_count, validation_failed = self._perform_atomic_operation(
+                        rows, serializer_class, queryset
+                    )
+                else:
+                    new_objs, row_count, validation_failed = self._perform_operation(rows, serializer_class, queryset)
 
         if new_objs:
             self.logger.info(
-                "Created %d %s object(s) from %d row(s) of data", len(new_objs), content_type.model, len(data)
+                "Created %d %s object(s) from %d row(s) of data", len(new_objs), content_type.model, row_count
             )
         else:
             self.logger.warning("No %s objects were created", content_type.model)
@@ -314,5 +638,40 @@ class ImportObjects(Job):
             raise RunJobTaskFailed("CSV import not fully successful, see logs")
 
 
-jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects]
+class RefreshDynamicGroupCaches(Job):
+    """
+    System Job to recompute the member cache tables of Dynamic Groups.
+
+    Object saves keep the member caches up to date incrementally, but changes that do not save the member objects
+    themselves (such as bulk updates, or changes to related objects that a group's filter refers to) are only picked
+    up when the caches are recomputed, so this Job is suitable for running on a schedule.
+    """
+
+    single_group = ObjectVar(
+        model=DynamicGroup,
+        required=False,
+        description="Only refresh the member cache of this Dynamic Group",
+    )
+
+    class Meta:
+        name = "Refresh Dynamic Group Caches"
+        has_sensitive_variables = False
+
+    def run(self, single_group=None):
+        if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+            self.logger.warning(
+                "DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT is set to 0; Dynamic Group member caching is disabled"
+            )
+            return
+
+        groups = DynamicGroup.objects.restrict(self.user, "view")
+        if single_group is not None:
+            groups = groups.filter(pk=single_group.pk)
+        for group in groups:
+            group.update_cached_members()
+            self.logger.debug("Refreshed the member cache of Dynamic Group %s", group, extra={"object": group})
+        self.logger.info("Refreshed the member caches of %d Dynamic Group(s)", groups.count())
+
+
+jobs = [ExportObjectList, GitRepositorySync, GitRepositoryDryRun, ImportObjects, RefreshDynamicGroupCaches]
 register_jobs(*jobs)
@@ -1,3 +1,6 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import NotSupportedError
 from django.db.models import Aggregate, Func, JSONField
 
@@ -68,3 +71,62 @@ class EmptyGroupByJSONBAgg(JSONBAgg):
     """
 
     contains_aggregate = False
+
+
+class JSONSet(Func):
+    """
+    Set the given top-level `key` of a JSON object field to the given `value`, adding the key if not already present.
+
+    Supports both Postgres (`||` with `JSONB_BUILD_OBJECT`) and MySQL (`JSON_SET`). Usable in `QuerySet.update()`:
+
+    Example:
+        >>> Location.objects.update(_custom_field_data=JSONSet("_custom_field_data", "my_field", "some value"))
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, value, **extra):
+        self.key = key
+        self.value = value
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONSet is not supported for database {connection.vendor}")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        value = json.dumps(self.value, cls=DjangoJSONEncoder)
+        return f"({sql} || JSONB_BUILD_OBJECT(%s, %s::jsonb))", [*params, self.key, value]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        value = json.dumps(self.value, cls=DjangoJSONEncoder)
+        return f"JSON_SET({sql}, %s, CAST(%s AS JSON))", [*params, f'$."{self.key}"', value]
+
+
+class JSONRemove(Func):
+    """
+    Remove the given top-level `key`, if present, from a JSON object field.
+
+    Supports both Postgres (`-`) and MySQL (`JSON_REMOVE`). Usable in `QuerySet.update()`:
+
+    Example:
+        >>> Location.objects.update(_custom_field_data=JSONRemove("_custom_field_data", "my_field"))
+    """
+
+    output_field = JSONField()
+
+    def __init__(self, expression, key, **extra):
+        self.key = key
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f"JSONRemove is not supported for database {connection.vendor}")
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"({sql} - %s)", [*params, self.key]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSON_REMOVE({sql}, %s)", [*params, f'$."{self.key}"']
@@ -1,4 +1,4 @@
-from django.db.models import Count, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Count, OuterRef, prefetch_related_objects, QuerySet, Subquery
 from django.db.models.functions import Coalesce
 
 from nautobot.core.models.utils import deconstruct_composite_key
@@ -32,6 +32,29 @@ def count_related(model, field, *, filter_dict=None, distinct=False):
     return Coalesce(subquery, 0)
 
 
+def iter_queryset_chunks(queryset, chunk_size):
+    """
+    Iterate over the given queryset in lists of at most `chunk_size` objects, without caching its results.
+
+    Unlike `queryset.iterator()` on its own, any `prefetch_related()` lookups on the queryset are applied to each chunk.
+
+    Args:
+        queryset (QuerySet): The queryset to iterate over
+        chunk_size (int): The number of objects to retrieve from the database at a time
+    """
+    prefetch_lookups = queryset._prefetch_related_lookups
+    chunk = []
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            prefetch_related_objects(chunk, *prefetch_lookups)
+            yield chunk
+            chunk = []
+    if chunk:
+        prefetch_related_objects(chunk, *prefetch_lookups)
+        yield chunk
+
+
 class CompositeKeyQuerySetMixin:
     """
     Mixin to extend a base queryset class with support for filtering by `composite_key=...` as a virtual parameter.
@@ -129,12 +152,7 @@ class RestrictedQuerySet(CompositeKeyQuerySetMixin, QuerySet):
 
         # Filter the queryset to include only objects with allowed attributes
         else:
-            attrs = Q()
-            tokens = {
-                "$user": user,
-            }
-
-            attrs = permissions.qs_filter_from_constraints(user._object_perm_cache[permission_required], tokens)
+            attrs = permissions.qs_filter_from_user_permission(user, permission_required)
             qs = self.filter(attrs)
 
         return qs
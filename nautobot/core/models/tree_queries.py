@@ -1,5 +1,6 @@
+from django.conf import settings
 from django.core.cache import cache
-from django.db.models import Case, When
+from django.db.models import Case, OuterRef, Subquery, When
 from tree_queries.models import TreeNode
 from tree_queries.query import TreeManager as TreeManager_, TreeQuerySet as TreeQuerySet_
 
@@ -14,9 +15,22 @@ class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
     def ancestors(self, of, *, include_self=False):
         """Custom ancestors method for optimization purposes.
 
-        Dynamically computes ancestors either through the tree or through the `parent` foreign key depending on whether
-        tree fields are present on `of`.
+        Looks up ancestors through the tree ancestor index if `settings.TREE_ANCESTOR_INDEX_ENABLED` is set and `of` (a
+        node or its primary key) has been saved to the database; otherwise dynamically computes ancestors either through
+        the tree or through the `parent` foreign key depending on whether tree fields are present on `of`.
         """
+        if settings.TREE_ANCESTOR_INDEX_ENABLED and not getattr(getattr(of, "_state", None), "adding", False):
+            from nautobot.extras.models import TreeModelAncestor
+
+            index = TreeModelAncestor.objects.filter(
+                descendant_id=getattr(of, "pk", of), depth__gte=0 if include_self else 1
+            )
+            depth = Subquery(index.filter(ancestor_id=OuterRef("pk")).values("depth")[:1])
+            return (
+                self.model._meta.concrete_model.objects.without_tree_fields()
+                .filter(pk__in=index.values("ancestor_id"))
+                .order_by(depth.desc())
+            )
         # If `of` has `tree_depth` defined, i.e. if it was retrieved from the database on a queryset where tree fields
         # were enabled (see `TreeQuerySet.with_tree_fields` and `TreeQuerySet.without_tree_fields`), use the default
         # implementation from `tree_queries.query.TreeQuerySet`.
@@ -38,6 +52,22 @@ class TreeQuerySet(TreeQuerySet_, querysets.RestrictedQuerySet):
         preserve_order = Case(*[When(pk=pk, then=position) for position, pk in enumerate(ancestor_pks)])
         return model_class.objects.without_tree_fields().filter(pk__in=ancestor_pks).order_by(preserve_order)
 
+    def descendants(self, of, *, include_self=False):
+        """Custom descendants method for optimization purposes.
+
+        Looks up descendants through the tree ancestor index if `settings.TREE_ANCESTOR_INDEX_ENABLED` is set, rather
+        than by matching against the tree path of every node. Tree fields are only annotated (and the descendants only
+        ordered depth-first) if they are enabled on this queryset, so use `.without_tree_fields().descendants(...)` to
+        avoid querying the tree altogether.
+        """
+        if not settings.TREE_ANCESTOR_INDEX_ENABLED:
+            return super().descendants(of, include_self=include_self)
+
+        from nautobot.extras.models import TreeModelAncestor
+
+        index = TreeModelAncestor.objects.filter(ancestor_id=getattr(of, "pk", of), depth__gte=0 if include_self else 1)
+        return self.filter(pk__in=index.values("descendant_id"))
+
     def max_tree_depth(self):
         r"""
         Get the maximum tree depth of any node in this queryset.
@@ -95,6 +125,14 @@ class TreeModel(TreeNode):
     class Meta:
         abstract = True
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Used to skip updating the tree ancestor index on save unless the parent has changed
+        if "parent_id" in instance.__dict__:
+            instance._original_parent_id = instance.parent_id
+        return instance
+
     @property
     def display(self):
         """
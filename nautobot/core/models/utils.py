@@ -1,13 +1,19 @@
+from collections import defaultdict
+import functools
 from itertools import count, groupby
 import json
+import threading
 import unicodedata
 from urllib.parse import quote_plus, unquote_plus
 
 from django.apps import apps
 from django.core.exceptions import FieldDoesNotExist
-from django.core.serializers import serialize
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import prefetch_related_objects
+from django.utils.encoding import is_protected_type
 from django.utils.tree import Node
 import emoji
+import redis.exceptions
 from slugify import slugify
 
 from nautobot.core import constants
@@ -96,15 +102,58 @@ def pretty_print_query(query):
     return pretty_str(query)
 
 
+_json_encoder = DjangoJSONEncoder()
+
+
+def _json_value(value):
+    """Convert a value as if it were encoded with Django's `DjangoJSONEncoder` and decoded again."""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        return json.loads(json.dumps(value, cls=DjangoJSONEncoder))
+    return _json_encoder.default(value)
+
+
+@functools.lru_cache(maxsize=None)
+def get_serialized_fields(model):
+    """
+    Get the fields of the given model that are included in `serialize_object()` representations of its instances.
+
+    These are the same fields that Django's built-in serializer includes, in the same order.
+
+    Returns:
+        (tuple): A tuple of (fields, many-to-many fields).
+    """
+    concrete_model = model._meta.concrete_model
+    fields = tuple(field for field in concrete_model._meta.local_fields if field.serialize)
+    m2m_fields = tuple(
+        field
+        for field in concrete_model._meta.local_many_to_many
+        if field.serialize and field.remote_field.through._meta.auto_created
+    )
+    return fields, m2m_fields
+
+
+def _serialized_value(obj, field):
+    # Same as django.core.serializers.python.Serializer._value_from_field()
+    value = field.value_from_object(obj)
+    return _json_value(value if is_protected_type(value) else field.value_to_string(obj))
+
+
 def serialize_object(obj, extra=None, exclude=None):
     """
-    Return a generic JSON representation of an object using Django's built-in serializer. (This is used for things like
-    change logging, not the REST API.) Optionally include a dictionary to supplement the object data. A list of keys
-    can be provided to exclude them from the returned dictionary. Private fields (prefaced with an underscore) are
-    implicitly excluded.
+    Return a generic JSON representation of an object, identical to that of Django's built-in serializer. (This is used
+    for things like change logging, not the REST API.) Optionally include a dictionary to supplement the object data. A
+    list of keys can be provided to exclude them from the returned dictionary. Private fields (prefaced with an
+    underscore) are implicitly excluded.
     """
-    json_str = serialize("json", [obj])
-    data = json.loads(json_str)[0]["fields"]
+    fields, m2m_fields = get_serialized_fields(obj.__class__)
+    data = {field.name: _serialized_value(obj, field) for field in fields}
+    for field in m2m_fields:
+        related_objects = getattr(obj, "_prefetched_objects_cache", {}).get(field.name)
+        if related_objects is None:
+            related_objects = getattr(obj, field.name).iterator()
+        data[field.name] = [_serialized_value(related, related._meta.pk) for related in related_objects]
 
     # Include custom_field_data as "custom_fields"
     if hasattr(obj, "_custom_field_data"):
@@ -132,22 +181,75 @@ def serialize_object(obj, extra=None, exclude=None):
     return data
 
 
+# Instances of REST API serializers, per thread and serializer class, reused by serialize_object_v2()
+_object_serializers = threading.local()
+
+
+def get_object_serializer(model):
+    """
+    Get an instance of the REST API serializer of the given model, for use by `serialize_object_v2()`.
+
+    Constructing the fields of a serializer takes much longer than representing an object with them, so serializer
+    instances (and thereby their fields) are constructed only once per serializer class and thread, and then reused
+    until the custom fields or relationships that their fields are derived from change.
+
+    Raises:
+        (SerializerNotFound): If the model has no REST API serializer.
+    """
+    from nautobot.core.api.utils import get_serializer_for_model
+    from nautobot.core.filters import get_dynamic_filters_cache_version
+
+    serializer_class = get_serializer_for_model(model)
+    try:
+        # Bumped in all processes whenever a custom field or relationship changes, see invalidate_models_cache()
+        version = get_dynamic_filters_cache_version()
+    except redis.exceptions.ConnectionError:
+        version = None
+    if version is None or getattr(_object_serializers, "version", None) != version:
+        _object_serializers.version = version
+        _object_serializers.serializers = {}
+    serializers = _object_serializers.serializers
+    if serializer_class not in serializers:
+        serializer = serializer_class(context={"request": None, "depth": 1})
+        # Construct the fields now, as the serializer's depth is only applied until another serializer is instantiated
+        serializer.fields  # pylint: disable=pointless-statement
+        serializers[serializer_class] = serializer
+    return serializers[serializer_class]
+
+
 def serialize_object_v2(obj):
     """
     Return a JSON serialized representation of an object using obj's serializer.
     """
     from nautobot.core.api.exceptions import SerializerNotFound
-    from nautobot.core.api.utils import get_serializer_for_model
 
     # Try serializing obj(model instance) using its API Serializer
     try:
-        serializer_class = get_serializer_for_model(obj.__class__)
-        data = serializer_class(obj, context={"request": None, "depth": 1}).data
+        serializer = get_object_serializer(obj.__class__)
     except SerializerNotFound:
         # Fall back to generic JSON representation of obj
-        data = serialize_object(obj)
+        return serialize_object(obj)
 
-    return data
+    return serializer.to_representation(obj)
+
+
+def prefetch_serialized_related_objects(objs):
+    """
+    Fetch the objects directly related to each of the given objects, as included in `serialize_object_v2()`
+    representations, with a single query per model and relation, rather than one query per object and relation.
+
+    Related objects that are already cached on an object are not fetched again.
+    """
+    objs_by_model = defaultdict(list)
+    for obj in objs:
+        objs_by_model[obj.__class__].append(obj)
+    for model, model_objs in objs_by_model.items():
+        relation_names = [
+            field.name
+            for field in model._meta.concrete_model._meta.get_fields()
+            if (field.many_to_one or field.one_to_one) and not field.auto_created
+        ]
+        prefetch_related_objects(model_objs, *relation_names)
 
 
 def find_models_with_matching_fields(app_models, field_names, field_attributes=None):
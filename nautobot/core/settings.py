@@ -81,6 +81,10 @@ if "NAUTOBOT_BANNER_TOP" in os.environ and os.environ["NAUTOBOT_BANNER_TOP"] !=
 if "NAUTOBOT_CHANGELOG_RETENTION" in os.environ and os.environ["NAUTOBOT_CHANGELOG_RETENTION"] != "":
     CHANGELOG_RETENTION = int(os.environ["NAUTOBOT_CHANGELOG_RETENTION"])
 
+# Record ObjectChanges together, once the changes of each request (or job) have been committed, rather than each as
+# soon as the change is made.
+CHANGELOG_WRITE_BEHIND_ENABLED = is_truthy(os.getenv("NAUTOBOT_CHANGELOG_WRITE_BEHIND_ENABLED", "False"))
+
 # Disable linking of Config Context objects via Dynamic Groups by default. This could cause performance impacts
 # when a large number of dynamic groups are present
 CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED = is_truthy(os.getenv("NAUTOBOT_CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED", "False"))
@@ -96,7 +100,7 @@ if "NAUTOBOT_DEPLOYMENT_ID" in os.environ and os.environ["NAUTOBOT_DEPLOYMENT_ID
 if "NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY" in os.environ and os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"] != "":
     DEVICE_NAME_AS_NATURAL_KEY = is_truthy(os.environ["NAUTOBOT_DEVICE_NAME_AS_NATURAL_KEY"])
 
-# The number of seconds to cache the member list of dynamic groups. Set this to `0` to disable caching.
+# Enables the member cache tables of dynamic groups, if non-zero. Set this to `0` to disable caching.
 if (
     "NAUTOBOT_DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT" in os.environ
     and os.environ["NAUTOBOT_DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT"] != ""
@@ -247,6 +251,11 @@ TEST_USE_FACTORIES = is_truthy(os.getenv("NAUTOBOT_TEST_USE_FACTORIES", "False")
 # Pseudo-random number generator seed, for reproducibility of test results.
 TEST_FACTORY_SEED = os.getenv("NAUTOBOT_TEST_FACTORY_SEED", None)
 
+# Maintain a persisted index of the ancestors of each tree model node (such as Locations), and use it to look up
+# ancestors and descendants rather than querying the tree recursively. Run `nautobot-server rebuild_tree_ancestors`
+# when enabling it.
+TREE_ANCESTOR_INDEX_ENABLED = is_truthy(os.getenv("NAUTOBOT_TREE_ANCESTOR_INDEX_ENABLED", "False"))
+
 #
 # django-slowtests
 #
@@ -716,10 +725,12 @@ CONSTANCE_CONFIG = {
     ),
     "DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT": ConstanceConfigItem(
         default=0,
-        help_text="Dynamic Group member cache timeout in seconds. This is the amount of time that a Dynamic Group's member list "
-        "will be cached in Django cache backend. Since retrieving the member list of a Dynamic Group can be a very "
-        "expensive operation, especially in reverse, this cache is used to speed up the process of retrieving the "
-        "member list. This cache is invalidated when a Dynamic Group is saved. Set to 0 to disable caching.",
+        help_text="Dynamic Group member cache timeout in seconds. Since retrieving the member list of a Dynamic Group can be a "
+        "very expensive operation, especially in reverse, any non-zero value enables recording the members of each "
+        "Dynamic Group in a member cache table, which is kept up to date as objects are saved and deleted, and is entirely "
+        "recomputed once it is older than this number of seconds. This is also "
+        "the amount of time that the list of Dynamic Groups applicable to each content type will be cached in Django "
+        "cache backend. Set to 0 to disable caching.",
         field_type=int,
     ),
     "JOB_CREATE_FILE_MAX_SIZE": ConstanceConfigItem(
@@ -473,10 +473,17 @@ class ComputedFieldColumn(django_tables2.Column):
         kwargs["verbose_name"] = computedfield.label
         kwargs["empty_values"] = []
         kwargs["orderable"] = False
+        self.rendered_values = {}
 
         super().__init__(*args, **kwargs)
 
-    def render(self, record):
+    def render(self, record, table):
+        # Render the computed field for all records on the current page at once
+        if record.pk not in self.rendered_values:
+            records = [row.record for row in table.paginated_rows]
+            self.rendered_values = dict(zip((r.pk for r in records), self.computedfield.render_many(records)))
+        if record.pk in self.rendered_values:
+            return self.rendered_values[record.pk]
         return self.computedfield.render({"obj": record})
 
 
@@ -515,29 +522,35 @@ class RelationshipColumn(django_tables2.Column):
     Display relationship association instances in the appropriate format.
     """
 
-    # Add [] to empty_values so when there is no relationship associations i.e. [], "—" is returned automatically.
-    empty_values = (None, "", [])
-
     def __init__(self, relationship, side, *args, **kwargs):
         self.relationship = relationship
         self.side = side
         self.peer_side = choices.RelationshipSideChoices.OPPOSITE[side]
         kwargs.setdefault("verbose_name", relationship.get_label(side))
-        kwargs.setdefault("accessor", Accessor("associations"))
+        # The associations are looked up in render(), so there is no value to access and the column is never "empty"
+        kwargs["empty_values"] = []
         super().__init__(orderable=False, *args, **kwargs)
 
-    def render(self, record, value):  # pylint: disable=arguments-differ
-        # Filter the relationship associations by the relationship instance.
-        # Since associations accessor returns all the relationship associations regardless of the relationship.
-        value = [v for v in value if v.relationship == self.relationship]
-        if not self.relationship.symmetric:
-            if self.side == choices.RelationshipSideChoices.SIDE_SOURCE:
-                value = [v for v in value if v.source_id == record.id]
-            else:
-                value = [v for v in value if v.destination_id == record.id]
+    def get_associations(self, record, table):
+        """
+        Get the associations of `record` for this column's relationship and side.
 
-        # Handle Symmetric Relationships
-        # List `value` could be empty here [] after the filtering from above
+        The relationships of all records on the current page are loaded at once, and shared by all relationship columns
+        of the table.
+        """
+        relationships = getattr(table, "_relationships_by_pk", None)
+        if relationships is None or record.pk not in relationships:
+            records = [row.record for row in table.paginated_rows]
+            if record not in records:
+                records.append(record)
+            relationships = type(record).get_relationships_for_objects(records, include_hidden=True)
+            table._relationships_by_pk = relationships
+        return relationships[record.pk][self.side].get(self.relationship, [])
+
+    def render(self, record, table):  # pylint: disable=arguments-differ
+        value = self.get_associations(record, table)
+
+        # List `value` could be empty here [] if there are no associations or the relationship doesn't apply to record
         if len(value) < 1:
             return "—"
 
@@ -569,17 +569,20 @@ class APIViewTestCases:
                 f'attachment; filename="nautobot_{self.model.__name__.lower()}_data.csv"',
             )
 
+            # CSV list responses are streamed
+            self.assertTrue(response_1.streaming)
+            csv_data_1 = b"".join(response_1.streaming_content).decode(response_1.charset)
+            csv_data_2 = b"".join(response_2.streaming_content).decode(response_2.charset)
+
             self.maxDiff = None
             # This check is more useful than it might seem. Any related object that wasn't CSV-converted correctly
             # will likely be rendered incorrectly as an API URL, and that API URL *will* differ between the
             # two responses based on the inclusion or omission of the "?format=csv" parameter. If
             # you run into this, make sure all serializers have `Meta.fields = "__all__"` set.
-            self.assertEqual(
-                response_1.content.decode(response_1.charset), response_2.content.decode(response_2.charset)
-            )
+            self.assertEqual(csv_data_1, csv_data_2)
 
             # Load the csv data back into a list of object dicts
-            reader = csv.DictReader(StringIO(response_1.content.decode(response_1.charset)))
+            reader = csv.DictReader(StringIO(csv_data_1))
             rows = list(reader)
             # Should only have one entry (instance1) since we filtered out instance2 and permissions block instance3
             self.assertEqual(1, len(rows))
@@ -1159,6 +1162,8 @@ class APIViewTestCases:
 
 @tag("unit")
 class APITransactionTestCase(_APITransactionTestCase, mixins.NautobotTestCaseMixin):
+    client_class = mixins.NautobotTestClient
+
     def setUp(self):
         """
         Create a superuser and token for API calls.
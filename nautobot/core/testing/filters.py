@@ -91,6 +91,23 @@ class FilterTestCases:
             self.assertTrue(filterset.is_valid())
             self.assertEqual(filterset.qs.count(), 2)
 
+        @tag("performance")
+        def test_filterset_construction(self):
+            """
+            Verify that constructing the filterset repeatedly gives each instance its own, complete, set of filters.
+
+            As a `performance` test, this also serves as a benchmark of the time taken to construct the filterset.
+            """
+            filtersets = [self.filterset({}, self.queryset) for _ in range(10)]
+            expected_filters = {name: type(filter_) for name, filter_ in filtersets[0].get_filters().items()}
+            expected_filters.update({name: type(filter_) for name, filter_ in filtersets[0].filters.items()})
+            for filterset in filtersets:
+                self.assertEqual({name: type(filter_) for name, filter_ in filterset.filters.items()}, expected_filters)
+            for name, filter_ in filtersets[0].filters.items():
+                self.assertIsNot(filter_, filtersets[1].filters[name])
+                if getattr(filter_, "queryset", None) is not None:
+                    self.assertIsNot(filter_.queryset, filtersets[1].filters[name].queryset)
+
         def test_invalid_filter(self):
             """Verify that the filterset reports as invalid when initialized with an unsupported filter parameter."""
             params = {"ice_cream_flavor": ["chocolate"]}
@@ -60,3 +60,6 @@ METRICS_AUTHENTICATED = True
 
 DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT = 0
 CONTENT_TYPE_CACHE_TIMEOUT = 0
+
+# Exercise the tree ancestor index, which is disabled by default, throughout the test suite
+TREE_ANCESTOR_INDEX_ENABLED = True
@@ -9,7 +9,9 @@ from constance.test import override_config
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings, RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.exceptions import ParseError
@@ -20,6 +22,7 @@ from nautobot.circuits.models import Provider
 from nautobot.core import testing
 from nautobot.core.api.parsers import NautobotCSVParser
 from nautobot.core.api.renderers import NautobotCSVRenderer
+from nautobot.core.api.resolvers import RelatedObjectResolver
 from nautobot.core.api.utils import get_serializer_for_model, get_view_name
 from nautobot.core.api.versioning import NautobotAPIVersioning
 from nautobot.core.constants import COMPOSITE_KEY_SEPARATOR
@@ -47,6 +50,16 @@ class AppTest(testing.APITestCase):
 
         self.assertEqual(response.status_code, 200)
 
+    def test_get_object_counts(self):
+        url = reverse("ui-api:get-object-counts")
+        self.add_permissions("dcim.view_device", "extras.view_status")
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        counts = {entry["model"]: entry.get("count") for entries in response.data.values() for entry in entries}
+        self.assertEqual(counts["dcim.device"], dcim_models.Device.objects.count())
+        self.assertEqual(counts["extras.status"], extras_models.Status.objects.count())
+        self.assertIsNone(counts["ipam.prefix"])
+
     def test_non_existent_resource(self):
         url = reverse("api-root")
         response = self.client.get(f"{url}/non-existent-resource-url/", **self.header)
@@ -185,6 +198,48 @@ class APIPaginationTestCase(testing.APITestCase):
         self.assertHttpStatus(response, 200)
         self.assertEqual(len(response.data["results"]), config.MAX_PAGE_SIZE)
 
+    def _get_all_cursor_pages(self, url):
+        results = []
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, 200)
+            self.assertNotIn("count", response.data)
+            self.assertLessEqual(len(response.data["results"]), 3)
+            results.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+        return results
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination(self):
+        """Request pages with cursor pagination and verify that all objects are returned, in order, without counting."""
+        expected = [str(pk) for pk in Provider.objects.order_by("pk").values_list("pk", flat=True)]
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self._get_all_cursor_pages(f"{self.url}?cursor=&limit=3"), expected)
+        self.assertFalse([query for query in queries.captured_queries if '"__count"' in query["sql"]])
+
+        # Providers may share the same sort key, in which case they are ordered by primary key
+        Provider.objects.filter(pk__in=expected[:4]).update(account="12345")
+        expected = [str(pk) for pk in Provider.objects.order_by("-account", "-pk").values_list("pk", flat=True)]
+        self.assertEqual(self._get_all_cursor_pages(f"{self.url}?cursor=&limit=3&sort=-account"), expected)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination_errors(self):
+        """Invalid cursors and sort fields are rejected."""
+        response = self.client.get(f"{self.url}?cursor=notacursor", **self.header)
+        self.assertHttpStatus(response, 404)
+        response = self.client.get(f"{self.url}?cursor=&sort=asn", **self.header)
+        self.assertHttpStatus(response, 400)
+        response = self.client.get(f"{self.url}?cursor=&sort=name,asn", **self.header)
+        self.assertHttpStatus(response, 400)
+
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"], PAGINATE_COUNT=5, MAX_PAGE_SIZE=10)
+    def test_cursor_pagination_tree_model(self):
+        """Cursor pagination also works on tree models."""
+        url = reverse("dcim-api:location-list")
+        queryset = dcim_models.Location.objects.without_tree_fields().order_by("name", "pk")
+        expected = [str(pk) for pk in queryset.values_list("pk", flat=True)]
+        self.assertEqual(self._get_all_cursor_pages(f"{url}?cursor=&limit=3&sort=name"), expected)
+
 
 class APIVersioningTestCase(testing.APITestCase):
     """
@@ -755,6 +810,100 @@ class WritableNestedSerializerTest(testing.APITestCase):
         self.assertEqual(ipam_models.VLAN.objects.filter(name="Test VLAN 100").count(), 0)
 
 
+class RelatedObjectResolverTest(testing.APITestCase):
+    """
+    Test the lookup of related objects by RelatedObjectResolver, using VLANSerializer as our test subject.
+    """
+
+    def setUp(self):
+        super().setUp()
+        location_type = dcim_models.LocationType.objects.get(name="Campus")
+        location_type.content_types.add(ContentType.objects.get_for_model(ipam_models.VLANGroup))
+        self.status = extras_models.Status.objects.get_for_model(ipam_models.VLAN).first()
+        self.location = dcim_models.Location.objects.create(
+            location_type=location_type,
+            name="Resolver Location",
+            status=extras_models.Status.objects.get_for_model(dcim_models.Location).first(),
+        )
+        self.vlan_groups = [
+            ipam_models.VLANGroup.objects.create(name=f"Resolver VLANGroup {num}", location=self.location)
+            for num in range(3)
+        ]
+
+    def test_prefetch(self):
+        """Objects referenced by PK, by attributes, and by composite-key are each looked up at once."""
+        resolver = RelatedObjectResolver()
+        serializer = ipam_serializers.VLANSerializer(context={"request": None})
+        data = [
+            {"vlan_group": self.vlan_groups[0].pk, "status": {"name": self.status.name}},
+            {"vlan_group": {"name": self.vlan_groups[1].name}, "status": {"name": self.status.name}},
+            {"vlan_group": self.vlan_groups[2].composite_key, "status": self.status.composite_key},
+            {"vlan_group": {"name": "No such VLANGroup"}, "status": None},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            resolver.prefetch(serializer, data)
+        # One query for the VLANGroups referenced by PK, one for those referenced by name (or composite-key), one for Status
+        self.assertEqual(len([query for query in queries if query["sql"].startswith("SELECT")]), 3)
+
+        queryset = ipam_models.VLANGroup.objects.all()
+        with self.assertNumQueries(0):
+            self.assertEqual(resolver.get(queryset, {"pk": self.vlan_groups[0].pk}), self.vlan_groups[0])
+            self.assertEqual(resolver.get(queryset, {"name": self.vlan_groups[1].name}), self.vlan_groups[1])
+            self.assertEqual(resolver.get(queryset, {"name": self.vlan_groups[2].name}), self.vlan_groups[2])
+            self.assertEqual(
+                resolver.get(serializer.fields["status"].queryset, {"name": self.status.name}),
+                self.status,
+            )
+
+        # Objects not found aren't remembered, as they may be created later
+        vlan_group = ipam_models.VLANGroup.objects.create(name="No such VLANGroup")
+        self.assertEqual(resolver.get(queryset, {"name": "No such VLANGroup"}), vlan_group)
+
+    def test_prefetch_ambiguous(self):
+        """References matching more than one object are left for get() to report."""
+        dcim_models.Location.objects.create(
+            location_type=dcim_models.LocationType.objects.get(name="Building"),
+            name=self.location.name,
+            status=self.location.status,
+        )
+        resolver = RelatedObjectResolver()
+        resolver.prefetch(ipam_serializers.VLANSerializer(), [{"location": {"name": self.location.name}}])
+        with self.assertRaises(dcim_models.Location.MultipleObjectsReturned):
+            resolver.get(dcim_models.Location.objects.all(), {"name": self.location.name})
+
+    def test_bulk_create(self):
+        """Related objects are looked up in a constant number of queries regardless of the number of objects created."""
+        url = reverse("ipam-api:vlan-list")
+        self.add_permissions("ipam.add_vlan")
+
+        def get_vlan_group_queries(vids):
+            data = [
+                {
+                    "vid": vid,
+                    "name": f"Resolver VLAN {vid}",
+                    "status": {"name": self.status.name},
+                    "vlan_group": {"name": self.vlan_groups[vid % 3].name},
+                }
+                for vid in vids
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_201_CREATED)
+            # Not counting the queries of model validation checking that the related objects exist
+            return [
+                query
+                for query in queries
+                if 'FROM "ipam_vlangroup"' in query["sql"] and not query["sql"].startswith('SELECT (1) AS "a"')
+            ]
+
+        self.assertEqual(len(get_vlan_group_queries(range(1, 4))), len(get_vlan_group_queries(range(4, 13))))
+        vlans = ipam_models.VLAN.objects.filter(name__startswith="Resolver VLAN")
+        self.assertEqual(vlans.count(), 12)
+        for vlan in vlans:
+            self.assertEqual(vlan.vlan_group, self.vlan_groups[vlan.vid % 3])
+            self.assertEqual(vlan.status, self.status)
+
+
 class APIOrderingTestCase(testing.APITestCase):
     """
     Testing integration with DRF's OrderingFilter.
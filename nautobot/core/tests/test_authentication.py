@@ -1,16 +1,20 @@
+from unittest import mock
 import uuid
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test.utils import override_settings
 from django.urls import reverse
 from netaddr import IPNetwork
 
+from nautobot.core.authentication import get_object_permissions_cache_version, ObjectPermissionBackend
 from nautobot.core.settings_funcs import sso_auth_enabled
 from nautobot.core.testing import NautobotTestClient, TestCase
 from nautobot.core.utils import lookup
+from nautobot.core.utils.permissions import qs_filter_from_user_permission
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.models import ObjectChange, Status
 from nautobot.ipam.models import Namespace, Prefix
@@ -235,6 +239,68 @@ class ExternalAuthenticationTestCase(TestCase):
         self.assertFalse(sso_auth_enabled(tuple(TEST_AUTHENTICATION_BACKENDS)))
 
 
+class ObjectPermissionBackendTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.backend = ObjectPermissionBackend()
+        self.group = Group.objects.create(name="Permission Cache Group")
+        self.obj_perm = ObjectPermission.objects.create(
+            name="Test location permission", constraints={"name": "$user"}, actions=["view"]
+        )
+        self.obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+
+    def get_cached_object_permissions(self):
+        # Permissions loaded within a transaction are never cached, so pretend that we're not in one
+        with mock.patch.object(connection, "in_atomic_block", False):
+            return self.backend.get_cached_object_permissions(self.user)
+
+    def test_cache_object_permissions(self):
+        self.obj_perm.users.add(self.user)
+        perms = self.get_cached_object_permissions()
+        self.assertEqual(perms["dcim.view_location"], [{"name": "$user"}])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_cached_object_permissions(), perms)
+        # Permissions loaded within a transaction are not cached
+        other_user = User.objects.create(username="otheruser")
+        self.obj_perm.users.add(other_user)
+        self.backend.get_cached_object_permissions(other_user)
+        with self.assertNumQueries(2):
+            self.backend.get_cached_object_permissions(other_user)
+
+    def test_invalidate_cached_object_permissions(self):
+        version = get_object_permissions_cache_version()
+        self.assertEqual(self.get_cached_object_permissions(), {})
+
+        # Assigning the permission to a group the user belongs to invalidates the cache
+        self.obj_perm.groups.add(self.group)
+        self.assertNotEqual(get_object_permissions_cache_version(), version)
+        self.assertEqual(self.get_cached_object_permissions(), {})
+        version = get_object_permissions_cache_version()
+        self.user.groups.add(self.group)
+        self.assertNotEqual(get_object_permissions_cache_version(), version)
+        self.assertEqual(self.get_cached_object_permissions()["dcim.view_location"], [{"name": "$user"}])
+
+        # Modifying the permission invalidates the cache
+        self.obj_perm.actions = ["view", "change"]
+        self.obj_perm.save()
+        self.assertEqual(sorted(self.get_cached_object_permissions()), ["dcim.change_location", "dcim.view_location"])
+
+        # Deleting the group invalidates the cache
+        self.group.delete()
+        self.assertEqual(self.get_cached_object_permissions(), {})
+
+    def test_qs_filter_from_user_permission(self):
+        self.obj_perm.users.add(self.user)
+        self.assertTrue(self.user.has_perm("dcim.view_location"))
+        q_filter = qs_filter_from_user_permission(self.user, "dcim.view_location")
+        self.assertEqual(q_filter.children, [("name", self.user)])
+        self.assertIs(qs_filter_from_user_permission(self.user, "dcim.view_location"), q_filter)
+        # The filter is recomputed if the user's permissions are reloaded
+        del self.user._object_perm_cache
+        self.assertTrue(self.user.has_perm("dcim.view_location"))
+        self.assertIsNot(qs_filter_from_user_permission(self.user, "dcim.view_location"), q_filter)
+
+
 class ObjectPermissionAPIViewTestCase(TestCase):
     client_class = NautobotTestClient
 
@@ -259,7 +259,7 @@ class CSVParsingRelatedTestCase(TestCase):
         self.client.force_login(user)
         response = self.client.get(reverse("dcim-api:device-list") + "?format=csv")
         self.assertEqual(response.status_code, 200)
-        response_data = response.content.decode(response.charset)
+        response_data = b"".join(response.streaming_content).decode(response.charset)
 
         # Replace Device Name
         import_data = response_data.replace("TestDevice1", "TestDevice3").replace("TestDevice2", "")
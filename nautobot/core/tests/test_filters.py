@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
@@ -19,6 +20,7 @@ from nautobot.core.utils import lookup
 from nautobot.dcim import choices as dcim_choices, filters as dcim_filters, models as dcim_models
 from nautobot.dcim.models import Controller, Device
 from nautobot.extras import models as extras_models
+from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.utils import FeatureQuery
 from nautobot.ipam import models as ipam_models
 
@@ -1588,3 +1590,81 @@ class FilterTypeTest(TestCase):
         prefix_list_url = reverse(lookup.get_route_for_model(ipam_models.Prefix, "list"))
         response = self.client.get(f"{prefix_list_url}?prefix_length__lte=20")
         self.assertNotContains(response, "Invalid filters were specified")
+
+
+class DynamicFiltersCacheTest(testing.TestCase):
+    """Tests for the caching of the custom field and relationship filters of FilterSet classes."""
+
+    def test_filters_cached_until_invalidated(self):
+        """Custom field and relationship filters are only generated again once a custom field or relationship changes."""
+        device_ct = ContentType.objects.get_for_model(Device)
+        filterset_class = dcim_filters.DeviceFilterSet
+        self.assertNotIn("cf_cached_field", filterset_class().filters)
+        self.assertNotIn("cr_cached_relationship__peer", filterset_class().filters)
+
+        with mock.patch.object(
+            filterset_class, "generate_custom_field_filters", wraps=filterset_class.generate_custom_field_filters
+        ) as generate_custom_field_filters:
+            filterset_class()
+            generate_custom_field_filters.assert_not_called()
+
+            custom_field = extras_models.CustomField.objects.create(label="Cached Field", key="cached_field")
+            custom_field.content_types.add(device_ct)
+            filterset = filterset_class()
+            generate_custom_field_filters.assert_called_once()
+            self.assertIn("cf_cached_field", filterset.filters)
+
+        extras_models.Relationship(
+            label="Cached Relationship",
+            key="cached_relationship",
+            type="symmetric-many-to-many",
+            source_type=device_ct,
+            destination_type=device_ct,
+        ).validated_save()
+        filterset = filterset_class()
+        self.assertIn("cf_cached_field", filterset.filters)
+        self.assertIn("cr_cached_relationship__peer", filterset.filters)
+        self.assertIn("cr_cached_relationship__peer", filterset.relationships)
+
+        custom_field.delete()
+        self.assertNotIn("cf_cached_field", filterset_class().filters)
+
+    def test_filters_invalidated_by_custom_field_choices(self):
+        """Custom field filters are generated again once the choices of a select custom field change."""
+        custom_field = extras_models.CustomField.objects.create(
+            label="Cached Select Field", key="cached_select_field", type=CustomFieldTypeChoices.TYPE_SELECT
+        )
+        custom_field.content_types.add(ContentType.objects.get_for_model(Device))
+        filterset_class = dcim_filters.DeviceFilterSet
+
+        def get_choices():
+            widget = filterset_class().filters["cf_cached_select_field"].extra["widget"]
+            return [value for value, _ in widget.choices if value]
+
+        self.assertEqual(get_choices(), [])
+        choice = extras_models.CustomFieldChoice.objects.create(custom_field=custom_field, value="Choice 1")
+        self.assertEqual(get_choices(), ["Choice 1"])
+        choice.delete()
+        self.assertEqual(get_choices(), [])
+
+    def test_filters_cached_per_class(self):
+        """Filters cached for a FilterSet class are not reused by its subclasses."""
+        filterset_class = dcim_filters.DeviceFilterSet
+        subclass = type("DeviceSubFilterSet", (filterset_class,), {})
+        filterset_class()
+        self.assertNotIn("_dynamic_filters_cache", vars(subclass))
+        subclass()
+        self.assertIsNot(subclass._dynamic_filters_cache, filterset_class._dynamic_filters_cache)
+
+    def test_copy_filter(self):
+        """Copied filters share nothing that may change while in use with the original filter."""
+        original = filters.NaturalKeyOrPKMultipleChoiceFilter(queryset=dcim_models.Location.objects.all())
+        original.field  # pylint: disable=pointless-statement
+        copied = filters.copy_filter(original)
+        self.assertIsInstance(copied, filters.NaturalKeyOrPKMultipleChoiceFilter)
+        self.assertIsNot(copied.extra, original.extra)
+        self.assertIsNot(copied.queryset, original.queryset)
+        self.assertIs(copied.extra["queryset"], copied.queryset)
+        self.assertEqual(copied.queryset.model, dcim_models.Location)
+        self.assertIsNot(copied.field, original.field)
+        self.assertEqual(copied.natural_key, original.natural_key)
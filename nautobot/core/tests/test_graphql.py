@@ -1,16 +1,18 @@
 import datetime
 import random
 import types
-from unittest import skip, TestCase as UnitTestTestCase
+from unittest import mock, skip, TestCase as UnitTestTestCase
 import uuid
 
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.db.models import Q
 from django.test import override_settings, TestCase
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 import graphene.types
 from graphene_django.registry import get_global_registry
@@ -20,11 +22,12 @@ from graphql.error.located_error import GraphQLLocatedError
 from rest_framework import status
 
 from nautobot.circuits.models import CircuitTermination, Provider
-from nautobot.core.graphql import execute_query, execute_saved_query
+from nautobot.core.graphql import backends, execute_query, execute_saved_query, execute_saved_query_many
 from nautobot.core.graphql.generators import (
     generate_list_search_parameters,
     generate_schema_type,
 )
+from nautobot.core.graphql.loaders import ComputedFieldLoader, RelationshipPeersLoader
 from nautobot.core.graphql.schema import (
     extend_schema_type,
     extend_schema_type_config_context,
@@ -62,6 +65,7 @@ from nautobot.dcim.models import (
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import (
     ChangeLoggedModel,
+    ComputedField,
     ConfigContext,
     CustomField,
     GraphQLQuery,
@@ -172,6 +176,37 @@ class GraphQLTestCase(GraphQLTestCaseBase):
         resp = execute_saved_query("GQL 2", user=self.user, variables={"name": "location-1"}).to_dict()
         self.assertFalse(resp["data"].get("error"))
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_execute_saved_query_many(self):
+        with mock.patch("nautobot.core.graphql.backends.validate", wraps=backends.validate) as validate:
+            results = execute_saved_query_many(
+                "GQL 2", [{"name": location.name} for location in self.locations], user=self.user
+            )
+        self.assertEqual(
+            [result.to_dict()["data"]["locations"] for result in results],
+            [[{"name": location.name}] for location in self.locations],
+        )
+        # The saved query was already parsed and validated when it was saved
+        validate.assert_not_called()
+
+    def test_document_cache(self):
+        backend = backends.NautobotGraphQLBackend()
+        query = "query ($name: [String!]) { locations(name:$name) {name} }"
+        document = backend.document_from_string(self.SCHEMA, query)
+        self.assertFalse(document.validation_errors)
+        self.assertIs(backend.document_from_string(self.SCHEMA, query), document)
+
+        invalid_document = backend.document_from_string(self.SCHEMA, "{ locations { not_a_field } }")
+        self.assertEqual(len(invalid_document.validation_errors), 1)
+        result = invalid_document.execute(context_value=RequestFactory().post("/graphql/"))
+        self.assertTrue(result.invalid)
+        self.assertEqual(result.errors, invalid_document.validation_errors)
+
+        with mock.patch("nautobot.core.constants.GRAPHQL_DOCUMENT_CACHE_SIZE", 1):
+            backend.document_from_string(self.SCHEMA, "{ locations { id } }")
+            self.assertEqual(len(backend.documents), 1)
+        self.assertIsNot(backend.document_from_string(self.SCHEMA, query), document)
+
     def test_graphql_types_registry(self):
         """Ensure models with graphql feature are registered in the graphene_django registry."""
         graphene_django_registry = get_global_registry()
@@ -1211,6 +1246,42 @@ query {
         self.assertEqual(custom_field_data[0], {})
         self.assertEqual(result.data["device"]["_custom_field_data"], {})
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_query_config_context_batched(self):
+        """Test that the config contexts of all devices in a query are loaded together rather than one by one."""
+        query = "query { devices { id config_context } }"
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self.execute_query(query)
+
+        self.assertIsNone(result.errors)
+        self.assertEqual(len(result.data["devices"]), Device.objects.count())
+        for item in result.data["devices"]:
+            self.assertEqual(item["config_context"], Device.objects.get(id=item["id"]).get_config_context())
+        self.assertEqual(
+            len([query for query in queries.captured_queries if 'FROM "extras_configcontext"' in query["sql"]]), 1
+        )
+
+    def test_computed_field_loader(self):
+        """Test that a computed field is rendered for a batch of objects together."""
+        ComputedField.objects.create(
+            content_type=ContentType.objects.get_for_model(Location),
+            key="loader_test",
+            label="Loader Test",
+            template="{{ obj.name }}!",
+        )
+        locations = list(Location.objects.all()[:3])
+
+        with CaptureQueriesContext(connection) as queries:
+            values = ComputedFieldLoader(Location, "loader_test").batch_load_fn(locations).get()
+        self.assertEqual(values, [f"{location.name}!" for location in locations])
+        # One query to populate the cached computed fields of the model, and one to get the computed field by key
+        self.assertEqual(
+            len([query for query in queries.captured_queries if 'FROM "extras_computedfield"' in query["sql"]]), 2
+        )
+
+        self.assertEqual(ComputedFieldLoader(Location, "nonexistent").batch_load_fn(locations).get(), [None] * 3)
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_console_ports_cable_peer(self):
         """Test querying console port terminations for their cable peers"""
@@ -1468,6 +1539,26 @@ query {
         self.assertIn(str(self.device2.id), set(item["id"] for item in result.data["device"]["rel_device_group"]))
         self.assertIn(str(self.device3.id), set(item["id"] for item in result.data["device"]["rel_device_group"]))
 
+    def test_relationship_peers_loader(self):
+        """Test that the relationship peers of a batch of objects are loaded together."""
+        devices = [self.device1, self.device2, self.device3]
+
+        with CaptureQueriesContext(connection) as queries:
+            peers = RelationshipPeersLoader(self.relationship_o2o_1, "source", VirtualMachine).batch_load_fn(devices)
+            self.assertEqual(peers.get(), [self.virtualmachine, None, None])
+            peers = RelationshipPeersLoader(self.relationship_m2ms_1, "peer", Device).batch_load_fn(devices)
+            self.assertEqual(
+                [set(device_peers) for device_peers in peers.get()],
+                [{self.device2, self.device3}, {self.device1, self.device3}, {self.device1, self.device2}],
+            )
+        # One query for the associations, and one for the peers, of each relationship
+        self.assertEqual(len(queries), 4)
+
+        peers = RelationshipPeersLoader(self.relationship_o2o_1, "destination", Device).batch_load_fn(
+            [self.virtualmachine]
+        )
+        self.assertEqual(peers.get(), [self.device1])
+
     @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
     def test_query_device_role_filter(self):
         query = (
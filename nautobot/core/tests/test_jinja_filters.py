@@ -1,3 +1,6 @@
+from unittest import mock
+import uuid
+
 from django.test import TestCase
 from jinja2.exceptions import SecurityError, TemplateAssertionError
 from netutils.utils import jinja2_convenience_function
@@ -6,6 +9,34 @@ from nautobot.core.utils import data
 from nautobot.dcim import models as dcim_models
 
 
+class RenderJinja2Test(TestCase):
+    def test_compiled_template_cache(self):
+        """Validate that render_jinja2 compiles each distinct template only once, up to the size of the cache."""
+
+        def get_lookup_count(result):
+            return data.JINJA2_TEMPLATE_CACHE_METRIC.labels(result=result)._value.get()
+
+        # Make sure that the template isn't already cached by an earlier test
+        suffix = uuid.uuid4()
+        template_code = f"{{{{ value }}}} is cached {suffix}"
+        hits, misses = get_lookup_count("hit"), get_lookup_count("miss")
+        self.assertEqual(data.render_jinja2(template_code, {"value": "a"}), f"a is cached {suffix}")
+        self.assertEqual(data.render_jinja2(template_code, {"value": "b"}), f"b is cached {suffix}")
+        self.assertEqual(get_lookup_count("miss"), misses + 1)
+        self.assertEqual(get_lookup_count("hit"), hits + 1)
+        self.assertIs(data.get_jinja2_template(template_code), data.get_jinja2_template(template_code))
+
+        with mock.patch("nautobot.core.constants.JINJA2_TEMPLATE_CACHE_SIZE", 2):
+            template = data.get_jinja2_template(template_code)
+            data.get_jinja2_template("first other template")
+            data.get_jinja2_template("second other template")
+            self.assertIsNot(data.get_jinja2_template(template_code), template)
+
+    def test_rendered_text_is_not_marked_safe(self):
+        rendered = data.render_jinja2("{{ value }}", {"value": "<b>bold</b>"})
+        self.assertFalse(hasattr(rendered, "__html__"))
+
+
 class NautobotJinjaFilterTest(TestCase):
     def test_invalid_templatetags_raise_exception(self):
         """Validate that executing render_jinja2 with an invalid filter will raise TemplateAssertionError."""
@@ -1,12 +1,30 @@
 from pathlib import Path
+from unittest import mock
+import uuid
 
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.test import override_settings
+from kombu.exceptions import OperationalError as KombuOperationalError
+import redis.exceptions
 import yaml
 
+from nautobot.core.constants import CSV_NO_OBJECT
+from nautobot.core.jobs import _get_chunk_cache_key, import_objects_chunk
 from nautobot.core.testing import create_job_result_and_run_job, TransactionTestCase
 from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
 from nautobot.extras.choices import JobResultStatusChoices, LogLevelChoices
-from nautobot.extras.models import Contact, ContactAssociation, ExportTemplate, JobLogEntry, Role, Status
+from nautobot.extras.models import (
+    Contact,
+    ContactAssociation,
+    DynamicGroup,
+    ExportTemplate,
+    JobLogEntry,
+    JobResult,
+    Role,
+    Status,
+)
+from nautobot.ipam.models import Namespace, Prefix
 from nautobot.users.models import ObjectPermission
 
 
@@ -68,6 +86,33 @@ class ExportObjectListTest(TransactionTestCase):
         # May be more than one line per Status if they have newlines in their description strings
         self.assertGreaterEqual(len(csv_data.split("\n")), Status.objects.count() + 1, csv_data)  # +1 for CSV header
 
+    def test_export_all_to_csv_in_chunks(self):
+        """Exporting to CSV in multiple chunks should produce the same data as a single chunk, and report progress."""
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ExportObjectList",
+            content_type=ContentType.objects.get_for_model(Status).pk,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        expected_csv_data = job_result.files.first().file.read().decode("utf-8")
+
+        with mock.patch("nautobot.core.jobs.CSV_EXPORT_CHUNK_SIZE", 2):
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs",
+                "ExportObjectList",
+                content_type=ContentType.objects.get_for_model(Status).pk,
+            )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        csv_data = job_result.files.first().file.read().decode("utf-8")
+        self.assertEqual(csv_data, expected_csv_data)
+        self.assertEqual(csv_data.count("\nid,"), 0)  # the header row appears only once
+        log_progress = JobLogEntry.objects.filter(
+            job_result=job_result, log_level=LogLevelChoices.LOG_INFO, message__startswith="Exported "
+        )
+        self.assertGreater(log_progress.count(), 1)
+        status_count = Status.objects.count()
+        self.assertEqual(log_progress.last().message, f"Exported {status_count} of {status_count} objects")
+
     def test_export_all_via_export_template(self):
         """When an export-template is specified, it should be used."""
         et = ExportTemplate.objects.create(
@@ -204,6 +249,54 @@ class ImportObjectsTestCase(TransactionTestCase):
         )
         self.assertEqual(4, Status.objects.filter(name__startswith="test_status").count())
 
+    def test_csv_import_prefix_hierarchy(self):
+        """Prefixes imported in any order should have their parents set, as if they had been created one by one."""
+        namespace = Namespace.objects.create(name="ImportObjectsPrefixHierarchyTest")
+        csv_data = "\n".join(
+            [
+                "prefix,namespace__name,status__name,type",
+                f"10.1.1.0/24,{namespace.name},Active,network",
+                f"10.1.0.0/16,{namespace.name},Active,container",
+                f"10.0.0.0/8,{namespace.name},Active,container",
+            ]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Prefix).pk,
+            csv_data=csv_data,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        prefixes = {str(prefix.prefix): prefix for prefix in Prefix.objects.filter(namespace=namespace)}
+        self.assertEqual(len(prefixes), 3)
+        self.assertIsNone(prefixes["10.0.0.0/8"].parent)
+        self.assertEqual(prefixes["10.1.0.0/16"].parent, prefixes["10.0.0.0/8"])
+        self.assertEqual(prefixes["10.1.1.0/24"].parent, prefixes["10.1.0.0/16"])
+
+    def test_csv_import_related_objects(self):
+        """Rows should be able to refer to existing objects, and to objects created by earlier rows of the same import."""
+        location_type = LocationType.objects.create(name="ImportObjectsLocationType", nestable=True)
+        status = Status.objects.get_for_model(Location).first()
+        rows = ["name,location_type__name,status__name,parent__name"]
+        rows += [f"ImportObjectsParent{num},{location_type.name},{status.name},{CSV_NO_OBJECT}" for num in range(3)]
+        rows += [
+            f"ImportObjectsChild{num},{location_type.name},{status.name},ImportObjectsParent{num % 3}"
+            for num in range(6)
+        ]
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Location).pk,
+            csv_data="\n".join(rows),
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        children = Location.objects.filter(name__startswith="ImportObjectsChild")
+        self.assertEqual(children.count(), 6)
+        for child in children:
+            self.assertEqual(child.parent.name, f"ImportObjectsParent{int(child.name[-1]) % 3}")
+            self.assertEqual(child.location_type, location_type)
+            self.assertEqual(child.status, status)
+
     def test_csv_import_bad_row(self):
         """A row of incorrect data should fail validation for that object but import all others successfully if `roll_back_if_error` is False."""
         csv_data = self.csv_data.split("\n")
@@ -257,6 +350,147 @@ class ImportObjectsTestCase(TransactionTestCase):
             self.assertTrue(Status.objects.filter(name="test_status4").exists())
             self.assertEqual(log_successes[4].message, "Created 4 status object(s) from 5 row(s) of data")
 
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_CHUNK_SIZE", 2)
+    def test_csv_import_parallel(self):
+        """Rows should be imported in chunks, with per-row errors reported in order, if `parallel` is True."""
+        csv_data = self.csv_data.split("\n")
+        csv_data.insert(3, "test_status0,notacolor,dcim.device")
+        csv_data = "\n".join(csv_data)
+
+        for enqueue_fails in (False, True):
+            Status.objects.filter(name__startswith="test_status").delete()
+            with self.subTest(enqueue_fails=enqueue_fails), mock.patch(
+                "nautobot.core.jobs.import_objects_chunk.apply_async",
+                side_effect=KombuOperationalError if enqueue_fails else None,
+                wraps=None if enqueue_fails else import_objects_chunk.apply_async,
+            ) as apply_async:
+                job_result = create_job_result_and_run_job(
+                    "nautobot.core.jobs",
+                    "ImportObjects",
+                    content_type=ContentType.objects.get_for_model(Status).pk,
+                    csv_data=csv_data,
+                    roll_back_if_error=False,
+                    parallel=True,
+                )
+                self.assertEqual(apply_async.call_count, 3)
+                self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+                log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+                self.assertEqual(log_errors[0].message, "Row 3: `color`: `Enter a valid hexadecimal RGB color code.`")
+                log_successes = JobLogEntry.objects.filter(
+                    job_result=job_result, log_level=LogLevelChoices.LOG_INFO, message__icontains="created"
+                )
+                self.assertEqual(
+                    [log.message for log in log_successes],
+                    [
+                        'Row 1: Created record "test_status1"',
+                        'Row 2: Created record "test_status2"',
+                        'Row 4: Created record "test_status3"',
+                        'Row 5: Created record "test_status4"',
+                        "Created 4 status object(s) from 5 row(s) of data",
+                    ],
+                )
+                self.assertEqual(4, Status.objects.filter(name__startswith="test_status").count())
+                self.assertFalse(Status.objects.filter(name="test_status0").exists())
+
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_CHUNK_SIZE", 1)
+    def test_csv_import_parallel_prefix_hierarchy(self):
+        """Prefixes imported in parallel chunks should have their parents set once all chunks have been imported."""
+        namespace = Namespace.objects.create(name="ImportObjectsParallelPrefixHierarchyTest")
+        csv_data = "\n".join(
+            [
+                "prefix,namespace__name,status__name,type",
+                f"10.1.1.0/24,{namespace.name},Active,network",
+                f"10.1.0.0/16,{namespace.name},Active,container",
+                f"10.0.0.0/8,{namespace.name},Active,container",
+            ]
+        )
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs",
+            "ImportObjects",
+            content_type=ContentType.objects.get_for_model(Prefix).pk,
+            csv_data=csv_data,
+            roll_back_if_error=False,
+            parallel=True,
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        prefixes = {str(prefix.prefix): prefix for prefix in Prefix.objects.filter(namespace=namespace)}
+        self.assertEqual(len(prefixes), 3)
+        self.assertIsNone(prefixes["10.0.0.0/8"].parent)
+        self.assertEqual(prefixes["10.1.0.0/16"].parent, prefixes["10.0.0.0/8"])
+        self.assertEqual(prefixes["10.1.1.0/24"].parent, prefixes["10.1.0.0/16"])
+
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_POLL_INTERVAL", 0)
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_CHUNK_TIMEOUT", 0)
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_CHUNK_SIZE", 2)
+    def test_csv_import_parallel_worker_lost(self):
+        """Chunks claimed by a task that never imports them should be given up on instead of waited on indefinitely."""
+
+        def claim_chunk(args, **kwargs):
+            job_result_id, index = args[:2]
+            cache.add(_get_chunk_cache_key(job_result_id, index, "claim"), "task", 60)
+
+        with mock.patch("nautobot.core.jobs.import_objects_chunk.apply_async", side_effect=claim_chunk):
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs",
+                "ImportObjects",
+                content_type=ContentType.objects.get_for_model(Status).pk,
+                csv_data=self.csv_data,
+                roll_back_if_error=False,
+                parallel=True,
+            )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            [log.message for log in log_errors],
+            [
+                f"Row {row}: Not imported, as rows {first_row} to {first_row + 1} were not imported by a worker "
+                "within 0 seconds"
+                for row, first_row in [(1, 1), (2, 1), (3, 3), (4, 3)]
+            ],
+        )
+        self.assertFalse(Status.objects.filter(name__startswith="test_status").exists())
+
+    def test_csv_import_parallel_chunk_given_up_on(self):
+        """A task should not commit the import of a chunk that the Job has given up on."""
+        job_result = JobResult.objects.create(name="ImportObjectsParallelGivenUpTest", user=self.user)
+        cache.add(_get_chunk_cache_key(job_result.pk, 0, "done"), "job", 60)
+        import_objects_chunk(
+            str(job_result.pk),
+            0,
+            ContentType.objects.get_for_model(Manufacturer).pk,
+            str(self.user.pk),
+            [{"name": "ImportObjectsParallelGivenUpTest"}],
+            1,
+            60,
+        )
+        self.assertIn("error", cache.get(_get_chunk_cache_key(job_result.pk, 0, "result")))
+        self.assertFalse(Manufacturer.objects.filter(name="ImportObjectsParallelGivenUpTest").exists())
+
+    @mock.patch("nautobot.core.jobs.CSV_IMPORT_CHUNK_SIZE", 2)
+    def test_csv_import_parallel_cache_unavailable(self):
+        """The import should report the chunks it can't account for if the cache is unavailable, rather than crash."""
+        with mock.patch("nautobot.core.jobs.cache") as mock_cache:
+            mock_cache.add.side_effect = redis.exceptions.ConnectionError("Connection refused")
+            job_result = create_job_result_and_run_job(
+                "nautobot.core.jobs",
+                "ImportObjects",
+                content_type=ContentType.objects.get_for_model(Status).pk,
+                csv_data=self.csv_data,
+                roll_back_if_error=False,
+                parallel=True,
+            )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_FAILURE)
+        log_errors = JobLogEntry.objects.filter(job_result=job_result, log_level=LogLevelChoices.LOG_ERROR)
+        self.assertEqual(
+            [log.message for log in log_errors],
+            [
+                f"Rows {first_row} to {first_row + 1}: Unable to determine whether these rows were imported: "
+                "`Connection refused`"
+                for first_row in (1, 3)
+            ],
+        )
+        self.assertFalse(Status.objects.filter(name__startswith="test_status").exists())
+
     def test_csv_import_contact_assignment(self):
         location_types_csv = "\n".join(["name", "ContactAssignmentImportTestLocationType"])
         locations_csv = "\n".join(
@@ -333,3 +567,43 @@ class ImportObjectsTestCase(TransactionTestCase):
         )
 
         self.assertEqual(associations_job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+
+
+class RefreshDynamicGroupCachesTestCase(TransactionTestCase):
+    """
+    Test the RefreshDynamicGroupCaches system job.
+    """
+
+    databases = ("default", "job_logs")
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_refresh_dynamic_group_caches(self):
+        location_type = LocationType.objects.create(name="RefreshDynamicGroupCachesTestLocationType")
+        status = Status.objects.get_for_model(Location).first()
+        group = DynamicGroup.objects.create(
+            name="RefreshDynamicGroupCachesTest",
+            content_type=ContentType.objects.get_for_model(Location),
+            filter={"location_type": [location_type.name]},
+        )
+        # Bulk-created objects are not added to the member caches until they are refreshed
+        locations = Location.objects.bulk_create(
+            [
+                Location(name=f"RefreshDynamicGroupCachesTest {i}", location_type=location_type, status=status)
+                for i in range(3)
+            ]
+        )
+        self.assertFalse(group.members_cached.exists())
+
+        job_result = create_job_result_and_run_job("nautobot.core.jobs", "RefreshDynamicGroupCaches")
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(
+            sorted(group.members_cached.values_list("pk", flat=True)), sorted(location.pk for location in locations)
+        )
+
+        # A single group can also be refreshed
+        group.cached_members.create(member_id=uuid.uuid4())
+        job_result = create_job_result_and_run_job(
+            "nautobot.core.jobs", "RefreshDynamicGroupCaches", single_group=group.pk
+        )
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertEqual(group.cached_members.count(), 3)
@@ -1,18 +1,30 @@
+import json
 import time
 from unittest import skip
 from unittest.mock import patch
 import uuid
 
+from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.core.serializers import serialize
 from django.test import override_settings
 from django.test.utils import isolate_apps
 
+from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.models import BaseModel
-from nautobot.core.models.utils import construct_composite_key, construct_natural_slug, deconstruct_composite_key
+from nautobot.core.models.utils import (
+    construct_composite_key,
+    construct_natural_slug,
+    deconstruct_composite_key,
+    prefetch_serialized_related_objects,
+    serialize_object,
+    serialize_object_v2,
+)
 from nautobot.core.testing import TestCase
-from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer
-from nautobot.extras.models import Status
+from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Manufacturer
+from nautobot.extras.models import CustomField, Status
+from nautobot.ipam.models import Prefix, VLAN
 
 
 @isolate_apps("nautobot.core.tests")
@@ -60,6 +72,59 @@ class ModelUtilsTestCase(TestCase):
                 self.assertEqual(natural_slug, expected_natural_slug)
 
 
+class SerializeObjectTestCase(TestCase):
+    """Tests for the change logging representations of objects."""
+
+    models = [Device, Interface, Location, Prefix, Status, VLAN]
+
+    def test_serialize_object(self):
+        """serialize_object() should represent objects the same as Django's JSON serializer."""
+        for model in self.models:
+            for obj in model.objects.all()[:10]:
+                with self.subTest(obj=obj):
+                    expected = json.loads(serialize("json", [obj]))[0]["fields"]
+                    expected["custom_fields"] = expected.pop("_custom_field_data")
+                    if hasattr(obj, "tags"):
+                        expected["tags"] = [tag.name for tag in obj.tags.all()]
+                    expected = {key: value for key, value in expected.items() if not key.startswith("_")}
+                    self.assertEqual(serialize_object(obj), expected)
+
+    def test_serialize_object_v2(self):
+        """serialize_object_v2() should represent objects the same as their REST API serializer with a depth of 1."""
+        for model in self.models:
+            serializer_class = get_serializer_for_model(model)
+            for obj in model.objects.all()[:10]:
+                with self.subTest(obj=obj):
+                    expected = serializer_class(obj, context={"request": None, "depth": 1}).data
+                    self.assertEqual(serialize_object_v2(obj), expected)
+
+    def test_serialize_object_v2_custom_field_changes(self):
+        """serialize_object_v2() should reflect custom fields created, reassigned or deleted since it was last called."""
+        location = Location.objects.first()
+        self.assertNotIn("serialized_field", serialize_object_v2(location)["custom_fields"])
+
+        custom_field = CustomField.objects.create(label="Serialized Field", key="serialized_field")
+        custom_field.content_types.add(ContentType.objects.get_for_model(Location))
+        self.assertIn("serialized_field", serialize_object_v2(location)["custom_fields"])
+
+        custom_field.content_types.clear()
+        self.assertNotIn("serialized_field", serialize_object_v2(location)["custom_fields"])
+
+        custom_field.content_types.add(ContentType.objects.get_for_model(Location))
+        self.assertIn("serialized_field", serialize_object_v2(location)["custom_fields"])
+        custom_field.delete()
+        self.assertNotIn("serialized_field", serialize_object_v2(location)["custom_fields"])
+
+    def test_prefetch_serialized_related_objects(self):
+        devices = list(Device.objects.all()[:10])
+        prefetch_serialized_related_objects(devices)
+        with self.assertNumQueries(0):
+            for device in devices:
+                self.assertIsNotNone(device.location)
+                self.assertIsNotNone(device.device_type)
+                self.assertIsNotNone(device.status)
+
+
 class NaturalKeyTestCase(BaseModelTest):
     """Test the various natural-key APIs for a few representative models."""
 
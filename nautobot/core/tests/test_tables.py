@@ -1,8 +1,12 @@
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim.models import Device, InventoryItem, Location, LocationType, Rack, RackGroup
 from nautobot.dcim.tables import InventoryItemTable, LocationTable, LocationTypeTable, RackGroupTable
+from nautobot.extras.models import ComputedField
 from nautobot.tenancy.tables import TenantGroupTable
 
 
@@ -61,3 +65,19 @@ class TableTestCase(TestCase):
         queryset = RackGroupTable.Meta.model.objects.annotate(rack_count=count_related(Rack, "rack_group")).all()
         self._validate_sorted_tree_queryset_same_with_table_queryset(queryset, RackGroupTable, "rack_count")
         self._validate_sorted_tree_queryset_same_with_table_queryset(queryset, RackGroupTable, "-rack_count")
+
+    def test_computed_field_column(self):
+        """Assert that a computed field is rendered for all rows on the table's page at once."""
+        ComputedField.objects.create(
+            content_type=ContentType.objects.get_for_model(Location),
+            key="table_test",
+            label="Table Test",
+            template="{{ obj.name }}!",
+        )
+        table = LocationTable(Location.objects.all()[:5])
+        with mock.patch.object(
+            ComputedField, "render_many", autospec=True, side_effect=ComputedField.render_many
+        ) as render_many:
+            values = [row.get_cell("cpf_table_test") for row in table.rows]
+        self.assertEqual(values, [f"{location.name}!" for location in Location.objects.all()[:5]])
+        render_many.assert_called_once()
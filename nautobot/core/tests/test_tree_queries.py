@@ -1,5 +1,14 @@
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
+
 from nautobot.core.testing import TestCase
-from nautobot.dcim.models import Location
+from nautobot.dcim.filters import LocationFilterSet
+from nautobot.dcim.models import Location, LocationType
+from nautobot.extras.models import Status, TreeModelAncestor
+from nautobot.tenancy.models import TenantGroup
 
 
 class TestInvalidateMaxTreeDepthSignal(TestCase):
@@ -54,3 +63,86 @@ class QuerySetAncestorTests(TestCase):
         self.assertFalse(
             hasattr(ancestors_without_tree_fields.first(), "tree_depth"), "Tree annotations should not be present."
         )
+
+
+class TreeModelAncestorIndexTests(TestCase):
+    """Tests for the tree ancestor index and its use by `TreeQuerySet`."""
+
+    def assertIndexMatchesTree(self, model):
+        """Assert that the ancestor index of the given model matches the `parent` of each node."""
+        parents = dict(model.objects.without_tree_fields().values_list("pk", "parent_id"))
+        expected = set()
+        for pk in parents:
+            ancestor_id, depth = pk, 0
+            while ancestor_id is not None:
+                expected.add((ancestor_id, pk, depth))
+                ancestor_id, depth = parents[ancestor_id], depth + 1
+        actual = set(
+            TreeModelAncestor.objects.filter(content_type=ContentType.objects.get_for_model(model)).values_list(
+                "ancestor_id", "descendant_id", "depth"
+            )
+        )
+        self.assertSetEqual(actual, expected)
+
+    def test_index_matches_tree(self):
+        for model in (Location, LocationType, TenantGroup):
+            with self.subTest(model=model):
+                self.assertTrue(model.objects.exists())
+                self.assertIndexMatchesTree(model)
+
+    def test_index_updated_on_move_and_delete(self):
+        location_type = LocationType.objects.get(name="Campus")
+        status = Status.objects.get_for_model(Location).first()
+        root_1 = Location.objects.create(name="Root 1", location_type=location_type, status=status)
+        root_2 = Location.objects.create(name="Root 2", location_type=location_type, status=status)
+        branch = Location.objects.create(name="Branch", parent=root_1, location_type=location_type, status=status)
+        leaf = Location.objects.create(name="Leaf", parent=branch, location_type=location_type, status=status)
+        self.assertIndexMatchesTree(Location)
+        self.assertQuerysetEqual(leaf.ancestors(), [root_1, branch])
+
+        branch.parent = root_2
+        branch.save()
+        self.assertIndexMatchesTree(Location)
+        self.assertQuerysetEqual(leaf.ancestors(), [root_2, branch])
+        self.assertQuerysetEqual(root_1.descendants(), [])
+
+        branch.parent = None
+        branch.save()
+        self.assertIndexMatchesTree(Location)
+        self.assertQuerysetEqual(leaf.ancestors(include_self=True), [branch, leaf])
+
+        leaf.delete()
+        self.assertIndexMatchesTree(Location)
+        self.assertFalse(TreeModelAncestor.objects.filter(descendant_id=leaf.pk).exists())
+
+    def test_index_unchanged_on_save_without_move(self):
+        location = Location.objects.filter(parent__isnull=False).first()
+        location.description = "Not moved"
+        with self.assertNumQueries(1):
+            location.save()
+        self.assertIndexMatchesTree(Location)
+
+    def test_rebuild_tree_ancestors_command(self):
+        # QuerySet.update() bypasses the signals that maintain the index
+        Location.objects.filter(parent__isnull=False).update(parent=None)
+        out = StringIO()
+        call_command("rebuild_tree_ancestors", "dcim.Location", stdout=out)
+        self.assertIn("Rebuilt the tree ancestor index of locations", out.getvalue())
+        self.assertIndexMatchesTree(Location)
+
+    def test_ancestors_and_descendants_match_tree(self):
+        for location in Location.objects.without_tree_fields().filter(children__isnull=False, parent__isnull=False)[:5]:
+            with self.subTest(location=location.name):
+                ancestors = list(location.ancestors(include_self=True))
+                descendants = set(location.descendants())
+                with override_settings(TREE_ANCESTOR_INDEX_ENABLED=False):
+                    self.assertListEqual(ancestors, list(location.ancestors(include_self=True)))
+                    self.assertSetEqual(descendants, set(location.descendants()))
+
+    def test_tree_node_filter_matches_tree(self):
+        locations = Location.objects.without_tree_fields().filter(children__isnull=False)[:3]
+        params = {"subtree": [location.pk for location in locations]}
+        filtered = set(LocationFilterSet(params, Location.objects.all()).qs)
+        with override_settings(TREE_ANCESTOR_INDEX_ENABLED=False):
+            self.assertSetEqual(filtered, set(LocationFilterSet(params, Location.objects.all()).qs))
+        self.assertGreater(len(filtered), len(locations))
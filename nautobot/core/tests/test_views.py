@@ -5,6 +5,7 @@ import urllib.parse
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import override_settings, RequestFactory
 from django.test.utils import override_script_prefix
 from django.urls import get_script_prefix, reverse
@@ -14,7 +15,7 @@ from nautobot.core.constants import GLOBAL_SEARCH_EXCLUDE_LIST
 from nautobot.core.testing import TestCase
 from nautobot.core.testing.api import APITestCase
 from nautobot.core.utils.permissions import get_permission_for_model
-from nautobot.core.views import NautobotMetricsView
+from nautobot.core.views import counts as counts_backend, NautobotMetricsView, search
 from nautobot.core.views.mixins import GetReturnURLMixin
 from nautobot.dcim.models.locations import Location
 from nautobot.extras.choices import CustomFieldTypeChoices
@@ -73,6 +74,94 @@ class HomeViewTestCase(TestCase):
         response = self.client.get(f"{url}?{urllib.parse.urlencode(params)}")
         self.assertHttpStatus(response, 200)
 
+    def test_search_results(self):
+        self.add_permissions("dcim.view_location")
+        location = Location.objects.first()
+        url = reverse("search")
+        params = {
+            "q": location.name,
+        }
+
+        response = self.client.get(f"{url}?{urllib.parse.urlencode(params)}")
+        self.assertHttpStatus(response, 200)
+        result_names = [result["name"] for result in response.context["results"]]
+        self.assertIn(Location._meta.verbose_name_plural, result_names)
+        for result in response.context["results"]:
+            self.assertGreater(result["table"].page.paginator.count, 0)
+
+        params["obj_type"] = "location"
+        response = self.client.get(f"{url}?{urllib.parse.urlencode(params)}")
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["name"] for result in response.context["results"]], ["locations"])
+        self.assertEqual(response.context["results"][0]["url"], f"{reverse('dcim:location_list')}?q={location.name}")
+
+    def test_searchable_models_cached(self):
+        search.clear_searchable_models_cache()
+        with mock.patch("nautobot.core.views.search.resolve", wraps=search.resolve) as mock_resolve:
+            searchable_models = search.get_searchable_models()
+            self.assertEqual(mock_resolve.call_count, len(searchable_models))
+            self.assertIs(search.get_searchable_models(), searchable_models)
+            self.client.get(f"{reverse('search')}?q=foo")
+            self.assertEqual(mock_resolve.call_count, len(searchable_models))
+        self.assertIn(
+            ("dcim", "location", Location),
+            [(sm.app_label, sm.model_name, sm.model) for sm in searchable_models],
+        )
+
+    def test_search_evaluate_exists(self):
+        querysets = [
+            ContentType.objects.all(),
+            ContentType.objects.filter(app_label="no_such_app"),
+            ContentType.objects.none(),
+            Location.objects.filter(name__icontains=Location.objects.first().name),
+        ]
+        # All querysets are checked with a single query
+        with self.assertNumQueries(1):
+            self.assertEqual(search.evaluate_exists(querysets), [True, False, False, True])
+
+    def test_object_counts(self):
+        from nautobot.dcim.models import Device
+        from nautobot.ipam.models import Prefix
+
+        self.user.is_superuser = False
+        self.user.save()
+        obj_perm = ObjectPermission.objects.create(
+            name="View one location", constraints={"id": str(Location.objects.first().pk)}, actions=["view"]
+        )
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Location))
+        obj_perm.users.add(self.user)
+        obj_perm = ObjectPermission.objects.create(name="View all devices", actions=["view"])
+        obj_perm.object_types.add(ContentType.objects.get_for_model(Device))
+        obj_perm.users.add(self.user)
+
+        # All counts are made with a single query (after loading the user's permissions)
+        self.user.get_all_permissions()
+        with self.assertNumQueries(2):  # estimates for unconstrained models, and exact counts
+            counts = counts_backend.get_object_counts(self.user, [Location, Device, Prefix])
+        self.assertEqual(counts, {Location: 1, Device: Device.objects.count(), Prefix: 0})
+
+        # Estimates are used for unconstrained counts of large tables
+        with mock.patch("nautobot.core.views.counts.get_approximate_counts", return_value={Device: 123456}):
+            counts = counts_backend.get_object_counts(self.user, [Location, Device])
+        self.assertEqual(counts, {Location: 1, Device: 123456})
+
+        # Exact counts are cached outside of a transaction, for users with the same permission constraints
+        with mock.patch.object(connection, "in_atomic_block", False):
+            counts_backend.get_object_counts(self.user, [Location, Device])
+            with self.assertNumQueries(1):  # estimates for unconstrained models only
+                counts = counts_backend.get_object_counts(self.user, [Location, Device])
+        self.assertEqual(counts, {Location: 1, Device: Device.objects.count()})
+
+    def test_count_querysets(self):
+        querysets = [
+            ContentType.objects.all(),
+            ContentType.objects.none(),
+            ContentType.objects.filter(app_label="dcim"),
+        ]
+        with self.assertNumQueries(1):
+            counts = counts_backend.count_querysets(querysets)
+        self.assertEqual(counts, [ContentType.objects.count(), 0, ContentType.objects.filter(app_label="dcim").count()])
+
     def test_appropriate_models_included_in_global_search(self):
         # Gather core app configs
         existing_models = []
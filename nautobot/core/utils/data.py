@@ -1,10 +1,14 @@
 from collections import namedtuple, OrderedDict
 from decimal import Decimal
+import hashlib
+import threading
 import uuid
 
 from django.core import validators
 from django.template import engines
+from prometheus_client import Counter
 
+from nautobot.core import constants
 from nautobot.dcim import choices  # TODO move dcim.choices.CableLengthUnitChoices into core
 
 # Setup UtilizationData named tuple for use by multiple methods
@@ -92,12 +96,50 @@ def merge_dicts_without_collision(d1, d2):
     return {**d1, **d2}
 
 
-def render_jinja2(template_code, context):
+# Lookups of compiled templates by `get_jinja2_template()`, labeled by whether the template was already cached
+JINJA2_TEMPLATE_CACHE_METRIC = Counter(
+    "nautobot_jinja2_template_cache_lookups", "Lookups of compiled Jinja2 templates.", ["result"]
+)
+
+# Compiled templates by SHA-256 digest of their source, least recently used first
+_jinja2_template_cache = OrderedDict()
+_jinja2_template_cache_lock = threading.Lock()
+
+
+def get_jinja2_template(template_code):
     """
-    Render a Jinja2 template with the provided context. Return the rendered content.
+    Get the compiled Jinja2 template of the given source code.
+
+    Up to `JINJA2_TEMPLATE_CACHE_SIZE` compiled templates are kept in memory, keyed by a digest of their source, so
+    that a template rendered repeatedly (for example a computed field, once per object in a list) is only compiled once.
+    Templates that fail to compile are not cached; the error is raised on every call.
     """
     rendering_engine = engines["jinja"]
+    key = hashlib.sha256(template_code.encode()).digest()
+    with _jinja2_template_cache_lock:
+        cached = _jinja2_template_cache.get(key)
+        if cached is not None:
+            _jinja2_template_cache.move_to_end(key)
+    # Templates compiled by a previous engine (for example before the TEMPLATES setting was overridden) are stale
+    if cached is not None and cached[0] is rendering_engine:
+        JINJA2_TEMPLATE_CACHE_METRIC.labels(result="hit").inc()
+        return cached[1]
+
+    JINJA2_TEMPLATE_CACHE_METRIC.labels(result="miss").inc()
     template = rendering_engine.from_string(template_code)
+    with _jinja2_template_cache_lock:
+        _jinja2_template_cache[key] = (rendering_engine, template)
+        _jinja2_template_cache.move_to_end(key)
+        while len(_jinja2_template_cache) > constants.JINJA2_TEMPLATE_CACHE_SIZE:
+            _jinja2_template_cache.popitem(last=False)
+    return template
+
+
+def render_jinja2(template_code, context):
+    """
+    Render a Jinja2 template with the provided context. Return the rendered content.
+    """
+    template = get_jinja2_template(template_code)
     # For reasons unknown to me, django-jinja2 `template.render()` implicitly calls `mark_safe()` on the rendered text.
     # This is a security risk in general, especially so in our case because we're often using this function to render
     # a user-provided template and don't want to open ourselves up to script injection or similar issues.
@@ -97,3 +97,27 @@ def qs_filter_from_constraints(constraints, tokens=None):
             return Q()
 
     return params
+
+
+def qs_filter_from_user_permission(user, permission):
+    """
+    Construct the QuerySet filter for the constraints under which the given user has been granted the given permission.
+
+    The compiled filter is memoized on the user object (alongside its `_object_perm_cache`) so that it only needs to be
+    constructed once per permission for the lifetime of the user object, typically a single request.
+
+    Args:
+        user (User): User whose permissions have been loaded by `ObjectPermissionBackend.get_all_permissions()`.
+        permission (str): Permission name in the format <app_label>.<action>_<model>
+
+    Returns:
+        Q: Filter matching all objects on which the user has been granted the permission.
+    """
+    constraints = user._object_perm_cache[permission]
+    filter_cache = user.__dict__.setdefault("_object_perm_filter_cache", {})
+    # Recompute the filter if the user's permissions have been reloaded since it was memoized
+    cached_constraints, q_filter = filter_cache.get(permission, (None, None))
+    if cached_constraints is not constraints:
+        q_filter = qs_filter_from_constraints(constraints, {"$user": user})
+        filter_cache[permission] = (constraints, q_filter)
+    return q_filter
@@ -5,7 +5,6 @@ import sys
 import time
 
 from db_file_storage.views import get_file
-from django.apps import apps
 from django.conf import settings
 from django.contrib.auth.decorators import permission_required
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
@@ -14,7 +13,6 @@ from django.http import HttpResponseForbidden, HttpResponseServerError, JsonResp
 from django.shortcuts import get_object_or_404, render
 from django.template import loader, RequestContext, Template
 from django.template.exceptions import TemplateDoesNotExist
-from django.urls import resolve, reverse
 from django.utils.encoding import smart_str
 from django.views.csrf import csrf_failure as _csrf_failure
 from django.views.decorators.csrf import requires_csrf_token
@@ -39,9 +37,11 @@ from rest_framework.views import APIView
 
 from nautobot.core.constants import SEARCH_MAX_RESULTS
 from nautobot.core.forms import SearchForm
+from nautobot.core.graphql.backends import get_backend
 from nautobot.core.releases import get_latest_release
-from nautobot.core.utils.lookup import get_route_for_model
 from nautobot.core.utils.permissions import get_permission_for_model
+from nautobot.core.views.counts import get_object_counts
+from nautobot.core.views.search import get_search_results
 from nautobot.extras.forms import GraphQLQueryForm
 from nautobot.extras.models import FileProxy, GraphQLQuery, Status
 from nautobot.extras.registry import registry
@@ -96,6 +96,17 @@ class HomeView(AccessMixin, TemplateView):
             }
         )
 
+        # Count the objects of all models on the homepage layout at once
+        models = []
+        for panel_details in registry["homepage_layout"]["panels"].values():
+            for item_details in panel_details.get("items", {}).values():
+                if item_details.get("model") and not item_details.get("custom_template"):
+                    models.append(item_details["model"])
+                for group_item_details in item_details.get("items", {}).values():
+                    if group_item_details.get("model") and not group_item_details.get("custom_template"):
+                        models.append(group_item_details["model"])
+        object_counts = get_object_counts(request.user, models)
+
         # Loop over homepage layout to collect all additional data and create custom panels.
         for panel_details in registry["homepage_layout"]["panels"].values():
             if panel_details.get("custom_template"):
@@ -108,7 +119,7 @@ class HomeView(AccessMixin, TemplateView):
 
                     elif item_details.get("model"):
                         # If there is a model attached collect object count.
-                        item_details["count"] = item_details["model"].objects.restrict(request.user, "view").count()
+                        item_details["count"] = object_counts[item_details["model"]]
 
                     elif item_details.get("items"):
                         # Collect count for grouped objects.
@@ -118,9 +129,7 @@ class HomeView(AccessMixin, TemplateView):
                                     request, context, group_item_details
                                 )
                             elif group_item_details.get("model"):
-                                group_item_details["count"] = (
-                                    group_item_details["model"].objects.restrict(request.user, "view").count()
-                                )
+                                group_item_details["count"] = object_counts[group_item_details["model"]]
 
         return self.render_to_response(context)
 
@@ -156,47 +165,26 @@ class SearchView(AccessMixin, View):
         results = []
 
         if form.is_valid():
-            # Build the list of (app_label, modelname) tuples, representing all models included in the global search,
-            # based on the `app_config.searchable_models` list (if any) defined by each app
-            searchable_models = []
-            for app_config in apps.get_app_configs():
-                if hasattr(app_config, "searchable_models"):
-                    searchable_models += [(app_config.label, modelname) for modelname in app_config.searchable_models]
-
             if form.cleaned_data["obj_type"]:
                 # Searching for a single type of object
-                obj_types = [form.cleaned_data["obj_type"]]
+                model_names = [form.cleaned_data["obj_type"]]
             else:
                 # Searching all object types
-                obj_types = [model_info[1] for model_info in searchable_models]
-
-            for label, modelname in searchable_models:
-                if modelname not in obj_types:
-                    continue
-                # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
-                # corresponding to that URL, and finally the queryset, filterset, and table classes needed
-                # to find and display the model search results.
-                url = get_route_for_model(f"{label}.{modelname}", "list")
-                view_func = resolve(reverse(url)).func
-                # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
-                view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
-                queryset = view_or_viewset.queryset.restrict(request.user, "view")
-                # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
-                filterset = getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None))
-                # For a UIViewSet, .table_class, for an ObjectListView, .table.
-                table = getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None))
-
-                # Construct the results table for this object type
-                filtered_queryset = filterset({"q": form.cleaned_data["q"]}, queryset=queryset).qs
-                table = table(filtered_queryset, orderable=False)
+                model_names = None
+
+            # Only construct the results tables for those object types that have any matching records
+            for searchable_model, filtered_queryset in get_search_results(
+                request.user, form.cleaned_data["q"], model_names
+            ):
+                table = searchable_model.table(filtered_queryset, orderable=False)
                 table.paginate(per_page=SEARCH_MAX_RESULTS)
 
                 if table.page:
                     results.append(
                         {
-                            "name": queryset.model._meta.verbose_name_plural,
+                            "name": searchable_model.model._meta.verbose_name_plural,
                             "table": table,
-                            "url": f"{reverse(url)}?q={form.cleaned_data.get('q')}",
+                            "url": f"{searchable_model.list_url}?q={form.cleaned_data.get('q')}",
                         }
                     )
 
@@ -266,6 +254,9 @@ def csrf_failure(request, reason="", template_name="403_csrf_failure.html"):
 
 
 class CustomGraphQLView(LoginRequiredMixin, GraphQLView):
+    def get_backend(self, request):
+        return get_backend()
+
     def render_graphiql(self, request, **data):
         query_name = request.GET.get("name")
         if query_name:
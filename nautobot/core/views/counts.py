@@ -0,0 +1,167 @@
+"""
+Backend for the object counts displayed on the home page and returned by `GetObjectCountsView`.
+
+Counting all records of a large table, especially under permission constraints, can take seconds, so the counts of
+many models are obtained as follows:
+
+- For models that the user may view without any constraints, and whose tables the database estimates to have at least
+  `OBJECT_COUNTS_APPROXIMATE_THRESHOLD` rows, the estimate (PostgreSQL's `pg_class.reltuples`) is used as-is.
+- Exact counts are cached for `OBJECT_COUNTS_CACHE_TIMEOUT` seconds, keyed by model and by a signature of the
+  permission constraints under which they were counted, so that users with the same constraints share the same counts.
+- All remaining exact counts are computed together, in a single database query.
+"""
+
+import hashlib
+import logging
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+import redis.exceptions
+
+from nautobot.core import constants
+from nautobot.core.utils import permissions
+
+logger = logging.getLogger(__name__)
+
+# Signature of the counts of all records of a model, regardless of user
+UNCONSTRAINED = "all"
+
+
+def get_permission_signature(user, model, action="view"):
+    """
+    Get a signature identifying the set of records of `model` that the given user may perform `action` on.
+
+    Returns:
+        (str): `UNCONSTRAINED` if the user may act on all records, None if the user may not act on any records, and
+            otherwise a digest of the filter applied by `RestrictedQuerySet.restrict()` for the user.
+    """
+    permission_required = permissions.get_permission_for_model(model, action)
+    if user.is_superuser or permissions.permission_is_exempt(permission_required):
+        return UNCONSTRAINED
+    if not user.is_authenticated or permission_required not in user.get_all_permissions():
+        return None
+    q_filter = permissions.qs_filter_from_user_permission(user, permission_required)
+    if not q_filter:
+        return UNCONSTRAINED
+    return hashlib.sha256(str(q_filter).encode()).hexdigest()
+
+
+def _get_cache_key(model, signature):
+    return f"nautobot.core.views.counts.{model._meta.label_lower}.{signature}"
+
+
+def _get_queryset(model, user):
+    queryset = model.objects.all()
+    if hasattr(queryset, "without_tree_fields"):
+        queryset = queryset.without_tree_fields()
+    if hasattr(queryset, "restrict"):
+        queryset = queryset.restrict(user, "view")
+    return queryset.order_by()
+
+
+def get_approximate_counts(models, using="default"):
+    """
+    Get the database's estimate of the number of rows in the table of each of the given models, where available.
+
+    Returns:
+        (dict): Mapping of each model whose table has an estimated row count to that count.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql" or not models:
+        return {}
+    table_names = {connection.ops.quote_name(model._meta.db_table): model for model in models}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name, (SELECT reltuples FROM pg_class WHERE oid = to_regclass(name)) FROM unnest(%s::text[]) AS name",
+            [list(table_names)],
+        )
+        rows = cursor.fetchall()
+    # reltuples is -1 (PostgreSQL 14+) or 0 (earlier versions) for tables that have never been analyzed
+    return {table_names[name]: int(reltuples) for name, reltuples in rows if reltuples is not None and reltuples > 0}
+
+
+def count_querysets(querysets, using="default"):
+    """
+    Count the records of each of the given querysets with a single database query.
+
+    Returns:
+        (list[int]): The count of each queryset, in the same order as `querysets`.
+    """
+    counts = [0] * len(querysets)
+    subqueries = []
+    params = []
+    positions = []
+    for position, queryset in enumerate(querysets):
+        try:
+            sql, sql_params = queryset.values("pk").query.get_compiler(using=using).as_sql()
+        except EmptyResultSet:
+            # Queryset is known to be empty (for example, `.none()`) without running it
+            continue
+        # The SQL is compiled by Django, and all values in it are passed separately as parameters
+        subqueries.append(f"(SELECT COUNT(*) FROM ({sql}) AS q{position})")  # noqa: S608
+        params.extend(sql_params)
+        positions.append(position)
+    if not subqueries:
+        return counts
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(subqueries)}", params)
+        for position, count in zip(positions, cursor.fetchone()):
+            counts[position] = count
+    return counts
+
+
+def get_object_counts(user, models):
+    """
+    Get the number of records of each of the given models that the given user has permission to view.
+
+    Returns:
+        (dict): Mapping of each model to its count; counts of more than `OBJECT_COUNTS_APPROXIMATE_THRESHOLD` records
+            that the user may view without constraints are approximate.
+    """
+    counts = {}
+    signatures = {}
+    for model in models:
+        signature = get_permission_signature(user, model)
+        if signature is None:
+            counts[model] = 0
+        else:
+            signatures[model] = signature
+
+    # Estimates are only usable for querysets of all rows of a table, not for managers that filter out some rows
+    unconstrained_models = [
+        model
+        for model, signature in signatures.items()
+        if signature == UNCONSTRAINED and not _get_queryset(model, user).query.has_filters()
+    ]
+    for model, approximate_count in get_approximate_counts(unconstrained_models).items():
+        if approximate_count >= constants.OBJECT_COUNTS_APPROXIMATE_THRESHOLD:
+            counts[model] = approximate_count
+
+    remaining_models = [model for model in signatures if model not in counts]
+    try:
+        cached_counts = cache.get_many([_get_cache_key(model, signatures[model]) for model in remaining_models])
+    except redis.exceptions.ConnectionError:
+        cached_counts = {}
+    for model in remaining_models:
+        cache_key = _get_cache_key(model, signatures[model])
+        if cache_key in cached_counts:
+            counts[model] = cached_counts[cache_key]
+
+    uncounted_models = [model for model in remaining_models if model not in counts]
+    exact_counts = dict(
+        zip(uncounted_models, count_querysets([_get_queryset(model, user) for model in uncounted_models]))
+    )
+    counts.update(exact_counts)
+    # Counts made inside a transaction may include changes that are later rolled back, so are not cached
+    if exact_counts and not connections["default"].in_atomic_block:
+        try:
+            cache.set_many(
+                {_get_cache_key(model, signatures[model]): count for model, count in exact_counts.items()},
+                timeout=constants.OBJECT_COUNTS_CACHE_TIMEOUT,
+            )
+        except redis.exceptions.ConnectionError:
+            logger.warning("Unable to cache object counts, as the cache is unavailable")
+
+    return {model: counts[model] for model in models}
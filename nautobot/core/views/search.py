@@ -0,0 +1,138 @@
+"""
+Backend for the global search provided by `SearchView`.
+
+Resolving the list view (and hence the queryset, filterset, and table classes) of every searchable model requires a
+URL reversal and resolution per model, so the resulting mapping is computed only once per process and then reused.
+Each search then checks all requested models for matches with a single query, so that only the models that actually
+have matching records need their (more expensive) paginated results tables to be constructed.
+"""
+
+from collections import namedtuple
+import threading
+
+from django.apps import apps
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.urls import resolve, reverse
+
+from nautobot.core.utils.lookup import get_route_for_model
+
+# namedtuple describing a model included in the global search and the classes used to search for and display it.
+SearchableModel = namedtuple(
+    "SearchableModel",
+    ["app_label", "model_name", "model", "list_url", "queryset", "filterset", "table"],
+)
+
+_searchable_models = None
+_searchable_models_lock = threading.Lock()
+
+
+def get_searchable_models():
+    """
+    Get the list of all models included in the global search, in app and `searchable_models` order.
+
+    The list is built from the `searchable_models` attribute (if any) of each app config the first time this function
+    is called, and cached thereafter.
+
+    Returns:
+        (list[SearchableModel]): Searchable models and their associated queryset, filterset, and table classes.
+    """
+    global _searchable_models
+
+    with _searchable_models_lock:
+        if _searchable_models is None:
+            searchable_models = []
+            for app_config in apps.get_app_configs():
+                for model_name in getattr(app_config, "searchable_models", []):
+                    searchable_models.append(_get_searchable_model(app_config.label, model_name))
+            _searchable_models = searchable_models
+        return _searchable_models
+
+
+def clear_searchable_models_cache():
+    """Discard the cached list of searchable models, for example after the URL configuration has been changed."""
+    global _searchable_models
+
+    with _searchable_models_lock:
+        _searchable_models = None
+
+
+def _get_searchable_model(app_label, model_name):
+    # Based on the label and modelname, reverse-lookup the list URL, then the view or UIViewSet
+    # corresponding to that URL, and finally the queryset, filterset, and table classes needed
+    # to find and display the model search results.
+    list_url = reverse(get_route_for_model(f"{app_label}.{model_name}", "list"))
+    view_func = resolve(list_url).func
+    # For a UIViewSet, view_func.cls gets what we need; for an ObjectListView, view_func.view_class is it.
+    view_or_viewset = getattr(view_func, "cls", getattr(view_func, "view_class", None))
+    return SearchableModel(
+        app_label=app_label,
+        model_name=model_name,
+        model=view_or_viewset.queryset.model,
+        list_url=list_url,
+        queryset=view_or_viewset.queryset,
+        # For a UIViewSet, .filterset_class, for an ObjectListView, .filterset.
+        filterset=getattr(view_or_viewset, "filterset_class", getattr(view_or_viewset, "filterset", None)),
+        # For a UIViewSet, .table_class, for an ObjectListView, .table.
+        table=getattr(view_or_viewset, "table_class", getattr(view_or_viewset, "table", None)),
+    )
+
+
+def evaluate_exists(querysets):
+    """
+    Check whether each of the given querysets has any results, with a single query per database.
+
+    The `EXISTS` check of each queryset is included as a subquery of the same `SELECT` statement, which is run on the
+    current database connection, so that any uncommitted changes of the current transaction are taken into account.
+
+    Args:
+        querysets (list[QuerySet]): Querysets to check.
+
+    Returns:
+        (list[bool]): Whether each queryset has any results, in the same order as `querysets`.
+    """
+    results = [False] * len(querysets)
+    subqueries_by_db = {}
+    for index, queryset in enumerate(querysets):
+        try:
+            sql, params = queryset.query.exists(using=queryset.db).get_compiler(queryset.db).as_sql()
+        except EmptyResultSet:
+            # The queryset can't match anything
+            continue
+        subqueries_by_db.setdefault(queryset.db, []).append((index, sql, params))
+
+    for db, subqueries in subqueries_by_db.items():
+        with connections[db].cursor() as cursor:
+            cursor.execute(
+                "SELECT " + ", ".join(f"EXISTS({sql})" for _, sql, _ in subqueries),
+                [param for _, _, params in subqueries for param in params],
+            )
+            row = cursor.fetchone()
+        for (index, _, _), exists in zip(subqueries, row):
+            results[index] = bool(exists)
+    return results
+
+
+def get_search_results(user, q, model_names=None):
+    """
+    Search the given searchable models (or all searchable models) for records matching the query `q`.
+
+    Args:
+        user (User): User performing the search; only records the user has permission to view are matched.
+        q (str): Search query, as accepted by the `q` filter of each model's filterset.
+        model_names (list[str]): Names of the models to search; if unspecified, all searchable models are searched.
+
+    Returns:
+        (list[tuple[SearchableModel, QuerySet]]): Each searchable model with at least one matching record, and the
+            queryset of its matching records, in the same order as `get_searchable_models()`.
+    """
+    candidates = []
+    for searchable_model in get_searchable_models():
+        if model_names and searchable_model.model_name not in model_names:
+            continue
+        queryset = searchable_model.queryset.restrict(user, "view")
+        filtered_queryset = searchable_model.filterset({"q": q}, queryset=queryset).qs
+        candidates.append((searchable_model, filtered_queryset))
+
+    matches = evaluate_exists([filtered_queryset for _, filtered_queryset in candidates])
+    return [candidate for candidate, matched in zip(candidates, matches) if matched]
@@ -21,6 +21,7 @@ from nautobot.core.api.utils import get_serializer_for_model
 from nautobot.core.api.views import ModelViewSet
 from nautobot.core.models.querysets import count_related
 from nautobot.dcim import filters
+from nautobot.dcim.elevations import get_rack_elevation_svgs
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -205,9 +206,10 @@ class RackViewSet(NautobotModelViewSet):
         data = serializer.validated_data
 
         if data["render"] == "svg":
-            # Render and return the elevation as an SVG drawing with the correct content type
-            drawing = rack.get_elevation_svg(
-                face=data["face"],
+            # Render (or retrieve from the cache) and return the elevation as an SVG drawing with the correct content type
+            svgs = get_rack_elevation_svgs(
+                [rack],
+                faces=[data["face"]],
                 user=request.user,
                 unit_width=data["unit_width"],
                 unit_height=data["unit_height"],
@@ -216,7 +218,7 @@ class RackViewSet(NautobotModelViewSet):
                 base_url=request.build_absolute_uri("/"),
                 display_fullname=data["display_fullname"],
             )
-            return HttpResponse(drawing.tostring(), content_type="image/svg+xml")
+            return HttpResponse(svgs[(rack.pk, data["face"])], content_type="image/svg+xml")
 
         else:
             # Return a JSON representation of the rack units in the elevation
@@ -0,0 +1,328 @@
+"""
+Batched tracing and rebuilding of CablePaths.
+
+`CablePath.from_origin()` follows a path one hop at a time, querying the database for each cable peer, rear port, and
+front port along the way. `CablePathTracer` instead traces any number of origins in lockstep: at each step it collects
+the nodes that all of the in-progress traces need next and loads them with a single query per model, so that the
+number of queries depends on the length of the longest path rather than on the number of paths being traced.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from nautobot.dcim.utils import compile_path_node
+
+# Maximum number of primary keys to include in a single `pk__in` lookup, and number of CablePaths to write per query
+CABLE_PATH_BATCH_SIZE = 1000
+
+# Fields loaded for every cable termination, plus any additional fields needed to follow specific termination types
+NODE_FIELDS = ("pk", "cable_id", "cable__status_id", "_cable_peer_type_id", "_cable_peer_id")
+EXTRA_NODE_FIELDS = {
+    ("circuits", "circuittermination"): ("circuit_id", "term_side"),
+    ("dcim", "frontport"): ("rear_port_id", "rear_port_position"),
+    ("dcim", "rearport"): ("positions",),
+}
+
+
+def _chunks(values, chunk_size):
+    values = list(values)
+    for i in range(0, len(values), chunk_size):
+        yield values[i : i + chunk_size]
+
+
+class CablePathTracer:
+    """
+    Trace CablePaths from many origins at once, loading the cable and port adjacency they need in batches.
+
+    Nodes are identified by `(content_type_id, pk)` tuples. Nodes loaded by one call to `trace()` or `rebuild()` are
+    kept for the lifetime of the tracer, so a tracer should not be reused after cables or ports have been modified.
+    """
+
+    def __init__(self, batch_size=None):
+        # Avoid circular imports
+        from nautobot.circuits.models import CircuitTermination
+        from nautobot.dcim.models import Cable, FrontPort, RearPort
+
+        self.batch_size = batch_size or CABLE_PATH_BATCH_SIZE
+        self.cable_ct_id = ContentType.objects.get_for_model(Cable).pk
+        self.circuit_termination_ct_id = ContentType.objects.get_for_model(CircuitTermination).pk
+        self.front_port_ct_id = ContentType.objects.get_for_model(FrontPort).pk
+        self.rear_port_ct_id = ContentType.objects.get_for_model(RearPort).pk
+        self.connected_status_id = Cable.STATUS_CONNECTED.pk if Cable.STATUS_CONNECTED is not None else None
+
+        # Mapping of node key to a dict of its NODE_FIELDS values (or None, if it does not exist)
+        self._nodes = {}
+        # Mapping of (rear port pk, position) to the node key of the corresponding FrontPort
+        self._front_ports_by_position = {}
+        self._rear_ports_loaded = set()
+        # Mapping of (circuit pk, term_side) to the node key of the corresponding CircuitTermination
+        self._circuit_terminations_by_side = {}
+        self._circuits_loaded = set()
+
+    def trace(self, origin_keys):
+        """
+        Trace the CablePath originating from each of the given origins.
+
+        Args:
+            origin_keys (iterable): `(content_type_id, pk)` of each PathEndpoint to trace from.
+
+        Returns:
+            (dict): Mapping of each origin key to a new, unsaved, `CablePath`, or to None if the origin has no cable.
+        """
+        traces = {origin_key: self._trace(origin_key) for origin_key in origin_keys}
+        results = {}
+        requests = self._advance(traces, traces.keys(), results)
+        while requests:
+            self._load(requests.values())
+            requests = self._advance(traces, requests.keys(), results)
+        return results
+
+    def rebuild(self, origin_keys):
+        """
+        Trace the given origins and update, create, or delete their CablePaths to match.
+
+        Existing CablePaths are updated in place rather than being deleted and recreated.
+
+        Args:
+            origin_keys (iterable): `(content_type_id, pk)` of each PathEndpoint to rebuild the CablePath of.
+
+        Returns:
+            (tuple[int, int, int]): The number of CablePaths created, updated, and deleted.
+        """
+        from nautobot.dcim.models import CablePath
+
+        paths = self.trace(dict.fromkeys(origin_keys))
+        origins_by_type = {}
+        for origin_type_id, origin_id in paths:
+            origins_by_type.setdefault(origin_type_id, []).append(origin_id)
+
+        with transaction.atomic():
+            existing_paths = {}
+            for origin_type_id, origin_ids in origins_by_type.items():
+                for chunk in _chunks(origin_ids, self.batch_size):
+                    for pk, origin_id in CablePath.objects.filter(
+                        origin_type_id=origin_type_id, origin_id__in=chunk
+                    ).values_list("pk", "origin_id"):
+                        existing_paths[(origin_type_id, origin_id)] = pk
+
+            to_create, to_update, to_delete = [], [], []
+            for origin_key, path in paths.items():
+                existing_pk = existing_paths.get(origin_key)
+                if path is None:
+                    if existing_pk is not None:
+                        to_delete.append(existing_pk)
+                elif existing_pk is not None:
+                    path.pk = existing_pk
+                    to_update.append(path)
+                else:
+                    to_create.append(path)
+
+            for chunk in _chunks(to_delete, self.batch_size):
+                CablePath.objects.filter(pk__in=chunk).delete()
+            CablePath.objects.bulk_update(
+                to_update,
+                ["destination_type", "destination_id", "path", "is_active", "is_split"],
+                batch_size=self.batch_size,
+            )
+            CablePath.objects.bulk_create(to_create, batch_size=self.batch_size)
+
+            # Record a direct reference to each new CablePath on its originating object
+            new_paths_by_type = {}
+            for path in to_create:
+                new_paths_by_type.setdefault(path.origin_type_id, []).append(path)
+            for origin_type_id, new_paths in new_paths_by_type.items():
+                model = ContentType.objects.get_for_id(origin_type_id).model_class()
+                model.objects.bulk_update(
+                    [model(pk=path.origin_id, _path_id=path.pk) for path in new_paths],
+                    ["_path"],
+                    batch_size=self.batch_size,
+                )
+
+        return len(to_create), len(to_update), len(to_delete)
+
+    def _advance(self, traces, origin_keys, results):
+        """Resume the given traces until each either needs more data to be loaded or has finished."""
+        requests = {}
+        for origin_key in origin_keys:
+            try:
+                requests[origin_key] = next(traces[origin_key])
+            except StopIteration as exc:
+                results[origin_key] = exc.value
+        return requests
+
+    def _load(self, requests):
+        """Load the data needed to satisfy the given requests, using one query per model and kind of request."""
+        from nautobot.circuits.models import CircuitTermination
+        from nautobot.dcim.models import FrontPort
+
+        node_pks_by_type = {}
+        rear_port_pks = set()
+        circuit_pks = set()
+        for kind, value in requests:
+            if kind == "node":
+                node_pks_by_type.setdefault(value[0], set()).add(value[1])
+            elif kind == "front_ports":
+                rear_port_pks.add(value)
+            elif kind == "circuit":
+                circuit_pks.add(value)
+
+        for ct_id, pks in node_pks_by_type.items():
+            model = ContentType.objects.get_for_id(ct_id).model_class()
+            for chunk in _chunks(pks, self.batch_size):
+                self._load_nodes(ct_id, model.objects.filter(pk__in=chunk))
+            for pk in pks:
+                self._nodes.setdefault((ct_id, pk), None)
+
+        for chunk in _chunks(rear_port_pks, self.batch_size):
+            for node in self._load_nodes(self.front_port_ct_id, FrontPort.objects.filter(rear_port_id__in=chunk)):
+                self._front_ports_by_position[(node["rear_port_id"], node["rear_port_position"])] = (
+                    self.front_port_ct_id,
+                    node["pk"],
+                )
+            self._rear_ports_loaded.update(chunk)
+
+        for chunk in _chunks(circuit_pks, self.batch_size):
+            for node in self._load_nodes(
+                self.circuit_termination_ct_id, CircuitTermination.objects.filter(circuit_id__in=chunk)
+            ):
+                self._circuit_terminations_by_side[(node["circuit_id"], node["term_side"])] = (
+                    self.circuit_termination_ct_id,
+                    node["pk"],
+                )
+            self._circuits_loaded.update(chunk)
+
+    def _load_nodes(self, ct_id, queryset):
+        model = queryset.model
+        fields = NODE_FIELDS + EXTRA_NODE_FIELDS.get((model._meta.app_label, model._meta.model_name), ())
+        nodes = list(queryset.values(*fields))
+        for node in nodes:
+            self._nodes[(ct_id, node["pk"])] = node
+        return nodes
+
+    def _get_node(self, node_key):
+        if node_key[0] is None or node_key[1] is None:
+            return None
+        if node_key not in self._nodes:
+            yield ("node", node_key)
+        return self._nodes[node_key]
+
+    def _get_front_port_key(self, rear_port_pk, position):
+        if rear_port_pk not in self._rear_ports_loaded:
+            yield ("front_ports", rear_port_pk)
+        return self._front_ports_by_position.get((rear_port_pk, position))
+
+    def _get_circuit_peer_key(self, circuit_termination):
+        circuit_pk = circuit_termination["circuit_id"]
+        if circuit_pk not in self._circuits_loaded:
+            yield ("circuit", circuit_pk)
+        peer_side = "Z" if circuit_termination["term_side"] == "A" else "A"
+        return self._circuit_terminations_by_side.get((circuit_pk, peer_side))
+
+    def _trace(self, origin_key):
+        """
+        Generator tracing the path from the given origin, following the same rules as `CablePath.from_origin()`.
+
+        Yields a request whenever a node that has not yet been loaded is needed, and returns the resulting CablePath.
+        """
+        from nautobot.dcim.models import CablePath
+
+        origin = yield from self._get_node(origin_key)
+        if origin is None or origin["cable_id"] is None:
+            return None
+
+        destination_key = (None, None)
+        path = []
+        position_stack = []
+        is_active = True
+        is_split = False
+
+        node_key, node = origin_key, origin
+        visited_nodes = set()
+        while node["cable_id"] is not None:
+            if node_key[1] in visited_nodes:
+                raise ValidationError("a loop is detected in the path")
+            visited_nodes.add(node_key[1])
+            if node["cable__status_id"] != self.connected_status_id:
+                is_active = False
+
+            # Follow the cable to its far-end termination
+            path.append(compile_path_node(self.cable_ct_id, node["cable_id"]))
+            peer_key = (node["_cable_peer_type_id"], node["_cable_peer_id"])
+            peer = yield from self._get_node(peer_key)
+
+            if peer is None:
+                break
+
+            # Follow a FrontPort to its corresponding RearPort
+            if peer_key[0] == self.front_port_ct_id:
+                path.append(compile_path_node(*peer_key))
+                node_key = (self.rear_port_ct_id, peer["rear_port_id"])
+                node = yield from self._get_node(node_key)
+                if node["positions"] > 1:
+                    position_stack.append(peer["rear_port_position"])
+                path.append(compile_path_node(*node_key))
+
+            # Follow a RearPort to its corresponding FrontPort (if any)
+            elif peer_key[0] == self.rear_port_ct_id:
+                path.append(compile_path_node(*peer_key))
+
+                # Determine the peer FrontPort's position
+                if peer["positions"] == 1:
+                    position = 1
+                elif position_stack:
+                    position = position_stack.pop()
+                else:
+                    # No position indicated: path has split, so we stop at the RearPort
+                    is_split = True
+                    break
+
+                node_key = yield from self._get_front_port_key(peer_key[1], position)
+                if node_key is None:
+                    # No corresponding FrontPort found for the RearPort
+                    break
+                node = self._nodes[node_key]
+                path.append(compile_path_node(*node_key))
+
+            # Follow a CircuitTermination to the CircuitTermination on the other side of its Circuit (if any)
+            elif peer_key[0] == self.circuit_termination_ct_id:
+                node_key = yield from self._get_circuit_peer_key(peer)
+                # A Circuit Termination does not require a peer.
+                if node_key is None:
+                    destination_key = peer_key
+                    break
+                node = self._nodes[node_key]
+                path.append(compile_path_node(*peer_key))
+                path.append(compile_path_node(*node_key))
+
+            # Anything else marks the end of the path
+            else:
+                destination_key = peer_key
+                break
+
+        if destination_key[1] is None:
+            is_active = False
+
+        return CablePath(
+            origin_type_id=origin_key[0],
+            origin_id=origin_key[1],
+            destination_type_id=destination_key[0],
+            destination_id=destination_key[1],
+            path=path,
+            is_active=is_active,
+            is_split=is_split,
+        )
+
+
+def rebuild_cable_paths(origins=(), cable_paths=None):
+    """
+    Rebuild the CablePaths originating from the given PathEndpoint instances and/or from the origins of the given
+    CablePath queryset, using a single `CablePathTracer`.
+
+    Returns:
+        (tuple[int, int, int]): The number of CablePaths created, updated, and deleted.
+    """
+    origin_keys = [(ContentType.objects.get_for_model(origin).pk, origin.pk) for origin in origins]
+    if cable_paths is not None:
+        origin_keys += list(cable_paths.values_list("origin_type_id", "origin_id"))
+    return CablePathTracer().rebuild(origin_keys)
@@ -10,6 +10,9 @@ RACK_U_HEIGHT_DEFAULT = 42
 
 RACK_ELEVATION_BORDER_WIDTH = 2
 RACK_ELEVATION_LEGEND_WIDTH_DEFAULT = 30
+# Maximum time (in seconds) to cache a rendered rack elevation; elevations are also invalidated whenever the rack, or a
+# device or reservation within it, is saved or deleted, but not when other related objects (such as roles) change
+RACK_ELEVATION_SVG_CACHE_TIMEOUT = 900
 
 
 #
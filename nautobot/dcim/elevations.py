@@ -1,12 +1,33 @@
+import functools
+import hashlib
+import logging
+import uuid
+
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Prefetch, prefetch_related_objects
 from django.urls import reverse
 from django.utils.http import urlencode
+import redis.exceptions
 import svgwrite
 
 from nautobot.core.utils.config import get_settings_or_config
 
 from .choices import DeviceFaceChoices
-from .constants import RACK_ELEVATION_BORDER_WIDTH
+from .constants import (
+    RACK_ELEVATION_BORDER_WIDTH,
+    RACK_ELEVATION_LEGEND_WIDTH_DEFAULT,
+    RACK_ELEVATION_SVG_CACHE_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_stylesheet():
+    with open(f"{settings.STATICFILES_DIRS[0]}/css/rack_elevation.css") as css_file:
+        return css_file.read()
 
 
 class RackElevationSVG:
@@ -17,10 +38,22 @@ class RackElevationSVG:
     :param user: User instance. If specified, only devices viewable by this user will be fully displayed.
     :param include_images: If true, the SVG document will embed front/rear device face images, where available
     :param base_url: Base URL for links within the SVG document. If none, links will be relative.
+    :param devices: Devices installed within the rack, as returned by `Rack.get_installed_devices()` (optional)
+    :param permitted_device_ids: PKs of the devices viewable by the user (optional); if specified, `user` is ignored
     """
 
-    def __init__(self, rack, user=None, include_images=True, base_url=None, display_fullname=True):
+    def __init__(
+        self,
+        rack,
+        user=None,
+        include_images=True,
+        base_url=None,
+        display_fullname=True,
+        devices=None,
+        permitted_device_ids=None,
+    ):
         self.rack = rack
+        self.devices = devices
         self.include_images = include_images
         self.display_fullname = display_fullname
         if base_url is not None:
@@ -29,10 +62,12 @@ class RackElevationSVG:
             self.base_url = ""
 
         # Determine the subset of devices within this rack that are viewable by the user, if any
-        permitted_devices = self.rack.devices
-        if user is not None:
-            permitted_devices = permitted_devices.restrict(user, "view")
-        self.permitted_device_ids = permitted_devices.values_list("pk", flat=True)
+        if permitted_device_ids is None:
+            permitted_devices = self.rack.devices
+            if user is not None:
+                permitted_devices = permitted_devices.restrict(user, "view")
+            permitted_device_ids = permitted_devices.values_list("pk", flat=True)
+        self.permitted_device_ids = permitted_device_ids
 
     @staticmethod
     def _get_device_description(device):
@@ -76,8 +111,7 @@ class RackElevationSVG:
         drawing = svgwrite.Drawing(size=(width, height))
 
         # add the stylesheet
-        with open(f"{settings.STATICFILES_DIRS[0]}/css/rack_elevation.css") as css_file:
-            drawing.defs.add(drawing.style(css_file.read()))
+        drawing.defs.add(drawing.style(_get_stylesheet()))
 
         # add gradients
         RackElevationSVG._add_gradient(drawing, "reserved", "#c7c7ff")
@@ -91,7 +125,10 @@ class RackElevationSVG:
     def _draw_device_front(self, drawing, device, start, end, text):
         device_bay_details = ""
         if device.device_bay_count:
-            device_bay_details += f" ({device.get_children().count()}/{device.device_bay_count})"
+            child_device_count = getattr(device, "child_device_count", None)
+            if child_device_count is None:
+                child_device_count = device.get_children().count()
+            device_bay_details += f" ({child_device_count}/{device.device_bay_count})"
 
         device_fullname = str(device) + device_bay_details
         device_shortname = settings.UI_RACK_VIEW_TRUNCATE_FUNCTION(str(device)) + device_bay_details
@@ -183,7 +220,7 @@ class RackElevationSVG:
         query_params = urlencode(
             {
                 "rack": rack.pk,
-                "location": rack.location.pk,
+                "location": rack.location_id,
                 "face": face_id,
                 "position": id_,
             }
@@ -200,12 +237,12 @@ class RackElevationSVG:
         link.add(drawing.text("add device", insert=text, class_="add-device"))
 
     def merge_elevations(self, face):
-        elevation = self.rack.get_rack_units(face=face, expand_devices=False)
+        elevation = self.rack.get_rack_units(face=face, expand_devices=False, devices=self.devices)
         if face == DeviceFaceChoices.FACE_REAR:
             other_face = DeviceFaceChoices.FACE_FRONT
         else:
             other_face = DeviceFaceChoices.FACE_REAR
-        other = self.rack.get_rack_units(face=other_face)
+        other = self.rack.get_rack_units(face=other_face, devices=self.devices)
 
         unit_cursor = 0
         for u in elevation:
@@ -310,3 +347,143 @@ class RackElevationSVG:
         drawing.add(frame)
 
         return drawing
+
+
+def _get_version_key(rack_pk):
+    return f"nautobot.dcim.elevations.version.{rack_pk}"
+
+
+def get_rack_elevation_versions(rack_pks):
+    """
+    Get the current device placement version of each of the given racks, by which their cached elevations are keyed.
+
+    A rack's version changes whenever the rack, or a device or reservation within it, is saved or deleted (see
+    `invalidate_rack_elevations()`), so that elevations rendered before then are no longer used.
+
+    :return: A dictionary mapping the PK of each rack to its version
+    """
+    version_keys = {_get_version_key(pk): pk for pk in rack_pks}
+    cached_versions = cache.get_many(list(version_keys))
+    new_versions = {key: uuid.uuid4().hex for key in version_keys if key not in cached_versions}
+    if new_versions:
+        cache.set_many(new_versions, timeout=RACK_ELEVATION_SVG_CACHE_TIMEOUT)
+    return {version_keys[key]: version for key, version in {**cached_versions, **new_versions}.items()}
+
+
+def invalidate_rack_elevations(*rack_pks):
+    """Change the device placement version of each of the given racks, invalidating their cached elevations."""
+    version_keys = [_get_version_key(pk) for pk in rack_pks if pk is not None]
+    if not version_keys:
+        return
+    try:
+        cache.delete_many(version_keys)
+    except redis.exceptions.ConnectionError:
+        logger.warning("Unable to invalidate cached rack elevations, as the cache is unavailable")
+
+
+def get_rack_elevation_svgs(
+    racks,
+    faces=None,
+    user=None,
+    unit_width=None,
+    unit_height=None,
+    legend_width=RACK_ELEVATION_LEGEND_WIDTH_DEFAULT,
+    include_images=True,
+    base_url=None,
+    display_fullname=True,
+):
+    """
+    Get the SVG documents of the elevations of the given racks, identical to those rendered by `get_elevation_svg()`.
+
+    Rendered elevations are cached for `RACK_ELEVATION_SVG_CACHE_TIMEOUT` seconds, keyed by rack, device placement
+    version, face, rendering options, and a signature of the user's permission to view devices. Those not found in the
+    cache are rendered together, with the devices of all racks (on both faces) loaded by a single query rather than
+    several queries per rack and face.
+
+    :param racks: Racks to render the elevations of
+    :param faces: Faces of the racks to render; defaults to both front and rear
+    :return: A dictionary mapping each (rack PK, face) to its SVG document, as a string
+
+    See `Rack.get_elevation_svg()` for the remaining parameters.
+    """
+    from nautobot.core.views.counts import get_permission_signature, UNCONSTRAINED
+    from nautobot.dcim.models import Device, Rack, RackReservation
+
+    racks = list(racks)
+    if faces is None:
+        faces = DeviceFaceChoices.values()
+    if unit_width is None:
+        unit_width = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_WIDTH")
+    if unit_height is None:
+        unit_height = get_settings_or_config("RACK_ELEVATION_DEFAULT_UNIT_HEIGHT")
+    signature = UNCONSTRAINED if user is None else get_permission_signature(user, Device)
+    options = (
+        signature,
+        unit_width,
+        unit_height,
+        legend_width,
+        include_images,
+        base_url,
+        display_fullname,
+        get_settings_or_config("RACK_ELEVATION_UNIT_TWO_DIGIT_FORMAT"),
+    )
+    options_digest = hashlib.sha256(repr(options).encode()).hexdigest()
+
+    svgs = {}
+    cache_keys = {}
+    try:
+        versions = get_rack_elevation_versions([rack.pk for rack in racks])
+        cache_keys = {
+            (rack.pk, face): f"nautobot.dcim.elevations.svg.{rack.pk}.{versions[rack.pk]}.{face}.{options_digest}"
+            for rack in racks
+            for face in faces
+        }
+        cached_svgs = cache.get_many(list(cache_keys.values()))
+    except redis.exceptions.ConnectionError:
+        cached_svgs = {}
+    for key, cache_key in cache_keys.items():
+        if cache_key in cached_svgs:
+            svgs[key] = cached_svgs[cache_key]
+
+    uncached_racks = [rack for rack in racks if any((rack.pk, face) not in svgs for face in faces)]
+    if not uncached_racks:
+        return svgs
+
+    rack_devices = Rack.get_installed_devices(uncached_racks)
+    if signature == UNCONSTRAINED:
+        permitted_device_ids = {device.pk for devices in rack_devices.values() for device in devices}
+    elif signature is None:
+        permitted_device_ids = set()
+    else:
+        permitted_device_ids = set(
+            Device.objects.restrict(user, "view").filter(rack__in=uncached_racks).values_list("pk", flat=True)
+        )
+    prefetch_related_objects(
+        uncached_racks, Prefetch("rack_reservations", queryset=RackReservation.objects.select_related("user"))
+    )
+
+    rendered_svgs = {}
+    for rack in uncached_racks:
+        elevation = RackElevationSVG(
+            rack,
+            include_images=include_images,
+            base_url=base_url,
+            display_fullname=display_fullname,
+            devices=rack_devices[rack.pk],
+            permitted_device_ids=permitted_device_ids,
+        )
+        for face in faces:
+            if (rack.pk, face) not in svgs:
+                svgs[(rack.pk, face)] = elevation.render(face, unit_width, unit_height, legend_width).tostring()
+                rendered_svgs[(rack.pk, face)] = svgs[(rack.pk, face)]
+
+    # Elevations rendered inside a transaction may include changes that are later rolled back, so are not cached
+    if cache_keys and not connections["default"].in_atomic_block:
+        try:
+            cache.set_many(
+                {cache_keys[key]: svg for key, svg in rendered_svgs.items()}, timeout=RACK_ELEVATION_SVG_CACHE_TIMEOUT
+            )
+        except redis.exceptions.ConnectionError:
+            logger.warning("Unable to cache rack elevations, as the cache is unavailable")
+
+    return svgs
@@ -0,0 +1,94 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cablepaths import CablePathTracer
+from nautobot.dcim.models import (
+    ConsolePort,
+    ConsoleServerPort,
+    Interface,
+    Location,
+    PowerFeed,
+    PowerOutlet,
+    PowerPort,
+)
+
+# Mapping of each PathEndpoint model to the lookup of the Location it belongs to
+ENDPOINT_MODEL_LOCATION_LOOKUPS = {
+    CircuitTermination: "location",
+    ConsolePort: "device__location",
+    ConsoleServerPort: "device__location",
+    Interface: "device__location",
+    PowerFeed: "power_panel__location",
+    PowerOutlet: "device__location",
+    PowerPort: "device__location",
+}
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cable paths of all cable termination objects in Nautobot, one location at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--location",
+            action="append",
+            dest="locations",
+            metavar="NAME",
+            help="Only rebuild the cable paths originating at the named location (may be specified more than once)",
+        )
+
+    def get_origin_keys(self, location_filters):
+        """
+        Get the (content type ID, pk) of each path endpoint matching the given location filters that has a cable or path.
+        """
+        origin_keys = []
+        for model, location_filter in location_filters.items():
+            content_type_id = ContentType.objects.get_for_model(model).pk
+            origin_pks = (
+                model.objects.filter(location_filter)
+                .filter(Q(cable__isnull=False) | Q(_path__isnull=False))
+                .values_list("pk", flat=True)
+            )
+            origin_keys += [(content_type_id, pk) for pk in origin_pks]
+        return origin_keys
+
+    def rebuild(self, name, origin_keys):
+        if not origin_keys:
+            self.stdout.write(f"Found no cable paths for {name}; skipping")
+            return (0, 0, 0)
+        counts = CablePathTracer().rebuild(origin_keys)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt cable paths for {name}: {counts[0]} created, {counts[1]} updated, {counts[2]} deleted"
+            )
+        )
+        return counts
+
+    def handle(self, *args, **options):
+        locations = Location.objects.all()
+        if options["locations"]:
+            locations = locations.filter(name__in=options["locations"])
+            missing_names = set(options["locations"]) - set(locations.values_list("name", flat=True))
+            if missing_names:
+                raise CommandError(f"Location(s) not found: {', '.join(sorted(missing_names))}")
+
+        totals = [0, 0, 0]
+        for location in locations:
+            origin_keys = self.get_origin_keys(
+                {model: Q(**{lookup: location}) for model, lookup in ENDPOINT_MODEL_LOCATION_LOOKUPS.items()}
+            )
+            for i, count in enumerate(self.rebuild(f"location {location.display}", origin_keys)):
+                totals[i] += count
+
+        if not options["locations"]:
+            # Also rebuild the paths of any path endpoints that do not belong to any location
+            origin_keys = self.get_origin_keys(
+                {model: Q(**{f"{lookup}__isnull": True}) for model, lookup in ENDPOINT_MODEL_LOCATION_LOOKUPS.items()}
+            )
+            for i, count in enumerate(self.rebuild("path endpoints without a location", origin_keys)):
+                totals[i] += count
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Finished: {totals[0]} created, {totals[1]} updated, {totals[2]} deleted.")
+        )
@@ -1,8 +1,10 @@
+from django.contrib.contenttypes.models import ContentType
 from django.core.management.base import BaseCommand
 from django.core.management.color import no_style
 from django.db import connection
 
 from nautobot.circuits.models import CircuitTermination
+from nautobot.dcim.cablepaths import CABLE_PATH_BATCH_SIZE, CablePathTracer
 from nautobot.dcim.models import (
     CablePath,
     ConsolePort,
@@ -12,7 +14,6 @@ from nautobot.dcim.models import (
     PowerOutlet,
     PowerPort,
 )
-from nautobot.dcim.signals import create_cablepath
 
 ENDPOINT_MODELS = (
     CircuitTermination,
@@ -88,11 +89,14 @@ class Command(BaseCommand):
                 self.stdout.write(f"Found no missing {model._meta.verbose_name} paths; skipping")
                 continue
             self.stdout.write(f"Retracing {origins_count} cabled {model._meta.verbose_name_plural}...")
+            content_type_id = ContentType.objects.get_for_model(model).pk
+            origin_pks = list(origins.values_list("pk", flat=True))
             i = 0
-            for i, obj in enumerate(origins, start=1):
-                create_cablepath(obj)
-                if not i % 100:
-                    self.draw_progress_bar(i * 100 / origins_count)
+            while i < len(origin_pks):
+                chunk = origin_pks[i : i + CABLE_PATH_BATCH_SIZE]
+                CablePathTracer().rebuild((content_type_id, pk) for pk in chunk)
+                i += len(chunk)
+                self.draw_progress_bar(i * 100 / len(origin_pks))
             self.draw_progress_bar(100)
             self.stdout.write(self.style.SUCCESS(f"\n  Retraced {i} {model._meta.verbose_name_plural}"))
 
@@ -637,6 +637,14 @@ class Device(PrimaryModel, ConfigContextModel):
     def __str__(self):
         return self.display or super().__str__()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Used to invalidate the cached elevation of the rack that the device is moved out of, if any
+        if "rack_id" in instance.__dict__:
+            instance._original_rack_id = instance.rack_id
+        return instance
+
     def validate_unique(self, exclude=None):
         # Check for a duplicate name on a device assigned to the same Location and no Tenant. This is necessary
         # because Django does not consider two NULL fields to be equal, and thus will not trigger a violation
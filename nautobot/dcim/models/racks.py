@@ -253,12 +253,37 @@ class Rack(PrimaryModel):
             return f"{self.name} ({self.facility_id})"
         return self.name
 
+    @classmethod
+    def get_installed_devices(cls, racks, exclude=None):
+        """
+        Return the devices that occupy units of each of the given racks, on either face, loaded with a single query.
+
+        :param racks: Racks (or rack PKs) to load the devices of
+        :param exclude: PK of a Device to exclude (optional)
+        :return: A dictionary mapping the PK of each rack to a list of its devices, as used by `get_rack_units()`
+        """
+        rack_devices = {getattr(rack, "pk", rack): [] for rack in racks}
+        queryset = (
+            Device.objects.select_related("device_type", "device_type__manufacturer", "role")
+            .annotate(
+                device_bay_count=Count("device_bays"),
+                child_device_count=Count("device_bays", filter=Q(device_bays__installed_device__isnull=False)),
+            )
+            .exclude(pk=exclude)
+            .filter(rack__in=list(rack_devices), position__gt=0, device_type__u_height__gt=0)
+        )
+        for device in queryset:
+            rack_devices[device.rack_id].append(device)
+        return rack_devices
+
     def get_rack_units(
         self,
         user=None,
         face=DeviceFaceChoices.FACE_FRONT,
         exclude=None,
         expand_devices=True,
+        devices=None,
+        permitted_device_ids=None,
     ):
         """
         Return a list of rack units as dictionaries. Example: {'device': None, 'face': 0, 'id': 48, 'name': 'U48'}
@@ -271,6 +296,10 @@ class Rack(PrimaryModel):
         :param expand_devices: When True, all units that a device occupies will be listed with each containing a
             reference to the device. When False, only the bottom most unit for a device is included and that unit
             contains a height attribute for the device
+        :param devices: Devices installed within the rack, as returned by `get_installed_devices()` (optional); if
+            None, they will be retrieved from the database
+        :param permitted_device_ids: PKs of the devices that `user` has permission to view (optional); if None, they
+            will be retrieved from the database
         """
 
         elevation = {}
@@ -286,20 +315,19 @@ class Rack(PrimaryModel):
         # Add devices to rack units list
         if self.present_in_database:
             # Retrieve all devices installed within the rack
-            queryset = (
-                Device.objects.select_related("device_type", "device_type__manufacturer", "role")
-                .annotate(device_bay_count=Count("device_bays"))
-                .exclude(pk=exclude)
-                .filter(rack=self, position__gt=0, device_type__u_height__gt=0)
-                .filter(Q(face=face) | Q(device_type__is_full_depth=True))
-            )
+            if devices is None:
+                devices = self.get_installed_devices([self], exclude=exclude)[self.pk]
+            devices = [
+                device
+                for device in devices
+                if device.pk != exclude and (device.face == face or device.device_type.is_full_depth)
+            ]
 
             # Determine which devices the user has permission to view
-            permitted_device_ids = []
-            if user is not None:
-                permitted_device_ids = self.devices.restrict(user, "view").values_list("pk", flat=True)
+            if user is not None and permitted_device_ids is None:
+                permitted_device_ids = set(self.devices.restrict(user, "view").values_list("pk", flat=True))
 
-            for device in queryset:
+            for device in devices:
                 if expand_devices:
                     for u in range(device.position, device.position + device.device_type.u_height):
                         if user is None or device.pk in permitted_device_ids:
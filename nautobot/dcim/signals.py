@@ -3,11 +3,13 @@ import logging
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models.signals import m2m_changed, post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from nautobot.core.signals import disable_for_loaddata
 
+from .cablepaths import rebuild_cable_paths
+from .elevations import invalidate_rack_elevations
 from .models import (
     Cable,
     CablePath,
@@ -19,6 +21,7 @@ from .models import (
     PowerPanel,
     Rack,
     RackGroup,
+    RackReservation,
     VirtualChassis,
 )
 from .utils import validate_interface_tagged_vlans
@@ -45,13 +48,7 @@ def rebuild_paths(obj):
     """
     Rebuild all CablePaths which traverse the specified node
     """
-    cable_paths = CablePath.objects.filter(path__contains=obj)
-
-    with transaction.atomic():
-        for cp in cable_paths:
-            cp.delete()
-            # Prevent looping back to rebuild_paths during the atomic transaction.
-            create_cablepath(cp.origin, rebuild=False)
+    rebuild_cable_paths(cable_paths=CablePath.objects.filter(path__contains=obj))
 
 
 #
@@ -149,6 +146,27 @@ def handle_rack_location_change(instance, created, raw=False, **kwargs):
                 device.save()
 
 
+@receiver(post_save, sender=Rack)
+@receiver(post_delete, sender=Rack)
+def invalidate_rack_elevation(instance, **kwargs):
+    """
+    Invalidate the cached elevations of a rack when it is saved or deleted.
+    """
+    invalidate_rack_elevations(instance.pk)
+
+
+@receiver(post_save, sender=Device)
+@receiver(post_delete, sender=Device)
+@receiver(post_save, sender=RackReservation)
+@receiver(post_delete, sender=RackReservation)
+def invalidate_rack_elevation_contents(instance, **kwargs):
+    """
+    Invalidate the cached elevations of the rack(s) that a device or reservation is in, or was moved out of.
+    """
+    invalidate_rack_elevations(instance.rack_id, instance.__dict__.get("_original_rack_id"))
+    instance._original_rack_id = instance.rack_id
+
+
 #
 # Device redundancy group
 #
@@ -260,19 +278,8 @@ def nullify_connected_endpoints(instance, **kwargs):
         instance.termination_b._cable_peer = None
         instance.termination_b.save()
 
-    # Delete and retrace any dependent cable paths
-    for cablepath in CablePath.objects.filter(path__contains=instance):
-        cp = CablePath.from_origin(cablepath.origin)
-        if cp:
-            CablePath.objects.filter(pk=cablepath.pk).update(
-                path=cp.path,
-                destination_type=ContentType.objects.get_for_model(cp.destination) if cp.destination else None,
-                destination_id=cp.destination.pk if cp.destination else None,
-                is_active=cp.is_active,
-                is_split=cp.is_split,
-            )
-        else:
-            cablepath.delete()
+    # Retrace any dependent cable paths, deleting those which no longer have an origin cable
+    rebuild_cable_paths(cable_paths=CablePath.objects.filter(path__contains=instance))
 
 
 #
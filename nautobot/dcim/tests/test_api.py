@@ -5,7 +5,9 @@ from unittest import skip
 from constance.test import override_config
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
@@ -59,7 +61,7 @@ from nautobot.dcim.models import (
     SoftwareVersion,
     VirtualChassis,
 )
-from nautobot.extras.models import ConfigContextSchema, Role, SecretsGroup, Status
+from nautobot.extras.models import ConfigContext, ConfigContextSchema, Role, SecretsGroup, Status
 from nautobot.ipam.models import IPAddress, Namespace, Prefix, VLAN, VLANGroup
 from nautobot.tenancy.models import Tenant
 from nautobot.virtualization.models import Cluster, ClusterType
@@ -1335,6 +1337,24 @@ class DeviceTest(APIViewTestCases.APIViewTestCase):
         self.assertIn("config_context", response.data["results"][0])
         self.assertEqual(response.data["results"][0]["config_context"], {"A": 1})
 
+    def test_config_context_included_batched(self):
+        """
+        Check that the config context data of all devices in the list is loaded together rather than one by one.
+        """
+        ConfigContext.objects.create(name="Config Context 1", weight=100, data={"A": 0, "D": 4})
+        self.add_permissions("dcim.view_device")
+        url = reverse("dcim-api:device-list") + "?include=config_context"
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), Device.objects.count())
+        for result in response.data["results"]:
+            self.assertEqual(result["config_context"], Device.objects.get(pk=result["id"]).get_config_context())
+        self.assertEqual(
+            len([query for query in queries.captured_queries if 'FROM "extras_configcontext"' in query["sql"]]), 1
+        )
+
     def test_unique_name_per_location_constraint(self):
         """
         Check that creating a device with a duplicate name within a location fails.
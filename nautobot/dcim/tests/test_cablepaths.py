@@ -1,8 +1,12 @@
+from io import StringIO
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider
+from nautobot.dcim.cablepaths import CablePathTracer
 from nautobot.dcim.models import (
     Cable,
     CablePath,
@@ -33,6 +37,7 @@ class CablePathTestCase(TestCase):
         1XX: Test direct connections between different endpoint types
         2XX: Test different cable topologies
         3XX: Test responses to changes in existing objects
+        4XX: Test batched tracing and rebuilding of CablePaths
     """
 
     @classmethod
@@ -1494,3 +1499,108 @@ class CablePathTestCase(TestCase):
                 rearport1: 2,
             }
         )
+
+    def _create_patch_panel_topology(self, positions=4):
+        """
+        [IF1:n] --C-- [FP1:n] [RP1] --C-- [RP2] [FP2:n] --C-- [IF2:n]   (for n in 1..positions, via a planned trunk)
+        [IF3] --C-- [CT1A] [CT1Z] --C-- [IF4]
+        [IF5] --C-- [RP3] [FP3:1]
+                          [FP3:2] --C-- [IF6]
+        """
+        rearport1 = RearPort.objects.create(device=self.device, name="Rear Port 1", positions=positions)
+        rearport2 = RearPort.objects.create(device=self.device, name="Rear Port 2", positions=positions)
+        for n in range(1, positions + 1):
+            for side, rearport in ((1, rearport1), (2, rearport2)):
+                interface = Interface.objects.create(
+                    device=self.device, name=f"Interface {side}:{n}", status=self.interface_status
+                )
+                frontport = FrontPort.objects.create(
+                    device=self.device, name=f"Front Port {side}:{n}", rear_port=rearport, rear_port_position=n
+                )
+                Cable.objects.create(termination_a=interface, termination_b=frontport, status=self.status)
+        Cable.objects.create(termination_a=rearport1, termination_b=rearport2, status=self.status_planned)
+
+        interface3 = Interface.objects.create(device=self.device, name="Interface 3", status=self.interface_status)
+        interface4 = Interface.objects.create(device=self.device, name="Interface 4", status=self.interface_status)
+        circuittermination1 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="A"
+        )
+        circuittermination2 = CircuitTermination.objects.create(
+            circuit=self.circuit, location=self.location, term_side="Z"
+        )
+        Cable.objects.create(termination_a=interface3, termination_b=circuittermination1, status=self.status)
+        Cable.objects.create(termination_a=interface4, termination_b=circuittermination2, status=self.status)
+
+        interface5 = Interface.objects.create(device=self.device, name="Interface 5", status=self.interface_status)
+        interface6 = Interface.objects.create(device=self.device, name="Interface 6", status=self.interface_status)
+        rearport3 = RearPort.objects.create(device=self.device, name="Rear Port 3", positions=2)
+        FrontPort.objects.create(device=self.device, name="Front Port 3:1", rear_port=rearport3, rear_port_position=1)
+        frontport3_2 = FrontPort.objects.create(
+            device=self.device, name="Front Port 3:2", rear_port=rearport3, rear_port_position=2
+        )
+        Cable.objects.create(termination_a=interface5, termination_b=rearport3, status=self.status)
+        Cable.objects.create(termination_a=interface6, termination_b=frontport3_2, status=self.status)
+
+    @staticmethod
+    def _get_path_values(cable_paths):
+        return {
+            (cp.origin_type_id, cp.origin_id): (
+                cp.destination_type_id,
+                cp.destination_id,
+                list(cp.path),
+                cp.is_active,
+                cp.is_split,
+            )
+            for cp in cable_paths
+        }
+
+    def test_401_tracer_matches_from_origin(self):
+        self._create_patch_panel_topology()
+        cable_paths = list(CablePath.objects.all())
+        self.assertEqual(len(cable_paths), 14)
+
+        origin_keys = [(cp.origin_type_id, cp.origin_id) for cp in cable_paths]
+        uncabled_interface = Interface.objects.create(
+            device=self.device, name="Uncabled Interface", status=self.interface_status
+        )
+        origin_keys.append((ContentType.objects.get_for_model(Interface).pk, uncabled_interface.pk))
+        traced_paths = CablePathTracer().trace(origin_keys)
+        self.assertIsNone(traced_paths.pop(origin_keys[-1]))
+        expected_paths = [CablePath.from_origin(cp.origin) for cp in cable_paths]
+        for cp in expected_paths:
+            cp.origin_type_id = ContentType.objects.get_for_model(cp.origin).pk
+            cp.origin_id = cp.origin.pk
+        self.assertEqual(self._get_path_values(traced_paths.values()), self._get_path_values(expected_paths))
+        self.assertEqual(self._get_path_values(traced_paths.values()), self._get_path_values(cable_paths))
+
+    def test_402_tracer_queries_do_not_scale_with_paths(self):
+        self._create_patch_panel_topology(positions=8)
+        origin_keys = list(CablePath.objects.values_list("origin_type_id", "origin_id"))
+        self.assertEqual(len(origin_keys), 22)
+        # One query per hop of the longest path (origin, cable peer, rear port, front ports, rear port peer, ...)
+        tracer = CablePathTracer()
+        with self.assertNumQueries(7):
+            tracer.trace(origin_keys)
+
+    def test_403_rebuild_cable_paths_command(self):
+        self._create_patch_panel_topology()
+        expected_paths = self._get_path_values(CablePath.objects.all())
+
+        # Stale paths are updated in place, missing paths are created, and paths without a cable are deleted
+        stale_path = CablePath.objects.first()
+        CablePath.objects.filter(pk=stale_path.pk).update(path=[], is_active=False)
+        missing_path = CablePath.objects.exclude(pk=stale_path.pk).first()
+        missing_path.delete()
+        uncabled_interface = Interface.objects.create(
+            device=self.device, name="Uncabled Interface", status=self.interface_status
+        )
+        CablePath.objects.create(origin=uncabled_interface, path=[])
+
+        out = StringIO()
+        call_command("rebuild_cable_paths", location=[self.location.name], stdout=out)
+        self.assertIn("1 created, 13 updated, 1 deleted", out.getvalue())
+        self.assertEqual(self._get_path_values(CablePath.objects.all()), expected_paths)
+        self.assertTrue(CablePath.objects.filter(pk=stale_path.pk).exists())
+        for cp in CablePath.objects.all():
+            cp.origin.refresh_from_db()
+            self.assertPathIsSet(cp.origin, cp)
@@ -1,13 +1,16 @@
 from decimal import Decimal
+from unittest import mock
 
 from constance.test import override_config
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
 from django.test.utils import override_settings
 
 from nautobot.circuits.models import Circuit, CircuitTermination, CircuitType, Provider, ProviderNetwork
 from nautobot.core.testing.models import ModelTestCases
+from nautobot.dcim import elevations
 from nautobot.dcim.choices import (
     CableStatusChoices,
     CableTypeChoices,
@@ -530,6 +533,58 @@ class RackTestCase(ModelTestCases.BaseModelTestCase):
         for u in rack1_inventory_rear:
             self.assertIsNone(u["device"])
 
+    def test_get_rack_elevation_svgs(self):
+        rack2 = Rack.objects.create(name="TestRack2", location=self.location1, status=self.status, u_height=42)
+        Device.objects.create(
+            name="TestSwitch1",
+            device_type=self.device_type["ff2048"],
+            role=self.device_roles[1],
+            status=self.device_status,
+            location=self.location1,
+            rack=self.rack,
+            position=10,
+            face=DeviceFaceChoices.FACE_REAR,
+        )
+        device2 = Device.objects.create(
+            name="TestSwitch2",
+            device_type=self.device_type["ff2048"],
+            role=self.device_roles[1],
+            status=self.device_status,
+            location=self.location1,
+            rack=rack2,
+            position=20,
+            face=DeviceFaceChoices.FACE_FRONT,
+        )
+        racks = list(Rack.objects.filter(pk__in=[self.rack.pk, rack2.pk]))
+
+        # Elevations are rendered the same as by get_elevation_svg(), with the same queries for any number of racks
+        with self.assertNumQueries(2):  # devices and reservations
+            svgs = elevations.get_rack_elevation_svgs(racks)
+        self.assertEqual(len(svgs), 4)
+        for rack in racks:
+            for face in DeviceFaceChoices.values():
+                self.assertEqual(svgs[(rack.pk, face)], rack.get_elevation_svg(face=face).tostring())
+
+        # Rendered elevations are cached outside of a transaction, until a device in the rack is changed
+        with mock.patch.object(connection, "in_atomic_block", False):
+            elevations.get_rack_elevation_svgs(racks)
+            with self.assertNumQueries(0):
+                self.assertEqual(elevations.get_rack_elevation_svgs(racks), svgs)
+
+            device2 = Device.objects.get(pk=device2.pk)
+            device2.rack = self.rack
+            device2.save()
+            new_svgs = elevations.get_rack_elevation_svgs(racks, faces=[DeviceFaceChoices.FACE_FRONT])
+        self.assertEqual(len(new_svgs), 2)
+        for rack in racks:
+            self.assertNotEqual(
+                new_svgs[(rack.pk, DeviceFaceChoices.FACE_FRONT)], svgs[(rack.pk, DeviceFaceChoices.FACE_FRONT)]
+            )
+            self.assertEqual(
+                new_svgs[(rack.pk, DeviceFaceChoices.FACE_FRONT)],
+                rack.get_elevation_svg(face=DeviceFaceChoices.FACE_FRONT).tostring(),
+            )
+
     def test_mount_zero_ru(self):
         pdu = Device.objects.create(
             name="TestPDU",
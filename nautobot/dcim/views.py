@@ -49,6 +49,7 @@ from . import filters, forms, tables
 from .api import serializers
 from .choices import DeviceFaceChoices
 from .constants import NONCONNECTABLE_IFACE_TYPES
+from .elevations import get_rack_elevation_svgs
 from .models import (
     Cable,
     CablePath,
@@ -572,6 +573,10 @@ class RackElevationListView(generic.ObjectListView):
         if rack_face not in DeviceFaceChoices.values():
             rack_face = DeviceFaceChoices.FACE_FRONT
 
+        # Render the elevations of all racks on the page together, so that the SVG of each (as separately requested
+        # from the REST API by the page) is then retrieved from the cache rather than rendered with its own queries
+        get_rack_elevation_svgs(page, faces=[rack_face], user=request.user, base_url=request.build_absolute_uri("/"))
+
         return {
             "paginator": paginator,
             "page": page,
@@ -5,7 +5,7 @@ from django.db.models import Q
 from drf_spectacular.utils import extend_schema_field
 from rest_framework.fields import JSONField
 from rest_framework.reverse import reverse
-from rest_framework.serializers import ValidationError
+from rest_framework.serializers import ListSerializer, ValidationError
 
 from nautobot.core.api.exceptions import SerializerNotFound
 from nautobot.core.api.mixins import WritableSerializerMixin
@@ -106,7 +106,7 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
                 }`
         """
         data = {}
-        relationships_data = value.get_relationships(include_hidden=True)
+        relationships_data = self.get_relationships(value)
         for this_side, relationships in relationships_data.items():
             for relationship, associations in relationships.items():
                 depth = int(self.context.get("depth", 0))
@@ -166,6 +166,18 @@ class RelationshipsDataField(WritableSerializerMixin, JSONField):
         logger.debug("to_representation(%s) -> %s", value, data)
         return data
 
+    def get_relationships(self, value):
+        """Get the relationships of `value`, bulk-loading those of all objects on the page when serializing a list."""
+        list_serializer = getattr(self.parent, "parent", None)
+        if isinstance(list_serializer, ListSerializer) and isinstance(list_serializer.instance, (list, tuple)):
+            relationships = getattr(self, "_relationships_by_pk", None)
+            if relationships is None or value.pk not in relationships:
+                relationships = type(value).get_relationships_for_objects(list_serializer.instance, include_hidden=True)
+                self._relationships_by_pk = relationships
+            if value.pk in relationships:
+                return relationships[value.pk]
+        return value.get_relationships(include_hidden=True)
+
     def build_nested_field(self, field_name, relation_info, nested_depth):
         return nested_serializer_factory(relation_info, nested_depth)
 
@@ -151,23 +151,25 @@ class ComputedFieldViewSet(NotesViewSetMixin, ModelViewSet):
 class ConfigContextQuerySetMixin:
     """
     Used by views that work with config context models (device and virtual machine).
-    Provides a get_queryset() method which deals with adding the config context
-    data annotation or not.
+    Provides a get_serializer() method which deals with attaching the config context
+    data to the objects being serialized or not.
     """
 
-    def get_queryset(self):
+    def get_serializer(self, *args, **kwargs):
         """
-        Build the proper queryset based on the request context
-
-        If the `include` query param includes `config_context`, return the queryset annotated with config context.
-
-        Else, return the base queryset.
+        If the `include` query param includes `config_context`, attach the config context data to the list of objects
+        being serialized with a fixed number of database queries, rather than querying for each object individually.
         """
-        queryset = super().get_queryset()
         request = self.get_serializer_context()["request"]
-        if request is not None and "config_context" in request.query_params.get("include", []):
-            return queryset.annotate_config_context_data()
-        return queryset
+        if (
+            args
+            and args[0] is not None
+            and kwargs.get("many", False)
+            and request is not None
+            and "config_context" in request.query_params.get("include", [])
+        ):
+            args = (ConfigContext.objects.populate_config_context_data(args[0]), *args[1:])
+        return super().get_serializer(*args, **kwargs)
 
 
 class ConfigContextViewSet(NotesViewSetMixin, ModelViewSet):
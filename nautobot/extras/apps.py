@@ -23,9 +23,10 @@ class ExtrasConfig(NautobotConfig):
     def ready(self):
         super().ready()
         import nautobot.extras.signals  # noqa: F401  # unused-import -- but this import installs the signals
-        from nautobot.extras.signals import refresh_job_models
+        from nautobot.extras.signals import populate_tree_model_ancestors, refresh_job_models
 
         nautobot_database_ready.connect(refresh_job_models, sender=self)
+        nautobot_database_ready.connect(populate_tree_model_ancestors, sender=self)
 
         from graphene_django.converter import convert_django_field
 
@@ -1,16 +1,25 @@
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
+import functools
 import uuid
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 from django.test.client import RequestFactory
 
-from nautobot.extras.choices import ObjectChangeEventContextChoices
+from nautobot.core.celery import app
+from nautobot.core.models.querysets import iter_queryset_chunks
+from nautobot.core.models.utils import prefetch_serialized_related_objects
+from nautobot.extras.choices import ObjectChangeActionChoices, ObjectChangeEventContextChoices
 from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.models import ObjectChange
 from nautobot.extras.signals import change_context_state, get_user_if_authenticated
-from nautobot.extras.webhooks import enqueue_webhooks
+from nautobot.extras.webhooks import enqueue_webhooks, get_webhooks_for_object_change
+
+# Number of ObjectChanges to process at once when enqueuing job hooks and webhooks at the end of a change context
+HOOK_DISPATCH_BATCH_SIZE = 1000
 
 
 class ChangeContext:
@@ -25,15 +34,21 @@ class ChangeContext:
     :param context: Context of the transaction, must match a choice in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param context_detail: Optional extra details about the transaction (ex: the plugin name that initiated the change)
     :param change_id: Optional uuid object to uniquely identify the transaction. One will be generated if not supplied
+    :param write_behind: Optional bool to only create the ObjectChanges of the transaction once its changes have been
+        committed (see `web_request_context`). Defaults to `settings.CHANGELOG_WRITE_BEHIND_ENABLED`
     """
 
     defer_object_changes = False  # advanced usage, for creating object changes in bulk
 
-    def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None):
+    def __init__(self, user=None, request=None, context=None, context_detail="", change_id=None, write_behind=None):
         self.request = request
         self.user = user
         self.reset_deferred_object_changes()
 
+        self.write_behind = settings.CHANGELOG_WRITE_BEHIND_ENABLED if write_behind is None else write_behind
+        if self.write_behind:
+            self.defer_object_changes = True
+
         if self.request is None and self.user is None:
             raise TypeError("Either user or request must be provided")
 
@@ -84,12 +99,65 @@ class ChangeContext:
         if self.defer_object_changes:
             self.create_object_changes(batch_size=batch_size)
 
+    def defer_write_behind_change(self, unique_object_change_id, action, instance, user):
+        """
+        Note a change to an object, to be logged once the change has been committed (in write-behind mode).
+
+        Saved objects are only serialized when their ObjectChanges are created, from the instance they were last saved
+        as. Deleted objects are serialized immediately, together with any pending changes to the same object, as the
+        object will no longer exist by then.
+        """
+        entries = self.deferred_object_changes.setdefault(unique_object_change_id, [])
+        if action == ObjectChangeActionChoices.ACTION_DELETE:
+            for entry in entries:
+                if "objectchange" not in entry:
+                    entry["objectchange"] = entry["instance"].to_objectchange(entry["action"])
+            objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_DELETE)
+            # As when logging changes immediately, a deletion replaces any update made in this context, but not a creation
+            if entries and entries[-1]["action"] != ObjectChangeActionChoices.ACTION_CREATE:
+                entry = entries[-1]
+                entry.update(action=action, instance=instance, objectchange=objectchange)
+            else:
+                entry = {"action": action, "instance": instance, "user": user, "objectchange": objectchange}
+                entries.append(entry)
+            entry["changed_object_id"] = instance.pk
+        elif entries and "objectchange" not in entries[-1]:
+            entry = entries[-1]
+            entry["instance"] = instance
+        else:
+            entry = {"action": action, "instance": instance, "user": user}
+            entries.append(entry)
+
+        # Changes that are rolled back are never marked as committed, and so are not logged
+        transaction.on_commit(functools.partial(entry.__setitem__, "committed", True))
+
+    def flush_write_behind_object_changes(self, batch_size=1000):
+        """
+        Create the ObjectChanges of all committed changes noted in write-behind mode, then enqueue their hooks.
+        """
+        for key, entries in list(self.deferred_object_changes.items()):
+            committed_entries = [entry for entry in entries if entry.get("committed")]
+            if committed_entries:
+                self.deferred_object_changes[key] = committed_entries
+            else:
+                del self.deferred_object_changes[key]
+        self.create_object_changes(batch_size=batch_size)
+        enqueue_hooks_for_change_id(self.change_id, batch_size=batch_size)
+
     def create_object_changes(self, batch_size=1000):
         while self.deferred_object_changes:
             create_object_changes = []
-            for key in self._object_change_batch(batch_size):
+            keys = self._object_change_batch(batch_size)
+            # Deleted objects' related objects may have been deleted as well, so are left to be looked up individually
+            prefetch_serialized_related_objects(
+                entry["instance"]
+                for key in keys
+                for entry in self.deferred_object_changes[key]
+                if entry["action"] != ObjectChangeActionChoices.ACTION_DELETE and "objectchange" not in entry
+            )
+            for key in keys:
                 for entry in self.deferred_object_changes[key]:
-                    objectchange = entry["instance"].to_objectchange(entry["action"])
+                    objectchange = entry.get("objectchange") or entry["instance"].to_objectchange(entry["action"])
                     objectchange.user = entry["user"]
                     objectchange.user_name = objectchange.user.username
                     objectchange.request_id = self.change_id
@@ -173,9 +241,10 @@ def web_request_context(
     :param context: Optional string value of the generated change log entries' "change_context" field, defaults to ObjectChangeEventContextChoices.CONTEXT_ORM.
         Valid choices are in nautobot.extras.choices.ObjectChangeEventContextChoices
     :param request: Optional web request instance, one will be generated if not supplied
-    """
-    from nautobot.extras.jobs import enqueue_job_hooks  # prevent circular import
 
+    If `settings.CHANGELOG_WRITE_BEHIND_ENABLED` is true, the ObjectChanges of all changes made within this context are
+    created together once it exits, or if a transaction is then still in progress, once that transaction is committed.
+    """
     valid_contexts = {
         ObjectChangeEventContextChoices.CONTEXT_JOB: JobChangeContext,
         ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK: JobHookChangeContext,
@@ -197,10 +266,82 @@ def web_request_context(
         with change_logging(change_context):
             yield request
     finally:
-        # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
-        for object_change in ObjectChange.objects.filter(request_id=change_context.change_id).iterator():
-            enqueue_job_hooks(object_change)
-            enqueue_webhooks(object_change)
+        if change_context.write_behind:
+            # create the ObjectChanges, then enqueue their hooks, now or once the current transaction is committed
+            transaction.on_commit(change_context.flush_write_behind_object_changes)
+        else:
+            # enqueue jobhooks and webhooks, use change_context.change_id in case change_id was not supplied
+            enqueue_hooks_for_change_id(change_context.change_id)
+
+
+def enqueue_hooks_for_change_id(change_id, batch_size=HOOK_DISPATCH_BATCH_SIZE):
+    """
+    Enqueue the job hooks and webhooks for all ObjectChanges recorded with the given change_id (request_id).
+
+    Rather than doing so one ObjectChange at a time, the applicable JobHooks and Webhooks are looked up only once per
+    changed object type and action, the previous change of each changed object is retrieved together with each batch
+    of `batch_size` ObjectChanges, and all webhook tasks are published over a single broker connection, which is only
+    acquired once the first webhook needs publishing.
+
+    :param change_id: uuid of the change context (the `request_id` of its ObjectChanges)
+    :param batch_size: Number of ObjectChanges to process at once
+    """
+    from nautobot.extras.jobs import enqueue_job_hooks, get_job_hooks_for_object_change  # prevent circular import
+
+    prior_change_pk = Subquery(
+        ObjectChange.objects.filter(
+            changed_object_type=OuterRef("changed_object_type"),
+            changed_object_id=OuterRef("changed_object_id"),
+            time__lt=OuterRef("time"),
+        )
+        .order_by("-time")
+        .values("pk")[:1]
+    )
+    object_changes = (
+        ObjectChange.objects.filter(request_id=change_id)
+        .select_related("changed_object_type")
+        .annotate(prior_change_pk=prior_change_pk)
+        .order_by("time")
+    )
+    hooks = {}
+
+    with ExitStack() as stack:
+        producer = None
+
+        def get_producer():
+            """Acquire a broker producer once the first webhook needs publishing, and reuse it for all others."""
+            nonlocal producer
+            # When tasks are executed locally, there is no need to connect to the broker
+            if producer is None and not app.conf.task_always_eager:
+                producer = stack.enter_context(app.producer_or_acquire())
+            return producer
+
+        for chunk in iter_queryset_chunks(object_changes, batch_size):
+            # Only the previous changes of objects that have any webhooks to enqueue are needed
+            webhook_changes = []
+            for object_change in chunk:
+                key = (object_change.changed_object_type_id, object_change.action)
+                if key not in hooks:
+                    hooks[key] = (
+                        get_job_hooks_for_object_change(object_change),
+                        get_webhooks_for_object_change(object_change),
+                    )
+                if hooks[key][1] and object_change.action != ObjectChangeActionChoices.ACTION_CREATE:
+                    webhook_changes.append(object_change)
+            prior_changes = ObjectChange.objects.only("object_data", "object_data_v2").in_bulk(
+                [object_change.prior_change_pk for object_change in webhook_changes if object_change.prior_change_pk]
+            )
+
+            for object_change in chunk:
+                job_hooks, webhooks = hooks[(object_change.changed_object_type_id, object_change.action)]
+                enqueue_job_hooks(object_change, job_hooks=job_hooks)
+                if webhooks:
+                    if object_change.prior_change_pk is None:
+                        prior_change = ObjectChange.NO_PRIOR_CHANGE
+                    else:
+                        prior_change = prior_changes.get(object_change.prior_change_pk)
+                    snapshots = object_change.get_snapshots(prior_change=prior_change)
+                    enqueue_webhooks(object_change, webhooks=webhooks, snapshots=snapshots, producer=get_producer())
 
 
 @contextmanager
@@ -214,6 +355,12 @@ def deferred_change_logging_for_bulk_operation():
     if change_context is None:
         raise ValueError("Change logging must be enabled before using deferred_change_logging_for_bulk_operation")
 
+    if change_context.write_behind:
+        # All changes are already deferred until the end of the change context
+        with transaction.atomic():
+            yield
+        return
+
     with transaction.atomic():
         try:
             change_context.defer_object_changes = True
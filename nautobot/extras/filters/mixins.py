@@ -9,6 +9,7 @@ from nautobot.core.constants import (
     FILTER_NUMERIC_BASED_LOOKUP_MAP,
 )
 from nautobot.core.filters import (
+    get_dynamic_filters,
     MultiValueDateTimeFilter,
     NaturalKeyOrPKMultipleChoiceFilter,
 )
@@ -60,7 +61,17 @@ class CustomFieldModelFilterSetMixin(django_filters.FilterSet):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        custom_field_filters, _ = get_dynamic_filters(type(self), "custom_fields", self.generate_custom_field_filters)
+        self.filters.update(custom_field_filters)
 
+    @classmethod
+    def generate_custom_field_filters(cls):
+        """
+        Generate the filters (including extra lookup expression filters) of all CustomFields applicable to the model.
+
+        Returns:
+            (tuple): A dictionary of the generated filters, and None (see `get_dynamic_filters()`).
+        """
         custom_field_filter_classes = {
             # Here, for the "base" filters for each custom field, for backwards compatibility, use single-value filters.
             # For the "extended" filters, see below, we use multi-value filters.
@@ -74,7 +85,8 @@ class CustomFieldModelFilterSetMixin(django_filters.FilterSet):
             CustomFieldTypeChoices.TYPE_SELECT: CustomFieldSelectFilter,
         }
 
-        custom_fields = CustomField.objects.get_for_model(self._meta.model, exclude_filter_disabled=True)
+        filters = {}
+        custom_fields = CustomField.objects.get_for_model(cls._meta.model, exclude_filter_disabled=True)
         for cf in custom_fields:
             # Determine filter class for this CustomField type, default to CustomFieldCharFilter
             new_filter_name = cf.add_prefix_to_cf_key()
@@ -82,13 +94,15 @@ class CustomFieldModelFilterSetMixin(django_filters.FilterSet):
             new_filter = filter_class(field_name=cf.key, custom_field=cf)
             new_filter.label = f"{cf.label}"
             # Create base filter (cf_customfieldname)
-            self.filters[new_filter_name] = new_filter
+            filters[new_filter_name] = new_filter
 
             # Create extra lookup expression filters (cf_customfieldname__lookup_expr)
-            self.filters.update(
-                self._generate_custom_field_lookup_expression_filters(filter_name=new_filter_name, custom_field=cf)
+            filters.update(
+                cls._generate_custom_field_lookup_expression_filters(filter_name=new_filter_name, custom_field=cf)
             )
 
+        return filters, None
+
     @staticmethod
     def _get_custom_field_filter_lookup_dict(filter_type):
         # Choose the lookup expression map based on the filter type
@@ -230,58 +244,65 @@ class RelationshipModelFilterSetMixin(django_filters.FilterSet):
     def __init__(self, *args, **kwargs):
         self.obj_type = ContentType.objects.get_for_model(self._meta.model)
         super().__init__(*args, **kwargs)
-        self.relationships = []
-        self._append_relationships(model=self._meta.model)
+        relationship_filters, relationships = get_dynamic_filters(
+            type(self), "relationships", self.generate_relationship_filters
+        )
+        self.filters.update(relationship_filters)
+        self.relationships = list(relationships)
 
-    def _append_relationships(self, model):
+    @classmethod
+    def generate_relationship_filters(cls):
         """
-        Append form fields for all Relationships assigned to this model.
+        Generate a filter for each (non-hidden) Relationship assigned to the model.
+
+        Returns:
+            (tuple): A dictionary of the generated filters, and the list of the names of the filters of all relationships,
+                including any whose peer model is not installed and which therefore have no filter.
         """
+        model = cls._meta.model
+        filters = {}
+        relationships = []
         src_relationships, dst_relationships = Relationship.objects.get_for_model(model=model, hidden=False)
 
-        for rel in src_relationships:
-            self._append_relationships_side([rel], RelationshipSideChoices.SIDE_SOURCE, model)
-
-        for rel in dst_relationships:
-            self._append_relationships_side([rel], RelationshipSideChoices.SIDE_DESTINATION, model)
-
-    def _append_relationships_side(self, relationships, initial_side, model):
-        """
-        Helper method to _append_relationships, for processing one "side" of the relationships for this model.
-        """
-        for relationship in relationships:
-            if relationship.symmetric:
-                side = RelationshipSideChoices.SIDE_PEER
-            else:
-                side = initial_side
-            peer_side = RelationshipSideChoices.OPPOSITE[side]
-
-            # If this model is on the "source" side of the relationship, then the field will be named
-            # "cr_<relationship_key>__destination" since it's used to pick the destination object(s).
-            # If we're on the "destination" side, the field will be "cr_<relationship_key>__source".
-            # For a symmetric relationship, both sides are "peer", so the field will be "cr_<relationship_key>__peer"
-            field_name = f"cr_{relationship.key}__{peer_side}"
-
-            if field_name in self.relationships:
-                # This is a symmetric relationship that we already processed from the opposing "initial_side".
-                # No need to process it a second time!
-                continue
-            if peer_side == "source":
-                choice_model = relationship.source_type.model_class()
-            elif peer_side == "destination":
-                choice_model = relationship.destination_type.model_class()
-            else:
-                choice_model = model
-            # Check for invalid_relationship unit test
-            if choice_model:
-                self.filters[field_name] = RelationshipFilter(
-                    relationship=relationship,
-                    side=side,
-                    field_name=field_name,
-                    queryset=choice_model.objects.all(),
-                    qs=model.objects.all(),
-                )
-            self.relationships.append(field_name)
+        for initial_side, side_relationships in (
+            (RelationshipSideChoices.SIDE_SOURCE, src_relationships),
+            (RelationshipSideChoices.SIDE_DESTINATION, dst_relationships),
+        ):
+            for relationship in side_relationships:
+                if relationship.symmetric:
+                    side = RelationshipSideChoices.SIDE_PEER
+                else:
+                    side = initial_side
+                peer_side = RelationshipSideChoices.OPPOSITE[side]
+
+                # If this model is on the "source" side of the relationship, then the field will be named
+                # "cr_<relationship_key>__destination" since it's used to pick the destination object(s).
+                # If we're on the "destination" side, the field will be "cr_<relationship_key>__source".
+                # For a symmetric relationship, both sides are "peer", so the field will be "cr_<relationship_key>__peer"
+                field_name = f"cr_{relationship.key}__{peer_side}"
+
+                if field_name in relationships:
+                    # This is a symmetric relationship that we already processed from the opposing "initial_side".
+                    # No need to process it a second time!
+                    continue
+                if peer_side == "source":
+                    choice_model = relationship.source_type.model_class()
+                elif peer_side == "destination":
+                    choice_model = relationship.destination_type.model_class()
+                else:
+                    choice_model = model
+                # Check for invalid_relationship unit test
+                if choice_model:
+                    filters[field_name] = RelationshipFilter(
+                        relationship=relationship,
+                        side=side,
+                        field_name=field_name,
+                        queryset=choice_model.objects.all(),
+                        qs=model.objects.all(),
+                    )
+                relationships.append(field_name)
+
+        return filters, relationships
 
 
 #
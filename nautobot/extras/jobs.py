@@ -19,7 +19,7 @@ from django import forms
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
-from django.core.files.base import ContentFile
+from django.core.files.base import ContentFile, File
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.validators import RegexValidator
 from django.db.models import Model
@@ -30,6 +30,7 @@ import netaddr
 import yaml
 
 from nautobot.core.celery import import_jobs, nautobot_task
+from nautobot.core.celery.log import NautobotDatabaseHandler
 from nautobot.core.forms import (
     DynamicModelChoiceField,
     DynamicModelMultipleChoiceField,
@@ -709,7 +710,9 @@ class BaseJob:
 
         Args:
             filename (str): Name of the file to create, including extension
-            content (str, bytes): Content to populate the created file with.
+            content (str, bytes, file): Content to populate the created file with.
+                May also be a file-like object opened in binary mode, such as a `tempfile.TemporaryFile`,
+                to avoid holding large content entirely in memory.
 
         Raises:
             (ValueError): if the provided content exceeds JOB_CREATE_FILE_MAX_SIZE in length
@@ -720,12 +723,16 @@ class BaseJob:
         if isinstance(content, str):
             content = content.encode("utf-8")
         max_size = get_settings_or_config("JOB_CREATE_FILE_MAX_SIZE")
-        actual_size = len(content)
+        if isinstance(content, bytes):
+            actual_size = len(content)
+            file = ContentFile(content, name=filename)
+        else:
+            actual_size = content.seek(0, os.SEEK_END)
+            content.seek(0)
+            file = File(content, name=filename)
         if actual_size > max_size:
             raise ValueError(f"Provided {actual_size} bytes of content, but JOB_CREATE_FILE_MAX_SIZE is {max_size}")
-        fp = FileProxy.objects.create(
-            name=filename, job_result=self.job_result, file=ContentFile(content, name=filename)
-        )
+        fp = FileProxy.objects.create(name=filename, job_result=self.job_result, file=file)
         self.logger.info("Created file [%s](%s)", filename, fp.file.url)
         return fp
 
@@ -1142,22 +1149,23 @@ def run_job(self, job_class_path, *args, **kwargs):
         job.on_failure(exc, self.request.id, args, kwargs, einfo)
         job.after_return(JobResultStatusChoices.STATUS_FAILURE, exc, self.request.id, args, kwargs, einfo)
         raise
+    finally:
+        # Write any buffered log entries before the JobResult is marked as completed, after which the UI stops polling them
+        NautobotDatabaseHandler.flush_task(self.request.id)
 
 
-def enqueue_job_hooks(object_change):
+def get_job_hooks_for_object_change(object_change):
     """
-    Find job hook(s) assigned to this changed object type + action and enqueue them
-    to be processed
+    Get the list of enabled JobHooks applicable to the changed object type and action of the given ObjectChange.
     """
-
     # Job hooks cannot trigger other job hooks
     if object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
-        return
+        return []
 
     # Determine whether this type of object supports job hooks
     content_type = object_change.changed_object_type
     if content_type not in change_logged_models_queryset():
-        return
+        return []
 
     # Retrieve any applicable job hooks
     action_flag = {
@@ -1165,7 +1173,25 @@ def enqueue_job_hooks(object_change):
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
     }[object_change.action]
-    job_hooks = JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+    return list(
+        JobHook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True}).select_related("job")
+    )
+
+
+def enqueue_job_hooks(object_change, job_hooks=None):
+    """
+    Find job hook(s) assigned to this changed object type + action and enqueue them
+    to be processed
+
+    Args:
+        object_change (ObjectChange): The change to enqueue job hooks for.
+        job_hooks (list[JobHook]): The applicable JobHooks, if already known (see `get_job_hooks_for_object_change()`).
+    """
+    if job_hooks is None:
+        job_hooks = get_job_hooks_for_object_change(object_change)
+    elif object_change.change_context == ObjectChangeEventContextChoices.CONTEXT_JOB_HOOK:
+        # Job hooks cannot trigger other job hooks
+        return
 
     # Enqueue the jobs related to the job_hooks
     for job_hook in job_hooks:
@@ -0,0 +1,44 @@
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot.core.models.tree_queries import TreeModel
+from nautobot.extras.models import TreeModelAncestor
+
+
+class Command(BaseCommand):
+    help = "Rebuild the tree ancestor index of all tree models, or of the given tree models"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "args",
+            metavar="app_label.ModelName",
+            nargs="*",
+            help="Only rebuild the index of the given tree model(s)",
+        )
+
+    def handle(self, *model_labels, **options):
+        if not settings.TREE_ANCESTOR_INDEX_ENABLED:
+            self.stdout.write(self.style.NOTICE("TREE_ANCESTOR_INDEX_ENABLED is set to False; skipping rebuild"))
+            return
+
+        if model_labels:
+            models = []
+            for label in model_labels:
+                try:
+                    model = apps.get_model(label)
+                except (LookupError, ValueError):
+                    raise CommandError(f"Unknown model: {label}")
+                if not issubclass(model, TreeModel):
+                    raise CommandError(f"{label} is not a tree model")
+                models.append(model)
+        else:
+            models = [model for model in apps.get_models() if issubclass(model, TreeModel) and not model._meta.proxy]
+
+        for model in models:
+            count = TreeModelAncestor.rebuild(model)
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Rebuilt the tree ancestor index of {model._meta.verbose_name_plural}: {count} records"
+                )
+            )
@@ -18,8 +18,9 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.NOTICE("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT is set to 0; skipping cache refresh")
             )
-        else:
-            self.stdout.write(self.style.NOTICE("Refreshing DynamicGroup member caches..."))
+            return
+
+        self.stdout.write(self.style.NOTICE("Refreshing DynamicGroup member caches..."))
 
         for app_label in registry["model_features"]["dynamic_groups"]:
             for model_name in registry["model_features"]["dynamic_groups"][app_label]:
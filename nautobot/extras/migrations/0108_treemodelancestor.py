@@ -0,0 +1,39 @@
+# Generated by Django 3.2.25 on 2026-10-18 00:13
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("extras", "0107_dynamicgroupcachedmember"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TreeModelAncestor",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("ancestor_id", models.UUIDField(db_index=True)),
+                ("descendant_id", models.UUIDField()),
+                ("depth", models.PositiveSmallIntegerField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="contenttypes.contenttype"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("descendant_id", "ancestor_id")},
+            },
+        ),
+    ]
@@ -2,7 +2,7 @@ from .change_logging import ChangeLoggedModel, ObjectChange
 from .contacts import Contact, ContactAssociation, Team
 from .customfields import ComputedField, CustomField, CustomFieldChoice, CustomFieldModel
 from .datasources import GitRepository
-from .groups import DynamicGroup, DynamicGroupMembership
+from .groups import DynamicGroup, DynamicGroupCachedMember, DynamicGroupMembership
 from .jobs import (
     Job,
     JobButton,
@@ -32,6 +32,7 @@ from .roles import Role, RoleField
 from .secrets import Secret, SecretsGroup, SecretsGroupAssociation
 from .statuses import Status, StatusField, StatusModel
 from .tags import Tag, TaggedItem
+from .trees import TreeModelAncestor
 
 __all__ = (
     "ChangeLoggedModel",
@@ -46,6 +47,7 @@ __all__ = (
     "CustomFieldModel",
     "CustomLink",
     "DynamicGroup",
+    "DynamicGroupCachedMember",
     "DynamicGroupMembership",
     "ExportTemplate",
     "ExternalIntegration",
@@ -77,6 +79,7 @@ __all__ = (
     "StatusModel",
     "Tag",
     "TaggedItem",
+    "TreeModelAncestor",
     "Team",
     "Webhook",
 )
@@ -72,6 +72,9 @@ class ObjectChange(BaseModel):
     parent device. This will ensure changes made to component models appear in the parent model's changelog.
     """
 
+    # Sentinel to pass as the `prior_change` of `get_snapshots()` when the object is already known to have no prior change
+    NO_PRIOR_CHANGE = object()
+
     time = models.DateTimeField(auto_now_add=True, editable=False, db_index=True)
     user = models.ForeignKey(
         to=settings.AUTH_USER_MODEL,
@@ -189,11 +192,16 @@ class ObjectChange(BaseModel):
             return related_changes.restrict(user, permission)
         return related_changes
 
-    def get_snapshots(self):
+    def get_snapshots(self, prior_change=None):
         """
         Return a dictionary with the changed object's serialized data before and after this change
         occurred and a key with a shallow diff of those dictionaries.
 
+        Args:
+            prior_change (ObjectChange): The previous change of the same object, if already known; otherwise it is
+                retrieved with `get_prev_change()` as needed. Pass `ObjectChange.NO_PRIOR_CHANGE` if the object is
+                already known to have no previous change.
+
         Returns:
         {
             "prechange": dict(),
@@ -207,7 +215,10 @@ class ObjectChange(BaseModel):
         prechange = None
         postchange = None
 
-        prior_change = self.get_prev_change()
+        if prior_change is self.NO_PRIOR_CHANGE:
+            prior_change = None
+        elif self.action != ObjectChangeActionChoices.ACTION_CREATE and prior_change is None:
+            prior_change = self.get_prev_change()
 
         if self.action != ObjectChangeActionChoices.ACTION_CREATE and prior_change is not None:
             prechange = prior_change.object_data_v2
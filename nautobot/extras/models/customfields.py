@@ -35,7 +35,7 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.models.validators import validate_regex
 from nautobot.core.settings_funcs import is_truthy
 from nautobot.core.templatetags.helpers import render_markdown
-from nautobot.core.utils.data import render_jinja2
+from nautobot.core.utils.data import get_jinja2_template, render_jinja2
 from nautobot.extras.choices import CustomFieldFilterLogicChoices, CustomFieldTypeChoices
 from nautobot.extras.models import ChangeLoggedModel
 from nautobot.extras.models.mixins import NotesMixin
@@ -123,6 +123,29 @@ class ComputedField(BaseModel, ChangeLoggedModel, NotesMixin):
             logger.warning("Failed to render computed field %s: %s", self.key, exc)
             return self.fallback_value
 
+    def render_many(self, objects):
+        """
+        Render this computed field for each of the given objects, compiling its template only once.
+
+        Returns:
+            (list): The rendered value (or `fallback_value`) of each object, in the same order as `objects`.
+        """
+        objects = list(objects)
+        try:
+            template = get_jinja2_template(self.template)
+        except Exception as exc:
+            logger.warning("Failed to render computed field %s: %s", self.key, exc)
+            return [self.fallback_value] * len(objects)
+        values = []
+        for obj in objects:
+            try:
+                # As in render_jinja2(), concatenate to an ordinary string so that the rendered text isn't marked safe
+                values.append("" + template.render(context={"obj": obj}))
+            except Exception as exc:
+                logger.warning("Failed to render computed field %s: %s", self.key, exc)
+                values.append(self.fallback_value)
+        return values
+
     def save(self, *args, **kwargs):
         self.clean()
         super().save(*args, **kwargs)
@@ -303,6 +326,23 @@ class CustomFieldModel(models.Model):
             computed_fields_dict[cf.label if label_as_key else cf.key] = cf.render(context={"obj": self})
         return computed_fields_dict
 
+    @classmethod
+    def get_computed_fields_for_objects(cls, objects, label_as_key=False, advanced_ui=None):
+        """
+        Return the dictionary of `get_computed_fields()` of each of the given objects of this model, by object pk.
+
+        Each computed field is rendered for all of the objects at once, with `ComputedField.render_many()`.
+        """
+        objects = list(objects)
+        computed_fields_dicts = {obj.pk: {} for obj in objects}
+        computed_fields = ComputedField.objects.get_for_model(cls)
+        if advanced_ui is not None:
+            computed_fields = computed_fields.filter(advanced_ui=advanced_ui)
+        for cf in computed_fields:
+            for obj, value in zip(objects, cf.render_many(objects)):
+                computed_fields_dicts[obj.pk][cf.label if label_as_key else cf.key] = value
+        return computed_fields_dicts
+
 
 class CustomFieldManager(BaseManager.from_queryset(RestrictedQuerySet)):
     use_in_migrations = True
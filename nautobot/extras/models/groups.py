@@ -1,14 +1,14 @@
 """Dynamic Groups Models."""
 
 import logging
-import pickle
 
 from django import forms
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.functional import cached_property
 import django_filters
 
@@ -99,7 +99,8 @@ class DynamicGroup(OrganizationalModel):
 
         if getattr(self, "_model", None) is None:
             try:
-                model = self.content_type.model_class()
+                # Use the ContentType cache rather than querying for the related object on every instantiation
+                model = ContentType.objects.get_for_id(self.content_type_id).model_class()
             except models.ObjectDoesNotExist:
                 model = None
 
@@ -325,39 +326,52 @@ class DynamicGroup(OrganizationalModel):
 
     @property
     def members_cache_key(self):
-        """Return the cache key for this group's members."""
-        return f"nautobot.extras.dynamicgroup.{self.id}.members_cached"
+        """Return the cache key recording when the members of this group were last recorded in its member cache table."""
+        return f"nautobot.extras.dynamicgroup.{self.id}.members_cached_at"
 
     @property
     def members_cached(self):
-        """Return the member objects for this group, cached if available."""
+        """
+        Return the member objects for this group, as recorded in its member cache table, if caching is enabled.
 
-        unpickled_query = None
-        try:
-            cached_query = cache.get(self.members_cache_key)
-            if cached_query is not None:
-                unpickled_query = pickle.loads(cached_query)  # noqa: S301  # suspicious-pickle-usage -- we know, but we control what's in the DB
-        except pickle.UnpicklingError:
-            logger.warning("Failed to unpickle cached members for %s", self)
-        finally:
-            if unpickled_query is None:
-                unpickled_query = self.members.all()
-                cached_query = pickle.dumps(unpickled_query)  # Explicitly pickle the query to evaluate it.
-                cache.set(
-                    self.members_cache_key, cached_query, get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
-                )
-
-        return unpickled_query
+        The member cache table is first updated if it was never populated, or was last fully updated longer ago than
+        `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT` seconds. If that is set to 0, caching is disabled and this is the same as
+        `members`.
+        """
+        if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+            return self.members.all()
+        self.update_cached_members_if_stale()
+        return self.model.objects.filter(pk__in=self.cached_members.values("member_id"))
 
     def update_cached_members(self):
         """
-        Update the cached members of the groups. Also returns the updated cached members.
+        Update the member cache table of the group to match its current members. Also returns the updated cached members.
         """
-
-        cache.delete(self.members_cache_key)
+        member_pks = set(self.members.values_list("pk", flat=True))
+        cached_member_pks = set(self.cached_members.values_list("member_id", flat=True))
+        stale_member_pks = list(cached_member_pks - member_pks)
+        with transaction.atomic():
+            for i in range(0, len(stale_member_pks), 1000):
+                self.cached_members.filter(member_id__in=stale_member_pks[i : i + 1000]).delete()
+            DynamicGroupCachedMember.objects.bulk_create(
+                [DynamicGroupCachedMember(dynamic_group=self, member_id=pk) for pk in member_pks - cached_member_pks],
+                batch_size=1000,
+                ignore_conflicts=True,
+            )
+        timeout = get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT")
+        if timeout != 0:
+            cache.set(self.members_cache_key, timezone.now(), timeout)
 
         return self.members_cached
 
+    def update_cached_members_if_stale(self):
+        """
+        Update the member cache table of the group if it was never populated, or was last fully updated longer ago than
+        `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT` seconds.
+        """
+        if cache.get(self.members_cache_key) is None:
+            self.update_cached_members()
+
     def has_member(self, obj, use_cache=False):
         """
         Return True if the given object is a member of this group.
@@ -366,7 +380,8 @@ class DynamicGroup(OrganizationalModel):
 
         Args:
             obj (django.db.models.Model): The object to check for membership.
-            use_cache (bool, optional): Whether to use the cache and run the query directly. Defaults to False.
+            use_cache (bool, optional): Whether to use the member cache table rather than evaluating the group filter.
+                Defaults to False.
 
         Returns:
             bool: True if the object is a member of this group, otherwise False.
@@ -383,10 +398,11 @@ class DynamicGroup(OrganizationalModel):
         if not use_cache and ContentType.objects.get_for_model(obj).id != self.content_type_id:
             return False
 
-        if not use_cache:
+        if not use_cache or get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
             return self.members.filter(pk=obj.pk).exists()
         else:
-            return obj in list(self.members_cached)
+            self.update_cached_members_if_stale()
+            return self.cached_members.filter(member_id=obj.pk).exists()
 
     @property
     def count(self):
@@ -1030,3 +1046,21 @@ class DynamicGroupMembership(BaseModel):
 
         if self.group in self.parent_group.get_ancestors():
             raise ValidationError({"group": "Cannot add ancestor as a child"})
+
+
+class DynamicGroupCachedMember(BaseModel):
+    """
+    A member object of a DynamicGroup, as last recorded by `DynamicGroup.update_cached_members()`.
+
+    Recording the members of each group as indexed rows allows the groups that a given object is a member of to be
+    looked up with a single query, rather than by evaluating the filter of every group of its content type.
+    """
+
+    dynamic_group = models.ForeignKey("extras.DynamicGroup", on_delete=models.CASCADE, related_name="cached_members")
+    member_id = models.UUIDField(db_index=True)
+
+    class Meta:
+        unique_together = ["dynamic_group", "member_id"]
+
+    def __str__(self):
+        return f"{self.member_id} in {self.dynamic_group}"
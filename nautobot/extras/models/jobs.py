@@ -727,6 +727,21 @@ class JobResult(BaseModel, CustomFieldModel):
         level_choice (LogLevelChoices): Message severity level
         grouping (str): Grouping to store the log message under
         """
+        log = self.build_log_entry(message, obj=obj, level_choice=level_choice, grouping=grouping)
+        log.save(using=self.log_database)
+
+    def build_log_entry(
+        self,
+        message,
+        obj=None,
+        level_choice=LogLevelChoices.LOG_INFO,
+        grouping="main",
+    ):
+        """
+        Construct, but do not save, a JobLogEntry for this JobResult; see `log()` for the meaning of the arguments.
+
+        The returned entry should be saved to the `log_database`, for example with `bulk_create()`.
+        """
         if level_choice not in LogLevelChoices.as_dict():
             raise ValueError(f"Unknown logging level: {level_choice}")
 
@@ -754,14 +769,21 @@ class JobResult(BaseModel, CustomFieldModel):
                 log_object=str(obj)[:JOB_LOG_MAX_LOG_OBJECT_LENGTH] if obj else "",
                 absolute_url="",
             )
-        # If the override is provided, we want to use the default database(pass no using argument)
-        # Otherwise we want to use a separate database here so that the logs are created immediately
-        # instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
-        # are running, and allow us to rollback the database without losing the log entries.
+        return log
+
+    @property
+    def log_database(self):
+        """
+        The database alias that JobLogEntry records for this JobResult should be saved to.
+
+        If the override is provided, we want to use the default database (return None, i.e. no `using` argument).
+        Otherwise we want to use a separate database here so that the logs are created immediately
+        instead of within transaction.atomic(). This allows us to be able to report logs when the jobs
+        are running, and allow us to rollback the database without losing the log entries.
+        """
         if not self.use_job_logs_db or not JOB_LOGS:
-            log.save()
-        else:
-            log.save(using=JOB_LOGS)
+            return None
+        return JOB_LOGS
 
 
 #
@@ -13,7 +13,6 @@ from django.core.validators import MinValueValidator
 from django.db import models
 from django.http import HttpResponse
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend
 from graphql.error import GraphQLSyntaxError
 from graphql.language.ast import OperationDefinition
 from jsonschema.exceptions import SchemaError, ValidationError as JSONSchemaValidationError
@@ -657,11 +656,12 @@ class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
         verbose_name_plural = "GraphQL queries"
 
     def save(self, *args, **kwargs):
+        from nautobot.core.graphql.backends import get_backend
+
         variables = {}
         schema = graphene_settings.SCHEMA
-        backend = get_default_backend()
-        # Load query into GraphQL backend
-        document = backend.document_from_string(schema, self.query)
+        # Load query into GraphQL backend, which also caches the parsed and validated document for later executions
+        document = get_backend().document_from_string(schema, self.query)
 
         # Inspect the parsed document tree (document.document_ast) to retrieve the query (operation) definition(s)
         # that define one or more variables. For each operation and variable definition, store the variable's
@@ -680,11 +680,12 @@ class GraphQLQuery(BaseModel, ChangeLoggedModel, NotesMixin):
         return super().save(*args, **kwargs)
 
     def clean(self):
+        from nautobot.core.graphql.backends import get_backend
+
         super().clean()
         schema = graphene_settings.SCHEMA
-        backend = get_default_backend()
         try:
-            backend.document_from_string(schema, self.query)
+            get_backend().document_from_string(schema, self.query)
         except GraphQLSyntaxError as error:
             raise ValidationError({"query": error})
 
@@ -64,7 +64,7 @@ class RelationshipModel(models.Model):
 
     def get_relationships(self, include_hidden=False, advanced_ui=None):
         """
-        Return a dictionary of RelationshipAssociation querysets for all custom relationships
+        Return a dictionary of RelationshipAssociation querysets for all custom relationships, ordered by PK
 
         Returns:
             (dict): `{
@@ -121,7 +121,7 @@ class RelationshipModel(models.Model):
                     query_params[f"{side}_id"] = self.pk
                     query_params[f"{side}_type"] = content_type
 
-                    resp[side][relationship] = RelationshipAssociation.objects.filter(**query_params)
+                    resp[side][relationship] = RelationshipAssociation.objects.filter(**query_params).order_by("pk")
                 else:
                     # Query for RelationshipAssociations involving this object, regardless of side
                     resp[RelationshipSideChoices.SIDE_PEER][relationship] = RelationshipAssociation.objects.filter(
@@ -130,7 +130,122 @@ class RelationshipModel(models.Model):
                             | Q(destination_id=self.pk, destination_type=content_type)
                         ),
                         **query_params,
-                    )
+                    ).order_by("pk")
+
+        return resp
+
+    @classmethod
+    def get_relationships_for_objects(cls, objects, include_hidden=False, advanced_ui=None):
+        """
+        Bulk version of `get_relationships()` for many objects of this model at once.
+
+        Rather than querying the associations of each object separately, the `source_filter`/`destination_filter` of
+        each relationship is evaluated once against all of the objects, all of their associations are loaded in a
+        single query, and the peer objects of those associations are loaded in one query per peer model and cached on
+        the associations, so that `RelationshipAssociation.get_peer()` does not need to query them again.
+
+        Args:
+            objects (QuerySet, list): The instances of this model to get the relationships of.
+            include_hidden (bool): Whether to include relationships that are hidden on this model's side.
+            advanced_ui (bool): Filter based on the value of each relationship's `advanced_ui` flag, or None to not
+                apply this filter.
+
+        Returns:
+            (dict): `{<object pk>: <dict in the same format as get_relationships(), but of lists of associations>}`,
+                with the associations in the same (PK) order as the querysets of `get_relationships()`.
+        """
+        objects = list(objects)
+        objects_by_pk = {obj.pk: obj for obj in objects}
+        resp = {
+            pk: {
+                RelationshipSideChoices.SIDE_SOURCE: {},
+                RelationshipSideChoices.SIDE_DESTINATION: {},
+                RelationshipSideChoices.SIDE_PEER: {},
+            }
+            for pk in objects_by_pk
+        }
+        if not objects:
+            return resp
+
+        src_relationships, dst_relationships = Relationship.objects.get_for_model(cls)
+        if advanced_ui is not None:
+            src_relationships = src_relationships.filter(advanced_ui=advanced_ui)
+            dst_relationships = dst_relationships.filter(advanced_ui=advanced_ui)
+        content_type = ContentType.objects.get_for_model(cls)
+        filterset = get_filterset_for_model(cls._meta.model)
+
+        # Determine which objects each relationship is applicable to on each side, as in get_relationships(),
+        # but resolving each relationship filter only once as the set of PKs of all the objects that match it
+        applicable_pks = {}
+        for side, relationships in (
+            (RelationshipSideChoices.SIDE_SOURCE, src_relationships),
+            (RelationshipSideChoices.SIDE_DESTINATION, dst_relationships),
+        ):
+            for relationship in relationships:
+                if getattr(relationship, f"{side}_hidden") and not include_hidden:
+                    continue
+                pks = set(objects_by_pk)
+                filter_params = getattr(relationship, f"{side}_filter")
+                if filter_params and filterset:
+                    queryset = cls._meta.model.objects.filter(pk__in=pks)
+                    pks = set(filterset(filter_params, queryset).qs.values_list("pk", flat=True))
+                result_side = RelationshipSideChoices.SIDE_PEER if relationship.symmetric else side
+                applicable_pks.setdefault((relationship, result_side), set()).update(pks)
+
+        if not applicable_pks:
+            return resp
+        for (relationship, side), pks in applicable_pks.items():
+            for pk in pks:
+                resp[pk][side][relationship] = []
+
+        # Load all associations of the objects, with any of the applicable relationships, in a single query
+        relationships_by_id = {relationship.pk: relationship for relationship, _ in applicable_pks}
+        associations = list(
+            RelationshipAssociation.objects.filter(
+                Q(source_type=content_type, source_id__in=objects_by_pk)
+                | Q(destination_type=content_type, destination_id__in=objects_by_pk),
+                relationship__in=list(relationships_by_id),
+            ).order_by("pk")
+        )
+
+        # Load the peer objects of all the associations, in one query per peer model
+        peer_pks_by_type = {}
+        for association in associations:
+            for end in ("source", "destination"):
+                end_type_id = getattr(association, f"{end}_type_id")
+                end_id = getattr(association, f"{end}_id")
+                if end_type_id != content_type.pk or end_id not in objects_by_pk:
+                    peer_pks_by_type.setdefault(end_type_id, set()).add(end_id)
+        peers = {(content_type.pk, pk): obj for pk, obj in objects_by_pk.items()}
+        for peer_type_id, peer_pks in peer_pks_by_type.items():
+            peer_model = ContentType.objects.get_for_id(peer_type_id).model_class()
+            if peer_model is None:
+                # Relationship to a model of an App that is not installed; get_peer() will log and return None
+                continue
+            for peer in peer_model.objects.filter(pk__in=peer_pks):
+                peers[(peer_type_id, peer.pk)] = peer
+
+        for association in associations:
+            relationship = relationships_by_id[association.relationship_id]
+            association.relationship = relationship
+            for end in ("source", "destination"):
+                peer = peers.get((getattr(association, f"{end}_type_id"), getattr(association, f"{end}_id")))
+                if peer is not None:
+                    RelationshipAssociation._meta.get_field(end).set_cached_value(association, peer)
+
+            if relationship.symmetric:
+                sides = [
+                    (RelationshipSideChoices.SIDE_PEER, association.source_id),
+                    (RelationshipSideChoices.SIDE_PEER, association.destination_id),
+                ]
+            else:
+                sides = [
+                    (RelationshipSideChoices.SIDE_SOURCE, association.source_id),
+                    (RelationshipSideChoices.SIDE_DESTINATION, association.destination_id),
+                ]
+            for side, pk in sides:
+                if pk in objects_by_pk and relationship in resp[pk][side]:
+                    resp[pk][side][relationship].append(association)
 
         return resp
 
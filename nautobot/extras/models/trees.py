@@ -0,0 +1,122 @@
+"""Persisted ancestor index of tree models."""
+
+from collections import defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+
+from nautobot.core.models import BaseModel
+
+# Number of index rows to write (or descendants to unlink) per query
+TREE_MODEL_ANCESTOR_BATCH_SIZE = 1000
+
+
+class TreeModelAncestor(BaseModel):
+    """
+    A (closure table) record that `ancestor_id` is an ancestor of `descendant_id`, `depth` levels above it.
+
+    Every indexed node also has a record of depth 0 relating it to itself, so that a node's full ancestry or subtree
+    (optionally including the node itself) can be looked up or used as a subquery, without walking the tree level by
+    level through recursive queries or chained `parent` joins.
+
+    The index is maintained by signals whenever a `TreeModel` instance is saved or deleted while
+    `settings.TREE_ANCESTOR_INDEX_ENABLED` is true; changes that bypass signals, such as `QuerySet.update(parent=...)`,
+    require the index to be rebuilt with `rebuild()` (or `nautobot-server rebuild_tree_ancestors`).
+    """
+
+    content_type = models.ForeignKey(to=ContentType, on_delete=models.CASCADE, related_name="+")
+    ancestor_id = models.UUIDField(db_index=True)
+    # Indexed as the leading column of the unique_together constraint
+    descendant_id = models.UUIDField()
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        unique_together = ["descendant_id", "ancestor_id"]
+
+    def __str__(self):
+        return f"{self.ancestor_id} is an ancestor of {self.descendant_id} (depth {self.depth})"
+
+    @classmethod
+    def update_for_node(cls, node):
+        """
+        Update the index records of the given tree node, and of its descendants, to match its current parent.
+
+        Nothing needs to be written if the node was already indexed under the same ancestors. Otherwise, the subtree
+        rooted at the node (as far as it is already indexed) is unlinked from its previous ancestors and linked to its
+        new ones, so nodes can be indexed in any order (for example when loading fixtures) and still end up complete.
+        """
+        parent_id = node.parent_id
+        node_and_parent_ids = [node.pk] if parent_id is None else [node.pk, parent_id]
+        ancestor_depths = {node.pk: {}, parent_id: {}}
+        for descendant_id, ancestor_id, depth in cls.objects.filter(descendant_id__in=node_and_parent_ids).values_list(
+            "descendant_id", "ancestor_id", "depth"
+        ):
+            ancestor_depths[descendant_id][ancestor_id] = depth
+
+        new_ancestor_depths = {node.pk: 0}
+        if parent_id is not None:
+            new_ancestor_depths[parent_id] = 1
+            for ancestor_id, depth in ancestor_depths[parent_id].items():
+                new_ancestor_depths[ancestor_id] = depth + 1
+        if ancestor_depths[node.pk] == new_ancestor_depths:
+            return
+
+        content_type = ContentType.objects.get_for_model(node._meta.concrete_model)
+        subtree_depths = dict(cls.objects.filter(ancestor_id=node.pk).values_list("descendant_id", "depth"))
+        subtree_depths[node.pk] = 0
+        subtree_ids = list(subtree_depths)
+        with transaction.atomic():
+            for i in range(0, len(subtree_ids), TREE_MODEL_ANCESTOR_BATCH_SIZE):
+                cls.objects.filter(descendant_id__in=subtree_ids[i : i + TREE_MODEL_ANCESTOR_BATCH_SIZE]).exclude(
+                    ancestor_id__in=subtree_ids
+                ).delete()
+            cls.objects.filter(descendant_id=node.pk, ancestor_id=node.pk).delete()
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        content_type=content_type,
+                        ancestor_id=ancestor_id,
+                        descendant_id=descendant_id,
+                        depth=ancestor_depth + descendant_depth,
+                    )
+                    for ancestor_id, ancestor_depth in new_ancestor_depths.items()
+                    for descendant_id, descendant_depth in subtree_depths.items()
+                    if ancestor_id != node.pk or descendant_id == node.pk
+                ],
+                batch_size=TREE_MODEL_ANCESTOR_BATCH_SIZE,
+            )
+
+    @classmethod
+    def delete_for_node(cls, node):
+        """Delete all index records relating the given (deleted) tree node to its ancestors and descendants."""
+        cls.objects.filter(models.Q(ancestor_id=node.pk) | models.Q(descendant_id=node.pk)).delete()
+
+    @classmethod
+    def rebuild(cls, model):
+        """
+        Replace all index records of the given tree model with ones computed from the current `parent` of each node.
+
+        Returns:
+            (int): The number of index records created.
+        """
+        content_type = ContentType.objects.get_for_model(model._meta.concrete_model)
+        parents = dict(model.objects.without_tree_fields().order_by().values_list("pk", "parent_id"))
+        children = defaultdict(list)
+        for pk, parent_id in parents.items():
+            children[parent_id].append(pk)
+
+        records = []
+        # Walk down from the root nodes, so each node's ancestry is known by the time it is reached;
+        # nodes in a (corrupt) cycle are never reached and so are left out of the index.
+        stack = [(pk, []) for pk in children[None]]
+        while stack:
+            pk, ancestor_ids = stack.pop()
+            ancestor_ids = [*ancestor_ids, pk]
+            for depth, ancestor_id in enumerate(reversed(ancestor_ids)):
+                records.append(cls(content_type=content_type, ancestor_id=ancestor_id, descendant_id=pk, depth=depth))
+            stack.extend((child_pk, ancestor_ids) for child_pk in children[pk])
+
+        with transaction.atomic():
+            cls.objects.filter(content_type=content_type).delete()
+            cls.objects.bulk_create(records, batch_size=TREE_MODEL_ANCESTOR_BATCH_SIZE)
+        return len(records)
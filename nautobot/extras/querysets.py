@@ -1,7 +1,7 @@
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
-from django.db.models import F, Model, OuterRef, Q, Subquery
+from django.db.models import Exists, F, Model, OuterRef, Q, QuerySet, Subquery
 from django.db.models.functions import JSONObject
 
 from nautobot.core.models.query_functions import EmptyGroupByJSONBAgg
@@ -9,6 +9,12 @@ from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.extras.models.tags import TaggedItem
 
+# Number of objects to load at once when resolving the config contexts of many objects
+CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE = 1000
+
+# Number of objects whose membership in the member cache tables of dynamic groups is updated at once
+DYNAMIC_GROUP_CACHED_MEMBERS_CHUNK_SIZE = 1000
+
 
 class ConfigContextQuerySet(RestrictedQuerySet):
     def get_for_object(self, obj):
@@ -55,7 +61,7 @@ class ConfigContextQuerySet(RestrictedQuerySet):
             Q(tags__name__in=obj.tags.names()) | Q(tags=None),
         ]
         if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
-            query.append(Q(dynamic_groups__in=obj.dynamic_groups) | Q(dynamic_groups=None))
+            query.append(Q(dynamic_groups__in=obj.dynamic_groups_cached) | Q(dynamic_groups=None))
 
         queryset = (
             self.filter(
@@ -68,6 +74,198 @@ class ConfigContextQuerySet(RestrictedQuerySet):
 
         return queryset
 
+    def get_for_objects(self, objects):
+        """
+        Return all applicable ConfigContexts for each of the given objects, as `get_for_object()` would.
+
+        Rather than querying the database for each object, the ancestors of the objects' locations and tenant groups,
+        and all active ConfigContexts and their assignments, are each loaded only once and matched to the objects in
+        memory, so the number of queries does not depend on the number of objects.
+
+        Args:
+            objects (Iterable[ConfigContextModel]): Devices or VirtualMachines (all of the same model) or a queryset.
+
+        Returns:
+            (dict): Mapping of the primary key of each object to a list of its applicable ConfigContexts, ordered by
+                weight and name.
+        """
+        from nautobot.dcim.models import Location
+        from nautobot.tenancy.models import TenantGroup
+
+        if isinstance(objects, QuerySet):
+            model = objects.model._meta.concrete_model
+            pks = list(objects.values_list("pk", flat=True))
+        else:
+            objects = list(objects)
+            model = objects[0]._meta.concrete_model if objects else None
+            pks = [obj.pk for obj in objects]
+        if not pks:
+            return {}
+
+        # Map each ConfigContext assignment relation to the corresponding attribute of the object, if it has one
+        model_field_names = {field.name for field in model._meta.get_fields()}
+        object_fields = {
+            "roles": "role_id",
+            "platforms": "platform_id",
+            "clusters": "cluster_id",
+            "cluster_groups": "cluster__cluster_group_id",
+            "tenants": "tenant_id",
+            "tenant_groups": "tenant__tenant_group_id",
+            # The location of a VirtualMachine is that of its cluster
+            "locations": "location_id" if "location" in model_field_names else "cluster__location_id",
+        }
+        if "device_type" in model_field_names:
+            object_fields["device_types"] = "device_type_id"
+        if "device_redundancy_group" in model_field_names:
+            object_fields["device_redundancy_groups"] = "device_redundancy_group_id"
+        relations = [
+            "locations",
+            "roles",
+            "device_types",
+            "platforms",
+            "cluster_groups",
+            "clusters",
+            "device_redundancy_groups",
+            "tenant_groups",
+            "tenants",
+            "tags",
+        ]
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            relations.append("dynamic_groups")
+
+        # Collect the set of related primary keys that each object can be matched by, for each relation
+        object_values = {pk: {relation: set() for relation in relations} for pk in pks}
+        rows = []
+        for i in range(0, len(pks), CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE):
+            rows += model.objects.filter(pk__in=pks[i : i + CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE]).values(
+                "pk", *object_fields.values()
+            )
+        location_ancestors = _get_tree_ancestors(Location, {row[object_fields["locations"]] for row in rows})
+        tenant_group_ancestors = _get_tree_ancestors(TenantGroup, {row[object_fields["tenant_groups"]] for row in rows})
+        for row in rows:
+            values = object_values[row["pk"]]
+            for relation, field_name in object_fields.items():
+                if row[field_name] is not None:
+                    values[relation].add(row[field_name])
+            # Match against the directly assigned location/tenant group as well as any of their ancestors
+            values["locations"] = location_ancestors.get(row[object_fields["locations"]], set())
+            values["tenant_groups"] = tenant_group_ancestors.get(row[object_fields["tenant_groups"]], set())
+
+        for i in range(0, len(pks), CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE):
+            for object_id, tag_id in TaggedItem.objects.filter(
+                content_type=ContentType.objects.get_for_model(model),
+                object_id__in=pks[i : i + CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE],
+            ).values_list("object_id", "tag_id"):
+                object_values[object_id]["tags"].add(tag_id)
+
+        # Load all active ConfigContexts and the primary keys of the objects each is assigned to, for each relation
+        config_contexts = list(self.filter(is_active=True).order_by("weight", "name").distinct())
+        assignments = {
+            config_context.pk: {relation: set() for relation in relations} for config_context in config_contexts
+        }
+        for relation in relations:
+            field = self.model._meta.get_field(relation)
+            source_field_name = f"{field.m2m_field_name()}_id"
+            target_field_name = f"{field.m2m_reverse_field_name()}_id"
+            for config_context_id, target_id in field.remote_field.through.objects.filter(
+                **{f"{source_field_name}__in": assignments.keys()}
+            ).values_list(source_field_name, target_field_name):
+                assignments[config_context_id][relation].add(target_id)
+
+        if settings.CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED:
+            from nautobot.extras.models import DynamicGroup, DynamicGroupCachedMember
+
+            dynamic_group_ids = set().union(*(assigned["dynamic_groups"] for assigned in assignments.values()))
+            dynamic_groups = DynamicGroup.objects.filter(
+                pk__in=dynamic_group_ids, content_type=ContentType.objects.get_for_model(model)
+            )
+            if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") != 0:
+                dynamic_groups.update_stale_cached_members()
+                for i in range(0, len(pks), CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE):
+                    for member_pk, dynamic_group_id in DynamicGroupCachedMember.objects.filter(
+                        dynamic_group__in=dynamic_groups, member_id__in=pks[i : i + CONFIG_CONTEXT_OBJECTS_CHUNK_SIZE]
+                    ).values_list("member_id", "dynamic_group_id"):
+                        object_values[member_pk]["dynamic_groups"].add(dynamic_group_id)
+            else:
+                for dynamic_group in dynamic_groups:
+                    for member_pk in dynamic_group.members.filter(pk__in=pks).values_list("pk", flat=True):
+                        object_values[member_pk]["dynamic_groups"].add(dynamic_group.pk)
+
+        # A ConfigContext applies to an object if, for each relation, it is either unassigned or assigned to a match
+        return {
+            pk: [
+                config_context
+                for config_context in config_contexts
+                if all(
+                    not assignments[config_context.pk][relation]
+                    or not assignments[config_context.pk][relation].isdisjoint(values[relation])
+                    for relation in relations
+                )
+            ]
+            for pk, values in object_values.items()
+        }
+
+    def populate_config_context_data(self, objects):
+        """
+        Attach the data of all applicable ConfigContexts to each of the given objects, using `get_for_objects()`.
+
+        This sets the same `config_context_data` attribute as `ConfigContextModelQuerySet.annotate_config_context_data()`
+        so that calling `get_config_context()` on each object afterwards does not require any further database queries.
+
+        Args:
+            objects (Iterable[ConfigContextModel]): Devices or VirtualMachines, all of the same model.
+
+        Returns:
+            (list[ConfigContextModel]): The given objects, as a list.
+        """
+        objects = list(objects)
+        config_contexts = self.get_for_objects(objects)
+        for obj in objects:
+            obj.config_context_data = [
+                {"data": config_context.data, "name": config_context.name, "weight": config_context.weight}
+                for config_context in config_contexts.get(obj.pk, [])
+            ]
+        return objects
+
+
+def _get_tree_ancestors(model, pks):
+    """
+    Get a mapping of each of the given tree model primary keys to the set of its own and all of its ancestors' keys.
+
+    Uses a single query on the tree ancestor index if `settings.TREE_ANCESTOR_INDEX_ENABLED` is set; otherwise loads one
+    level of the tree per query, rather than one query per object.
+    """
+    if settings.TREE_ANCESTOR_INDEX_ENABLED:
+        from nautobot.extras.models import TreeModelAncestor
+
+        ancestors = {pk: {pk} for pk in pks if pk is not None}
+        for descendant_id, ancestor_id in TreeModelAncestor.objects.filter(
+            descendant_id__in=ancestors.keys()
+        ).values_list("descendant_id", "ancestor_id"):
+            ancestors[descendant_id].add(ancestor_id)
+        return ancestors
+
+    parents = {}
+    to_load = {pk for pk in pks if pk is not None}
+    while to_load:
+        to_load_next = set()
+        for pk, parent_id in model.objects.without_tree_fields().filter(pk__in=to_load).values_list("pk", "parent_id"):
+            parents[pk] = parent_id
+            if parent_id is not None and parent_id not in parents:
+                to_load_next.add(parent_id)
+        to_load = to_load_next
+
+    ancestors = {}
+    for pk in pks:
+        if pk is None:
+            continue
+        ancestors[pk] = set()
+        node = pk
+        while node is not None and node not in ancestors[pk]:
+            ancestors[pk].add(node)
+            node = parents.get(node)
+    return ancestors
+
 
 class ConfigContextModelQuerySet(RestrictedQuerySet):
     """
@@ -89,7 +287,8 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         we include "weight" and "name" into the result so that we can sort it within Python to ensure correctness.
 
         TODO This method does not accurately reflect location inheritance because of the reasons stated in _get_config_context_filters()
-        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead.
+        Do not use this method by itself, use get_config_context() method directly on ConfigContextModel instead, or
+        `ConfigContext.objects.populate_config_context_data()` to efficiently do so for many objects at once.
         """
         from nautobot.extras.models import ConfigContext
 
@@ -113,9 +312,11 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
     def _get_config_context_filters(self):
         """
         This method is constructing the set of Q objects for the specific object types.
-        Note that locations filters are not included in the method because the filter needs the
-        ability to query the ancestors for a particular tree node for subquery and we lost it since
-        moving from mptt to django-tree-queries https://github.com/matthiask/django-tree-queries/issues/54.
+        Note that the location and tenant group filters need the ability to query the ancestors of a particular tree
+        node in a subquery, which we lost when moving from mptt to django-tree-queries
+        (https://github.com/matthiask/django-tree-queries/issues/54). If `settings.TREE_ANCESTOR_INDEX_ENABLED` is set,
+        the tree ancestor index is used for this instead; otherwise a chain of `__parent` lookups is built up to the
+        maximum depth of each tree.
         """
         tag_query_filters = {
             "object_id": OuterRef(OuterRef("pk")),
@@ -146,6 +347,25 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
         else:
             location_query_string = "cluster__location"
 
+        tenant_group_query_string = "tenant__tenant_group"
+        if settings.TREE_ANCESTOR_INDEX_ENABLED:
+            from nautobot.extras.models import TreeModelAncestor
+
+            # Match the assigned location and tenant group and all of their ancestors through the tree ancestor index
+            location_query = Q(locations=None) | Q(
+                locations__in=TreeModelAncestor.objects.filter(
+                    descendant_id=OuterRef(OuterRef(location_query_string))
+                ).values("ancestor_id")
+            )
+            tenant_group_query = Q(tenant_groups=None) | Q(
+                tenant_groups__in=TreeModelAncestor.objects.filter(
+                    descendant_id=OuterRef(OuterRef(tenant_group_query_string))
+                ).values("ancestor_id")
+            )
+            base_query.add((location_query), Q.AND)
+            base_query.add((tenant_group_query), Q.AND)
+            return base_query
+
         location_query = Q(locations=None) | Q(locations=OuterRef(location_query_string))
         for _ in range(Location.objects.max_depth + 1):
             location_query_string += "__parent"
@@ -153,7 +373,6 @@ class ConfigContextModelQuerySet(RestrictedQuerySet):
 
         base_query.add((location_query), Q.AND)
 
-        tenant_group_query_string = "tenant__tenant_group"
         tenant_group_query = Q(tenant_groups=None) | Q(tenant_groups=OuterRef(tenant_group_query_string))
         for _ in range(TenantGroup.objects.max_depth + 1):
             tenant_group_query_string += "__parent"
@@ -173,11 +392,14 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
 
         Args:
             obj: The object to seek dynamic groups membership by.
-            use_cache: If True, use the cache and query the database directly.
+            use_cache: If True, use the member cache tables of the groups rather than evaluating their filters.
         """
         if not isinstance(obj, Model):
             raise TypeError(f"{obj} is not an instance of Django Model class")
 
+        if use_cache and get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") != 0:
+            return list(self._get_cached_for_object(obj))
+
         # Get dynamic groups for this content_type using the discrete content_type fields to
         # optimize the query.
         eligible_groups = self._get_eligible_dynamic_groups(obj, use_cache=use_cache)
@@ -196,10 +418,85 @@ class DynamicGroupQuerySet(RestrictedQuerySet):
 
         Args:
             obj: The object to seek dynamic groups membership by.
-            use_cache: If True, use the cache and query the database directly.
+            use_cache: If True, use the member cache tables of the groups rather than evaluating their filters.
         """
+        if use_cache and get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") != 0:
+            return self._get_cached_for_object(obj)
         return self.filter(pk__in=[dg.pk for dg in self.get_list_for_object(obj, use_cache=use_cache)])
 
+    def _get_cached_for_object(self, obj):
+        """
+        Return a queryset of `DynamicGroup` objects whose member cache table records the given object as a member.
+
+        The member cache tables of the eligible groups that are stale are updated first.
+        """
+        self.model.objects.all()._get_eligible_dynamic_groups(obj, use_cache=True).update_stale_cached_members()
+        return self.filter(
+            content_type=ContentType.objects.get_for_model(obj), cached_members__member_id=obj.pk
+        ).select_related("content_type")
+
+    def update_stale_cached_members(self):
+        """
+        Update the member cache tables of the groups in this queryset that were never populated, or were last fully
+        updated longer ago than `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT` seconds.
+        """
+        groups = list(self)
+        cached_at = cache.get_many([group.members_cache_key for group in groups])
+        for group in groups:
+            if group.members_cache_key not in cached_at:
+                group.update_cached_members()
+
+    def update_cached_members_for_objects(self, model, pks):
+        """
+        Update the membership of the given objects in the member cache tables of the groups in this queryset.
+
+        The objects are checked against the filters of all of the groups of their content type at once, with a single
+        query per chunk of objects. Groups whose member cache tables are stale are skipped, as they will be entirely
+        updated the next time that they are used anyway.
+
+        Args:
+            model (type[Model]): The model of the objects.
+            pks (Iterable): The PKs of the objects, which need not exist anymore.
+        """
+        from nautobot.extras.models import DynamicGroupCachedMember
+
+        groups = list(self.filter(content_type=ContentType.objects.get_for_model(model)))
+        cached_at = cache.get_many([group.members_cache_key for group in groups])
+        groups = [group for group in groups if group.members_cache_key in cached_at]
+        if not groups:
+            return
+
+        pks = list(pks)
+        annotations = {
+            f"_dynamic_group_{index}": Exists(group.members.filter(pk=OuterRef("pk")))
+            for index, group in enumerate(groups)
+        }
+        for i in range(0, len(pks), DYNAMIC_GROUP_CACHED_MEMBERS_CHUNK_SIZE):
+            chunk_pks = pks[i : i + DYNAMIC_GROUP_CACHED_MEMBERS_CHUNK_SIZE]
+            members = set()
+            for pk, *is_member in (
+                model.objects.filter(pk__in=chunk_pks).annotate(**annotations).values_list("pk", *annotations)
+            ):
+                members.update((group.pk, pk) for group, member in zip(groups, is_member) if member)
+            cached_members = set(
+                DynamicGroupCachedMember.objects.filter(dynamic_group__in=groups, member_id__in=chunk_pks).values_list(
+                    "dynamic_group_id", "member_id"
+                )
+            )
+
+            stale_members = Q()
+            for dynamic_group_id, member_id in cached_members - members:
+                stale_members |= Q(dynamic_group_id=dynamic_group_id, member_id=member_id)
+            if stale_members:
+                DynamicGroupCachedMember.objects.filter(stale_members).delete()
+            DynamicGroupCachedMember.objects.bulk_create(
+                [
+                    DynamicGroupCachedMember(dynamic_group_id=dynamic_group_id, member_id=member_id)
+                    for dynamic_group_id, member_id in members - cached_members
+                ],
+                ignore_conflicts=True,
+            )
+
     def get_by_natural_key(self, slug):
         return self.get(slug=slug)
 
@@ -9,6 +9,7 @@ import traceback
 
 from db_file_storage.model_utils import delete_file
 from db_file_storage.storage import DatabaseFileStorage
+from django.apps import apps as django_apps
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
@@ -22,7 +23,9 @@ from django_prometheus.models import model_deletes, model_inserts, model_updates
 import redis.exceptions
 
 from nautobot.core.celery import app, import_jobs
+from nautobot.core.filters import invalidate_dynamic_filters_cache
 from nautobot.core.models import BaseModel
+from nautobot.core.models.tree_queries import TreeModel
 from nautobot.core.utils.config import get_settings_or_config
 from nautobot.core.utils.logging import sanitize
 from nautobot.extras.choices import JobResultStatusChoices, ObjectChangeActionChoices
@@ -31,14 +34,19 @@ from nautobot.extras.models import (
     ComputedField,
     ContactAssociation,
     CustomField,
+    CustomFieldChoice,
     DynamicGroup,
+    DynamicGroupCachedMember,
     DynamicGroupMembership,
     GitRepository,
     JobResult,
     ObjectChange,
     Relationship,
+    TaggedItem,
+    TreeModelAncestor,
 )
 from nautobot.extras.querysets import NotesQuerySet
+from nautobot.extras.registry import registry
 from nautobot.extras.tasks import delete_custom_field_data, provision_field
 from nautobot.extras.utils import refresh_job_model_from_job_class
 
@@ -70,7 +78,11 @@ def get_user_if_authenticated(user, instance):
 @receiver(m2m_changed)
 @receiver(post_delete)
 def invalidate_models_cache(sender, **kwargs):
-    """Invalidate the related-models cache for ComputedFields, CustomFields and Relationships."""
+    """Invalidate the related-models cache for ComputedFields, CustomFields and Relationships, and derived caches."""
+    if sender is CustomFieldChoice:
+        # The form widgets of the cached custom field filters include the choices of select custom fields
+        invalidate_dynamic_filters_cache()
+        return
     if sender is CustomField.content_types.through:
         manager = CustomField.objects
     elif sender in (ComputedField, CustomField, Relationship):
@@ -92,6 +104,10 @@ def invalidate_models_cache(sender, **kwargs):
                     # TODO: *maybe* target more narrowly, e.g. only clear the cache for specific related content-types?
                     cache.delete_pattern(f"{method.cache_key_prefix}.*")
 
+    if manager is not ComputedField.objects:
+        # FilterSets generate filters from CustomFields and Relationships, and cache them until these change
+        invalidate_dynamic_filters_cache()
+
 
 @receiver(post_save)
 @receiver(m2m_changed)
@@ -133,9 +149,12 @@ def _handle_changed_object(sender, instance, raw=False, **kwargs):
         # This is used for deferred change logging and for looking up related changes without querying the database
         unique_object_change_id = f"{changed_object_type.pk}__{changed_object_id}__{user.pk}"
 
+        if change_context.write_behind:
+            change_context.defer_write_behind_change(unique_object_change_id, action, instance, user)
+
         # If a change already exists for this change_id, user, and object, update it instead of creating a new one.
         # If the object was deleted then recreated with the same pk (don't do this), change the action to update.
-        if unique_object_change_id in change_context.deferred_object_changes:
+        elif unique_object_change_id in change_context.deferred_object_changes:
             related_changes = ObjectChange.objects.filter(
                 changed_object_type=changed_object_type,
                 changed_object_id=changed_object_id,
@@ -215,12 +234,17 @@ def _handle_deleted_object(sender, instance, **kwargs):
         # Generate a unique identifier for this change to stash in the change context
         # This is used for deferred change logging and for looking up related changes without querying the database
         unique_object_change_id = f"{changed_object_type.pk}__{changed_object_id}__{user.pk}"
-        save_new_objectchange = True
+        save_new_objectchange = not change_context.write_behind
+
+        if change_context.write_behind:
+            change_context.defer_write_behind_change(
+                unique_object_change_id, ObjectChangeActionChoices.ACTION_DELETE, instance, user
+            )
 
         # if a change already exists for this change_id, user, and object, update it instead of creating a new one
         # except in the case that the object was created and deleted in the same change_id
         # we don't want to create a delete change for an object that never existed
-        if unique_object_change_id in change_context.deferred_object_changes:
+        elif unique_object_change_id in change_context.deferred_object_changes:
             cached_related_change = change_context.deferred_object_changes[unique_object_change_id][-1]
             if cached_related_change["action"] != ObjectChangeActionChoices.ACTION_CREATE:
                 cached_related_change["action"] = ObjectChangeActionChoices.ACTION_DELETE
@@ -443,8 +467,153 @@ def dynamic_group_update_cached_members(sender, instance, **kwargs):
     _update_cache_and_parents(group)
 
 
+def dynamic_group_membership_deleted(sender, instance, **kwargs):
+    """
+    When a DynamicGroupMembership is deleted, update the cache of members of its (former) parent group.
+    """
+    try:
+        parent_group = instance.parent_group
+    except DynamicGroup.DoesNotExist:
+        # The parent group itself is being deleted
+        return
+
+    dynamic_group_update_cached_members(sender, parent_group, **kwargs)
+
+
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroup)
 post_save.connect(dynamic_group_update_cached_members, sender=DynamicGroupMembership)
+post_delete.connect(dynamic_group_membership_deleted, sender=DynamicGroupMembership)
+
+
+def _is_dynamic_group_member_model(model):
+    """Return True if instances of the given model can be members of a DynamicGroup."""
+    return model._meta.model_name in registry["model_features"]["dynamic_groups"].get(model._meta.app_label, [])
+
+
+# PKs of the objects (by model) saved in the current transaction, whose cached DynamicGroup memberships need updating
+_pending_dynamic_group_cached_members = contextvars.ContextVar(
+    "nautobot.extras.pending_dynamic_group_cached_members", default=None
+)
+
+
+def _update_pending_dynamic_group_cached_members():
+    """Update the DynamicGroup member caches of all objects saved since they were last updated, in bulk."""
+    pending = _pending_dynamic_group_cached_members.get()
+    if not pending:
+        return
+    _pending_dynamic_group_cached_members.set(None)
+    for model, pks in pending.items():
+        DynamicGroup.objects.update_cached_members_for_objects(model, pks)
+
+
+def dynamic_group_update_cached_member(sender, instance, raw=False, **kwargs):
+    """
+    When an object is saved, update its membership in the member caches of the DynamicGroups of its content type.
+
+    The update is deferred until the current transaction (if any) is committed, so that all of the objects saved in a
+    transaction are checked against the filters of the groups together.
+    """
+    # Check the model first, as this is much cheaper than looking up the setting, and most models are not applicable
+    if raw or not _is_dynamic_group_member_model(type(instance)):
+        return
+
+    if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+        return
+
+    pending = _pending_dynamic_group_cached_members.get()
+    if pending is None:
+        pending = {}
+        _pending_dynamic_group_cached_members.set(pending)
+    pending.setdefault(type(instance), set()).add(instance.pk)
+    # Objects saved in a transaction that is rolled back are still checked along with those of a later transaction,
+    # which is harmless, as their membership is determined from the database anyway
+    transaction.on_commit(_update_pending_dynamic_group_cached_members)
+
+
+def dynamic_group_tags_changed(sender, instance, action, reverse, **kwargs):
+    """
+    When the tags of an object are changed, update its membership in the member caches of the DynamicGroups.
+    """
+    if reverse or action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    dynamic_group_update_cached_member(type(instance), instance)
+
+
+def dynamic_group_remove_cached_member(sender, instance, **kwargs):
+    """
+    When an object is deleted, remove it from the member caches of all DynamicGroups.
+    """
+    if not _is_dynamic_group_member_model(type(instance)):
+        return
+
+    if get_settings_or_config("DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT") == 0:
+        return
+
+    DynamicGroupCachedMember.objects.filter(member_id=instance.pk).delete()
+
+
+post_save.connect(dynamic_group_update_cached_member)
+m2m_changed.connect(dynamic_group_tags_changed, sender=TaggedItem)
+post_delete.connect(dynamic_group_remove_cached_member)
+
+
+#
+# Tree model ancestor index
+#
+
+
+def tree_model_update_ancestors(sender, instance, created=False, raw=False, **kwargs):
+    """
+    When a tree model object is created or moved to a different parent, update the ancestor index of it and its subtree.
+    """
+    if not settings.TREE_ANCESTOR_INDEX_ENABLED or not isinstance(instance, TreeModel):
+        return
+
+    if not created and not raw and instance.__dict__.get("_original_parent_id", ...) == instance.parent_id:
+        return
+
+    TreeModelAncestor.update_for_node(instance)
+    instance._original_parent_id = instance.parent_id
+
+
+def tree_model_delete_ancestors(sender, instance, **kwargs):
+    """
+    When a tree model object is deleted, remove it from the ancestor index.
+    """
+    if not settings.TREE_ANCESTOR_INDEX_ENABLED or not isinstance(instance, TreeModel):
+        return
+
+    TreeModelAncestor.delete_for_node(instance)
+
+
+post_save.connect(tree_model_update_ancestors)
+post_delete.connect(tree_model_delete_ancestors)
+
+
+def populate_tree_model_ancestors(sender, *, apps, **kwargs):
+    """
+    Callback for the nautobot_database_ready signal; builds the ancestor index of any tree model that lacks one.
+    """
+    if not settings.TREE_ANCESTOR_INDEX_ENABLED:
+        return
+
+    # To make reverse migrations safe
+    try:
+        apps.get_model("extras", "TreeModelAncestor")
+    except LookupError:
+        logger.info(
+            "Skipping populate_tree_model_ancestors() as the TreeModelAncestor model has not yet been migrated."
+        )
+        return
+
+    for model in django_apps.get_models():
+        if not issubclass(model, TreeModel) or model._meta.proxy:
+            continue
+        content_type = ContentType.objects.get_for_model(model)
+        if model.objects.exists() and not TreeModelAncestor.objects.filter(content_type=content_type).exists():
+            logger.info("Building the tree ancestor index of %s", model._meta.verbose_name_plural)
+            TreeModelAncestor.rebuild(model)
 
 
 #
@@ -1,17 +1,104 @@
+from contextlib import contextmanager
 from logging import getLogger
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
+from django.utils import timezone
 from jinja2.exceptions import TemplateError
 import requests
 
 from nautobot.core.celery import nautobot_task
+from nautobot.core.models.query_functions import JSONRemove, JSONSet
 from nautobot.extras.choices import CustomFieldTypeChoices, ObjectChangeActionChoices
+from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
 from nautobot.extras.utils import generate_signature
 
 logger = getLogger("nautobot.extras.tasks")
 
+# Number of objects whose custom field data is updated per query (and per transaction) by the tasks below
+CUSTOM_FIELD_DATA_CHUNK_SIZE = 1000
+
+
+def _iter_pk_chunks(queryset, chunk_size=None):
+    """Yield lists of the PKs of the objects in the given queryset, in ascending order, `chunk_size` PKs at a time."""
+    chunk_size = chunk_size or CUSTOM_FIELD_DATA_CHUNK_SIZE
+    queryset = queryset.order_by("pk").values_list("pk", flat=True)
+    pks = list(queryset[:chunk_size])
+    while pks:
+        yield pks
+        pks = list(queryset.filter(pk__gt=pks[-1])[:chunk_size])
+
+
+def _get_custom_field_model_queryset(model):
+    """Get a queryset of all instances of the given model suitable for use with `update()`."""
+    manager = model.objects
+    if hasattr(manager, "without_tree_fields"):
+        manager = manager.without_tree_fields()
+    return manager.all()
+
+
+def _record_custom_field_data_changes(model, pks):
+    """Record ObjectChanges in bulk for the given updated objects, if change logging is active."""
+    # Circular Import
+    from nautobot.extras.models import ObjectChange
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if change_context is None or not hasattr(model, "to_objectchange"):
+        return
+
+    object_changes = []
+    for instance in model.objects.filter(pk__in=pks):
+        objectchange = instance.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+        objectchange.user = change_context.get_user(instance)
+        objectchange.user_name = objectchange.user.username
+        objectchange.request_id = change_context.change_id
+        objectchange.change_context = change_context.context
+        objectchange.change_context_detail = change_context.context_detail[:CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL]
+        object_changes.append(objectchange)
+    ObjectChange.objects.bulk_create(object_changes)
+
+
+def _update_custom_field_data(queryset, **update_kwargs):
+    """
+    Update the `_custom_field_data` of the objects in the given queryset using `update()` with the given expression(s).
+
+    Objects are updated `CUSTOM_FIELD_DATA_CHUNK_SIZE` at a time, each chunk in its own transaction, so that no single
+    transaction or table lock is held for the duration of the entire operation. No signals are sent for the updated
+    objects; instead, ObjectChanges are recorded for each chunk in bulk, if change logging is active.
+
+    Returns:
+        (int): The number of objects updated.
+    """
+    model = queryset.model
+    if hasattr(model, "last_updated"):
+        update_kwargs.setdefault("last_updated", timezone.now())
+    count = 0
+    for pks in _iter_pk_chunks(queryset):
+        with transaction.atomic():
+            count += _get_custom_field_model_queryset(model).filter(pk__in=pks).update(**update_kwargs)
+            _record_custom_field_data_changes(model, pks)
+    return count
+
+
+@contextmanager
+def _optional_change_context(change_context):
+    """Enter a `web_request_context()` as described by the given `change_context` dict, if any."""
+    # Circular Import
+    from nautobot.extras.context_managers import web_request_context
+
+    if change_context is None:
+        yield
+        return
+    with web_request_context(
+        user=change_context.get("user"),
+        change_id=change_context.get("change_id"),
+        context_detail=change_context.get("context_detail"),
+        context=change_context.get("context"),
+    ):
+        yield
+
 
 @nautobot_task
 def update_custom_field_choice_data(field_id, old_value, new_value, change_context=None):
@@ -24,7 +111,6 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         new_value (str): The value which will be used as replacement
     """
     # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -33,51 +119,38 @@ def update_custom_field_choice_data(field_id, old_value, new_value, change_conte
         logger.error(f"Custom field with ID {field_id} not found, failing to act on choice data.")
         return False
 
-    if field.type == CustomFieldTypeChoices.TYPE_SELECT:
-        # Loop through all field content types and search for values to update
-        for ct in field.content_types.all():
-            model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                        obj._custom_field_data[field.key] = new_value
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}": old_value}):
-                    obj._custom_field_data[field.key] = new_value
-                    obj.save()
+    if field.type not in (CustomFieldTypeChoices.TYPE_SELECT, CustomFieldTypeChoices.TYPE_MULTISELECT):
+        logger.error(f"Unknown field type, failing to act on choice data for this field {field.key}.")
+        return False
 
-    elif field.type == CustomFieldTypeChoices.TYPE_MULTISELECT:
+    with _optional_change_context(change_context):
         # Loop through all field content types and search for values to update
         for ct in field.content_types.all():
             model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                        old_list = obj._custom_field_data[field.key]
-                        new_list = [new_value if e == old_value else e for e in old_list]
-                        obj._custom_field_data[field.key] = new_list
-                        obj.save()
+            queryset = _get_custom_field_model_queryset(model)
+            if field.type == CustomFieldTypeChoices.TYPE_SELECT:
+                _update_custom_field_data(
+                    queryset.filter(**{f"_custom_field_data__{field.key}": old_value}),
+                    _custom_field_data=JSONSet("_custom_field_data", field.key, new_value),
+                )
             else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field.key}__contains": old_value}):
-                    old_list = obj._custom_field_data[field.key]
-                    new_list = [new_value if e == old_value else e for e in old_list]
-                    obj._custom_field_data[field.key] = new_list
-                    obj.save()
-
-    else:
-        logger.error(f"Unknown field type, failing to act on choice data for this field {field.key}.")
-        return False
+                # Each object may have a different list of selected values, so the new lists are calculated in Python,
+                # but still written one chunk at a time with a single query per chunk.
+                queryset = queryset.filter(**{f"_custom_field_data__{field.key}__contains": old_value})
+                update_fields = ["_custom_field_data"]
+                if hasattr(model, "last_updated"):
+                    update_fields.append("last_updated")
+                for pks in _iter_pk_chunks(queryset):
+                    with transaction.atomic():
+                        objs = list(_get_custom_field_model_queryset(model).filter(pk__in=pks).only(*update_fields))
+                        now = timezone.now()
+                        for obj in objs:
+                            old_list = obj._custom_field_data[field.key]
+                            obj._custom_field_data[field.key] = [new_value if e == old_value else e for e in old_list]
+                            if "last_updated" in update_fields:
+                                obj.last_updated = now
+                        model.objects.bulk_update(objs, update_fields)
+                        _record_custom_field_data_changes(model, pks)
 
     return True
 
@@ -91,26 +164,13 @@ def delete_custom_field_data(field_key, content_type_pk_set, change_context=None
         field_key (str): The key of the custom field which is being deleted
         content_type_pk_set (list): List of PKs for content types to act upon
     """
-    # Circular Import
-    from nautobot.extras.context_managers import web_request_context
-
-    with transaction.atomic():
+    with _optional_change_context(change_context):
         for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
             model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                        del obj._custom_field_data[field_key]
-                        obj.save()
-            else:
-                for obj in model.objects.filter(**{f"_custom_field_data__{field_key}__isnull": False}):
-                    del obj._custom_field_data[field_key]
-                    obj.save()
+            _update_custom_field_data(
+                _get_custom_field_model_queryset(model).filter(_custom_field_data__has_key=field_key),
+                _custom_field_data=JSONRemove("_custom_field_data", field_key),
+            )
 
 
 @nautobot_task
@@ -123,7 +183,6 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         content_type_pk_set (list): List of PKs for content types to act upon
     """
     # Circular Import
-    from nautobot.extras.context_managers import web_request_context
     from nautobot.extras.models import CustomField
 
     try:
@@ -132,23 +191,13 @@ def provision_field(field_id, content_type_pk_set, change_context=None):
         logger.error(f"Custom field with ID {field_id} not found, failing to provision.")
         return False
 
-    with transaction.atomic():
+    with _optional_change_context(change_context):
         for ct in ContentType.objects.filter(pk__in=content_type_pk_set):
             model = ct.model_class()
-            if change_context is not None:
-                with web_request_context(
-                    user=change_context.get("user"),
-                    change_id=change_context.get("change_id"),
-                    context_detail=change_context.get("context_detail"),
-                    context=change_context.get("context"),
-                ):
-                    for obj in model.objects.all():
-                        obj._custom_field_data.setdefault(field.key, field.default)
-                        obj.save()
-            else:
-                for obj in model.objects.all():
-                    obj._custom_field_data.setdefault(field.key, field.default)
-                    obj.save()
+            _update_custom_field_data(
+                _get_custom_field_model_queryset(model).exclude(_custom_field_data__has_key=field.key),
+                _custom_field_data=JSONSet("_custom_field_data", field.key, field.default),
+            )
 
     return True
 
@@ -0,0 +1,18 @@
+from nautobot.core.celery import register_jobs
+from nautobot.extras.jobs import get_task_logger, IntegerVar, Job
+
+logger = get_task_logger(__name__)
+
+
+class TestLogMany(Job):
+    count = IntegerVar(default=25)
+
+    class Meta:
+        description = "Test logging of many messages"
+
+    def run(self, count):
+        for i in range(count):
+            logger.info("Message %d", i)
+
+
+register_jobs(TestLogMany)
@@ -7,7 +7,9 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.timezone import make_aware, now
 from rest_framework import status
@@ -179,6 +181,15 @@ class ComputedFieldTest(APIViewTestCases.APIViewTestCase):
         response = self.client.get(url, data=params, **self.header)
         self.assertIn("computed_fields", response.json())
 
+    def test_computed_field_include_list(self):
+        """Test that the computed fields of each object in a list are rendered as expected."""
+        self.add_permissions("dcim.view_location")
+        url = reverse("dcim-api:location-list")
+        response = self.client.get(url, data={"include": "computed_fields", "limit": 5}, **self.header)
+        self.assertHttpStatus(response, 200)
+        for result in response.json()["results"]:
+            self.assertEqual(result["computed_fields"], Location.objects.get(pk=result["id"]).get_computed_fields())
+
 
 class ConfigContextTest(APIViewTestCases.APIViewTestCase):
     model = ConfigContext
@@ -3160,6 +3171,32 @@ class RelationshipAssociationTest(APIViewTestCases.APIViewTestCase):
                 self.devices[i].name,
             )
 
+    def test_get_association_data_on_location_list(self):
+        """
+        Check that `include=relationships` on a list endpoint matches the detail endpoint, in a constant number of queries.
+        """
+        self.add_permissions("dcim.view_location")
+        url = reverse("dcim-api:location-list") + f"?include=relationships&location_type={self.lt.pk}&limit=1000"
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        with CaptureQueriesContext(connection) as initial_queries:
+            self.client.get(url, **self.header)
+
+        # Associating more of the locations with devices doesn't increase the number of queries
+        for location, device in zip(self.locations[1:], self.devices):
+            RelationshipAssociation.objects.create(relationship=self.relationship, source=location, destination=device)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(queries), len(initial_queries))
+
+        for result in response.data["results"]:
+            detail_response = self.client.get(
+                reverse("dcim-api:location-detail", kwargs={"pk": result["id"]}) + "?include=relationships",
+                **self.header,
+            )
+            self.assertEqual(result["relationships"], detail_response.data["relationships"])
+
     def test_update_association_data_on_location(self):
         """
         Check that relationship-associations can be updated via the 'relationships' field.
@@ -1,8 +1,13 @@
+from unittest import mock
+import uuid
+
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.db import transaction
+from django.test import override_settings, TestCase
 
 from nautobot.core.celery import app
+from nautobot.core.models.utils import serialize_object_v2
 from nautobot.core.testing import TransactionTestCase
 from nautobot.core.utils.lookup import get_changes_for_model
 from nautobot.dcim.models import (
@@ -20,7 +25,7 @@ from nautobot.extras.context_managers import (
     deferred_change_logging_for_bulk_operation,
     web_request_context,
 )
-from nautobot.extras.models import Status, Webhook
+from nautobot.extras.models import ObjectChange, Status, Tag, Webhook
 from nautobot.extras.utils import bulk_delete_with_bulk_change_logging
 
 # Use the proper swappable User model
@@ -303,6 +308,31 @@ class BulkEditDeleteChangeLogging(TestCase):
             self.assertIsNone(snapshots["differences"]["removed"])
             self.assertEqual(snapshots["differences"]["added"]["description"], "changed")
 
+    def test_bulk_edit_related_objects(self):
+        """Test that the related objects of deferred changes are fetched in bulk and represented in full"""
+        location_type = LocationType.objects.get(name="Campus")
+        location_status = Status.objects.get_for_model(Location).first()
+        Location.objects.bulk_create(
+            [
+                Location(name=f"Test Location {i}", location_type=location_type, status=location_status)
+                for i in range(1, 4)
+            ]
+        )
+        locations = list(Location.objects.filter(name__startswith="Test Location "))
+        with web_request_context(self.user):
+            with deferred_change_logging_for_bulk_operation():
+                for location in locations:
+                    location.description = "changed"
+                    location.save()
+                    self.assertFalse(Location.location_type.is_cached(location))
+
+        for location in locations:
+            self.assertTrue(Location.location_type.is_cached(location))
+            oc = get_changes_for_model(location).get()
+            self.assertEqual(oc.object_data_v2["location_type"]["name"], "Campus")
+            self.assertEqual(oc.object_data_v2["status"]["name"], location_status.name)
+            self.assertEqual(oc.object_data_v2, serialize_object_v2(Location.objects.get(pk=location.pk)))
+
     def test_bulk_edit_device_type_software_image_file(self):
         """Test that bulk edits to null does not cause integrity error"""
         manufacturer = Manufacturer.objects.create(name="Test")
@@ -340,3 +370,117 @@ class BulkEditDeleteChangeLogging(TestCase):
             self.assertEqual(oc_list[0].change_context, ObjectChangeEventContextChoices.CONTEXT_ORM)
         with self.subTest():
             self.assertEqual(oc_list[0].change_context_detail, "test_change_log_context")
+
+
+@override_settings(CHANGELOG_WRITE_BEHIND_ENABLED=True)
+class WriteBehindChangeLoggingTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="jacob",
+            email="jacob@example.com",
+            password="top_secret",  # noqa: S106  # hardcoded-password-func-arg -- ok as this is test code only
+        )
+        self.location_type = LocationType.objects.get(name="Campus")
+        self.location_status = Status.objects.get_for_model(Location).first()
+
+    def test_changes_logged_on_commit(self):
+        """Test that changes are only logged, together with enqueuing their hooks, once they are committed"""
+        change_id = uuid.uuid4()
+        with mock.patch("nautobot.extras.context_managers.enqueue_hooks_for_change_id") as enqueue_hooks:
+            with self.captureOnCommitCallbacks(execute=True):
+                with web_request_context(self.user, change_id=change_id):
+                    location = Location(name="Test Location 1", location_type=self.location_type)
+                    location.status = self.location_status
+                    location.save()
+                    location.description = "changed"
+                    location.save()
+                    location.tags.add(Tag.objects.get_for_model(Location).first())
+                self.assertFalse(get_changes_for_model(location).exists())
+                enqueue_hooks.assert_not_called()
+
+        oc = get_changes_for_model(location).get()
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(oc.request_id, change_id)
+        self.assertEqual(oc.user, self.user)
+        self.assertEqual(oc.object_data["description"], "changed")
+        self.assertEqual(len(oc.object_data["tags"]), 1)
+        enqueue_hooks.assert_called_once_with(change_id, batch_size=1000)
+
+    def test_rolled_back_changes_not_logged(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location_1 = Location.objects.create(
+                    name="Test Location 1", location_type=self.location_type, status=self.location_status
+                )
+                with self.assertRaises(RuntimeError):
+                    with transaction.atomic():
+                        location_2 = Location.objects.create(
+                            name="Test Location 2", location_type=self.location_type, status=self.location_status
+                        )
+                        raise RuntimeError
+
+        self.assertEqual(get_changes_for_model(location_1).count(), 1)
+        self.assertEqual(get_changes_for_model(location_2).count(), 0)
+
+    def test_delete(self):
+        """Test that deleted objects are logged as they were before their deletion"""
+        location_1 = Location.objects.create(
+            name="Test Location 1", location_type=self.location_type, status=self.location_status
+        )
+        location_1_pk = location_1.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                location_1.description = "changed"
+                location_1.save()
+                location_1.delete()
+                location_2 = Location.objects.create(
+                    name="Test Location 2", location_type=self.location_type, status=self.location_status
+                )
+                location_2_pk = location_2.pk
+                location_2.description = "changed"
+                location_2.save()
+                location_2.delete()
+
+        # An update followed by a deletion is logged as the deletion
+        oc = ObjectChange.objects.get(changed_object_id=location_1_pk)
+        self.assertEqual(oc.action, ObjectChangeActionChoices.ACTION_DELETE)
+        self.assertEqual(oc.object_data["description"], "changed")
+
+        # A creation followed by a deletion is logged as both
+        oc_list = ObjectChange.objects.filter(changed_object_id=location_2_pk).order_by("time")
+        self.assertEqual(
+            [oc.action for oc in oc_list],
+            [ObjectChangeActionChoices.ACTION_CREATE, ObjectChangeActionChoices.ACTION_DELETE],
+        )
+        for oc in oc_list:
+            self.assertEqual(oc.object_data["name"], "Test Location 2")
+            self.assertEqual(oc.object_data["description"], "changed")
+
+    def test_bulk_operations(self):
+        locations = [
+            Location(name=f"Test Location {i}", location_type=self.location_type, status=self.location_status)
+            for i in range(1, 4)
+        ]
+        Location.objects.bulk_create(locations)
+        with self.captureOnCommitCallbacks(execute=True):
+            with web_request_context(self.user):
+                with deferred_change_logging_for_bulk_operation():
+                    for location in locations:
+                        location.description = "changed"
+                        location.save()
+                bulk_delete_with_bulk_change_logging(Location.objects.filter(pk=locations[0].pk))
+
+        oc_list = get_changes_for_model(Location)
+        self.assertEqual(len(oc_list), 3)
+        for oc in oc_list:
+            self.assertEqual(oc.object_data["description"], "changed")
+        self.assertEqual(
+            sorted(oc.action for oc in oc_list),
+            sorted(
+                [
+                    ObjectChangeActionChoices.ACTION_DELETE,
+                    ObjectChangeActionChoices.ACTION_UPDATE,
+                    ObjectChangeActionChoices.ACTION_UPDATE,
+                ]
+            ),
+        )
@@ -1,5 +1,6 @@
 import json
 import logging
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
@@ -1430,6 +1431,35 @@ class CustomFieldModelTest(TestCase):
     def test_get_computed_fields_only_returns_fields_for_content_type(self):
         self.assertTrue(self.non_location_computed_field.key not in self.location1.get_computed_fields())
 
+    def test_render_many(self):
+        location2 = Location.objects.create(name="LAX", location_type=self.lt, status=self.location_status)
+        self.assertEqual(
+            self.computed_field_one.render_many([self.location1, location2]),
+            [f"{self.location1.name} is the name of this location.", f"{location2.name} is the name of this location."],
+        )
+        self.assertEqual(
+            self.bad_computed_field.render_many([self.location1, location2]),
+            [self.bad_computed_field.fallback_value, self.bad_computed_field.fallback_value],
+        )
+        self.assertEqual(
+            self.worse_computed_field.render_many([self.location1]), [self.worse_computed_field.fallback_value]
+        )
+        self.assertEqual(self.computed_field_one.render_many([]), [])
+
+    def test_get_computed_fields_for_objects(self):
+        location2 = Location.objects.create(name="LAX", location_type=self.lt, status=self.location_status)
+        self.assertDictEqual(
+            Location.get_computed_fields_for_objects([self.location1, location2]),
+            {
+                self.location1.pk: self.location1.get_computed_fields(),
+                location2.pk: location2.get_computed_fields(),
+            },
+        )
+        self.assertDictEqual(
+            Location.get_computed_fields_for_objects([self.location1], label_as_key=True),
+            {self.location1.pk: self.location1.get_computed_fields(label_as_key=True)},
+        )
+
     def test_check_if_key_is_graphql_safe(self):
         """
         Check the GraphQL validation method on CustomField Key Attribute.
@@ -2131,6 +2161,54 @@ class CustomFieldBackgroundTasks(TransactionTestCase):
         self.assertEqual(oc_list[0].change_context_detail, "update custom field choice data")
         self.assertEqual(oc_list[0].user, self.user)
 
+    @mock.patch("nautobot.extras.tasks.CUSTOM_FIELD_DATA_CHUNK_SIZE", 2)
+    def test_custom_field_data_tasks_in_chunks(self):
+        """The custom field data tasks should update every applicable object, a chunk at a time."""
+        obj_type = ContentType.objects.get_for_model(Location)
+        location_type = LocationType.objects.create(name="Root Type 4")
+        location_status = Status.objects.get_for_model(Location).first()
+        locations = [
+            Location.objects.create(name=f"Chunked Location {i}", location_type=location_type, status=location_status)
+            for i in range(5)
+        ]
+
+        with web_request_context(self.user):
+            cf = CustomField(label="Chunked CF", type=CustomFieldTypeChoices.TYPE_MULTISELECT)
+            cf.save()
+            CustomFieldChoice.objects.create(custom_field=cf, value="Foo")
+            CustomFieldChoice.objects.create(custom_field=cf, value="Bar")
+            cf.default = ["Foo"]
+            cf.save()
+            cf.content_types.set([obj_type])
+
+        with self.subTest("provision_field"):
+            for location in locations:
+                location.refresh_from_db()
+                self.assertEqual(location.cf["chunked_cf"], ["Foo"])
+                oc_list = get_changes_for_model(location)
+                self.assertEqual(len(oc_list), 1)
+                self.assertEqual(oc_list[0].object_data["custom_fields"]["chunked_cf"], ["Foo"])
+                self.assertEqual(oc_list[0].user, self.user)
+
+        with self.subTest("update_custom_field_choice_data"):
+            Location.objects.filter(pk=locations[0].pk).update(_custom_field_data={"chunked_cf": ["Bar", "Foo"]})
+            with web_request_context(self.user):
+                choice = CustomFieldChoice.objects.get(custom_field=cf, value="Foo")
+                choice.value = "FizzBuzz"
+                choice.save()
+            locations[0].refresh_from_db()
+            self.assertEqual(locations[0].cf["chunked_cf"], ["Bar", "FizzBuzz"])
+            for location in locations[1:]:
+                location.refresh_from_db()
+                self.assertEqual(location.cf["chunked_cf"], ["FizzBuzz"])
+                self.assertEqual(len(get_changes_for_model(location)), 2)
+
+        with self.subTest("delete_custom_field_data"):
+            cf.delete()
+            for location in locations:
+                location.refresh_from_db()
+                self.assertNotIn("chunked_cf", location.cf)
+
 
 class CustomFieldTableTest(TestCase):
     """
@@ -1,6 +1,5 @@
 import random
-import time
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
@@ -42,6 +41,7 @@ from nautobot.extras.models import (
     Status,
     Tag,
 )
+from nautobot.extras.querysets import DynamicGroupQuerySet
 from nautobot.ipam.models import Prefix
 from nautobot.tenancy.models import Tenant
 
@@ -984,41 +984,150 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
         dg.filter["tags"] = [unapplied_tag.pk]
         dg.validated_save()
 
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
     def test_member_caching_output(self):
+        for group in DynamicGroup.objects.all():
+            group.update_cached_members()
+            self.assertQuerySetEqual(group.members, group.members_cached)
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_member_caching_enabled(self):
+        """
+        Verify that the members list of the DynamicGroup is read from its member cache table once updated.
+        """
         group = self.first_child
+        self.assertFalse(group.cached_members.exists())
 
-        # Ensure the cache is empty from previous tests
-        cache.delete(group.members_cache_key)
+        # The member cache table is populated when first used
+        self.assertEqual(list(group.members_cached), [self.devices[0]])
+        self.assertEqual(list(group.cached_members.values_list("member_id", flat=True)), [self.devices[0].pk])
 
-        self.assertEqual(sorted(list(group.members)), sorted(list(group.members_cached)))
+        with patch.object(group, "get_queryset") as mock_get_queryset:
+            self.assertEqual(list(group.members_cached), [self.devices[0]])
+            self.assertTrue(group.has_member(self.devices[0], use_cache=True))
+            self.assertFalse(group.has_member(self.devices[1], use_cache=True))
+            mock_get_queryset.assert_not_called()
 
-    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=2)
-    def test_member_caching_enabled(self):
+        # Stale members are removed
+        group.filter = {"location": ["Location 2"]}
+        group.save()
+        self.assertEqual(list(group.members_cached), [self.devices[1]])
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_member_caching_timeout(self):
         """
-        Verify that the members list of the DynamicGroup is cached and expires.
+        Verify that the member cache table of the DynamicGroup is updated once `DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT`
+        has passed since it was last updated.
         """
         group = self.first_child
+        self.assertFalse(group.has_member(self.devices[1], use_cache=True))
+        self.assertIsNotNone(cache.get(group.members_cache_key))
 
-        class FakeQuerySet:
-            def all(self):
-                return []
-
-        # Ensure the cache is empty from previous tests
+        # Changes that bypass signals are not reflected in the member cache table until it expires
+        Device.objects.filter(pk=self.devices[1].pk).update(location=self.devices[0].location)
+        self.assertFalse(group.has_member(self.devices[1], use_cache=True))
         cache.delete(group.members_cache_key)
+        self.assertTrue(group.has_member(self.devices[1], use_cache=True))
+        self.assertEqual(set(group.members_cached), {self.devices[0], self.devices[1]})
 
-        with patch.object(group, "get_queryset", return_value=FakeQuerySet()) as mock_get_queryset:
-            group.members_cached
-            group.members_cached
-            group.members_cached
-            self.assertEqual(mock_get_queryset.call_count, 1)
+        with patch("nautobot.extras.models.groups.cache.set") as mock_cache_set:
+            group.update_cached_members()
+        mock_cache_set.assert_called_once_with(group.members_cache_key, ANY, 60)
 
-            time.sleep(5)  # Let the cache expire
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_member_caching_incremental(self):
+        """
+        Verify that saving, tagging, and deleting objects updates the member cache tables of the relevant groups.
+        """
+        tag = Tag.objects.get_for_model(Device).first()
+        tag_group = DynamicGroup.objects.create(name="Tagged", content_type=self.device_ct, filter={"tags": [tag.name]})
+        group = self.first_child
+        group.update_cached_members()
+
+        # Member cache tables are updated once the transaction is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            device = Device.objects.create(
+                name="device-location-1-new",
+                status=self.status_1,
+                role=self.device_role,
+                device_type=self.device_type,
+                location=self.locations[0],
+            )
+            self.assertFalse(group.has_member(device, use_cache=True))
+        self.assertTrue(group.has_member(device, use_cache=True))
+        self.assertFalse(tag_group.has_member(device, use_cache=True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.add(tag)
+        self.assertTrue(tag_group.has_member(device, use_cache=True))
+        with self.captureOnCommitCallbacks(execute=True):
+            device.tags.remove(tag)
+        self.assertFalse(tag_group.has_member(device, use_cache=True))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            device.location = self.locations[1]
+            device.save()
+        self.assertFalse(group.has_member(device, use_cache=True))
+
+        device.location = self.locations[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            device.save()
+        device_pk = device.pk
+        device.delete()
+        self.assertFalse(group.cached_members.filter(member_id=device_pk).exists())
+
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_member_caching_incremental_batched(self):
+        """
+        Verify that the objects saved in a transaction are checked against the filters of the groups together.
+        """
+        group = self.first_child
+        group.update_cached_members()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            for device in self.devices:
+                device.location = self.locations[0]
+                device.save()
+        with patch.object(
+            DynamicGroupQuerySet,
+            "update_cached_members_for_objects",
+            autospec=True,
+            side_effect=DynamicGroupQuerySet.update_cached_members_for_objects,
+        ) as mock_update_cached_members_for_objects:
+            for callback in callbacks:
+                callback()
+        mock_update_cached_members_for_objects.assert_called_once_with(
+            ANY, Device, {device.pk for device in self.devices}
+        )
+        self.assertEqual(
+            set(group.cached_members.values_list("member_id", flat=True)), {device.pk for device in self.devices}
+        )
 
-            group.members_cached
-            self.assertEqual(mock_get_queryset.call_count, 2)
+    def test_member_caching_other_models(self):
+        """
+        Verify that saving or deleting objects that can't be members of a DynamicGroup doesn't look up any settings.
+        """
+        with patch("nautobot.extras.signals.get_settings_or_config") as mock_get_settings_or_config:
+            tag = Tag.objects.create(name="Not A Member")
+            tag.delete()
+        mock_get_settings_or_config.assert_not_called()
 
-        # Clean-up after ourselves
-        cache.delete(group.members_cache_key)
+    @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_get_for_object_cached(self):
+        """
+        Verify that the cached lookups of the groups of an object match the uncached lookups, in a single query.
+        """
+        # The member cache tables are populated when first used
+        DynamicGroup.objects.get_list_for_object(self.devices[0], use_cache=True)
+
+        for device in self.devices:
+            with self.assertNumQueries(1):
+                cached_groups = DynamicGroup.objects.get_list_for_object(device, use_cache=True)
+            self.assertEqual(
+                sorted(group.pk for group in cached_groups),
+                sorted(group.pk for group in DynamicGroup.objects.get_list_for_object(device)),
+            )
+            self.assertQuerySetEqual(device.dynamic_groups_cached, device.dynamic_groups)
 
     @override_settings(DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=0)
     def test_member_caching_disabled(self):
@@ -1031,14 +1140,24 @@ class DynamicGroupModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mi
             def all(self):
                 return []
 
-        # Ensure the cache is empty from previous tests
-        cache.delete(group.members_cache_key)
-
         with patch.object(group, "get_queryset", return_value=FakeQuerySet()) as mock_get_queryset:
             group.members_cached
             group.members_cached
             self.assertEqual(mock_get_queryset.call_count, 2)
 
+        group.update_cached_members()
+        self.assertEqual(list(group.members_cached), [self.devices[0]])
+        device = Device.objects.create(
+            name="device-location-1-new",
+            status=self.status_1,
+            role=self.device_role,
+            device_type=self.device_type,
+            location=self.locations[0],
+        )
+        # Object saves do not update the member cache table while caching is disabled
+        self.assertFalse(group.cached_members.filter(member_id=device.pk).exists())
+        self.assertTrue(group.has_member(device, use_cache=True))
+
 
 class DynamicGroupMembershipModelTest(DynamicGroupTestBase):  # TODO: BaseModelTestCase mixin?
     """DynamicGroupMembership model tests."""
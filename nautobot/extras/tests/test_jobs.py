@@ -15,10 +15,13 @@ from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
 from django.core.management.base import CommandError
+from django.db import connections
 from django.test import override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from nautobot.core.celery.log import NautobotDatabaseHandler
 from nautobot.core.testing import (
     create_job_result_and_run_job,
     get_job_class_and_model,
@@ -524,6 +527,65 @@ class JobTransactionTest(TransactionTestCase):
         self.assertFalse(logs.filter(message="I should NOT be logged to the database").exists())
         self.assertTrue(logs.filter(message="I should be logged to the database").exists())
 
+    def test_log_buffering(self):
+        """
+        Test that log entries are written to the database in bulk, in order, and flushed at the end of the job.
+        """
+        module = "log_many"
+        name = "TestLogMany"
+        with mock.patch.object(NautobotDatabaseHandler, "flush_size", 10):
+            with mock.patch.object(NautobotDatabaseHandler, "flush_interval", 3600):
+                with CaptureQueriesContext(connections["job_logs"]) as queries:
+                    job_result = create_job_result_and_run_job(module, name, count=25)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        messages = list(job_result.job_log_entries.filter(grouping="run").values_list("message", flat=True))
+        self.assertEqual(messages, [f"Message {i}" for i in range(25)])
+        self.assertTrue(job_result.job_log_entries.filter(message="Job completed").exists())
+        inserts = [query for query in queries if query["sql"].startswith('INSERT INTO "extras_joblogentry"')]
+        self.assertLessEqual(len(inserts), 5)
+
+    def test_log_buffer_flushed_before_completion(self):
+        """
+        Test that buffered log entries are written before the job result is marked as completed.
+        """
+        module = "log_many"
+        name = "TestLogMany"
+        flush_task = NautobotDatabaseHandler.flush_task
+        statuses = []
+
+        def record_status_and_flush_task(task_id):
+            statuses.extend(models.JobResult.objects.filter(pk=task_id).values_list("status", flat=True))
+            flush_task(task_id)
+
+        with mock.patch.object(NautobotDatabaseHandler, "flush_size", 1000):
+            with mock.patch.object(NautobotDatabaseHandler, "flush_interval", 3600):
+                with mock.patch.object(NautobotDatabaseHandler, "flush_task", side_effect=record_status_and_flush_task):
+                    job_result = create_job_result_and_run_job(module, name, count=25)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertNotIn(statuses[0], JobResultStatusChoices.READY_STATES)
+        self.assertEqual(job_result.job_log_entries.filter(grouping="run").count(), 25)
+
+    def test_log_buffer_limit(self):
+        """
+        Test that the log buffer is bounded, and that a warning is logged when messages are discarded.
+        """
+        module = "log_many"
+        name = "TestLogMany"
+        with mock.patch.object(NautobotDatabaseHandler, "flush_size", 1000):
+            with mock.patch.object(NautobotDatabaseHandler, "flush_interval", 3600):
+                with mock.patch.object(NautobotDatabaseHandler, "max_buffer_size", 10):
+                    job_result = create_job_result_and_run_job(module, name, count=25)
+
+        self.assertEqual(job_result.status, JobResultStatusChoices.STATUS_SUCCESS)
+        self.assertLess(job_result.job_log_entries.filter(grouping="run").count(), 25)
+        self.assertTrue(
+            job_result.job_log_entries.filter(
+                log_level=LogLevelChoices.LOG_WARNING, message__endswith="could not be saved in time"
+            ).exists()
+        )
+
     def test_object_vars(self):
         """
         Test that Object variable fields behave as expected.
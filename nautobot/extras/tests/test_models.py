@@ -8,10 +8,11 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.db.models import ProtectedError
 from django.db.utils import IntegrityError
 from django.test import override_settings
-from django.test.utils import isolate_apps
+from django.test.utils import CaptureQueriesContext, isolate_apps
 from django.utils.timezone import now
 from jinja2.exceptions import TemplateAssertionError, TemplateSyntaxError
 
@@ -591,6 +592,131 @@ class ConfigContextTest(ModelTestCases.BaseModelTestCase):
         self.assertIn("dynamic context 2", device2.get_config_context().values())
         self.assertNotIn("dynamic context 1", device2.get_config_context().values())
 
+    @override_settings(CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True)
+    def test_get_for_objects_same_as_get_for_object_devices(self):
+        """Assert that get_for_objects() matches get_for_object() for many devices, including inherited assignments."""
+        for name, relation, value in [
+            ("root-location", "locations", self.root_location),
+            ("parent-location", "locations", self.parent_location),
+            ("location", "locations", self.location),
+            ("parent-tenant-group", "tenant_groups", self.parent_tenantgroup),
+            ("child-tenant-group", "tenant_groups", self.child_tenantgroup),
+            ("tenant", "tenants", self.tenant),
+            ("platform", "platforms", self.platform),
+            ("tag", "tags", self.tag),
+            ("tag-2", "tags", self.tag2),
+            ("dynamic-group", "dynamic_groups", self.dynamic_groups),
+            ("dynamic-group-2", "dynamic_groups", self.dynamic_group_2),
+        ]:
+            config_context = ConfigContext.objects.create(name=name, weight=100, data={name: 1, "shared": name})
+            getattr(config_context, relation).add(value)
+        # Assigned to both a location and a non-matching device type, so should never apply
+        mismatched_context = ConfigContext.objects.create(name="mismatched", weight=200, data={"mismatched": 1})
+        mismatched_context.locations.add(self.root_location)
+        mismatched_context.device_types.add(DeviceType.objects.exclude(pk=self.devicetype.pk).first())
+        ConfigContext.objects.create(name="inactive", weight=300, data={"inactive": 1}, is_active=False)
+
+        device_2 = Device.objects.create(
+            name="Device 2",
+            location=self.parent_location,
+            tenant=self.child_tenant,
+            platform=self.platform,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+            local_config_context_data={"shared": "local"},
+        )
+        device_2.tags.add(self.tag, self.tag2)
+        device_3 = Device.objects.create(
+            name="Device 3",
+            location=self.root_location,
+            tenant=self.tenant,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+        )
+        device_3.tags.add(self.tag2)
+        devices = [self.device, device_2, device_3]
+
+        config_contexts = ConfigContext.objects.get_for_objects(Device.objects.filter(pk__in=[d.pk for d in devices]))
+        for device in devices:
+            self.assertEqual(config_contexts[device.pk], list(ConfigContext.objects.get_for_object(device)))
+
+        populated_devices = ConfigContext.objects.populate_config_context_data(Device.objects.order_by("name"))
+        for device in populated_devices:
+            with self.assertNumQueries(0):
+                populated_context = device.get_config_context()
+            del device.config_context_data
+            self.assertEqual(populated_context, device.get_config_context())
+
+        # The number of queries does not depend on the number of devices
+        with CaptureQueriesContext(connection) as queries:
+            ConfigContext.objects.get_for_objects(devices)
+        for device in list(devices):
+            devices.append(
+                Device.objects.create(
+                    name=f"{device.name} Copy",
+                    location=device.location,
+                    tenant=device.tenant,
+                    role=self.devicerole,
+                    status=self.device_status,
+                    device_type=self.devicetype,
+                )
+            )
+        with self.assertNumQueries(len(queries)):
+            ConfigContext.objects.get_for_objects(devices)
+
+    @override_settings(CONFIG_CONTEXT_DYNAMIC_GROUPS_ENABLED=True, DYNAMIC_GROUPS_MEMBER_CACHE_TIMEOUT=60)
+    def test_get_for_objects_dynamic_group_member_cache(self):
+        """Assert that get_for_objects() uses the member cache tables of dynamic groups when enabled, populating them."""
+        dynamic_group_context = ConfigContext.objects.create(name="dynamic group", weight=100, data={"dg": 1})
+        dynamic_group_context.dynamic_groups.add(self.dynamic_group_2)
+        device_2 = Device.objects.create(
+            name="Device 2",
+            location=self.location,
+            role=self.devicerole,
+            status=self.device_status,
+            device_type=self.devicetype,
+        )
+
+        config_contexts = ConfigContext.objects.get_for_objects([self.device, device_2])
+        self.assertNotIn(dynamic_group_context, config_contexts[self.device.pk])
+        self.assertIn(dynamic_group_context, config_contexts[device_2.pk])
+        for device in [self.device, device_2]:
+            self.assertEqual(config_contexts[device.pk], list(ConfigContext.objects.get_for_object(device)))
+
+    def test_get_for_objects_same_as_get_for_object_virtual_machines(self):
+        """Assert that get_for_objects() matches get_for_object() for many virtual machines."""
+        cluster_group = ClusterGroup.objects.create(name="Cluster Group")
+        cluster_type = ClusterType.objects.create(name="Cluster Type 1")
+        cluster = Cluster.objects.create(
+            name="Cluster", cluster_group=cluster_group, cluster_type=cluster_type, location=self.location
+        )
+        other_cluster = Cluster.objects.create(name="Other Cluster", cluster_type=cluster_type)
+        for name, relation, value in [
+            ("root-location", "locations", self.root_location),
+            ("cluster-group", "cluster_groups", cluster_group),
+            ("cluster", "clusters", cluster),
+            ("parent-tenant-group", "tenant_groups", self.parent_tenantgroup),
+            ("tag", "tags", self.tag),
+            ("vm-dynamic-group", "dynamic_groups", self.vm_dynamic_group),
+        ]:
+            config_context = ConfigContext.objects.create(name=name, weight=100, data={name: 1})
+            getattr(config_context, relation).add(value)
+
+        vm_status = Status.objects.get_for_model(VirtualMachine).first()
+        vm_1 = VirtualMachine.objects.create(
+            name="VM 1", cluster=cluster, tenant=self.child_tenant, role=self.devicerole, status=vm_status
+        )
+        vm_1.tags.add(self.tag)
+        vm_2 = VirtualMachine.objects.create(name="Other VM", cluster=other_cluster, status=vm_status)
+
+        config_contexts = ConfigContext.objects.get_for_objects([vm_1, vm_2])
+        for vm in [vm_1, vm_2]:
+            self.assertEqual(config_contexts[vm.pk], list(ConfigContext.objects.get_for_object(vm)))
+        self.assertEqual(len(config_contexts[vm_1.pk]), 7)
+        self.assertNotIn("cluster", [config_context.name for config_context in config_contexts[vm_2.pk]])
+
 
 class ConfigContextSchemaTestCase(ModelTestCases.BaseModelTestCase):
     """
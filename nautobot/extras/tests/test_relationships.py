@@ -3,6 +3,8 @@ import uuid
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.html import format_html
 
@@ -875,6 +877,72 @@ class RelationshipAssociationTest(RelationshipBaseTest, ModelTestCases.BaseModel
             },
         )
 
+    def _assert_relationships_for_objects_match(self, objects, include_hidden):
+        bulk_data = type(objects[0]).get_relationships_for_objects(objects, include_hidden=include_hidden)
+        self.assertEqual(set(bulk_data), {obj.pk for obj in objects})
+        for obj in objects:
+            for side, relationships in obj.get_relationships(include_hidden=include_hidden).items():
+                self.assertEqual(set(bulk_data[obj.pk][side]), set(relationships))
+                for relationship, queryset in relationships.items():
+                    bulk_associations = bulk_data[obj.pk][side][relationship]
+                    self.assertEqual({a.pk for a in bulk_associations}, {a.pk for a in queryset})
+                    self.assertEqual({a.get_peer(obj) for a in bulk_associations}, {a.get_peer(obj) for a in queryset})
+
+    def test_get_relationships_for_objects(self):
+        """Verify that get_relationships_for_objects() matches get_relationships() for each object, in bulk."""
+        rack_d = Rack.objects.create(name="Rack D", location=self.locations[3], status=self.rack_status)
+        associations = [
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[0]),
+            RelationshipAssociation(relationship=self.m2m_1, source=self.racks[0], destination=self.vlans[1]),
+            RelationshipAssociation(relationship=self.m2m_2, source=self.racks[1], destination=self.vlans[2]),
+            RelationshipAssociation(relationship=self.o2o_1, source=self.racks[0], destination=self.locations[1]),
+            RelationshipAssociation(relationship=self.o2os_1, source=self.racks[1], destination=self.racks[2]),
+            RelationshipAssociation(relationship=self.o2os_1, source=self.racks[0], destination=rack_d),
+            RelationshipAssociation(relationship=self.m2ms_1, source=self.locations[0], destination=self.locations[1]),
+            RelationshipAssociation(relationship=self.m2ms_1, source=self.locations[2], destination=self.locations[0]),
+            RelationshipAssociation(relationship=self.o2o_2, source=self.locations[0], destination=self.locations[1]),
+        ]
+        for association in associations:
+            association.validated_save()
+        # Relationships don't apply to objects that don't match their source_filter, as in get_relationships()
+        filtered_relationship = Relationship(
+            label="Filtered VLAN to Rack",
+            key="filtered_vlan_rack",
+            source_type=self.rack_ct,
+            source_filter={"name": [self.racks[0].name]},
+            destination_type=self.vlan_ct,
+            type=RelationshipTypeChoices.TYPE_MANY_TO_MANY,
+        )
+        filtered_relationship.validated_save()
+
+        racks = [*self.racks, rack_d]
+        for include_hidden in (True, False):
+            with self.subTest(model=Rack, include_hidden=include_hidden):
+                self._assert_relationships_for_objects_match(racks, include_hidden)
+            with self.subTest(model=Location, include_hidden=include_hidden):
+                # The associations defined in self.setUp() with nonexistent peers are logged as errors by get_peer()
+                with self.assertLogs(logger=logging.getLogger("nautobot.extras.models.relationships"), level="ERROR"):
+                    self._assert_relationships_for_objects_match(list(self.locations), include_hidden)
+
+        data = Rack.get_relationships_for_objects(racks)
+        self.assertEqual(data[self.racks[0].pk]["source"][filtered_relationship], [])
+        self.assertNotIn(filtered_relationship, data[rack_d.pk]["source"])
+        self.assertEqual(Rack.get_relationships_for_objects([]), {})
+
+        # The peers of the associations are loaded along with them, and the number of queries doesn't grow with the
+        # number of objects (if anything it shrinks, as peers that are among the objects themselves aren't queried)
+        Rack.get_relationships_for_objects(racks)  # populate caches
+        with CaptureQueriesContext(connection) as one_rack_queries:
+            Rack.get_relationships_for_objects(racks[:1])
+        with CaptureQueriesContext(connection) as all_rack_queries:
+            data = Rack.get_relationships_for_objects(racks)
+            for obj in racks:
+                for relationships in data[obj.pk].values():
+                    for relationship_associations in relationships.values():
+                        for association in relationship_associations:
+                            self.assertIsNotNone(association.get_peer(obj))
+        self.assertLessEqual(len(all_rack_queries), len(one_rack_queries))
+
     def test_delete_cascade(self):
         """Verify that a RelationshipAssociation is deleted if either of the associated records is deleted."""
         initial_count = RelationshipAssociation.objects.count()
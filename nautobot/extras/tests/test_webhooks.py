@@ -6,6 +6,8 @@ import uuid
 from django.apps import apps
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from requests import Session
 
@@ -16,8 +18,8 @@ from nautobot.core.utils.lookup import get_changes_for_model
 from nautobot.dcim.api.serializers import LocationSerializer
 from nautobot.dcim.models import Location, LocationType
 from nautobot.extras.choices import ObjectChangeActionChoices
-from nautobot.extras.context_managers import web_request_context
-from nautobot.extras.models import Tag, Webhook
+from nautobot.extras.context_managers import enqueue_hooks_for_change_id, web_request_context
+from nautobot.extras.models import ObjectChange, Tag, Webhook
 from nautobot.extras.models.statuses import Status
 from nautobot.extras.registry import registry
 from nautobot.extras.tasks import process_webhook
@@ -345,7 +347,93 @@ class WebhookTest(APITestCase):
 
         all_changes = get_changes_for_model(location)
         self.assertEqual(all_changes.count(), 1)
-        mock_enqueue_webhooks.assert_called_once_with(all_changes.first())
+        mock_enqueue_webhooks.assert_called_once()
+        self.assertEqual(mock_enqueue_webhooks.call_args[0][0], all_changes.first())
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_batched(self, mock_async):
+        """
+        Make sure the webhooks for many changes in the same change context are enqueued with a fixed number of queries.
+        """
+        location_type = LocationType.objects.get(name="Campus")
+        with web_request_context(self.user):
+            locations = [
+                Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+                for i in range(5)
+            ]
+        mock_async.reset_mock()
+
+        request_ids = [uuid.uuid4(), uuid.uuid4()]
+        with patch("nautobot.extras.context_managers.enqueue_hooks_for_change_id"):
+            with web_request_context(self.user, change_id=request_ids[0]):
+                locations[0].description = "changed"
+                locations[0].save()
+            with web_request_context(self.user, change_id=request_ids[1]):
+                for location in locations[1:]:
+                    location.description = "changed"
+                    location.save()
+
+        with CaptureQueriesContext(connection) as single_change_queries:
+            enqueue_hooks_for_change_id(request_ids[0])
+        with self.assertNumQueries(len(single_change_queries)):
+            enqueue_hooks_for_change_id(request_ids[1])
+
+        self.assertEqual(mock_async.call_count, 5)
+        for call in mock_async.call_args_list:
+            args = call[1]["args"]
+            self.assertEqual(args[0], Webhook.objects.get(type_update=True).pk)
+            self.assertEqual(args[3], ObjectChangeActionChoices.ACTION_UPDATE)
+            self.assertEqual(args[7]["prechange"]["description"], "")
+            self.assertEqual(args[7]["postchange"]["description"], "changed")
+            self.assertEqual(args[7]["differences"]["added"], {"description": "changed"})
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_producer_acquired_lazily(self, mock_async):
+        """
+        Make sure a broker producer is only acquired once there is a webhook to publish.
+        """
+        location_type = LocationType.objects.get(name="Campus")
+        request_ids = [uuid.uuid4(), uuid.uuid4()]
+        with patch("nautobot.extras.context_managers.enqueue_hooks_for_change_id"):
+            with web_request_context(self.user, change_id=request_ids[0]):
+                Location.objects.filter(location_type=location_type).exists()
+            with web_request_context(self.user, change_id=request_ids[1]):
+                for i in range(2):
+                    Location.objects.create(name=f"Location {i}", location_type=location_type, status=self.statuses[0])
+
+        with patch("nautobot.extras.context_managers.app") as mock_app:
+            mock_app.conf.task_always_eager = False
+            enqueue_hooks_for_change_id(request_ids[0])
+            mock_app.producer_or_acquire.assert_not_called()
+
+            enqueue_hooks_for_change_id(request_ids[1])
+            mock_app.producer_or_acquire.assert_called_once()
+
+        self.assertEqual(mock_async.call_count, 2)
+        for call in mock_async.call_args_list:
+            self.assertEqual(call[1]["producer"], mock_app.producer_or_acquire.return_value.__enter__.return_value)
+
+    @patch("nautobot.extras.tasks.process_webhook.apply_async")
+    def test_enqueue_webhooks_without_prior_change(self, mock_async):
+        """
+        Make sure the previous change of an updated object is not looked up again when it is known to have none.
+        """
+        location_type = LocationType.objects.get(name="Campus")
+        location = Location.objects.create(name="Location 1", location_type=location_type, status=self.statuses[0])
+        request_id = uuid.uuid4()
+        with patch("nautobot.extras.context_managers.enqueue_hooks_for_change_id"):
+            with web_request_context(self.user, change_id=request_id):
+                location.description = "changed"
+                location.save()
+
+        with patch.object(ObjectChange, "get_prev_change") as mock_get_prev_change:
+            enqueue_hooks_for_change_id(request_id)
+        mock_get_prev_change.assert_not_called()
+
+        mock_async.assert_called_once()
+        snapshots = mock_async.call_args[1]["args"][7]
+        self.assertIsNone(snapshots["prechange"])
+        self.assertEqual(snapshots["postchange"]["description"], "changed")
 
     def test_all_webhook_supported_models(self):
         """
@@ -626,6 +626,12 @@ def bulk_delete_with_bulk_change_logging(qs, batch_size=1000):
     if change_context is None:
         raise ValueError("Change logging must be enabled before using bulk_delete_with_bulk_change_logging")
 
+    if change_context.write_behind:
+        # The deleted objects are serialized by the pre_delete signal handler, and their ObjectChanges created in bulk
+        # together with all other changes at the end of the change context
+        with transaction.atomic():
+            return qs.delete()
+
     with transaction.atomic():
         try:
             queued_object_changes = []
@@ -6,16 +6,15 @@ from nautobot.extras.registry import registry
 from nautobot.extras.tasks import process_webhook
 
 
-def enqueue_webhooks(object_change):
+def get_webhooks_for_object_change(object_change):
     """
-    Find Webhook(s) assigned to this instance + action and enqueue them
-    to be processed
+    Get the list of enabled Webhooks applicable to the changed object type and action of the given ObjectChange.
     """
     # Determine whether this type of object supports webhooks
     app_label = object_change.changed_object_type.app_label
     model_name = object_change.changed_object_type.model
     if model_name not in registry["model_features"]["webhooks"].get(app_label, []):
-        return
+        return []
 
     # Retrieve any applicable Webhooks
     content_type = object_change.changed_object_type
@@ -24,24 +23,41 @@ def enqueue_webhooks(object_change):
         ObjectChangeActionChoices.ACTION_UPDATE: "type_update",
         ObjectChangeActionChoices.ACTION_DELETE: "type_delete",
     }[object_change.action]
-    webhooks = Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True})
+    return list(Webhook.objects.filter(content_types=content_type, enabled=True, **{action_flag: True}))
+
+
+def enqueue_webhooks(object_change, webhooks=None, snapshots=None, producer=None):
+    """
+    Find Webhook(s) assigned to this instance + action and enqueue them
+    to be processed
+
+    Args:
+        object_change (ObjectChange): The change to enqueue webhooks for.
+        webhooks (list[Webhook]): The applicable Webhooks, if already known (see `get_webhooks_for_object_change()`).
+        snapshots (dict): The result of `object_change.get_snapshots()`, if already known.
+        producer (kombu.Producer): Producer to publish the webhook tasks with, to reuse a single broker connection.
+    """
+    if webhooks is None:
+        webhooks = get_webhooks_for_object_change(object_change)
 
-    if webhooks.exists():
+    if webhooks:
         # fall back to object_data if object_data_v2 is not available
         serialized_data = object_change.object_data_v2
         if serialized_data is None:
             serialized_data = object_change.object_data
+        if snapshots is None:
+            snapshots = object_change.get_snapshots()
 
         # Enqueue the webhooks
         for webhook in webhooks:
             args = [
                 webhook.pk,
                 serialized_data,
-                model_name,
+                object_change.changed_object_type.model,
                 object_change.action,
                 str(timezone.now()),
                 object_change.user_name,
                 object_change.request_id,
-                object_change.get_snapshots(),
+                snapshots,
             ]
-            process_webhook.apply_async(args=args)
+            process_webhook.apply_async(args=args, producer=producer)
@@ -216,6 +216,14 @@ class VLANLocationAssignmentSerializer(ValidatedModelSerializer):
 #
 
 
+class PrefixListSerializer(serializers.ListSerializer):
+    """Bulk-create Prefixes with their hierarchy (parents and reparented children) computed once for the whole list."""
+
+    def create(self, validated_data):
+        with Prefix.objects.deferred_hierarchy():
+            return super().create(validated_data)
+
+
 class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     prefix = IPFieldSerializer()
     type = ChoiceField(choices=PrefixTypeChoices, default=PrefixTypeChoices.TYPE_NETWORK)
@@ -231,6 +239,7 @@ class PrefixSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     class Meta:
         model = Prefix
         fields = "__all__"
+        list_serializer_class = PrefixListSerializer
         list_display_fields = [
             "prefix",
             "namespace",
@@ -451,6 +460,16 @@ class AvailableIPSerializer(serializers.Serializer):
         )
 
 
+class AvailableIPAllocationSerializer(serializers.Serializer):
+    """
+    Request to allocate an available IP address from within the specified Prefix.
+
+    Any other IPAddress fields (`status`, `description`, etc.) may be included alongside the `prefix` as well.
+    """
+
+    prefix = serializers.UUIDField(help_text="ID of the Prefix to allocate an available IP address from")
+
+
 #
 # IP address to interface
 #
@@ -1,10 +1,14 @@
+from contextlib import ExitStack
+import itertools
+
 from django.conf import settings
 from django.core.cache import cache
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.decorators import action
-from rest_framework.exceptions import APIException
+from rest_framework.exceptions import APIException, ValidationError
 from rest_framework.response import Response
 
 from nautobot.core.models.querysets import count_related
@@ -94,6 +98,37 @@ class RIRViewSet(NautobotModelViewSet):
 #
 
 
+def _get_allocation_lock_name(prefix, resource):
+    """
+    Get the name of the cache lock guarding the allocation of available `resource` (IPs or prefixes) from within the
+    given Prefix.
+
+    The lock is scoped to the Namespace and the root Prefix of the hierarchy containing the given Prefix, since a
+    Prefix and its ancestors and descendants allocate from the same addresses, while allocations from unrelated
+    prefix hierarchies can proceed in parallel.
+    """
+    root = prefix.root() or prefix
+    return f"nautobot.ipam.api.views.{resource}.{prefix.namespace_id}.{root.pk}"
+
+
+def _get_allocation_lock(prefix=None, resource=None, name=None):
+    """Get a cache lock guarding the allocation of available `resource` from within the given Prefix, or by `name`."""
+    return cache.lock(
+        name or _get_allocation_lock_name(prefix, resource),
+        blocking_timeout=5,
+        timeout=settings.REDIS_LOCK_TIMEOUT,
+    )
+
+
+def _assign_available_ips(prefix, available_ips, requested_ips):
+    """Assign addresses from `available_ips`, in order, to each of the `requested_ips` dicts in place."""
+    available_ips = iter(available_ips)
+    prefix_length = prefix.prefix.prefixlen
+    for requested_ip in requested_ips:
+        requested_ip["address"] = f"{next(available_ips)}/{prefix_length}"
+        requested_ip["namespace"] = prefix.namespace.pk
+
+
 @extend_schema_view(
     bulk_update=extend_schema(
         responses={"200": serializers.PrefixLegacySerializer(many=True)}, versions=["2.0", "2.1"]
@@ -176,9 +211,7 @@ class PrefixViewSet(NautobotModelViewSet):
         """
         prefix = get_object_or_404(self.queryset, pk=pk)
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_prefixes", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
+            with _get_allocation_lock(prefix, "available_prefixes"):
                 available_prefixes = prefix.get_available_prefixes()
 
                 # Validate Requested Prefixes' length
@@ -224,9 +257,8 @@ class PrefixViewSet(NautobotModelViewSet):
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
-            available_prefixes = prefix.get_available_prefixes()
             serializer = serializers.AvailablePrefixSerializer(
-                available_prefixes.iter_cidrs(),
+                list(prefix.iter_available_prefixes()),
                 many=True,
                 context={
                     "request": request,
@@ -262,15 +294,13 @@ class PrefixViewSet(NautobotModelViewSet):
 
         # Create the next available IP within the prefix
         if request.method == "POST":
-            with cache.lock(
-                "nautobot.ipam.api.views.available_ips", blocking_timeout=5, timeout=settings.REDIS_LOCK_TIMEOUT
-            ):
+            with _get_allocation_lock(prefix, "available_ips"):
                 # Normalize to a list of objects
                 requested_ips = request.data if isinstance(request.data, list) else [request.data]
 
                 # Determine if the requested number of IPs is available
-                available_ips = prefix.get_available_ips()
-                if available_ips.size < len(requested_ips):
+                available_ips = list(itertools.islice(prefix.iter_available_ips(), len(requested_ips)))
+                if len(available_ips) < len(requested_ips):
                     return Response(
                         {
                             "detail": (
@@ -282,11 +312,7 @@ class PrefixViewSet(NautobotModelViewSet):
                     )
 
                 # Assign addresses from the list of available IPs and copy Namespace assignment from the parent Prefix
-                available_ips = iter(available_ips)
-                prefix_length = prefix.prefix.prefixlen
-                for requested_ip in requested_ips:
-                    requested_ip["address"] = f"{next(available_ips)}/{prefix_length}"
-                    requested_ip["namespace"] = prefix.namespace.pk
+                _assign_available_ips(prefix, available_ips, requested_ips)
 
                 # Initialize the serializer with a list or a single object depending on what was requested
                 context = {"request": request, "depth": 0}
@@ -310,11 +336,7 @@ class PrefixViewSet(NautobotModelViewSet):
                 limit = min(limit, get_settings_or_config("MAX_PAGE_SIZE"))
 
             # Calculate available IPs within the prefix
-            ip_list = []
-            for index, ip in enumerate(prefix.get_available_ips(), start=1):
-                ip_list.append(ip)
-                if index == limit:
-                    break
+            ip_list = list(itertools.islice(prefix.iter_available_ips(), limit))
             serializer = serializers.AvailableIPSerializer(
                 ip_list,
                 many=True,
@@ -326,6 +348,89 @@ class PrefixViewSet(NautobotModelViewSet):
 
             return Response(serializer.data)
 
+    @extend_schema(
+        methods=["post"],
+        responses={201: serializers.IPAddressSerializer(many=True)},
+        request=serializers.AvailableIPAllocationSerializer(many=True),
+    )
+    @action(
+        detail=False,
+        name="Bulk Available IPs",
+        url_path="available-ips",
+        url_name="bulk-available-ips",
+        methods=["post"],
+        queryset=IPAddress.objects.all(),
+        filterset_class=None,
+    )
+    def bulk_available_ips(self, request):
+        """
+        Allocate available IP addresses from any number of prefixes in a single transaction.
+
+        Each requested IP address must specify the ID of the `prefix` to allocate it from, along with any other desired
+        IP address fields. Either all of the requested IP addresses are created, or none of them are.
+
+        Only the locks of the prefix hierarchies involved in the request are acquired (in a consistent order, to avoid
+        deadlocks), so requests allocating from unrelated prefixes do not block one another.
+        """
+        # Normalize to a list of objects
+        requested_ips = request.data if isinstance(request.data, list) else [request.data]
+        allocation_serializer = serializers.AvailableIPAllocationSerializer(data=requested_ips, many=True)
+        allocation_serializer.is_valid(raise_exception=True)
+
+        # Group the requested IPs by the prefix they are to be allocated from, leaving the request data as-is
+        ip_address_data = [
+            {key: value for key, value in requested_ip.items() if key != "prefix"} for requested_ip in requested_ips
+        ]
+        requested_ips_by_prefix = {}
+        for requested_ip, allocation in zip(ip_address_data, allocation_serializer.validated_data):
+            requested_ips_by_prefix.setdefault(allocation["prefix"], []).append(requested_ip)
+
+        prefixes = (
+            Prefix.objects.restrict(request.user)
+            .select_related("namespace")
+            .filter(pk__in=requested_ips_by_prefix.keys())
+            .order_by("pk")
+        )
+        if len(prefixes) != len(requested_ips_by_prefix):
+            missing = sorted(str(pk) for pk in requested_ips_by_prefix.keys() - {prefix.pk for prefix in prefixes})
+            raise ValidationError({"prefix": [f"Prefix {pk} not found" for pk in missing]})
+
+        with ExitStack() as stack:
+            # Prefixes within the same hierarchy share a single lock
+            for lock_name in sorted({_get_allocation_lock_name(prefix, "available_ips") for prefix in prefixes}):
+                stack.enter_context(_get_allocation_lock(name=lock_name))
+
+            # Prefixes within the same hierarchy share available IPs, so don't allocate any of them twice
+            allocated_ips = set()
+            for prefix in prefixes:
+                prefix_requested_ips = requested_ips_by_prefix[prefix.pk]
+                available_ips = list(
+                    itertools.islice(
+                        (ip for ip in prefix.iter_available_ips() if (prefix.namespace_id, ip) not in allocated_ips),
+                        len(prefix_requested_ips),
+                    )
+                )
+                if len(available_ips) < len(prefix_requested_ips):
+                    return Response(
+                        {
+                            "detail": (
+                                f"An insufficient number of IP addresses are available within the prefix {prefix} "
+                                f"({len(prefix_requested_ips)} requested, {len(available_ips)} available)"
+                            )
+                        },
+                        status=status.HTTP_204_NO_CONTENT,
+                    )
+                _assign_available_ips(prefix, available_ips, prefix_requested_ips)
+                allocated_ips.update((prefix.namespace_id, ip) for ip in available_ips)
+
+            serializer = serializers.IPAddressSerializer(
+                data=ip_address_data, many=True, context={"request": request, "depth": 0}
+            )
+            serializer.is_valid(raise_exception=True)
+            with transaction.atomic():
+                serializer.save()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+
 
 class PrefixLocationAssignmentViewSet(NautobotModelViewSet):
     queryset = PrefixLocationAssignment.objects.select_related("prefix", "location")
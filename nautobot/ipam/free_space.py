@@ -0,0 +1,124 @@
+"""
+Free-space calculations over sorted integer intervals of IP address space.
+
+An interval is a `(first, last)` tuple of integers, inclusive at both ends, such as the `network` and `broadcast` values
+of a Prefix or the `host` value of an IPAddress (as `(host, host)`). Occupied intervals are consumed lazily in ascending
+order of their `first` value, which lets the free space within a Prefix be streamed directly from an ordered database
+query without first loading every child object into memory.
+"""
+
+import netaddr
+
+# Default number of rows to fetch per query when streaming occupied intervals from the database.
+FREE_SPACE_CHUNK_SIZE = 1000
+
+
+def iter_free_intervals(first, last, occupied):
+    """
+    Yield the maximal intervals within `[first, last]` that are not covered by any of the `occupied` intervals.
+
+    Args:
+        first (int): First value of the interval to search.
+        last (int): Last value of the interval to search.
+        occupied (iterable): `(first, last)` intervals, sorted ascending by their first value. May overlap or nest.
+
+    Yields:
+        (tuple[int, int]): Free `(first, last)` intervals, in ascending order.
+    """
+    cursor = first
+    for occupied_first, occupied_last in occupied:
+        if occupied_last < cursor:
+            continue
+        if occupied_first > last:
+            break
+        if occupied_first > cursor:
+            yield (cursor, occupied_first - 1)
+        cursor = occupied_last + 1
+        if cursor > last:
+            return
+    if cursor <= last:
+        yield (cursor, last)
+
+
+def iter_covered_intervals(occupied):
+    """
+    Merge the given sorted, possibly overlapping, `occupied` intervals into disjoint, non-adjacent intervals.
+
+    Args:
+        occupied (iterable): `(first, last)` intervals, sorted ascending by their first value.
+
+    Yields:
+        (tuple[int, int]): Merged `(first, last)` intervals, in ascending order.
+    """
+    current = None
+    for occupied_first, occupied_last in occupied:
+        if current is None:
+            current = [occupied_first, occupied_last]
+        elif occupied_first <= current[1] + 1:
+            current[1] = max(current[1], occupied_last)
+        else:
+            yield tuple(current)
+            current = [occupied_first, occupied_last]
+    if current is not None:
+        yield tuple(current)
+
+
+def intervals_size(intervals):
+    """Return the total number of values contained in the given disjoint `intervals`."""
+    return sum(interval_last - interval_first + 1 for interval_first, interval_last in intervals)
+
+
+def iter_interval_addresses(intervals, version):
+    """Yield every address within the given `intervals`, in order, as `netaddr.IPAddress` objects."""
+    for interval_first, interval_last in intervals:
+        for value in range(interval_first, interval_last + 1):
+            yield netaddr.IPAddress(value, version=version)
+
+
+def iter_interval_cidrs(intervals, version):
+    """Yield the minimal list of CIDRs covering each of the given `intervals`, in order, as `netaddr.IPNetwork`."""
+    for interval_first, interval_last in intervals:
+        yield from netaddr.iprange_to_cidrs(
+            netaddr.IPAddress(interval_first, version=version),
+            netaddr.IPAddress(interval_last, version=version),
+        )
+
+
+def intervals_to_ipset(intervals, version):
+    """Convert the given `intervals` into a `netaddr.IPSet`."""
+    return netaddr.IPSet(iter_interval_cidrs(intervals, version))
+
+
+def iter_queryset_intervals(queryset, first_field, last_field=None, order_by=(), chunk_size=None):
+    """
+    Stream `(first, last)` integer intervals from a queryset, in ascending order of `first_field`.
+
+    Rows are fetched in chunks using keyset pagination on `first_field`, so that only as many rows are retrieved as
+    the consumer actually iterates over. Rows sharing the same `first_field` value as the last row of a chunk may be
+    skipped, which is harmless for free-space calculations as long as `order_by` sorts the largest such interval first
+    (for prefixes, by ascending `prefix_length`), as any skipped rows are then nested within it.
+
+    Args:
+        queryset (QuerySet): Queryset to fetch intervals from.
+        first_field (str): Name of the `VarbinaryIPField` holding the first address of each interval.
+        last_field (str): Name of the `VarbinaryIPField` holding the last address of each interval, if any.
+        order_by (tuple): Additional fields to order rows sharing the same `first_field` value by.
+        chunk_size (int): Number of rows to fetch per query. Defaults to `FREE_SPACE_CHUNK_SIZE`.
+
+    Yields:
+        (tuple[int, int]): `(first, last)` intervals.
+    """
+    chunk_size = chunk_size or FREE_SPACE_CHUNK_SIZE
+    fields = [first_field] if last_field is None else [first_field, last_field]
+    queryset = queryset.order_by(first_field, *order_by).values_list(*fields)
+    last_seen = None
+    while True:
+        chunk_queryset = queryset if last_seen is None else queryset.filter(**{f"{first_field}__gt": last_seen})
+        rows = list(chunk_queryset[:chunk_size])
+        for row in rows:
+            interval_first = int(netaddr.IPAddress(row[0]))
+            interval_last = interval_first if last_field is None else int(netaddr.IPAddress(row[1]))
+            yield (interval_first, interval_last)
+        if len(rows) < chunk_size:
+            return
+        last_seen = rows[-1][0]
@@ -18,11 +18,11 @@ from nautobot.core.utils.data import UtilizationData
 from nautobot.dcim.models import Interface
 from nautobot.extras.models import RoleField, StatusField
 from nautobot.extras.utils import extras_features
-from nautobot.ipam import choices, constants
+from nautobot.ipam import choices, constants, free_space
 from nautobot.virtualization.models import VMInterface
 
 from .fields import VarbinaryIPField
-from .querysets import IPAddressQuerySet, PrefixQuerySet, RIRQuerySet, VLANQuerySet
+from .querysets import defer_hierarchy_update, IPAddressQuerySet, PrefixQuerySet, RIRQuerySet, VLANQuerySet
 from .validators import DNSValidator
 
 __all__ = (
@@ -611,11 +611,15 @@ class Prefix(PrimaryModel):
             # which will (re)set the broadcast and ip_version values of this instance to their correct values.
             self.prefix = self.prefix.cidr
 
+        # Within `Prefix.objects.deferred_hierarchy()`, the parent and children of this prefix are determined later
+        hierarchy_deferred = defer_hierarchy_update(self)
+
         # Determine if a parent exists and set it to the closest ancestor by `prefix_length`.
-        supernets = self.supernets()
-        if supernets:
-            parent = max(supernets, key=operator.attrgetter("prefix_length"))
-            self.parent = parent
+        if not hierarchy_deferred:
+            supernets = self.supernets()
+            if supernets:
+                parent = max(supernets, key=operator.attrgetter("prefix_length"))
+                self.parent = parent
 
         # Validate that creation of this prefix does not create an invalid parent/child relationship
         # 3.0 TODO: uncomment this to enforce this constraint
@@ -652,10 +656,11 @@ class Prefix(PrimaryModel):
             if self._location is not None:
                 self.location = self._location
 
-        # Determine the subnets and reparent them to this prefix.
-        self.reparent_subnets()
-        # Determine the child IPs and reparent them to this prefix.
-        self.reparent_ips()
+        if not hierarchy_deferred:
+            # Determine the subnets and reparent them to this prefix.
+            self.reparent_subnets()
+            # Determine the child IPs and reparent them to this prefix.
+            self.reparent_ips()
 
     @property
     def cidr_str(self):
@@ -844,43 +849,58 @@ class Prefix(PrimaryModel):
 
         return query
 
-    def get_available_prefixes(self):
-        """
-        Return all available Prefixes within this prefix as an IPSet.
-        """
-        prefix = netaddr.IPSet(self.prefix)
-        child_prefixes = netaddr.IPSet([child.prefix for child in self.descendants()])
-        available_prefixes = prefix - child_prefixes
-
-        return available_prefixes
-
-    def get_available_ips(self):
-        """
-        Return all available IPs within this prefix as an IPSet.
-        """
-        prefix = netaddr.IPSet(self.prefix)
-        child_ips = netaddr.IPSet([ip.address.ip for ip in self.ip_addresses.all()])
-        available_ips = prefix - child_ips
+    def _iter_available_prefix_intervals(self):
+        """Yield the (network, broadcast) integer intervals within this prefix not covered by any descendant."""
+        descendants = free_space.iter_queryset_intervals(
+            self.descendants(), "network", "broadcast", order_by=("prefix_length",)
+        )
+        return free_space.iter_free_intervals(self.prefix.first, self.prefix.last, descendants)
 
+    def _iter_available_ip_intervals(self):
+        """Yield the integer intervals of usable addresses within this prefix not taken by a child IPAddress."""
+        first, last = self.prefix.first, self.prefix.last
         # IPv6, pool, or IPv4 /31-32 sets are fully usable
-        if any(
+        # For "normal" IPv4 prefixes, omit first and last addresses
+        if not any(
             [
                 self.ip_version == 6,
                 self.type == choices.PrefixTypeChoices.TYPE_POOL,
                 self.ip_version == 4 and self.prefix_length >= 31,
             ]
         ):
-            return available_ips
+            first, last = first + 1, last - 1
+        child_ips = free_space.iter_queryset_intervals(self.ip_addresses.all(), "host")
+        return free_space.iter_free_intervals(first, last, child_ips)
 
-        # Omit first and last IP address from the available set
-        # For "normal" IPv4 prefixes, omit first and last addresses
-        available_ips -= netaddr.IPSet(
-            [
-                netaddr.IPAddress(self.prefix.first),
-                netaddr.IPAddress(self.prefix.last),
-            ]
-        )
-        return available_ips
+    def iter_available_prefixes(self):
+        """
+        Iterate over the available child prefixes within this prefix, in order, as `netaddr.IPNetwork` objects.
+
+        Descendant prefixes are streamed from the database in order of their network address, so retrieving only the
+        first few available prefixes does not require loading every descendant of this prefix.
+        """
+        return free_space.iter_interval_cidrs(self._iter_available_prefix_intervals(), self.ip_version)
+
+    def iter_available_ips(self):
+        """
+        Iterate over the available IPs within this prefix, in order, as `netaddr.IPAddress` objects.
+
+        Child IP addresses are streamed from the database in order of their host address, so retrieving only the
+        first few available IPs does not require loading every child IP address of this prefix.
+        """
+        return free_space.iter_interval_addresses(self._iter_available_ip_intervals(), self.ip_version)
+
+    def get_available_prefixes(self):
+        """
+        Return all available Prefixes within this prefix as an IPSet.
+        """
+        return free_space.intervals_to_ipset(self._iter_available_prefix_intervals(), self.ip_version)
+
+    def get_available_ips(self):
+        """
+        Return all available IPs within this prefix as an IPSet.
+        """
+        return free_space.intervals_to_ipset(self._iter_available_ip_intervals(), self.ip_version)
 
     def get_child_ips(self):
         """
@@ -903,19 +923,16 @@ class Prefix(PrimaryModel):
         """
         Return the first available child prefix within the prefix (or None).
         """
-        available_prefixes = self.get_available_prefixes()
-        if not available_prefixes:
-            return None
-        return available_prefixes.iter_cidrs()[0]
+        return next(self.iter_available_prefixes(), None)
 
     def get_first_available_ip(self):
         """
         Return the first available IP within the prefix (or None).
         """
-        available_ips = self.get_available_ips()
-        if not available_ips:
+        available_ip = next(self.iter_available_ips(), None)
+        if available_ip is None:
             return None
-        return f"{next(available_ips.__iter__())}/{self.prefix_length}"
+        return f"{available_ip}/{self.prefix_length}"
 
     def get_utilization(self):
         """Return the utilization of this prefix as a UtilizationData object.
@@ -925,26 +942,44 @@ class Prefix(PrimaryModel):
         For prefixes containing IP addresses and/or pools, pools are considered fully utilized while
         only IP addresses that are not contained within pools are added to the utilization.
 
+        The calculation is performed with aggregate queries, so that the cost of retrieving the IP addresses within
+        this prefix does not grow with their number; only the direct child prefixes are retrieved individually.
+
         Returns:
             UtilizationData (namedtuple): (numerator, denominator)
         """
         denominator = self.prefix.size
-        child_ips = netaddr.IPSet()
-        child_prefixes = netaddr.IPSet()
+        numerator = 0
+        child_ips = IPAddress.objects.none()
+        child_prefixes = Prefix.objects.none()
+
+        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
+            child_prefixes = self.children.all()
+            child_intervals = free_space.iter_queryset_intervals(
+                child_prefixes, "network", "broadcast", order_by=("prefix_length",)
+            )
+            numerator += free_space.intervals_size(free_space.iter_covered_intervals(child_intervals))
 
         # 3.0 TODO: In the long term, TYPE_POOL prefixes will be disallowed from directly containing IPAddresses,
         # and the addresses will instead be parented to the containing TYPE_NETWORK prefix. It should be possible to
         # change this when that is the case, see #3873 for historical context.
         if self.type != choices.PrefixTypeChoices.TYPE_CONTAINER:
-            pool_ips = IPAddress.objects.filter(
+            child_ips = IPAddress.objects.filter(
                 parent__namespace=self.namespace, host__gte=self.network, host__lte=self.broadcast
-            ).values_list("host", flat=True)
-            child_ips = netaddr.IPSet(pool_ips)
-
-        if self.type != choices.PrefixTypeChoices.TYPE_POOL:
-            child_prefixes = netaddr.IPSet(p.prefix for p in self.children.only("network", "prefix_length").iterator())
-
-        numerator_set = child_ips | child_prefixes
+            )
+            uncounted_ips = child_ips
+            if self.type != choices.PrefixTypeChoices.TYPE_POOL:
+                # IPs within a child prefix have already been counted as part of that prefix
+                uncounted_ips = child_ips.filter(
+                    ~models.Exists(
+                        Prefix.objects.filter(
+                            parent=self,
+                            network__lte=models.OuterRef("host"),
+                            broadcast__gte=models.OuterRef("host"),
+                        )
+                    )
+                )
+            numerator += uncounted_ips.values("host").distinct().count()
 
         # Exclude network and broadcast address from the denominator unless they've been assigned to an IPAddress or child pool.
         # Only applies to IPv4 network prefixes with a prefix length of /30 or shorter
@@ -955,10 +990,16 @@ class Prefix(PrimaryModel):
                 self.ip_version == 4,
             ]
         ):
-            if not any([self.network in numerator_set, self.broadcast in numerator_set]):
+            # A child prefix can only contain our network or broadcast address if it starts or ends at the same address
+            if not any(
+                [
+                    child_ips.filter(Q(host=self.network) | Q(host=self.broadcast)).exists(),
+                    child_prefixes.filter(Q(network=self.network) | Q(broadcast=self.broadcast)).exists(),
+                ]
+            ):
                 denominator -= 2
 
-        return UtilizationData(numerator=numerator_set.size, denominator=denominator)
+        return UtilizationData(numerator=numerator, denominator=denominator)
 
 
 @extras_features("graphql")
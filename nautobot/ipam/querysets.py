@@ -1,13 +1,87 @@
+from contextlib import contextmanager
+import contextvars
 import re
 
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.models import ProtectedError, Q
 import netaddr
 
 from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.core.utils.data import merge_dicts_without_collision
+from nautobot.ipam import free_space
 from nautobot.ipam.mixins import LocationToLocationsQuerySetMixin
 
+# List of Prefixes saved while hierarchy maintenance is deferred by `PrefixQuerySet.deferred_hierarchy()`, if active
+_deferred_hierarchy_prefixes = contextvars.ContextVar("nautobot.ipam.deferred_hierarchy_prefixes", default=None)
+
+# Beyond this many disjoint address ranges, `PrefixQuerySet.update_hierarchy()` scans the entire Namespace instead
+HIERARCHY_MAX_RANGE_FILTERS = 100
+
+
+def defer_hierarchy_update(prefix):
+    """
+    Record the given Prefix for a later hierarchy update if `PrefixQuerySet.deferred_hierarchy()` is active.
+
+    Returns:
+        (bool): True if the update was deferred, False if the caller should update the hierarchy itself.
+    """
+    deferred_prefixes = _deferred_hierarchy_prefixes.get()
+    if deferred_prefixes is None:
+        return False
+    deferred_prefixes.append(prefix)
+    return True
+
+
+def _refresh_object_changes(prefixes):
+    """
+    Update the snapshots of the ObjectChanges already recorded in the active change context for the given Prefixes,
+    whose hierarchy was only determined after they were saved.
+    """
+    # Circular Import
+    from nautobot.extras.signals import change_context_state
+
+    change_context = change_context_state.get()
+    if not prefixes or change_context is None or change_context.write_behind or change_context.defer_object_changes:
+        # Either no changes are logged, or they are only serialized from the (updated) instances once logged
+        return
+
+    object_change_model = apps.get_model("extras", "ObjectChange")
+    content_type = ContentType.objects.get_for_model(prefixes[0])
+    prefixes_by_pk = {prefix.pk: prefix for prefix in prefixes}
+    pks = list(prefixes_by_pk)
+    for i in range(0, len(pks), 1000):
+        object_changes = list(
+            object_change_model.objects.filter(
+                request_id=change_context.change_id,
+                changed_object_type=content_type,
+                changed_object_id__in=pks[i : i + 1000],
+            )
+        )
+        for object_change in object_changes:
+            snapshot = prefixes_by_pk[object_change.changed_object_id].to_objectchange(object_change.action)
+            object_change.object_data = snapshot.object_data
+            object_change.object_data_v2 = snapshot.object_data_v2
+        object_change_model.objects.bulk_update(object_changes, ["object_data", "object_data_v2"])
+
+
+def _ranges_filter(intervals, version, first_field, last_field=None):
+    """Build a Q matching objects overlapping any of the given integer `intervals`, or None if there are too many."""
+    if len(intervals) > HIERARCHY_MAX_RANGE_FILTERS:
+        return None
+    last_field = last_field or first_field
+    query = Q()
+    for interval_first, interval_last in intervals:
+        query |= Q(
+            **{
+                f"{first_field}__lte": str(netaddr.IPAddress(interval_last, version=version)),
+                f"{last_field}__gte": str(netaddr.IPAddress(interval_first, version=version)),
+            }
+        )
+    return query
+
 
 class RIRQuerySet(RestrictedQuerySet):
     """QuerySet for RIR objects."""
@@ -383,6 +457,147 @@ class PrefixQuerySet(LocationToLocationsQuerySetMixin, BaseNetworkQuerySet):
         except IndexError:
             raise self.model.DoesNotExist(f"Could not determine parent Prefix for {cidr}")
 
+    def bulk_create_with_hierarchy(self, objs, batch_size=None):
+        """
+        Create the given unsaved Prefix instances in bulk, then set their `parent` and reparent any existing Prefixes
+        and IPAddresses within them, as `Prefix.save()` would do, but in a single pass per Namespace.
+
+        As with `bulk_create()`, `save()` is not called and no signals are sent for the created Prefixes.
+
+        Args:
+            objs (list): Unsaved Prefix instances.
+            batch_size (int, optional): Maximum number of objects to create or update per query.
+
+        Returns:
+            (list): The created Prefix instances, with their `parent` populated.
+        """
+        objs = list(objs)
+        for obj in objs:
+            # Clear host bits from prefix, as in Prefix.save()
+            obj.prefix = obj.prefix.cidr
+        with transaction.atomic():
+            objs = self.bulk_create(objs, batch_size=batch_size)
+            self.update_hierarchy(objs, batch_size=batch_size)
+        return objs
+
+    def update_hierarchy(self, prefixes, batch_size=None):
+        """
+        Recalculate the `parent` of the given Prefixes, and of all Prefixes and IPAddresses contained within them.
+
+        All Prefixes in the affected address ranges of each Namespace are loaded at once and sorted by network, so
+        that the closest parent of every Prefix and IPAddress can be determined with a single sweep in memory. Only
+        the objects whose parent has actually changed are then written, with `bulk_update()`. The `parent` of the
+        given in-memory Prefix instances is updated as well.
+
+        Args:
+            prefixes (list): Saved Prefix instances.
+            batch_size (int, optional): Maximum number of objects to update per query.
+        """
+        prefix_model = self.model
+        ip_address_model = apps.get_model("ipam", "IPAddress")
+
+        prefixes_by_range = {}
+        for prefix in prefixes:
+            prefixes_by_range.setdefault((prefix.namespace_id, prefix.ip_version), []).append(prefix)
+
+        with transaction.atomic():
+            for (namespace_id, ip_version), range_prefixes in prefixes_by_range.items():
+                intervals = list(
+                    free_space.iter_covered_intervals(
+                        sorted((prefix.prefix.first, prefix.prefix.last) for prefix in range_prefixes)
+                    )
+                )
+
+                # Load every Prefix overlapping the given ones, i.e. all of their supernets and subnets
+                candidate_prefixes = prefix_model.objects.filter(namespace_id=namespace_id, ip_version=ip_version)
+                ranges_filter = _ranges_filter(intervals, ip_version, "network", "broadcast")
+                if ranges_filter is not None:
+                    candidate_prefixes = candidate_prefixes.filter(ranges_filter)
+                candidate_prefixes = [
+                    (int(netaddr.IPAddress(network)), int(netaddr.IPAddress(broadcast)), pk, parent_id)
+                    for pk, network, broadcast, parent_id in candidate_prefixes.order_by(
+                        "network", "prefix_length"
+                    ).values_list("pk", "network", "broadcast", "parent_id")
+                ]
+
+                # Sweep in order of network address, keeping a stack of the nested Prefixes containing the current one
+                new_parents = {}
+                changed_prefixes = []
+                stack = []
+                for network, broadcast, pk, parent_id in candidate_prefixes:
+                    while stack and stack[-1][1] < network:
+                        stack.pop()
+                    new_parents[pk] = stack[-1][2] if stack else None
+                    if new_parents[pk] != parent_id:
+                        changed_prefixes.append(prefix_model(pk=pk, parent_id=new_parents[pk]))
+                    stack.append((network, broadcast, pk))
+                prefix_model.objects.bulk_update(changed_prefixes, ["parent"], batch_size=batch_size)
+
+                for prefix in range_prefixes:
+                    if prefix.pk in new_parents:
+                        prefix.parent_id = new_parents[prefix.pk]
+
+                # Sweep the IPAddresses within the given Prefixes against the same sorted list of Prefixes
+                candidate_ips = ip_address_model.objects.filter(
+                    parent__namespace_id=namespace_id, ip_version=ip_version
+                )
+                ranges_filter = _ranges_filter(intervals, ip_version, "host")
+                if ranges_filter is not None:
+                    candidate_ips = candidate_ips.filter(ranges_filter)
+                changed_ips = []
+                stack = []
+                prefix_iter = iter(candidate_prefixes)
+                next_prefix = next(prefix_iter, None)
+                for pk, host, parent_id in candidate_ips.order_by("host").values_list("pk", "host", "parent_id"):
+                    host = int(netaddr.IPAddress(host))
+                    while next_prefix is not None and next_prefix[0] <= host:
+                        while stack and stack[-1][1] < next_prefix[0]:
+                            stack.pop()
+                        stack.append(next_prefix[:3])
+                        next_prefix = next(prefix_iter, None)
+                    while stack and stack[-1][1] < host:
+                        stack.pop()
+                    # An IPAddress's current parent always contains it, so a new parent will always be found
+                    if stack and stack[-1][2] != parent_id:
+                        changed_ips.append(ip_address_model(pk=pk, parent_id=stack[-1][2]))
+                ip_address_model.objects.bulk_update(changed_ips, ["parent"], batch_size=batch_size)
+
+    @contextmanager
+    def deferred_hierarchy(self):
+        """
+        Defer the calculation of Prefix parents and reparenting of child Prefixes and IPAddresses on `Prefix.save()`
+        until the end of the context manager, where it is performed for all saved Prefixes at once with
+        `update_hierarchy()`. For use with bulk create operations; nested usage is a no-op.
+
+        Example:
+            >>> with Prefix.objects.deferred_hierarchy():
+            ...     for cidr in cidrs:
+            ...         Prefix.objects.create(prefix=cidr, status=status)
+        """
+        if _deferred_hierarchy_prefixes.get() is not None:
+            yield
+            return
+
+        deferred_prefixes = []
+        token = _deferred_hierarchy_prefixes.set(deferred_prefixes)
+        try:
+            yield
+        finally:
+            _deferred_hierarchy_prefixes.reset(token)
+        # Ignore any Prefixes whose creation was rolled back or which were deleted again in the meantime
+        existing_pks = set()
+        for i in range(0, len(deferred_prefixes), 1000):
+            existing_pks.update(
+                self.model.objects.filter(pk__in=[prefix.pk for prefix in deferred_prefixes[i : i + 1000]]).values_list(
+                    "pk", flat=True
+                )
+            )
+        prefixes = [prefix for prefix in deferred_prefixes if prefix.pk in existing_pks]
+        saved_parent_ids = {prefix.pk: prefix.parent_id for prefix in prefixes}
+        self.update_hierarchy(prefixes)
+        # The changes to any Prefixes whose parent was only determined now were logged with their parent as saved
+        _refresh_object_changes([prefix for prefix in prefixes if prefix.parent_id != saved_parent_ids[prefix.pk]])
+
 
 class IPAddressQuerySet(BaseNetworkQuerySet):
     """Queryset for `IPAddress` objects."""
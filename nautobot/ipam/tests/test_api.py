@@ -621,6 +621,89 @@ class PrefixTest(APIViewTestCases.APIViewTestCase):
         self.assertHttpStatus(response, status.HTTP_201_CREATED)
         self.assertEqual(len(response.data), 6)
 
+    def test_create_available_ips_from_multiple_prefixes(self):
+        """
+        Test the creation of available IP addresses within several parent prefixes in a single request.
+        """
+        prefix_1 = Prefix.objects.create(
+            prefix="192.0.2.0/30",
+            type=choices.PrefixTypeChoices.TYPE_NETWORK,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        prefix_2 = Prefix.objects.create(
+            prefix="198.51.100.0/29",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        url = reverse("ipam-api:prefix-bulk-available-ips")
+        self.add_permissions("ipam.view_prefix", "ipam.add_ipaddress", "extras.view_status")
+
+        # Try to create three IPs in prefix_1 (only two are available) and two in prefix_2
+        data = [
+            {"prefix": str(prefix.pk), "description": f"Test IP {i}", "status": str(self.status.pk)}
+            for i, prefix in enumerate([prefix_1, prefix_1, prefix_1, prefix_2, prefix_2], start=1)
+        ]
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_204_NO_CONTENT)
+        self.assertIn("detail", response.data)
+        # Verify that no IPs were created in either prefix
+        self.assertFalse(prefix_1.ip_addresses.exists())
+        self.assertFalse(prefix_2.ip_addresses.exists())
+
+        # Create two IPs in prefix_1 and two in prefix_2 in a single request
+        response = self.client.post(url, data[1:], format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 4)
+        # The request data should be left as-is
+        self.assertEqual(response.renderer_context["request"].data, data[1:])
+        self.assertEqual(
+            sorted(str(ip.address) for ip in prefix_1.ip_addresses.all()), ["192.0.2.1/30", "192.0.2.2/30"]
+        )
+        self.assertEqual(
+            sorted(str(ip.address) for ip in prefix_2.ip_addresses.all()), ["198.51.100.0/29", "198.51.100.1/29"]
+        )
+
+        with self.subTest("missing prefix"):
+            response = self.client.post(url, [{"status": self.status.pk}], format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        with self.subTest("nonexistent prefix"):
+            data = [{"prefix": "00000000-0000-0000-0000-000000000000", "status": self.status.pk}]
+            response = self.client.post(url, data, format="json", **self.header)
+            self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("prefix", response.data)
+
+    def test_create_available_ips_from_nested_prefixes(self):
+        """
+        Test the creation of available IP addresses within a prefix and its parent prefix in a single request.
+        """
+        parent = Prefix.objects.create(
+            prefix="192.0.2.0/29",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        child = Prefix.objects.create(
+            prefix="192.0.2.0/30",
+            type=choices.PrefixTypeChoices.TYPE_POOL,
+            namespace=self.namespace,
+            status=self.status,
+        )
+        url = reverse("ipam-api:prefix-bulk-available-ips")
+        self.add_permissions("ipam.view_prefix", "ipam.add_ipaddress", "extras.view_status")
+
+        data = [
+            {"prefix": str(prefix.pk), "description": f"Test IP {i}", "status": self.status.pk}
+            for i, prefix in enumerate([parent, parent, child, child], start=1)
+        ]
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        addresses = [ip["address"] for ip in response.data]
+        self.assertEqual(len(addresses), 4)
+        self.assertEqual(len({address.split("/")[0] for address in addresses}), 4, "Duplicate IPs should not exist")
+
 
 class PrefixLocationAssignmentTest(APIViewTestCases.APIViewTestCase):
     model = PrefixLocationAssignment
@@ -703,6 +786,28 @@ class ParallelPrefixTest(APITransactionTestCase):
         ips = [str(o) for o in IPAddress.objects.filter().all()]
         self.assertEqual(len(ips), len(set(ips)), "Duplicate IPs should not exist")
 
+    def test_create_available_ips_from_multiple_prefixes_parallel(self):
+        prefixes = [
+            Prefix.objects.create(
+                prefix=f"192.0.2.{network}/29",
+                type=choices.PrefixTypeChoices.TYPE_POOL,
+                namespace=self.namespace,
+                status=self.status,
+            )
+            for network in (0, 8)
+        ]
+
+        # 8 requests of 2 IPs each, one IP from each prefix
+        requests = [
+            [{"prefix": str(prefix.pk), "description": f"Test IP {i}", "status": self.status.pk} for prefix in prefixes]
+            for i in range(1, 9)
+        ]
+        url = reverse("ipam-api:prefix-bulk-available-ips")
+        self._do_parallel_requests(url, requests)
+        ips = [str(o) for o in IPAddress.objects.filter(parent__in=prefixes)]
+        self.assertEqual(len(ips), 16)
+        self.assertEqual(len(ips), len(set(ips)), "Duplicate IPs should not exist")
+
     def _do_parallel_requests(self, url, requests):
         # Randomize request order, such that test run more closely simulates
         # a real calling pattern.
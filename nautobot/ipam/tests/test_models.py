@@ -1,4 +1,4 @@
-from unittest import skipIf
+from unittest import mock, skipIf
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
@@ -614,6 +614,56 @@ class TestPrefix(ModelTestCases.BaseModelTestCase):
         available_ips = parent_prefix.get_available_ips()
         self.assertEqual(available_ips, missing_ips)
 
+    def test_iter_available_prefixes(self):
+        parent_prefix = Prefix.objects.create(
+            prefix="10.0.0.0/16", status=self.status, namespace=self.namespace, type=PrefixTypeChoices.TYPE_CONTAINER
+        )
+        for cidr in ["10.0.0.0/20", "10.0.0.0/24", "10.0.16.0/24", "10.0.17.0/24", "10.0.32.0/20", "10.0.128.0/18"]:
+            Prefix.objects.create(prefix=cidr, status=self.status, namespace=self.namespace)
+        expected = [
+            netaddr.IPNetwork(cidr)
+            for cidr in [
+                "10.0.18.0/23",
+                "10.0.20.0/22",
+                "10.0.24.0/21",
+                "10.0.48.0/20",
+                "10.0.64.0/18",
+                "10.0.192.0/18",
+            ]
+        ]
+
+        self.assertEqual(list(parent_prefix.iter_available_prefixes()), expected)
+        self.assertEqual(parent_prefix.get_available_prefixes(), netaddr.IPSet(expected))
+        # Descendants fetched across several chunks, including a chunk boundary between nested prefixes
+        with mock.patch("nautobot.ipam.free_space.FREE_SPACE_CHUNK_SIZE", 1):
+            self.assertEqual(list(parent_prefix.iter_available_prefixes()), expected)
+
+    def test_iter_available_ips(self):
+        parent_prefix = Prefix.objects.create(prefix="10.0.0.0/28", status=self.status, namespace=self.namespace)
+        for address in ["10.0.0.2/28", "10.0.0.3/28", "10.0.0.5/28", "10.0.0.13/28"]:
+            IPAddress.objects.create(address=address, status=self.status, namespace=self.namespace)
+        expected = [netaddr.IPAddress(f"10.0.0.{i}") for i in [1, 4, 6, 7, 8, 9, 10, 11, 12, 14]]
+
+        self.assertEqual(list(parent_prefix.iter_available_ips()), expected)
+        with mock.patch("nautobot.ipam.free_space.FREE_SPACE_CHUNK_SIZE", 2):
+            self.assertEqual(list(parent_prefix.iter_available_ips()), expected)
+
+        # Only as many child IPs as needed to find the first available IPs are retrieved
+        IPAddress.objects.create(address="10.0.0.1/28", status=self.status, namespace=self.namespace)
+        with mock.patch("nautobot.ipam.free_space.FREE_SPACE_CHUNK_SIZE", 2):
+            with self.assertNumQueries(2):
+                self.assertEqual(parent_prefix.get_first_available_ip(), "10.0.0.4/28")
+
+        # Pools and IPv6 prefixes are fully usable
+        parent_prefix.type = PrefixTypeChoices.TYPE_POOL
+        parent_prefix.save()
+        self.assertEqual(next(parent_prefix.iter_available_ips()), netaddr.IPAddress("10.0.0.0"))
+        v6_prefix = Prefix.objects.create(prefix="2001:db8::/126", status=self.status, namespace=self.namespace)
+        self.assertEqual(
+            list(v6_prefix.iter_available_ips()),
+            [netaddr.IPAddress(f"2001:db8::{i}") for i in range(4)],
+        )
+
     def test_get_first_available_prefix(self):
         prefixes = [
             Prefix(
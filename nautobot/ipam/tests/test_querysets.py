@@ -1,14 +1,19 @@
 import re
 from unittest import skipIf
 
+from django.contrib.auth import get_user_model
 from django.db import connection
 import netaddr
 
 from nautobot.core.testing import TestCase
-from nautobot.extras.models import Status
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.models import ObjectChange, Status
 from nautobot.ipam import choices
 from nautobot.ipam.models import IPAddress, Namespace, Prefix
 
+User = get_user_model()
+
 
 class IPAddressQuerySet(TestCase):
     queryset = IPAddress.objects.all()
@@ -757,3 +762,111 @@ class PrefixQuerysetTestCase(TestCase):
                     .order_by("-prefix_length")
                     .first(),
                 )
+
+    def test_bulk_create_with_hierarchy(self):
+        """Test the PrefixQuerySet.bulk_create_with_hierarchy() method."""
+        namespace = Namespace.objects.create(name="test_bulk_create_with_hierarchy")
+        ip_status = Status.objects.get_for_model(IPAddress).first()
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/8",
+            type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+            namespace=namespace,
+            status=self.status,
+        )
+        network = Prefix.objects.create(prefix="10.1.1.0/24", namespace=namespace, status=self.status)
+        ip_1 = IPAddress.objects.create(address="10.1.1.1/24", namespace=namespace, status=ip_status)
+        ip_2 = IPAddress.objects.create(address="10.1.1.200/24", namespace=namespace, status=ip_status)
+        ip_3 = IPAddress.objects.create(address="10.2.0.1/24", namespace=namespace, status=ip_status)
+        self.assertEqual(network.parent, container)
+        self.assertEqual(ip_3.parent, container)
+
+        new_prefixes = Prefix.objects.bulk_create_with_hierarchy(
+            [
+                Prefix(
+                    prefix=cidr,
+                    type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+                    namespace=namespace,
+                    status=self.status,
+                )
+                for cidr in ("10.1.0.0/16", "10.2.0.0/16", "10.2.0.0/24", "10.1.1.130/25")
+            ]
+        )
+        self.assertEqual(
+            [str(prefix.prefix) for prefix in new_prefixes],
+            ["10.1.0.0/16", "10.2.0.0/16", "10.2.0.0/24", "10.1.1.128/25"],
+        )
+        prefixes = {str(prefix.prefix): prefix for prefix in Prefix.objects.filter(namespace=namespace)}
+        self.assertIsNone(prefixes["10.0.0.0/8"].parent)
+        self.assertEqual(prefixes["10.1.0.0/16"].parent, container)
+        self.assertEqual(prefixes["10.2.0.0/16"].parent, container)
+        self.assertEqual(prefixes["10.1.1.0/24"].parent, prefixes["10.1.0.0/16"])
+        self.assertEqual(prefixes["10.2.0.0/24"].parent, prefixes["10.2.0.0/16"])
+        self.assertEqual(prefixes["10.1.1.128/25"].parent, network)
+        # In-memory instances are updated as well
+        self.assertEqual(
+            [prefix.parent_id for prefix in new_prefixes], [prefixes[str(p.prefix)].parent_id for p in new_prefixes]
+        )
+
+        ip_1.refresh_from_db()
+        ip_2.refresh_from_db()
+        ip_3.refresh_from_db()
+        self.assertEqual(ip_1.parent, network)
+        self.assertEqual(ip_2.parent, prefixes["10.1.1.128/25"])
+        self.assertEqual(ip_3.parent, prefixes["10.2.0.0/24"])
+
+    def test_deferred_hierarchy(self):
+        """Test that the PrefixQuerySet.deferred_hierarchy() context manager defers and then applies reparenting."""
+        namespace = Namespace.objects.create(name="test_deferred_hierarchy")
+        ip_status = Status.objects.get_for_model(IPAddress).first()
+        container = Prefix.objects.create(
+            prefix="10.0.0.0/8",
+            type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+            namespace=namespace,
+            status=self.status,
+        )
+        ip = IPAddress.objects.create(address="10.1.1.1/24", namespace=namespace, status=ip_status)
+
+        with Prefix.objects.deferred_hierarchy():
+            network = Prefix.objects.create(prefix="10.1.1.0/24", namespace=namespace, status=self.status)
+            with Prefix.objects.deferred_hierarchy():
+                supernet = Prefix.objects.create(
+                    prefix="10.1.0.0/16",
+                    type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+                    namespace=namespace,
+                    status=self.status,
+                )
+            # Nested usage doesn't end the deferral
+            self.assertIsNone(network.parent)
+            self.assertIsNone(supernet.parent)
+            ip.refresh_from_db()
+            self.assertEqual(ip.parent, container)
+
+        self.assertEqual(network.parent, supernet)
+        self.assertEqual(supernet.parent, container)
+        network.refresh_from_db()
+        supernet.refresh_from_db()
+        ip.refresh_from_db()
+        self.assertEqual(network.parent, supernet)
+        self.assertEqual(supernet.parent, container)
+        self.assertEqual(ip.parent, network)
+
+    def test_deferred_hierarchy_object_changes(self):
+        """Test that the ObjectChanges of Prefixes created with a deferred hierarchy record their eventual parent."""
+        namespace = Namespace.objects.create(name="test_deferred_hierarchy_object_changes")
+        user = User.objects.create(username="test_deferred_hierarchy_object_changes")
+
+        with web_request_context(user):
+            with Prefix.objects.deferred_hierarchy():
+                network = Prefix.objects.create(prefix="10.1.1.0/24", namespace=namespace, status=self.status)
+                supernet = Prefix.objects.create(
+                    prefix="10.1.0.0/16",
+                    type=choices.PrefixTypeChoices.TYPE_CONTAINER,
+                    namespace=namespace,
+                    status=self.status,
+                )
+
+        object_change = ObjectChange.objects.get(changed_object_id=network.pk)
+        self.assertEqual(object_change.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(object_change.object_data["parent"], str(supernet.pk))
+        self.assertEqual(str(object_change.object_data_v2["parent"]["id"]), str(supernet.pk))
+        self.assertIsNone(ObjectChange.objects.get(changed_object_id=supernet.pk).object_data["parent"])
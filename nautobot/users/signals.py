@@ -0,0 +1,29 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from nautobot.core.authentication import invalidate_object_permissions_cache
+from nautobot.users.models import ObjectPermission
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=ObjectPermission)
+@receiver(post_delete, sender=ObjectPermission)
+@receiver(post_delete, sender=Group)
+@receiver(m2m_changed, sender=ObjectPermission.object_types.through)
+@receiver(m2m_changed, sender=ObjectPermission.groups.through)
+@receiver(m2m_changed, sender=ObjectPermission.users.through)
+@receiver(m2m_changed, sender=User.groups.through)
+def invalidate_object_permissions(sender, **kwargs):
+    """
+    Invalidate the cached object permissions of all users when an ObjectPermission or group membership changes.
+    """
+    if kwargs.get("action", "post_").startswith("pre_"):
+        return
+    invalidate_object_permissions_cache()
+    # Invalidate again once the transaction has been committed, in case another process re-cached the old permissions
+    # in the meantime, as it could not yet see the uncommitted changes.
+    transaction.on_commit(invalidate_object_permissions_cache)